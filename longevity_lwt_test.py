@@ -75,6 +75,7 @@ class LWTLongevityTest(LongevityTest):
                 longevity_self_object=self,
                 user_profile_name="c-s_lwt",
                 base_table_partition_keys=self.BASE_TABLE_PARTITION_KEYS,
+                digest_mode=self.params.get("data_validation_digest_mode"),
             )
 
             self.data_validator.copy_immutable_expected_data()
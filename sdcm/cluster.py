@@ -34,7 +34,7 @@ import json
 import shlex
 import uuid
 from decimal import Decimal, ROUND_UP
-from typing import List, Optional, Dict, Union, Set, Iterable, ContextManager, Any, IO, AnyStr, Callable, Literal
+from typing import List, Optional, Dict, Union, Set, ContextManager, Any, IO, AnyStr, Callable, Literal
 from datetime import datetime, timezone
 from textwrap import dedent
 from functools import cached_property, wraps, lru_cache, partial
@@ -148,6 +148,18 @@ from sdcm.utils.health_checker import (
 from sdcm.utils.decorators import NoValue, retrying, log_run_info, optional_cached_property, optional_stage
 from sdcm.test_config import TestConfig
 from sdcm.utils.issues_by_keyword.find_known_issue import FindIssuePerBacktrace
+from sdcm.utils.backtrace_decoder import (
+    ADDR2LINE_MAX_ADDRESSES,
+    BACKTRACE_DECODING_BATCH_SIZE,
+    BACKTRACE_DECODING_WORKERS,
+    BacktraceFramesCache,
+    addr2line_command,
+    backtrace_decoding_metrics,
+    compose_backtrace,
+    get_backtrace_addresses,
+    get_backtrace_cache_dir,
+    parse_addr2line_output,
+)
 from sdcm.utils.sstable.sstable_utils import SstableUtils
 from sdcm.utils.version_utils import (
     assume_version,
@@ -194,7 +206,8 @@ from sdcm.utils.ldap import (
 )
 from sdcm.utils.remote_logger import get_system_logging_thread
 from sdcm.utils.scylla_args import ScyllaArgParser
-from sdcm.utils.file import File
+from sdcm.utils.system_log_hub import LogSubscription, SystemLogHub
+from sdcm.utils.log_time_index import LogTimeIndex
 from sdcm.utils import cdc
 from sdcm.utils.raft import get_raft_mode
 from sdcm.utils.sct_agent_installer import reconfigure_agent_script, DEFAULT_AGENT_CERTS_DIR
@@ -1406,16 +1419,25 @@ class BaseNode(AutoSshContainerMixin):
         self._coredump_thread.start()
 
     def start_db_log_reader_thread(self):
-        self._db_log_reader_thread = DbLogReader(
+        reader_kwargs = dict(
             system_log=self.system_log,
-            remoter=self.remoter,
             node_name=str(self.name),
-            system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS,
-            decoding_queue=self.test_config.DECODING_QUEUE,
             log_lines=self.parent_cluster.params.get("logs_transport") in ["syslog-ng", "vector"],
             backtrace_stall_decoding=self.parent_cluster.params.get("backtrace_stall_decoding"),
             backtrace_decoding_disable_regex=self.parent_cluster.params.get("backtrace_decoding_disable_regex"),
+            chunked_tailing=self.parent_cluster.params.get("db_log_reader_chunked_tailing"),
         )
+        pool_size = self.parent_cluster.params.get("db_log_reader_pool_size")
+        if pool_size == 0:
+            self._db_log_reader_thread = DbLogReader(
+                remoter=self.remoter,
+                system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS,
+                decoding_queue=self.test_config.DECODING_QUEUE,
+                **reader_kwargs,
+            )
+        else:
+            pool = self.test_config.get_db_log_reader_pool(size=pool_size or os.cpu_count() or 1)
+            self._db_log_reader_thread = pool.register(**reader_kwargs)
         self._db_log_reader_thread.start()
 
     def start_alert_manager_thread(self):
@@ -1949,10 +1971,11 @@ class BaseNode(AutoSshContainerMixin):
 
     def follow_system_log(
         self, patterns: Optional[List[Union[str, re.Pattern, LogEvent]]] = None, start_from_beginning: bool = False
-    ) -> Iterable[str]:
-        stream = File(self.system_log)
-        if not start_from_beginning:
-            stream.move_to_end()
+    ) -> LogSubscription:
+        """Follow lines of the system log which match any of the patterns (SYSTEM_ERROR_EVENTS_PATTERNS by default.)
+
+        All followers of the log share a single reader of it, see `sdcm.utils.system_log_hub'.
+        """
         if not patterns:
             patterns = [p[0] for p in SYSTEM_ERROR_EVENTS_PATTERNS]
         regexps = []
@@ -1963,51 +1986,23 @@ class BaseNode(AutoSshContainerMixin):
                 regexps.append(re.compile(pattern, flags=re.IGNORECASE))
             elif isinstance(pattern, LogEvent):
                 regexps.append(re.compile(pattern.regex, flags=re.IGNORECASE))
-        return stream.read_lines_filtered(*regexps)
+        return SystemLogHub.for_log(str(self.system_log)).subscribe(
+            patterns=regexps, start_from_beginning=start_from_beginning
+        )
 
     @contextlib.contextmanager
     def open_system_log(self, on_datetime: Optional[datetime] = None) -> IO[AnyStr]:
-        """Opens system log file and seeks to the given datetime."""
+        """Opens system log file and seeks to the first line logged at the given datetime or later."""
         with open(self.system_log, "r", encoding="utf-8") as log_file:
-            if not on_datetime:
-                yield log_file
-                return
-            else:
-                # ignore microseconds because log lines don't have them
-                on_datetime = on_datetime.replace(microsecond=0)
-            left, right = 0, log_file.seek(0, 2)
-            log_size = right
-            while left <= right:
-                mid = (left + right) // 2
-                log_file.seek(mid)
-                log_file.readline()  # skip line fragment
-                line = log_file.readline()
-                if not line:  # EOF
-                    right = mid - 1
-                    continue
-                while True:
-                    try:
-                        log_time = datetime.fromisoformat(line.split(" ")[0]).replace(tzinfo=None)
-                    except ValueError:
-                        # in case it gets to split line fragment
-                        line = log_file.readline()
-                        if not line:
-                            return
-                        continue
-                    break
-                if log_time < on_datetime:
-                    left = mid + 1
-                elif log_time >= on_datetime:
-                    right = mid - 1
-            self.log.debug(
-                "Asked to open log at %s, the closest log line is %s. log size: %s, line: <%s>...",
-                on_datetime,
-                log_time,
-                log_size,
-                line[:100],
-            )
+            if on_datetime:
+                log_file.seek(offset := LogTimeIndex.for_log(str(self.system_log)).offset_of(on_datetime))
+                self.log.debug("Asked to open log at %s, the closest log line is at offset %s", on_datetime, offset)
             yield log_file
 
+    def read_system_log(self, start_time: datetime, end_time: Optional[datetime] = None) -> Iterator[str]:
+        """Iterate over lines of the system log logged from `start_time' until `end_time'."""
+        return LogTimeIndex.for_log(str(self.system_log)).read_lines(start_time=start_time, end_time=end_time)
+
     def start_decode_on_monitor_node_thread(self):
         self._decoding_backtraces_thread = threading.Thread(
             target=self.decode_backtrace, name="DecodeOnMonitorNodeThread", daemon=True
@@ -2043,64 +2038,142 @@ class BaseNode(AutoSshContainerMixin):
             raise ValueError(f"External backtrace service failed: {result.get('stderr', 'unknown error')}")
         return result["stdout"]
 
+    @cached_property
+    def backtrace_frames_cache(self) -> BacktraceFramesCache:
+        return BacktraceFramesCache(cache_dir=get_backtrace_cache_dir())
+
     def decode_backtrace(self):
-        while True:
-            event = None
-            try:
-                obj = self.test_config.DECODING_QUEUE.get(timeout=5)
-                if obj is None:
+        """Decode backtraces of events from the decoding queue in batches and publish the events.
+
+        Unique addresses of all backtraces of a batch which are not cached yet are decoded by a single `addr2line'
+        call per build id, the external service calls and the known issues lookups run in a pool of workers.
+        """
+        metrics = backtrace_decoding_metrics()
+        with ThreadPoolExecutor(
+            max_workers=BACKTRACE_DECODING_WORKERS, thread_name_prefix="DecodeBacktraceWorker"
+        ) as executor:
+            while True:
+                batch, closed = self._get_backtraces_batch()
+                if batch:
+                    self._decode_backtraces_batch(batch=batch, executor=executor)
+                    queue_depth = None
+                    with contextlib.suppress(NotImplementedError):
+                        queue_depth = self.test_config.DECODING_QUEUE.qsize()
+                    metrics.observe(
+                        queue_depth=queue_depth,
+                        batch_size=len(batch),
+                        latency=time.time() - min(obj.get("queued_at", time.time()) for obj in batch),
+                    )
+                if closed or (self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty()):
                     break
-                event = obj["event"]
-                self.log.debug("Event origin severity: %s", event.severity)
-                build_id = obj["build_id"]
-                raw_backtrace_oneline = " ".join(event.raw_backtrace.split("\n"))
 
-                decoded = None
-                if build_id:
-                    try:
-                        decoded = self._decode_via_external_service(build_id, event.raw_backtrace)
-                        self.log.debug("Decoded backtrace via external service for build_id=%s", build_id)
-                    except Exception as exc:  # noqa: BLE001
-                        self.log.warning("External backtrace service failed (%s), falling back to local addr2line", exc)
-
-                if decoded is None:
-                    scylla_debug_file = self.copy_scylla_debug_info(obj["node"], build_id)
-                    decoded = self.decode_backtrace_local(scylla_debug_file, raw_backtrace_oneline).stdout
-
-                event.backtrace = decoded
-                the_map = FindIssuePerBacktrace()
-                if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
-                    event.known_issue = issue_url
-                    skip_per_issue = SkipPerIssues(issue_url, self.parent_cluster.params)
-                    # If found issue is closed
-                    if not skip_per_issue.issues_opened():
-                        if skip_per_issue.issues_labeled():
-                            # If found issue has skip label, this issue was fixed but won't be backported to the tested branch.
-                            # So this reactor stall is expected and shouldn't fail the test
-                            # if this event severity is Error or Critical - decrease to warning.
-                            event.severity = (
-                                Severity.WARNING if event.severity.value > Severity.WARNING.value else event.severity
-                            )
-                        else:
-                            # If found issue has no skip label - increase severity to Error (if not).
-                            # A reason: the issue was fixed, and it is not expected to get this reactor stall
-                            event.severity = (
-                                Severity.ERROR if event.severity.value < Severity.ERROR.value else event.severity
-                            )
-                    self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
-            except queue.Empty:
-                pass
+    def _get_backtraces_batch(self) -> tuple[list[dict], bool]:
+        """Wait for an item in the decoding queue and take up to a batch of items, return them and if it's closed."""
+        batch = []
+        try:
+            obj = self.test_config.DECODING_QUEUE.get(timeout=5)
+            while obj is not None:
+                batch.append(obj)
+                if len(batch) >= BACKTRACE_DECODING_BATCH_SIZE:
+                    return batch, False
+                obj = self.test_config.DECODING_QUEUE.get_nowait()
+            return batch, True
+        except queue.Empty:
+            pass
+        except Exception as details:  # noqa: BLE001
+            self.log.error("failed to get backtraces to decode: %s", details)
+            if "is closed" in str(details):
+                return batch, True
+        return batch, False
+
+    def _decode_backtraces_batch(self, batch: list[dict], executor: ThreadPoolExecutor) -> None:
+        decoded = dict(enumerate(executor.map(self._decode_via_external_service_if_possible, batch)))
+        by_build_id = defaultdict(list)
+        for index, obj in enumerate(batch):
+            if decoded[index] is None:
+                by_build_id[obj["build_id"]].append(index)
+        for build_id, indexes in by_build_id.items():
+            try:
+                backtraces = self._decode_backtraces_local(
+                    node_name=batch[indexes[0]]["node"],
+                    build_id=build_id,
+                    raw_backtraces=[batch[index]["event"].raw_backtrace for index in indexes],
+                )
+                decoded.update(zip(indexes, backtraces))
+            except Exception as details:  # noqa: BLE001
+                self.log.error("failed to decode backtraces %s", details)
+        for obj, future in [
+            (obj, executor.submit(self._set_decoded_backtrace, obj["event"], decoded[index]))
+            for index, obj in enumerate(batch)
+        ]:
+            try:
+                future.result()
             except Exception as details:  # noqa: BLE001
                 self.log.error("failed to decode backtrace %s", details)
-                if "is closed" in str(details):
-                    break
             finally:
-                if event:
-                    event.ready_to_publish()
-                    event.publish()
+                obj["event"].ready_to_publish()
+                obj["event"].publish()
 
-            if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
-                break
+    def _decode_via_external_service_if_possible(self, obj: dict) -> Optional[str]:
+        if not (build_id := obj["build_id"]):
+            return None
+        try:
+            decoded = self._decode_via_external_service(build_id, obj["event"].raw_backtrace)
+            self.log.debug("Decoded backtrace via external service for build_id=%s", build_id)
+            return decoded
+        except Exception as exc:  # noqa: BLE001
+            self.log.warning("External backtrace service failed (%s), falling back to local addr2line", exc)
+        return None
+
+    def _decode_backtraces_local(self, node_name: str, build_id: Optional[str], raw_backtraces: list[str]) -> list:
+        """Decode the backtraces with `addr2line' on the monitor node, only the addresses which are not cached yet."""
+        scylla_debug_file = self.copy_scylla_debug_info(node_name, build_id)
+        backtraces_addresses = [get_backtrace_addresses(raw_backtrace) for raw_backtrace in raw_backtraces]
+        cache = self.backtrace_frames_cache if build_id else BacktraceFramesCache(cache_dir=None)
+        cache_key = build_id or scylla_debug_file
+        frames = cache.get(cache_key, itertools.chain.from_iterable(backtraces_addresses))
+        unresolved = list(
+            dict.fromkeys(
+                address for address in itertools.chain.from_iterable(backtraces_addresses) if address not in frames
+            )
+        )
+        for start in range(0, len(unresolved), ADDR2LINE_MAX_ADDRESSES):
+            addresses = unresolved[start : start + ADDR2LINE_MAX_ADDRESSES]
+            result = self.remoter.run(addr2line_command(scylla_debug_file, addresses), verbose=False)
+            if (decoded_frames := parse_addr2line_output(addresses, result.stdout)) is None:
+                self.log.warning("Unexpected output of addr2line, decode backtraces one by one")
+                return [
+                    self.decode_backtrace_local(scylla_debug_file, " ".join(addresses)).stdout
+                    for addresses in backtraces_addresses
+                ]
+            cache.update(cache_key, decoded_frames)
+            frames.update(decoded_frames)
+        self.log.debug("Decoded %s backtraces, %s addresses were not cached", len(raw_backtraces), len(unresolved))
+        return [compose_backtrace(addresses, frames) for addresses in backtraces_addresses]
+
+    def _set_decoded_backtrace(self, event: LogEvent, decoded: Optional[str]) -> None:
+        self.log.debug("Event origin severity: %s", event.severity)
+        if decoded is None:
+            return
+        event.backtrace = decoded
+        the_map = FindIssuePerBacktrace()
+        if issue_url := the_map.find_issue(backtrace_type=event.type, decoded_backtrace=event.backtrace):
+            event.known_issue = issue_url
+            skip_per_issue = SkipPerIssues(issue_url, self.parent_cluster.params)
+            # If found issue is closed
+            if not skip_per_issue.issues_opened():
+                if skip_per_issue.issues_labeled():
+                    # If found issue has skip label, this issue was fixed but won't be backported to the tested branch.
+                    # So this reactor stall is expected and shouldn't fail the test
+                    # if this event severity is Error or Critical - decrease to warning.
+                    event.severity = (
+                        Severity.WARNING if event.severity.value > Severity.WARNING.value else event.severity
+                    )
+                else:
+                    # If found issue has no skip label - increase severity to Error (if not).
+                    # A reason: the issue was fixed, and it is not expected to get this reactor stall
+                    event.severity = Severity.ERROR if event.severity.value < Severity.ERROR.value else event.severity
+            self.log.debug("Found issue for %s event: %s", event.event_id, event.known_issue)
 
     def copy_scylla_debug_info(self, node_name: str, build_id: str):
         """Copy scylla debug file from db-node to monitor-node.
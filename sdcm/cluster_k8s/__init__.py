@@ -88,6 +88,7 @@ from sdcm.utils.k8s import (
 from sdcm.utils.decorators import log_run_info, retrying
 from sdcm.utils.decorators import timeout as timeout_wrapper
 from sdcm.utils.k8s.chaos_mesh import ChaosMesh
+from sdcm.utils.k8s.informer import K8sObjectsInformer, cluster_scoped_key
 from sdcm.utils.remote_logger import (
     get_system_logging_thread,
     CertManagerLogger,
@@ -100,6 +101,7 @@ from sdcm.utils.remote_logger import (
 from sdcm.utils.sstable.load_utils import SstableLoadUtils
 from sdcm.utils.version_utils import ComparableScyllaOperatorVersion, ComparableScyllaVersion
 from sdcm.wait import wait_for
+from sdcm.exceptions import WaitForTimeoutError
 from sdcm.cluster_k8s.operator_monitoring import ScyllaOperatorLogMonitoring
 
 
@@ -1607,6 +1609,30 @@ class KubernetesCluster(metaclass=abc.ABCMeta):
     def k8s_core_v1_api(self) -> k8s.client.CoreV1Api:
         return KubernetesOps.core_v1_api(self.api_client)
 
+    @cached_property
+    def pods_informer(self) -> K8sObjectsInformer:
+        """Cache of all pods of the K8S cluster, shared by all pod containers of it."""
+        return K8sObjectsInformer(
+            name=f"PodsInformer-{self.region_name}",
+            list_func=KubernetesOps.core_v1_api(self.get_api_client()).list_pod_for_all_namespaces,
+            log_prefix=self.region_name,
+        ).ensure_started()
+
+    @cached_property
+    def nodes_informer(self) -> K8sObjectsInformer:
+        return K8sObjectsInformer(
+            name=f"NodesInformer-{self.region_name}",
+            list_func=KubernetesOps.core_v1_api(self.get_api_client()).list_node,
+            key_func=cluster_scoped_key,
+            log_prefix=self.region_name,
+        ).ensure_started()
+
+    def stop_informers(self, timeout: float = 10) -> None:
+        """Stop the informers which were started, reads go to the API after it."""
+        for name in ("pods_informer", "nodes_informer"):
+            if informer := self.__dict__.get(name):
+                informer.stop(timeout=timeout)
+
     @property
     def k8s_apps_v1_api(self) -> k8s.client.AppsV1Api:
         return KubernetesOps.apps_v1_api(self.api_client)
@@ -2017,12 +2043,19 @@ class BasePodContainer(cluster.BaseNode):
         pass
 
     @property
-    def _pod(self):
+    def _pod_key(self) -> tuple[str, str]:
+        return self.parent_cluster.namespace, self.name
+
+    def _read_pod(self):
         pods = KubernetesOps.list_pods(
             self.k8s_cluster, namespace=self.parent_cluster.namespace, field_selector=f"metadata.name={self.name}"
         )
         return pods[0] if pods else None
 
+    @property
+    def _pod(self):
+        return self.k8s_cluster.pods_informer.get(self._pod_key, fallback=self._read_pod)
+
     @property
     def pod_spec(self):
         if pod := self._pod:
@@ -2037,7 +2070,9 @@ class BasePodContainer(cluster.BaseNode):
 
     @property
     def _node(self):
-        return KubernetesOps.get_node(self.k8s_cluster, self.node_name)
+        read_node = partial(KubernetesOps.get_node, self.k8s_cluster, self.node_name)
+        # a just created K8S node could be not in the cache yet
+        return self.k8s_cluster.nodes_informer.get(self.node_name, fallback=read_node) or read_node()
 
     @property
     def _cluster_ip_service(self):
@@ -2111,14 +2146,32 @@ class BasePodContainer(cluster.BaseNode):
         """
         if timeout is None:
             timeout = self.pod_replace_timeout
-        wait_for(
-            lambda: self.k8s_pod_uid and self.k8s_pod_uid != ignore_uid,
+        self._wait_for_pod(
+            lambda pod: pod and pod.metadata.uid and str(pod.metadata.uid) != ignore_uid,
             timeout=timeout,
             text=f"Wait till host {self} get uid",
             throw_exc=throw_exc,
         )
         return self.k8s_pod_uid
 
+    def _wait_for_pod(self, predicate: Callable, timeout: float, text: str, throw_exc: bool) -> bool:
+        """Wait till `predicate(pod)' is true (the pod is None if it doesn't exist.)
+
+        The predicate is checked on every change of the pods cache, or polled if the cache can't be synced or it's
+        not kept up to date.
+        """
+        informer = self.k8s_cluster.pods_informer
+        if not informer.wait_for_sync() or not informer.fresh:
+            return wait_for(
+                lambda: predicate(self._read_pod()), timeout=timeout, step=5, text=text, throw_exc=throw_exc
+            )
+        self.log.debug("%s (timeout=%s)", text, timeout)
+        if informer.wait_for(lambda pods: predicate(pods.get(self._pod_key)), timeout=timeout):
+            return True
+        if throw_exc:
+            raise WaitForTimeoutError(f"{text}: timeout {timeout}s is exceeded")
+        return False
+
     def wait_for_k8s_node_readiness(self):
         wait_for(
             self._wait_for_k8s_node_readiness,
@@ -2141,18 +2194,13 @@ class BasePodContainer(cluster.BaseNode):
         return True
 
     def wait_for_pod_to_appear(self):
-        wait_for(
-            self._wait_for_pod_to_appear,
+        self._wait_for_pod(
+            lambda pod: pod is not None,
             text="Wait for pod to appear...",
             timeout=self.pod_readiness_timeout * 60,
             throw_exc=True,
         )
 
-    def _wait_for_pod_to_appear(self):
-        if self._pod is None:
-            raise RuntimeError("Pod is not there")
-        return True
-
     def wait_for_pod_readiness(self, pod_readiness_timeout_minutes: int = None):
         timeout = pod_readiness_timeout_minutes or self.pod_readiness_timeout
         KubernetesOps.wait_for_pod_readiness(
@@ -601,6 +601,7 @@ class EksCluster(KubernetesCluster, EksClusterCleanupMixin):
             self.pools[name].wait_for_nodes_readiness()
 
     def destroy(self):
+        self.stop_informers()
         EksClusterCleanupMixin.destroy(self)
 
     def get_ec2_instance_by_id(self, instance_id):
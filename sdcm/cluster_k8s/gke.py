@@ -447,6 +447,7 @@ class GkeCluster(KubernetesCluster):
         self.gcloud.run(f"container clusters get-credentials {self.short_cluster_name} --region {self.gce_region}")
 
     def destroy(self):
+        self.stop_informers()
         self.api_call_rate_limiter.stop()
 
     def deploy_scylla_manager(self, pool_name: str = None) -> None:
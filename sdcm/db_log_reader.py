@@ -12,13 +12,17 @@
 # Copyright (c) 2021 ScyllaDB
 
 
+import itertools
 import json
 import logging
 import os
 import re
+import threading
+import time
+import uuid
 from functools import cached_property
 from multiprocessing import Process, Event, Queue
-from typing import Optional
+from typing import Iterator, Optional
 
 from sdcm.remote.base import CommandRunner
 from sdcm.sct_events import Severity
@@ -26,6 +30,8 @@ from sdcm.sct_events.base import LogEvent
 from sdcm.sct_events.database import get_pattern_to_event_to_func_mapping, BACKTRACE_RE
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.common import make_threads_be_daemonic_by_default
+from sdcm.utils.inotify import InotifyWatcher
+from sdcm.utils.pattern_matcher import ChunkPrefilter, MultiPatternMatcher, compile_pattern
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +40,13 @@ LOGGER = logging.getLogger(__name__)
 # but they would still be in the logs
 LOG_LINE_MAX_PROCESSING_SIZE = 1024 * 5
 
+# size of a single read of the log in the chunked tailing mode
+LOG_READ_CHUNK_SIZE = 4 * 1024 * 1024
+# the longest time to block waiting for log changes before checking if the reader was stopped
+LOG_CHANGE_WAIT_TIMEOUT = 1
+
+ONE_LINE_BACKTRACE_RE = re.compile("backtrace:|report: at", flags=re.IGNORECASE)
+
 
 class DbLogReader(Process):
     EXCLUDE_FROM_LOGGING = [
@@ -64,6 +77,7 @@ class DbLogReader(Process):
         log_lines: bool,
         backtrace_stall_decoding: bool = True,
         backtrace_decoding_disable_regex: Optional[str] = None,
+        chunked_tailing: bool = False,
     ):
         self._system_log = system_log
         self._system_event_patterns = system_event_patterns
@@ -84,12 +98,22 @@ class DbLogReader(Process):
         self._remoter = remoter
         self._skipped_end_line = 0
         self._build_id = None
+        self._chunked_tailing = chunked_tailing
+        self._log_fd = None
         super().__init__(name=self.__class__.__name__, daemon=True)
 
     @cached_property
     def _continuous_event_patterns(self):
         return get_pattern_to_event_to_func_mapping(node=self._node_name)
 
+    @cached_property
+    def _continuous_event_matcher(self) -> MultiPatternMatcher:
+        return MultiPatternMatcher(item.pattern for item in self._continuous_event_patterns)
+
+    @cached_property
+    def _system_event_matcher(self) -> MultiPatternMatcher:
+        return MultiPatternMatcher(pattern for pattern, _ in self._system_event_patterns)
+
     def _should_skip_decoding(self, event: LogEvent) -> bool:
         """Check if backtrace decoding should be skipped for this event.
 
@@ -112,10 +136,8 @@ class DbLogReader(Process):
 
         return False
 
-    def _read_and_publish_events(self) -> None:  # noqa: PLR0912
-        """Search for all known patterns listed in `sdcm.sct_events.database.SYSTEM_ERROR_EVENTS'."""
-
-        backtraces = []
+    def _read_lines(self) -> Iterator[tuple[int, str]]:
+        """Reopen the log on every call and iterate over the new lines in text mode."""
         index = 0
 
         if not os.path.exists(self._system_log):
@@ -135,81 +157,159 @@ class DbLogReader(Process):
                 else:
                     self._skipped_end_line += 1
                     continue
-                try:
-                    json_log = None
-                    if line[0] == "{":
-                        try:
-                            json_log = json.loads(line)
-                        except Exception:  # noqa: BLE001
-                            pass
-
-                    if self._log_lines:
-                        line = line.strip()  # noqa: PLW2901
-                        for pattern in self.EXCLUDE_FROM_LOGGING:
-                            if pattern in line:
-                                break
-                        else:
-                            LOGGER.debug(line)
-
-                    if json_log:
-                        continue
-
-                    if match := self.BUILD_ID_REGEX.search(line):
-                        self._build_id = match.groups()[0]
-                        LOGGER.debug("Found build-id: %s", self._build_id)
-
-                    one_line_backtrace = []
-                    if ("backtrace:" in line.lower() or "report: at" in line.lower()) and "0x" in line:
-                        # This part handles the backtrases are printed in one line.
-                        # Example:
-                        # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
-                        # (Operation timed out for system.paxos - received only 0 responses from 1 CL=ONE.),
-                        # backtrace:   0x3316f4d#012  0x2e2d177#012  0x189d397#012  0x2e76ea0#012  0x2e770af#012
-                        # 0x2eaf065#012  0x2ebd68c#012  0x2e48d5d#012  /opt/scylladb/libreloc/libpthread.so.0+0x94e1#012
-                        splitted_line = re.split("backtrace:|report: at", line, flags=re.IGNORECASE)
-                        for trace_line in splitted_line[1].split():
-                            if trace_line.startswith("0x") or "scylladb/lib" in trace_line:
-                                one_line_backtrace.append(trace_line)
-
-                    elif (match := BACKTRACE_RE.search(line)) and backtraces:
-                        data = match.groupdict()
-                        if data["other_bt"]:
-                            backtraces[-1]["backtrace"] += [data["other_bt"].strip()]
-                        if data["scylla_bt"]:
-                            backtraces[-1]["backtrace"] += [data["scylla_bt"].strip()]
-
-                    # for each line, if it matches a continuous event pattern,
-                    # call the appropriate function with the class tied to that pattern
-                    for item in self._continuous_event_patterns:
-                        if event_match := item.pattern.search(line):
-                            item.period_func(match=event_match)
-                            break
-
-                    skip_to_next_line = False
-                    # for each line use all regexes to match, and if found send an event
-                    for pattern, event in self._system_event_patterns:
-                        if pattern.search(line):
-                            if event.severity == Severity.SUPPRESS:
-                                skip_to_next_line = True
-                                break
-                            cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
-                            backtraces.append(dict(event=cloned_event, backtrace=[]))
-                            break  # Stop iterating patterns to avoid creating two events for one line of the log
-
-                    if skip_to_next_line:
-                        continue
-
-                    if one_line_backtrace and backtraces:
-                        backtraces[-1]["backtrace"] = one_line_backtrace
-                except Exception:
-                    LOGGER.exception(
-                        "Processing of %s line of %s failed, line content:\n%s", index, self._system_log, line
-                    )
+                yield index, line
 
             if index:
                 self._last_line_no = index
                 self._last_log_position = db_file.tell()
 
+    @cached_property
+    def _chunk_prefilter(self) -> Optional[ChunkPrefilter]:
+        if self._log_lines:  # all lines should be decoded to be logged
+            return None
+        return ChunkPrefilter.from_patterns(
+            patterns=[
+                *self._continuous_event_matcher.patterns,
+                *self._system_event_matcher.patterns,
+                compile_pattern(self.BUILD_ID_REGEX),
+            ],
+            # one-line backtraces and `BACKTRACE_RE'
+            ignorecase_literals=[b"0x"],
+        )
+
+    def _open_system_log(self) -> bool:
+        """Keep the log opened between the reads, reopen it only if the file was replaced."""
+        try:
+            path_stat = os.stat(self._system_log)
+        except FileNotFoundError:
+            return False
+        if self._log_fd is not None:
+            if os.path.samestat(os.fstat(self._log_fd), path_stat):
+                return True
+            self._close_system_log()
+        self._log_fd = os.open(self._system_log, os.O_RDONLY)
+        return True
+
+    def _close_system_log(self) -> None:
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def _tail_lines(self) -> Iterator[tuple[int, str]]:
+        """Read new bytes in big chunks from the kept opened log, and decode only lines which pass the prefilter."""
+        if not self._open_system_log():
+            return
+
+        pending = b""
+        while data := os.pread(self._log_fd, LOG_READ_CHUNK_SIZE, self._last_log_position + len(pending)):
+            pending += data
+            if end := pending.rfind(b"\n") + 1:
+                self._skipped_end_line = 0
+                yield from self._split_chunk(pending[:end])
+                pending = pending[end:]
+            if len(data) < LOG_READ_CHUNK_SIZE:
+                break
+
+        # Postpone processing line with no ending in case if half of line is written to the disc
+        if pending:
+            if self._skipped_end_line > 20:
+                self._skipped_end_line = 0
+                yield from self._split_chunk(pending)
+            else:
+                self._skipped_end_line += 1
+
+    def _split_chunk(self, chunk: bytes) -> Iterator[tuple[int, str]]:
+        """Iterate over the lines of the chunk which pass the prefilter, then move the read position after it."""
+        first_index = self._last_line_no + 1
+        if (prefilter := self._chunk_prefilter) is None:
+            line_starts = itertools.accumulate((len(line) + 1 for line in chunk.split(b"\n")[:-1]), initial=0)
+        else:
+            line_starts = prefilter.line_starts(chunk)
+        index, previous_start = first_index, 0
+        for start in line_starts:
+            if start >= len(chunk):
+                break
+            index += chunk.count(b"\n", previous_start, start)
+            previous_start = start
+            end = chunk.find(b"\n", start) + 1 or len(chunk)
+            # trim to avoid filling the memory when lot of long line is writen
+            line = chunk[start : min(end, start + LOG_LINE_MAX_PROCESSING_SIZE * 4)].decode(errors="replace")
+            yield index, line[:LOG_LINE_MAX_PROCESSING_SIZE]
+        self._last_line_no = first_index + chunk.count(b"\n") - (1 if chunk.endswith(b"\n") else 0)
+        self._last_log_position += len(chunk)
+
+    def _process_line(self, index: int, line: str, backtraces: list[dict]) -> None:
+        json_log = None
+        if line[0] == "{":
+            try:
+                json_log = json.loads(line)
+            except Exception:  # noqa: BLE001
+                pass
+
+        if self._log_lines:
+            line = line.strip()
+            for pattern in self.EXCLUDE_FROM_LOGGING:
+                if pattern in line:
+                    break
+            else:
+                LOGGER.debug(line)
+
+        if json_log:
+            return
+
+        if match := self.BUILD_ID_REGEX.search(line):
+            self._build_id = match.groups()[0]
+            LOGGER.debug("Found build-id: %s", self._build_id)
+
+        one_line_backtrace = []
+        if "0x" in line and ONE_LINE_BACKTRACE_RE.search(line):
+            # This part handles the backtrases are printed in one line.
+            # Example:
+            # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
+            # (Operation timed out for system.paxos - received only 0 responses from 1 CL=ONE.),
+            # backtrace:   0x3316f4d#012  0x2e2d177#012  0x189d397#012  0x2e76ea0#012  0x2e770af#012
+            # 0x2eaf065#012  0x2ebd68c#012  0x2e48d5d#012  /opt/scylladb/libreloc/libpthread.so.0+0x94e1#012
+            splitted_line = ONE_LINE_BACKTRACE_RE.split(line)
+            for trace_line in splitted_line[1].split():
+                if trace_line.startswith("0x") or "scylladb/lib" in trace_line:
+                    one_line_backtrace.append(trace_line)
+
+        elif (match := BACKTRACE_RE.search(line)) and backtraces:
+            data = match.groupdict()
+            if data["other_bt"]:
+                backtraces[-1]["backtrace"] += [data["other_bt"].strip()]
+            if data["scylla_bt"]:
+                backtraces[-1]["backtrace"] += [data["scylla_bt"].strip()]
+
+        # for each line, if it matches a continuous event pattern,
+        # call the appropriate function with the class tied to that pattern
+        item_index, event_match = self._continuous_event_matcher.search(line)
+        if event_match:
+            self._continuous_event_patterns[item_index].period_func(match=event_match)
+
+        # for each line find the first regex (in the patterns order) which matches, and send an event
+        event_index, event_match = self._system_event_matcher.search(line)
+        if event_match:
+            event = self._system_event_patterns[event_index][1]
+            if event.severity == Severity.SUPPRESS:
+                return
+            cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
+            backtraces.append(dict(event=cloned_event, backtrace=[]))
+
+        if one_line_backtrace and backtraces:
+            backtraces[-1]["backtrace"] = one_line_backtrace
+
+    def _read_and_publish_events(self) -> None:
+        """Search for all known patterns listed in `sdcm.sct_events.database.SYSTEM_ERROR_EVENTS'."""
+
+        backtraces = []
+
+        for index, line in self._tail_lines() if self._chunked_tailing else self._read_lines():
+            try:
+                self._process_line(index=index, line=line, backtraces=backtraces)
+            except Exception:
+                LOGGER.exception("Processing of %s line of %s failed, line content:\n%s", index, self._system_log, line)
+
         traces_count = 0
         for backtrace in backtraces:
             backtrace["event"].raw_backtrace = "\n".join(backtrace["backtrace"])
@@ -238,6 +338,7 @@ class DbLogReader(Process):
                         "node": self._node_name,
                         "build_id": self._build_id,
                         "event": event,
+                        "queued_at": time.time(),
                     }
                 )
             except Exception:
@@ -251,20 +352,57 @@ class DbLogReader(Process):
         """
         LOGGER.debug(
             "Logging for node %s is started with following configuration:\nsystem_log=%s"
-            "\nlog_lines=%s\ndecoding_queue=%s",
+            "\nlog_lines=%s\ndecoding_queue=%s\nchunked_tailing=%s",
             self._node_name,
             self._system_log,
             self._log_lines,
             self._decoding_queue is not None,
+            self._chunked_tailing,
         )
         make_threads_be_daemonic_by_default()
-        while not self._terminate_event.wait(0.1):
-            try:
-                self._read_and_publish_events()
-            except (SystemExit, KeyboardInterrupt) as ex:
-                LOGGER.debug("db_log_reader_thread() stopped by %s", ex.__class__.__name__)
-            except Exception:
-                LOGGER.exception("failed to read db log")
+        watcher = self._create_log_watcher() if self._chunked_tailing else None
+        try:
+            while not self._terminate_event.wait(0.1):
+                try:
+                    self._read_and_publish_events()
+                except (SystemExit, KeyboardInterrupt) as ex:
+                    LOGGER.debug("db_log_reader_thread() stopped by %s", ex.__class__.__name__)
+                except Exception:
+                    LOGGER.exception("failed to read db log")
+                # a postponed partial line should be re-checked even if the log isn't changed anymore
+                if watcher and not self._skipped_end_line:
+                    self._wait_for_log_change(watcher)
+        finally:
+            if watcher:
+                watcher.close()
+            self._close_system_log()
+
+    @cached_property
+    def _system_log_path(self) -> str:
+        return os.path.abspath(self._system_log)
+
+    def _watch_log(self, watcher: InotifyWatcher) -> bool:
+        try:
+            # watch the directory, since the log could be not created yet or replaced
+            watcher.add_watch(os.path.dirname(self._system_log_path))
+        except OSError as exc:
+            LOGGER.debug("Failed to watch %s, fallback to polling: %s", self._system_log, exc)
+            return False
+        return True
+
+    def _create_log_watcher(self) -> Optional[InotifyWatcher]:
+        if not (watcher := InotifyWatcher.create()):
+            return None
+        if not self._watch_log(watcher):
+            watcher.close()
+            return None
+        return watcher
+
+    def _wait_for_log_change(self, watcher: InotifyWatcher) -> None:
+        log_name = os.path.basename(self._system_log)
+        while not self._terminate_event.is_set():
+            if any(name == log_name for _, _, name in watcher.wait(timeout=LOG_CHANGE_WAIT_TIMEOUT)):
+                return
 
     def filter_backtraces(self, backtrace):
         # A filter function to attach the backtrace to the correct error and not to the backtraces.
@@ -289,3 +427,187 @@ class DbLogReader(Process):
 
     def stop(self):
         self._terminate_event.set()
+
+
+class PooledDbLogReader:
+    """Handle of a node log registered in `DbLogReaderPool', has the same start/stop interface as `DbLogReader'."""
+
+    def __init__(self, worker: "DbLogReaderWorker", reader_kwargs: dict, pool_lock: threading.Lock):
+        self._worker = worker
+        self._reader_kwargs = reader_kwargs
+        self._pool_lock = pool_lock
+        # a node can be registered again (e.g., after a replacement) before the previous handle is stopped
+        self.reader_id = uuid.uuid4().hex
+        self._started = False
+        self._stopped = False
+
+    @property
+    def node_name(self) -> str:
+        return self._reader_kwargs["node_name"]
+
+    def start(self) -> None:
+        self._worker.add_reader(reader_id=self.reader_id, reader_kwargs=self._reader_kwargs)
+        self._started = True
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+        if self._started:
+            self._worker.remove_reader(reader_id=self.reader_id)
+        with self._pool_lock:
+            self._worker.readers_count -= 1
+        self._stopped = True
+
+    def is_alive(self) -> bool:
+        return self._started and not self._stopped and self._worker.is_alive()
+
+
+class DbLogReaderWorker(Process):
+    """Process which tails logs of many db nodes, each one of them by a `DbLogReader' object with own offsets.
+
+    Readers are added and removed by commands sent through a queue.  Chunked tailing readers are read only after
+    inotify reports a change of their log, other ones (and the ones with a postponed partial line) are polled.
+    """
+
+    def __init__(self, index: int, system_event_patterns: list, decoding_queue: Optional[Queue]):
+        self._system_event_patterns = system_event_patterns
+        self._decoding_queue = decoding_queue
+        self._commands = Queue()
+        self._terminate_event = Event()
+        self.readers_count = 0  # number of the logs assigned to this worker, maintained by the parent process
+        super().__init__(name=f"{self.__class__.__name__}-{index}", daemon=True)
+
+    def add_reader(self, reader_id: str, reader_kwargs: dict) -> None:
+        self._commands.put(("add", (reader_id, reader_kwargs)))
+
+    def remove_reader(self, reader_id: str) -> None:
+        self._commands.put(("remove", reader_id))
+
+    def _handle_commands(self, readers: dict[str, DbLogReader], watcher: Optional[InotifyWatcher]) -> list[str]:
+        """Apply the queued commands to `readers' (keyed by reader ID) and return IDs of the added readers."""
+        added = []
+        while not self._commands.empty():
+            command, arg = self._commands.get()
+            if command == "add":
+                reader_id, reader_kwargs = arg
+                reader = DbLogReader(
+                    remoter=None,
+                    system_event_patterns=self._system_event_patterns,
+                    decoding_queue=self._decoding_queue,
+                    **reader_kwargs,
+                )
+                readers[reader_id] = reader
+                added.append(reader_id)
+                if watcher and reader._chunked_tailing and not reader._watch_log(watcher):
+                    reader._chunked_tailing = False
+                LOGGER.debug("%s: start reading %s of node %s", self.name, reader._system_log, reader._node_name)
+            elif command == "remove" and (reader := readers.pop(arg, None)):
+                reader._close_system_log()
+                LOGGER.debug("%s: stop reading %s of node %s", self.name, reader._system_log, reader._node_name)
+        return added
+
+    @raise_event_on_failure
+    def run(self):
+        make_threads_be_daemonic_by_default()
+        readers: dict[str, DbLogReader] = {}
+        watcher = InotifyWatcher.create()
+        try:
+            due = set()
+            while not self._terminate_event.is_set():
+                due.update(self._handle_commands(readers=readers, watcher=watcher))
+                for reader_id in due:
+                    if reader := readers.get(reader_id):
+                        try:
+                            reader._read_and_publish_events()
+                        except Exception:
+                            LOGGER.exception("failed to read db log of %s", reader._node_name)
+                due = self._wait_for_logs_changes(readers=readers, watcher=watcher)
+        finally:
+            if watcher:
+                watcher.close()
+            for reader in readers.values():
+                reader._close_system_log()
+
+    def _wait_for_logs_changes(self, readers: dict[str, DbLogReader], watcher: Optional[InotifyWatcher]) -> set[str]:
+        """Return IDs of the readers which logs should be read now."""
+        polled = {
+            reader_id
+            for reader_id, reader in readers.items()
+            if not (watcher and reader._chunked_tailing) or reader._skipped_end_line
+        }
+        timeout = 0.1 if polled or not watcher else LOG_CHANGE_WAIT_TIMEOUT
+        if not watcher:
+            self._terminate_event.wait(timeout)
+            return polled
+        changed_logs = {os.path.join(path, name) for path, _, name in watcher.wait(timeout=timeout)}
+        if changed_logs:
+            # let more data to be written, to read it in bigger chunks
+            self._terminate_event.wait(0.1)
+            changed_logs.update(os.path.join(path, name) for path, _, name in watcher.read_events())
+        return polled | {reader_id for reader_id, reader in readers.items() if reader._system_log_path in changed_logs}
+
+    def stop(self) -> None:
+        self._terminate_event.set()
+
+
+class DbLogReaderPool:
+    """Fixed set of `DbLogReaderWorker' processes shared by all db nodes instead of a `DbLogReader' process per node.
+
+    Workers are started on demand, up to `size', and every new node log is assigned to the least loaded one.
+    """
+
+    def __init__(self, size: int, system_event_patterns: list, decoding_queue: Optional[Queue]):
+        self.size = max(size, 1)
+        self._system_event_patterns = system_event_patterns
+        self._decoding_queue = decoding_queue
+        self._workers: list[DbLogReaderWorker] = []
+        self._lock = threading.Lock()
+
+    def _get_worker(self) -> DbLogReaderWorker:
+        with self._lock:
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            if len(self._workers) < self.size:
+                worker = DbLogReaderWorker(
+                    index=len(self._workers),
+                    system_event_patterns=self._system_event_patterns,
+                    decoding_queue=self._decoding_queue,
+                )
+                worker.start()
+                self._workers.append(worker)
+            else:
+                worker = min(self._workers, key=lambda worker: worker.readers_count)
+            worker.readers_count += 1
+            return worker
+
+    def register(  # noqa: PLR0913
+        self,
+        system_log: str,
+        node_name: str,
+        log_lines: bool,
+        backtrace_stall_decoding: bool = True,
+        backtrace_decoding_disable_regex: Optional[str] = None,
+        chunked_tailing: bool = False,
+    ) -> PooledDbLogReader:
+        return PooledDbLogReader(
+            worker=self._get_worker(),
+            reader_kwargs=dict(
+                system_log=system_log,
+                node_name=node_name,
+                log_lines=log_lines,
+                backtrace_stall_decoding=backtrace_stall_decoding,
+                backtrace_decoding_disable_regex=backtrace_decoding_disable_regex,
+                chunked_tailing=chunked_tailing,
+            ),
+            pool_lock=self._lock,
+        )
+
+    def stop(self, timeout: float = 10) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                LOGGER.warning("%s is still alive after %s seconds, killing it", worker.name, timeout)
+                worker.kill()
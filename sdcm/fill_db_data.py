@@ -31,6 +31,7 @@ from cassandra.protocol import ProtocolException
 
 from sdcm.tester import ClusterTester
 from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.range_digest import TableRangeDigests, diff_range_digests
 from sdcm.utils.decorators import retrying
 from sdcm.utils.cdc.options import CDC_LOGTABLE_SUFFIX
 from sdcm.utils.version_utils import ComparableScyllaVersion
@@ -55,6 +56,9 @@ class FillDatabaseData(ClusterTester):
     NEW_SORTING_ORDER_WITH_SECONDARY_INDEXES_ENTERPRISE_MIN_VERSION = "2021.1.dev"
 
     base_ks = "keyspace_fill_db_data"
+    DIGEST_RANGES = 8  # tables of the verification items are small, a few token ranges are enough
+    # Digests of tables of the verification items taken on the last verification in digest mode
+    verified_items_digests = None
     # List of dictionaries for all items tables and their data
     all_verification_items = [
         {
@@ -3705,10 +3709,12 @@ class FillDatabaseData(ClusterTester):
             except AssertionError as err:
                 LOGGER.error("content was differ %s", err)
 
-    def run_db_queries(self, session, default_fetch_size):
+    def run_db_queries(self, session, default_fetch_size, items_to_verify=None):
         self.log.info("Start to running queries")
 
         for test_num, item in enumerate(self.all_verification_items):
+            if items_to_verify is not None and test_num not in items_to_verify:
+                continue
             test_name = item.get("name", "Test #" + str(test_num))
             # Some queries contains statement of switch keyspace, reset keyspace at the beginning
             session.set_keyspace(self.base_ks)
@@ -3783,14 +3789,71 @@ class FillDatabaseData(ClusterTester):
             # Create all tables according the above list
             self.cql_create_tables(session)
 
-    def verify_db_data(self):
+    def get_items_digests(self, session):
+        """Return digests of token ranges of tables of the verification items by the item number (None if failed.)"""
+        items_digests = {}
+        for test_num, item in enumerate(self.all_verification_items):
+            if not item["skip"] and ("skip_condition" not in item or eval(str(item["skip_condition"]))):
+                tables = [
+                    table.lower() for table in map(self._get_table_name_from_query, item["create_tables"]) if table
+                ]
+                try:
+                    items_digests[test_num] = {
+                        table: TableRangeDigests(
+                            session=session, keyspace=self.base_ks, table=table, ranges_number=self.DIGEST_RANGES
+                        ).compute()
+                        for table in tables
+                    }
+                except Exception as exc:  # noqa: BLE001
+                    LOGGER.debug("Failed to compute digests of %s tables: %s", tables, exc)
+                    items_digests[test_num] = None
+        return items_digests
+
+    def get_items_with_changed_data(self, items_digests):
+        """Return numbers of the verification items with tables changed since the last verification."""
+        changed_items = set()
+        for test_num, digests in items_digests.items():
+            verified_digests = self.verified_items_digests.get(test_num)
+            if digests is None or digests != verified_digests:
+                changed_items.add(test_num)
+                item = self.all_verification_items[test_num]
+                for table, table_digests in (digests or {}).items():
+                    if mismatching_ranges := diff_range_digests(table_digests, (verified_digests or {}).get(table, {})):
+                        LOGGER.debug(
+                            'Test "%s": %s token ranges of %s table changed',
+                            item.get("name", "Test #" + str(test_num)),
+                            len(mismatching_ranges),
+                            table,
+                        )
+        return changed_items
+
+    def verify_db_data(self, digest_mode=False):
+        """
+        Run queries of the verification items and check their results.
+
+        In digest mode, digests of token ranges of the tables are compared with the digests taken on the previous
+        verification in digest mode, and the queries are run only for the items with changed tables (or tables
+        which failed to be digested.)  The first verification runs all queries.  Note, that the digest mode checks
+        that data wasn't changed, while the queries of the items with unchanged tables aren't run at all.
+        """
         # Prepare connection
         node = self.db_cluster.nodes[0]
         with self.db_cluster.cql_connection_patient(node, keyspace=self.base_ks, connect_timeout=600) as session:
             # override driver consistency level
             session.default_consistency_level = ConsistencyLevel.QUORUM
             session.default_timeout = 60 * 5
-            self.run_db_queries(session, session.default_fetch_size)
+            items_to_verify = items_digests = None
+            if digest_mode:
+                with self._execute_and_log("Computed digests of tables in {} seconds"):
+                    items_digests = self.get_items_digests(session)
+                if self.verified_items_digests is not None:
+                    items_to_verify = self.get_items_with_changed_data(items_digests)
+                    self.log.info(
+                        "Data of %s of %s verification items changed", len(items_to_verify), len(items_digests)
+                    )
+            self.run_db_queries(session, session.default_fetch_size, items_to_verify=items_to_verify)
+            if digest_mode:
+                self.verified_items_digests = items_digests
 
     def paged_query(self, keyspace: str):
         # Prepare connection
@@ -11,18 +11,15 @@
 #
 # Copyright (c) 2016 ScyllaDB
 
-import os
 import re
 from abc import abstractmethod, ABCMeta
-import time
 import logging
 from typing import NamedTuple
 
 from sdcm.prometheus import NemesisMetrics
 from sdcm.utils.common import FileFollowerThread, convert_metric_to_ms
-from sdcm.utils.hdrhistogram import (
-    make_hdrhistogram_summary_from_log_line,
-)
+from sdcm.utils.hdrhistogram import HdrLogLineDecoder
+from sdcm.utils.log_follower import get_log_follower_reactor
 
 LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +68,7 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
         self.cpu_idx = cpu_idx
         self.metrics_positions = self.metrics_position_in_log()
         self.keyspace = keyspace
+        self._followed_file = None
         self.init()
 
     def init(self):
@@ -109,31 +107,35 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
 
         return value
 
-    def run(self):
-        while not self.stopped():
-            exists = os.path.isfile(self.stress_log_filename)
-            if not exists:
-                time.sleep(0.5)
-                continue
+    def start(self):
+        """Follow the stress log by the shared `LogFollowerReactor' instead of a thread per exporter.
 
-            for line in self.follow_file(self.stress_log_filename):
-                if self.stopped():
-                    break
+        The returned future is resolved after `stop()', once the complete lines left in the log are handled.
+        """
+        self._followed_file = get_log_follower_reactor().follow(path=self.stress_log_filename, on_line=self.handle_line)
+        self.future = self._followed_file.future
+        return self.future
+
+    def stop(self):
+        super().stop()
+        if self._followed_file is not None:
+            get_log_follower_reactor().unfollow(self._followed_file)
 
-                if self.skip_line(line=line):
-                    continue
+    def handle_line(self, line: str) -> None:
+        if self.skip_line(line=line):
+            return
 
-                cols = self.split_line(line=line)
+        cols = self.split_line(line=line)
 
-                for metric in self.METRIC_NAMES:
-                    if metric_value := self.get_metric_value(columns=cols, metric_name=metric):
-                        self.set_metric(metric, convert_metric_to_ms(str(metric_value)))
+        for metric in self.METRIC_NAMES:
+            if metric_value := self.get_metric_value(columns=cols, metric_name=metric):
+                self.set_metric(metric, convert_metric_to_ms(str(metric_value)))
 
-                if ops := self.get_metric_value(columns=cols, metric_name="ops"):
-                    self.set_metric("ops", float(ops))
+        if ops := self.get_metric_value(columns=cols, metric_name="ops"):
+            self.set_metric("ops", float(ops))
 
-                if errors := self.get_metric_value(columns=cols, metric_name="errors"):
-                    self.set_metric("errors", int(errors))
+        if errors := self.get_metric_value(columns=cols, metric_name="errors"):
+            self.set_metric("errors", int(errors))
 
 
 class CassandraStressExporter(StressExporter):
@@ -259,6 +261,7 @@ class LatteExporter(StressExporter):
 
 class CassandraStressHDRExporter(StressExporter):
     METRIC_NAMES = ["lat_perc_50", "lat_perc_90", "lat_perc_99", "lat_perc_999", "lat_perc_9999"]
+    HDR_PERCENTILES = [50, 90, 99, 99.9, 99.99]  # in the order of `METRIC_NAMES'
 
     def __init__(
         self,
@@ -272,8 +275,8 @@ class CassandraStressHDRExporter(StressExporter):
         keyspace: str = "",
     ):
         super().__init__(instance_name, metrics, stress_operation, stress_log_filename, loader_idx, cpu_idx, keyspace)
-        self.log_start_time = 0
         self.hdr_tags = hdr_tags
+        self.hdr_decoder = HdrLogLineDecoder(hdr_tags=hdr_tags, percentiles=self.HDR_PERCENTILES)
         self.current_line_hdr_tag = ""
 
     def create_metrix_gauge(self):
@@ -294,11 +297,9 @@ class CassandraStressHDRExporter(StressExporter):
         return gauge_name
 
     def metrics_position_in_log(self) -> HDRPositions:
-        return HDRPositions(lat_perc_50=3, lat_perc_90=4, lat_perc_99=6, lat_perc_999=7, lat_perc_9999=8)
+        return HDRPositions(lat_perc_50=0, lat_perc_90=1, lat_perc_99=2, lat_perc_999=3, lat_perc_9999=4)
 
     def skip_line(self, line: str) -> bool:
-        if match := re.match(r"^#\[StartTime:\s(\d+)", line):
-            self.log_start_time = int(match.group(1))
         for hdr_tag in self.hdr_tags:
             if line.startswith(f"Tag={hdr_tag}"):
                 return False
@@ -310,17 +311,14 @@ class CassandraStressHDRExporter(StressExporter):
         ).set(value)
 
     def split_line(self, line: str) -> list:
-        summary_data = make_hdrhistogram_summary_from_log_line(
-            hdr_tags=self.hdr_tags,
-            stress_operation=self.stress_operation,
-            log_line=line,
-            hst_log_start_time=self.log_start_time,
-        )
-        if not summary_data:
-            LOGGER.warning("Got empty HDR histogram summary from line: %s", line.strip())
+        if not (decoded := self.hdr_decoder.decode(line)):
+            return []
+        self.current_line_hdr_tag, percentiles = decoded
+        if all(value is None for value in percentiles.values()):
+            LOGGER.warning("Got empty HDR histogram from line: %s", line.strip())
             return []
-        self.current_line_hdr_tag, percentiles = summary_data.popitem()
-        return list(percentiles.values())
+        # in the order of `metrics_position_in_log()', a missing value is None and its metric is not set
+        return [percentiles[perc] for perc in self.HDR_PERCENTILES]
 
 
 class LatteHDRExporter(CassandraStressHDRExporter):
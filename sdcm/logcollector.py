@@ -21,7 +21,7 @@ import logging
 import datetime
 import tempfile
 import traceback
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from typing import Optional, Tuple, List
 from pathlib import Path
 from functools import cached_property
@@ -68,6 +68,7 @@ from sdcm.utils.decorators import retrying
 from sdcm.utils.docker_utils import get_docker_bridge_gateway
 from sdcm.utils.k8s import KubernetesOps
 from sdcm.utils.s3_remote_uploader import upload_remote_files_directly_to_s3
+from sdcm.utils.streaming_archive import ZSTD_COMPRESS_PROGRAM, StreamingArchiveUpload
 from sdcm.utils.gce_utils import gce_public_addresses, gce_private_addresses
 from sdcm.localhost import LocalHost
 from sdcm.cloud_api_client import ScyllaCloudAPIClient
@@ -816,12 +817,18 @@ class LogCollector:
                     LOGGER.error(
                         "Error occured during collecting of %s on host: %s\n%s", log_entity.name, node.name, details
                     )
+            if archive and os.path.isdir(local_node_dir):
+                archive.add(local_node_dir, arcname=os.path.join(local_dir_name, node.name))
+                streamed.add(node.name)
 
         LOGGER.debug("Nodes list %s", [node.name for node in self.nodes])
 
         if not self.nodes and not os.listdir(self.local_dir):
             LOGGER.warning("No nodes found for %s cluster. Logs will not be collected", self.cluster_log_type)
             return []
+        local_dir_name = os.path.basename(self.local_dir)
+        archive = self.start_streaming_archive(f"{local_dir_name}.tar.zst") if self.nodes else None
+        streamed = set()
         if workers_number := len(self.nodes):
             workers_number = min(workers_number, 30)
             try:
@@ -833,8 +840,19 @@ class LogCollector:
 
         if not os.listdir(self.local_dir):
             LOGGER.warning("Directory %s is empty", self.local_dir)
+            if archive:
+                archive.abort()
             return []
 
+        if archive:
+            # Files of the whole cluster (e.g., schema.log), logs of inactive nodes and of nodes which timed out
+            for name in sorted(set(os.listdir(self.local_dir)) - streamed):
+                archive.add(os.path.join(self.local_dir, name), arcname=os.path.join(local_dir_name, name))
+            if s3_link := archive.finish():
+                remove_files(self.local_dir)
+                return [s3_link]
+            LOGGER.warning("Failed to upload %s while collecting, archive it and upload again", archive.archive_name)
+
         final_archive = self.archive_to_tarfile(self.local_dir)
         if not final_archive:
             return []
@@ -843,6 +861,18 @@ class LogCollector:
         remove_files(final_archive)
         return [s3_link]
 
+    def start_streaming_archive(self, archive_name: str) -> Optional[StreamingArchiveUpload]:
+        """Start an upload of an archive which is written while logs of the nodes are collected."""
+        try:
+            return StreamingArchiveUpload(
+                archive_name=archive_name, dest_dir=f"{self.test_id}/{self.current_run}"
+            ).start()
+        except Exception as details:  # noqa: BLE001
+            LOGGER.warning(
+                "Unable to start streaming of %s, will archive the logs after collecting: %s", archive_name, details
+            )
+            return None
+
     def collect_logs_for_inactive_nodes(self, local_search_path=None):
         node_names = {node.name for node in self.nodes}
         if not local_search_path:
@@ -871,7 +901,8 @@ class LogCollector:
         archive_dir, log_filename = os.path.split(src_path)
 
         LocalCmdRunner().run(
-            cmd=f"tar --zstd --warning=no-file-changed -cf '{archive_name}' -C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'"
+            cmd=f"tar --use-compress-program='{ZSTD_COMPRESS_PROGRAM}' --warning=no-file-changed -cf '{archive_name}' "
+            f"-C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'"
         )
 
         return archive_name
@@ -1220,6 +1251,7 @@ class BaseSCTLogCollector(LogCollector):
     cluster_log_type = "sct-runner-events"
     cluster_dir_prefix = "sct-runner-events"
     too_big_log_size = 1 * 1024 * 1024 * 1024
+    archive_workers = 4
 
     def collect_logs(self, local_search_path: Optional[str] = None) -> list[str]:
         for ent in self.log_entities:
@@ -1256,17 +1288,34 @@ class BaseSCTLogCollector(LogCollector):
         return [s3_link]
 
     def create_archive_per_file_and_upload(self) -> list[str]:
-        s3_links = []
+        # Files with the same name would be archived to the same archive, so they're handled sequentially
+        files_by_name = defaultdict(list)
         for root, _, files in os.walk(self.local_dir):
             for current_file in files:
-                file_path = os.path.join(root, current_file)
+                files_by_name[current_file].append(os.path.join(root, current_file))
+
+        def _archive_and_upload(file_paths):
+            s3_links = []
+            for file_path in file_paths:
                 LOGGER.info(file_path)
                 file_archive = self.archive_to_tarfile(file_path, add_test_id_to_archive=True)
                 LOGGER.info(file_archive)
-                s3_link = upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}")
-                s3_links.append(s3_link)
+                s3_links.append(upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}"))
                 remove_files(file_path)
                 remove_files(file_archive)
+            return s3_links
+
+        if not files_by_name:
+            return []
+        parallel = ParallelObject(
+            list(files_by_name.values()), timeout=3600, num_workers=min(len(files_by_name), self.archive_workers)
+        )
+        s3_links = []
+        for result in parallel.run(_archive_and_upload, ignore_exceptions=True):
+            if result.exc:
+                LOGGER.error("Failed to archive and upload %s: %s", result.obj, result.exc)
+            else:
+                s3_links.extend(result.result)
         return s3_links
 
     def create_archive_and_upload(self) -> list[str]:
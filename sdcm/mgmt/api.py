@@ -0,0 +1,341 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Client of the Scylla Manager REST API.
+
+The client returns typed models of the JSON responses instead of parsed `sctool' tables.  Like `sctool', it talks to
+the local HTTP API of the Manager server (127.0.0.1:5080), which is not exposed outside of the Manager node: requests
+are sent by running `curl' on the node over its SSH connection, few requests by a single command if possible.
+
+Manager has no long-poll or event API, so `ScyllaManagerApiClient.watch_task()' polls the task, and every poll is
+a single command on the Manager node, same as an `sctool' call.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import shlex
+import logging
+import threading
+from datetime import datetime
+from typing import Iterator, Optional
+
+import requests
+from pydantic import BaseModel, ConfigDict
+
+from sdcm.mgmt.common import ScyllaManagerError, TaskStatus
+
+LOGGER = logging.getLogger(__name__)
+
+MANAGER_API_HOST = "127.0.0.1"
+MANAGER_API_PORT = 5080
+MANAGER_API_PATH = "api/v1"
+MANAGER_API_TIMEOUT = (5, 30)  # seconds, (connect, read)
+MANAGER_API_AVAILABILITY_TTL = 300  # seconds, how long to trust the result of a check that the API answers
+MANAGER_API_MIN_POLL_INTERVAL = 10  # seconds, every poll is a command over SSH, don't run them more often
+MANAGER_API_STATUS_MARKER = "--sct-manager-api-status:"  # prefix of a status code line which follows every response
+
+
+class ManagerTaskInfo(BaseModel):
+    """A task as listed by `GET /cluster/{cluster_id}/tasks'."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: str
+    type: str
+    cluster_id: str
+    name: str = ""
+    status: str = ""
+    enabled: bool = True
+    suspended: bool = False
+    retry: int = 0
+    success_count: int = 0
+    error_count: int = 0
+    next_activation: Optional[datetime] = None
+    last_success: Optional[datetime] = None
+    last_error: Optional[datetime] = None
+
+    @property
+    def task_status(self) -> str:
+        """The status as one of `TaskStatus' values."""
+        try:
+            return TaskStatus.from_str(self.status)
+        except ScyllaManagerError:
+            return TaskStatus.UNKNOWN
+
+
+class ManagerTaskRun(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    id: str
+    task_id: str
+    type: str = ""
+    status: str = ""
+    cause: str = ""
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+
+class ManagerProgressCounters(BaseModel):
+    """Progress of a run of a repair, backup or restore task, only counters which apply to the type are set."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    stage: str = ""
+    snapshot_tag: str = ""
+    # repair
+    token_ranges: int = 0
+    success: int = 0
+    error: int = 0
+    # backup and restore, in bytes
+    size: int = 0
+    uploaded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    downloaded: int = 0
+    restored: int = 0
+
+
+class ManagerTaskProgress(BaseModel):
+    """Progress of a task run as returned by `GET /cluster/{cluster_id}/task/{task_type}/{task_id}/{run_id}'."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    run: Optional[ManagerTaskRun] = None
+    progress: ManagerProgressCounters = ManagerProgressCounters()
+
+    def percentage(self, task_type: str) -> float:
+        if self.run and self.run.status.upper() == TaskStatus.DONE:
+            return 100.0
+        counters = self.progress
+        match task_type:
+            case "repair":
+                done, total = counters.success, counters.token_ranges
+            case "backup":
+                done, total = counters.uploaded + counters.skipped, counters.size
+            case "restore":
+                done, total = counters.restored, counters.size
+            case _:
+                return 0.0
+        return 100.0 * done / total if total else 0.0
+
+
+class ManagerTaskState(BaseModel):
+    """A snapshot of a task (and of the progress of its latest run) at some moment."""
+
+    task: ManagerTaskInfo
+    progress: Optional[ManagerTaskProgress] = None
+
+    @property
+    def percentage(self) -> float:
+        return self.progress.percentage(self.task.type) if self.progress else 0.0
+
+
+class ManagerSnapshotInfo(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    snapshot_tag: str
+    size: int = 0
+
+
+class ManagerBackupListItem(BaseModel):
+    """A backup as listed by `GET /cluster/{cluster_id}/backups'."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    cluster_id: str
+    snapshot_info: list[ManagerSnapshotInfo] = []
+
+    @property
+    def snapshot_tags(self) -> list[str]:
+        return [snapshot.snapshot_tag for snapshot in self.snapshot_info]
+
+
+def split_task_id(task_id: str) -> tuple[str, str]:
+    """Split a task ID as printed by `sctool' (e.g., `repair/2a4125d6-...') to the type and the UUID."""
+    task_type, sep, task_uuid = task_id.strip().partition("/")
+    if not sep:
+        raise ScyllaManagerError(f"Task ID `{task_id}' doesn't include the task type")
+    return task_type, task_uuid
+
+
+class ScyllaManagerApiClient:
+    """Typed client of the Manager REST API, use `ScyllaManagerApiClient.for_node()' to get a client of a node.
+
+    `remoter' runs `curl' on the Manager node (e.g., `node.remoter'.)
+    """
+
+    _clients: dict[str, ScyllaManagerApiClient] = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(self, remoter, port: int = MANAGER_API_PORT, timeout: tuple[float, float] = MANAGER_API_TIMEOUT):
+        self.remoter = remoter
+        self.base_url = f"http://{MANAGER_API_HOST}:{port}"
+        self.timeout = timeout
+        self._available: Optional[bool] = None
+        self._available_checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_node(cls, manager_node) -> Optional[ScyllaManagerApiClient]:
+        """Return a client of the Manager server running on the node, or None if the API is not reachable."""
+        if manager_node.is_kubernetes():
+            return None
+        with cls._clients_lock:
+            if (client := cls._clients.get(manager_node.name)) is None:
+                client = cls._clients[manager_node.name] = cls(
+                    remoter=manager_node.remoter, port=manager_node.MANAGER_SERVER_PORT
+                )
+        return client if client.available else None
+
+    @property
+    def available(self) -> bool:
+        with self._lock:
+            if self._available is None or time.monotonic() - self._available_checked_at > MANAGER_API_AVAILABILITY_TTL:
+                self._available = self.ping()
+                self._available_checked_at = time.monotonic()
+                if not self._available:
+                    LOGGER.debug("Scylla Manager API at %s is not available, use sctool", self.base_url)
+            return self._available
+
+    def _url(self, path: str, params: Optional[dict] = None) -> str:
+        return requests.Request("GET", f"{self.base_url}/{MANAGER_API_PATH}/{path}", params=params).prepare().url
+
+    def _run_requests(self, urls: list[str]) -> list[tuple[int, str]]:
+        """Run GET requests by a single command on the Manager node, return the status code and the body of each.
+
+        The status code of a request which failed to connect is 0, and the body is the error then.
+        """
+        connect_timeout, read_timeout = self.timeout
+        curl = (
+            f"curl --silent --show-error --connect-timeout {connect_timeout} --max-time {connect_timeout + read_timeout}"
+            f" --write-out '\\n{MANAGER_API_STATUS_MARKER}%{{http_code}}\\n'"
+        )
+        try:
+            result = self.remoter.run(
+                " ; ".join(f"{curl} {shlex.quote(url)}" for url in urls),
+                timeout=(connect_timeout + read_timeout) * len(urls) + 10,
+                ignore_status=True,
+                verbose=False,
+            )
+        except Exception as exc:  # noqa: BLE001
+            raise ScyllaManagerError(f"Scylla Manager API requests {urls} failed: {exc}") from exc
+        body, *responses = result.stdout.split(f"\n{MANAGER_API_STATUS_MARKER}")
+        if len(responses) != len(urls):
+            raise ScyllaManagerError(f"Scylla Manager API requests {urls} failed: {result.stderr.strip()}")
+        status_codes_and_bodies = []
+        for response in responses:
+            status_code, _, next_body = response.partition("\n")
+            status_codes_and_bodies.append((int(status_code), body if int(status_code) else result.stderr.strip()))
+            body = next_body
+        return status_codes_and_bodies
+
+    @staticmethod
+    def _parse_response(url: str, status_code: int, body: str):
+        if not status_code:
+            raise ScyllaManagerError(f"Scylla Manager API request GET {url} failed: {body}")
+        if not 200 <= status_code < 300:
+            try:
+                message = json.loads(body).get("message", body)
+            except ValueError, AttributeError:
+                message = body
+            raise ScyllaManagerError(f"Scylla Manager API request GET {url} failed with {status_code}: {message}")
+        return json.loads(body) if body else None
+
+    def _request(self, path: str, params: Optional[dict] = None):
+        url = self._url(path, params)
+        [(status_code, body)] = self._run_requests([url])
+        return self._parse_response(url, status_code, body)
+
+    def ping(self) -> bool:
+        try:
+            [(status_code, _)] = self._run_requests([f"{self.base_url}/ping"])
+        except ScyllaManagerError:
+            return False
+        return status_code == 204
+
+    @staticmethod
+    def _find_task(tasks: Optional[list], cluster_id: str, task_id: str) -> ManagerTaskInfo:
+        _, task_uuid = split_task_id(task_id)
+        for task in tasks or []:
+            if task["id"] == task_uuid:
+                return ManagerTaskInfo.model_validate(task)
+        raise ScyllaManagerError(f"Task {task_id} is not found in cluster {cluster_id}")
+
+    def get_task(self, cluster_id: str, task_id: str) -> ManagerTaskInfo:
+        task_type, _ = split_task_id(task_id)
+        tasks = self._request(f"cluster/{cluster_id}/tasks", params={"all": "true", "type": task_type})
+        return self._find_task(tasks, cluster_id=cluster_id, task_id=task_id)
+
+    def get_task_progress(self, cluster_id: str, task_id: str, run_id: str = "latest") -> ManagerTaskProgress:
+        task_type, task_uuid = split_task_id(task_id)
+        return ManagerTaskProgress.model_validate(
+            self._request(f"cluster/{cluster_id}/task/{task_type}/{task_uuid}/{run_id}")
+        )
+
+    def get_task_history(self, cluster_id: str, task_id: str, limit: int = 10) -> list[ManagerTaskRun]:
+        task_type, task_uuid = split_task_id(task_id)
+        runs = self._request(f"cluster/{cluster_id}/task/{task_type}/{task_uuid}/history", params={"limit": limit})
+        return [ManagerTaskRun.model_validate(run) for run in runs or []]
+
+    def list_backups(
+        self, cluster_id: str, locations: list[str], keyspace: Optional[list[str]] = None
+    ) -> list[ManagerBackupListItem]:
+        params = {"locations": locations}
+        if keyspace:
+            params["keyspace"] = keyspace
+        backups = self._request(f"cluster/{cluster_id}/backups", params=params)
+        return [ManagerBackupListItem.model_validate(backup) for backup in backups or []]
+
+    def get_task_state(self, cluster_id: str, task_id: str, with_progress: bool = False) -> ManagerTaskState:
+        """Return the task and the progress of its latest run, both are read by a single command."""
+        task_type, task_uuid = split_task_id(task_id)
+        urls = [self._url(f"cluster/{cluster_id}/tasks", params={"all": "true", "type": task_type})]
+        if with_progress and task_type != "healthcheck":  # there is no progress of healthcheck tasks
+            urls.append(self._url(f"cluster/{cluster_id}/task/{task_type}/{task_uuid}/latest"))
+        responses = self._run_requests(urls)
+        task = self._find_task(self._parse_response(urls[0], *responses[0]), cluster_id=cluster_id, task_id=task_id)
+        progress = None
+        # and there is no progress of tasks which haven't started yet
+        if len(urls) > 1 and task.task_status not in (TaskStatus.NEW, TaskStatus.STARTING):
+            progress = ManagerTaskProgress.model_validate(self._parse_response(urls[1], *responses[1]))
+        return ManagerTaskState(task=task, progress=progress)
+
+    def watch_task(
+        self, cluster_id: str, task_id: str, timeout: float, interval: float, with_progress: bool = False
+    ) -> Iterator[ManagerTaskState]:
+        """Yield the state of the task every `interval' seconds until timeout, the first one immediately.
+
+        The task is not polled more often than every `MANAGER_API_MIN_POLL_INTERVAL' seconds.
+        """
+        deadline = time.monotonic() + timeout
+        interval = max(interval, MANAGER_API_MIN_POLL_INTERVAL)
+        while True:
+            yield self.get_task_state(cluster_id=cluster_id, task_id=task_id, with_progress=with_progress)
+            if (remaining := deadline - time.monotonic()) <= 0:
+                return
+            time.sleep(min(interval, remaining))
+
+
+__all__ = (
+    "ManagerBackupListItem",
+    "ManagerProgressCounters",
+    "ManagerSnapshotInfo",
+    "ManagerTaskInfo",
+    "ManagerTaskProgress",
+    "ManagerTaskRun",
+    "ManagerTaskState",
+    "ScyllaManagerApiClient",
+    "split_task_id",
+)
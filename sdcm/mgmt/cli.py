@@ -27,6 +27,7 @@ from invoke.exceptions import Failure as InvokeFailure
 
 from sdcm.remote.libssh2_client.exceptions import Failure as Libssh2Failure
 from sdcm import wait
+from sdcm.mgmt.api import ManagerTaskState, ScyllaManagerApiClient
 from sdcm.mgmt.common import (
     TaskStatus,
     ScyllaManagerError,
@@ -46,6 +47,8 @@ from sdcm.wait import WaitForTimeoutError
 
 LOGGER = logging.getLogger(__name__)
 
+SCTOOL_CHECK_PERIOD = 10  # steps, how often to check a watched task with sctool if its API state doesn't look final
+
 STATUS_DONE = "done"
 STATUS_ERROR = "error"
 SSL_CONF_DIR = Path("/tmp/ssl_conf")
@@ -74,6 +77,46 @@ class ManagerTask:
     def get_property(self, parsed_table, column_name):
         return self.sctool.get_table_value(parsed_table=parsed_table, column_name=column_name, identifier=self.id)
 
+    @property
+    def api(self) -> ScyllaManagerApiClient | None:
+        """Client of the Manager REST API, or None if the API is not reachable (then waits poll sctool.)"""
+        if not isinstance(self.id, str) or "/" not in self.id:
+            return None
+        return ScyllaManagerApiClient.for_node(self.manager_node)
+
+    def _wait_for_task_state(self, is_candidate, confirm, text, timeout, step, with_progress=False):
+        """Wait until `confirm()' returns true, use the Manager API to find out when it's worth to call it.
+
+        The task is polled through the API every `step' seconds, and `confirm()' (which runs sctool) is called when
+        the state of the task satisfies `is_candidate(state)', or if it wasn't called for `SCTOOL_CHECK_PERIOD' steps.
+        If the API fails, fall back to polling `confirm()' every `step' seconds.
+        """
+        deadline = time.monotonic() + timeout
+        if api := self.api:
+            LOGGER.debug(text)
+            confirmed_at = time.monotonic()
+            try:
+                for state in api.watch_task(
+                    cluster_id=self.cluster_id,
+                    task_id=self.id,
+                    timeout=timeout,
+                    interval=step,
+                    with_progress=with_progress,
+                ):
+                    if is_candidate(state) or time.monotonic() - confirmed_at >= step * SCTOOL_CHECK_PERIOD:
+                        try:
+                            if result := confirm():
+                                return result
+                        except Exception as exc:  # noqa: BLE001
+                            LOGGER.debug("%s: the check failed: %r", text, exc)
+                        confirmed_at = time.monotonic()
+                raise WaitForTimeoutError(f"Wait for: {text}: timeout - {timeout} seconds - expired")
+            except ScyllaManagerError as exc:
+                LOGGER.warning("Failed to watch task %s through the Manager API, poll sctool: %s", self.id, exc)
+        return wait.wait_for(
+            func=confirm, step=step, text=text, timeout=max(deadline - time.monotonic(), step), throw_exc=True
+        )
+
     def stop(self):
         cmd = f"stop {self.id} -c {self.cluster_id}"
         self.sctool.run(cmd=cmd, is_verify_errorless_result=True)
@@ -372,15 +415,20 @@ class ManagerTask:
 
     def wait_for_status(self, list_status, check_task_progress=True, timeout=3600, step=120):
         text = f"Waiting until task: {self.id} reaches status of: {list_status}"
+
+        def is_candidate(state: ManagerTaskState) -> bool:
+            # the retries counter of a failed task (e.g., `ERROR (4/4)') is known to sctool only
+            return state.task.task_status in list_status or state.task.task_status == TaskStatus.ERROR
+
         try:
-            return wait.wait_for(
-                func=self.is_status_in_list,
-                step=step,
-                throw_exc=True,
+            return self._wait_for_task_state(
+                is_candidate=is_candidate,
+                confirm=lambda: self.is_status_in_list(
+                    list_status=list_status, check_task_progress=check_task_progress
+                ),
                 text=text,
-                list_status=list_status,
-                check_task_progress=check_task_progress,
                 timeout=timeout,
+                step=step,
             )
         except WaitForTimeoutError as ex:
             raise WaitForTimeoutError(
@@ -389,13 +437,13 @@ class ManagerTask:
 
     def wait_for_percentage(self, minimum_percentage, timeout=3600, step=10):
         text = f"Waiting until task: {self.id} reaches at least {minimum_percentage}% progress"
-        is_percentage_reached = wait.wait_for(
-            func=self.has_progress_reached_percentage,
-            minimum_percentage=minimum_percentage,
-            step=step,
+        is_percentage_reached = self._wait_for_task_state(
+            is_candidate=lambda state: state.percentage >= minimum_percentage,
+            confirm=lambda: self.has_progress_reached_percentage(minimum_percentage=minimum_percentage),
             text=text,
             timeout=timeout,
-            throw_exc=True,
+            step=step,
+            with_progress=True,
         )
         return is_percentage_reached
 
@@ -479,8 +527,13 @@ class BackupTask(ManagerTask):
 
     def wait_for_uploading_stage(self, timeout=1440, step=10):
         text = f"Waiting until backup task: {self.id} starts to upload snapshots"
-        is_status_reached = wait.wait_for(
-            func=self.is_task_in_uploading_stage, step=step, text=text, timeout=timeout, throw_exc=True
+        is_status_reached = self._wait_for_task_state(
+            is_candidate=lambda state: state.progress is not None and state.progress.progress.stage == "UPLOAD",
+            confirm=self.is_task_in_uploading_stage,
+            text=text,
+            timeout=timeout,
+            step=step,
+            with_progress=True,
         )
         return is_status_reached
 
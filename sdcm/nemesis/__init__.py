@@ -33,7 +33,7 @@ import itertools
 from abc import ABC, abstractmethod
 from contextlib import ExitStack
 from datetime import timedelta
-from typing import List, Optional, Callable, Union, Iterable, TYPE_CHECKING
+from typing import List, Optional, Callable, Union, TYPE_CHECKING
 from functools import partial, cached_property
 from collections import defaultdict, Counter, namedtuple
 from concurrent.futures import ThreadPoolExecutor
@@ -158,6 +158,7 @@ from sdcm.nemesis.utils.node_allocator import NemesisNodeAllocator, NemesisNodeA
 from sdcm.utils.node import build_node_api_command
 from sdcm.utils.sstable.load_utils import SstableLoadUtils
 from sdcm.utils.sstable.sstable_utils import SstableUtils
+from sdcm.utils.system_log_hub import LogSubscription
 from sdcm.utils.tablets.common import wait_no_tablets_migration_running
 from sdcm.utils.toppartition_util import NewApiTopPartitionCmd, OldApiTopPartitionCmd
 from sdcm.utils.version_utils import MethodVersionNotFound, scylla_versions, ComparableScyllaVersion
@@ -3608,20 +3609,17 @@ class NemesisRunner:
 
     def _call_disrupt_func_after_expression_logged(
         self,
-        log_follower: Iterable[str],
+        log_follower: LogSubscription,
         disrupt_func: Callable,
         disrupt_func_kwargs: dict = None,
-        sleep: int = 1,
         delay: int = 10,
         timeout: int = 600,
     ):
         """
-        This method watches the target node logs for an expression
-        with a <sleep> time step. Once the expression is found it
-        will call the callable <disrupt_func> with <disrupt_func_kwargs> keyword
-        arguments after a <delay>.
+        This method waits for an expression in the target node logs.
+        Once the expression is found it will call the callable <disrupt_func>
+        with <disrupt_func_kwargs> keyword arguments after a <delay>.
         """
-        start_time = time.time()
 
         with (
             DbEventsFilter(
@@ -3639,12 +3637,9 @@ class NemesisRunner:
                 db_event=DatabaseLogEvent.RUNTIME_ERROR, line="got error in row level repair", node=self.target_node
             ),
         ):
-            while time.time() - start_time < timeout:
-                if list(log_follower):
-                    time.sleep(delay)
-                    disrupt_func(**disrupt_func_kwargs)
-                    break
-                time.sleep(sleep)
+            if log_follower.wait(timeout=timeout) is not None:
+                time.sleep(delay)
+                disrupt_func(**disrupt_func_kwargs)
 
     def start_and_interrupt_decommission_streaming(self):
         """
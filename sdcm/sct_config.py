@@ -835,6 +835,16 @@ class SCTConfiguration(BaseModel):
          this regex, its backtrace will not be decoded. This can be used to reduce overhead in performance tests
          by skipping backtrace decoding for certain types of events. Only applies when backtrace_decoding is True.""",
     )
+    db_log_reader_chunked_tailing: Boolean = SctField(
+        description="""If True, db nodes logs are tailed by keeping them opened and reading new data in big chunks,
+         waking up on file changes (inotify), and decoding only lines which may match known event patterns.
+         If False, the log is reopened and read line by line every 0.1 second.""",
+    )
+    db_log_reader_pool_size: int = SctField(
+        description="""Number of shared worker processes which tail the logs of all db nodes, every worker multiplexes
+         many node logs. If set to null, the number of CPUs of the runner is used. 0 means a dedicated process per
+         node.""",
+    )
     print_kernel_callstack: Boolean = SctField(
         description="""Scylla will print kernel callstack to logs if True, otherwise, it will try and may print a message
          that it failed to.""",
@@ -1774,6 +1784,11 @@ class SCTConfiguration(BaseModel):
     data_validation: String = SctField(
         description="Specify the type of data validation to perform",
     )
+    data_validation_digest_mode: Boolean = SctField(
+        description="""Validate data by digests of token ranges of the tables: the data validator of longevity
+            tests compares rows of the mismatching token ranges only, and the verification of upgrade tests runs
+            queries only of the items which tables were changed since the previous verification""",
+    )
     stress_read_cmd: StringOrList = SctField(
         description="""cassandra-stress commands.
             You can specify everything but the -node parameter, which is going to
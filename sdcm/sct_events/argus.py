@@ -11,14 +11,18 @@
 #
 # Copyright (c) 2025 ScyllaDB
 
+import json
 import time
 import logging
 import threading
-from typing import NewType, Dict, Any, Tuple, Optional, Callable, cast
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NewType, Dict, Any, List, Tuple, Optional, Callable, cast
 from functools import partial
 from collections import defaultdict
 
 from argus.common.sct_types import RawEventPayload
+from sdcm.sct_events.events_device import EVENTS_LOG_DIR
 from sdcm.sct_events.events_processes import (
     EVENTS_ARGUS_ANNOTATOR_ID,
     EVENTS_ARGUS_AGGREGATOR_ID,
@@ -34,6 +38,12 @@ from sdcm.utils.argus import Argus
 
 
 ARGUS_EVENT_AGGREGATOR_TIME_WINDOW: float = 90  # seconds
+ARGUS_EVENTS_BATCH_SIZE: int = 100  # events
+ARGUS_EVENTS_BATCH_PERIOD: float = 5  # seconds, max time an event waits for its batch to be filled
+ARGUS_POSTING_CONCURRENCY: int = 4  # concurrent bulk submissions
+ARGUS_POSTING_MAX_IN_FLIGHT: int = 8  # batches posted or waiting for a free worker, the inbound events wait for more
+ARGUS_SPOOL_RETRY_PERIOD: float = 60  # seconds
+ARGUS_EVENTS_SPOOL: str = "argus_events_spool.jsonl"
 LOGGER = logging.getLogger(__name__)
 
 
@@ -98,25 +108,139 @@ class ArgusEventAggregator(EventsProcessPipe[SCTArgusEvent, SCTArgusEvent]):
         return SCTArgusEventKey(tuple([event["run_id"], event["severity"], event["event_type"], event.pop("event_id")]))
 
 
+class ArgusEventsSpool:
+    """Events which failed to be posted to Argus, one JSON per line, kept on the disk till they're posted."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, events: List[SCTArgusEvent]) -> None:
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as spool_file:
+                    spool_file.writelines(json.dumps(event, default=str) + "\n" for event in events)
+            except OSError as exc:
+                LOGGER.error("Failed to spool %s Argus events to %s: %s", len(events), self.path, exc)
+
+    def pop(self) -> List[SCTArgusEvent]:
+        """Return all spooled events and truncate the spool."""
+        with self._lock:
+            try:
+                with self.path.open("r+", encoding="utf-8") as spool_file:
+                    lines = spool_file.readlines()
+                    spool_file.truncate(0)
+            except FileNotFoundError:
+                return []
+            except OSError as exc:
+                LOGGER.error("Failed to read spooled Argus events from %s: %s", self.path, exc)
+                return []
+        events = []
+        for line in lines:
+            try:
+                events.append(SCTArgusEvent(json.loads(line)))
+            except ValueError:
+                LOGGER.warning("Skip a broken line of %s: %r", self.path, line)
+        return events
+
+
 class ArgusEventPostman(BaseEventsProcess[SCTArgusEvent, None], threading.Thread):
+    """Post events to Argus in batches.
+
+    A batch is posted when it has `batch_size' events or once per `batch_period' seconds by the flusher thread.
+    Up to `ARGUS_POSTING_CONCURRENCY' batches are posted concurrently, and reading of the inbound events is blocked
+    while `ARGUS_POSTING_MAX_IN_FLIGHT' batches are not posted yet.  Batches which failed to be posted are spooled
+    to the disk and re-posted every `ARGUS_SPOOL_RETRY_PERIOD' seconds and once more on the termination.
+    """
+
     inbound_events_process = EVENTS_ARGUS_AGGREGATOR_ID
+    batch_size = ARGUS_EVENTS_BATCH_SIZE
+    batch_period = ARGUS_EVENTS_BATCH_PERIOD
+    spool_retry_period = ARGUS_SPOOL_RETRY_PERIOD
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self.enabled = threading.Event()
         self._argus_client = None
+        self._batch: List[SCTArgusEvent] = []
+        self._batch_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(ARGUS_POSTING_MAX_IN_FLIGHT)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.spool = ArgusEventsSpool(path=_registry.log_dir / EVENTS_LOG_DIR / ARGUS_EVENTS_SPOOL)
         super().__init__(_registry=_registry)
 
     def run(self) -> None:
         self.enabled.wait()
 
-        for event in self.inbound_events():  # events from ArgusAggregator
-            with verbose_suppress(
-                "ArgusEventPostman failed to post an event to '%s' endpoint.\nEvent: %s",
+        with ThreadPoolExecutor(
+            max_workers=ARGUS_POSTING_CONCURRENCY, thread_name_prefix="ArgusEventPostman"
+        ) as self._executor:
+            flusher = threading.Thread(target=self._flush_periodically, name="ArgusEventFlusher", daemon=True)
+            flusher.start()
+            for event in self.inbound_events():  # events from ArgusAggregator
+                with self._batch_lock:
+                    self._batch.append(event)
+                    batch = self._take_batch() if len(self._batch) >= self.batch_size else None
+                if batch:
+                    self._post(batch)
+            flusher.join()
+            self.flush()
+        self.resubmit_spooled_events(wait=True)
+
+    def _take_batch(self) -> List[SCTArgusEvent]:
+        batch, self._batch = self._batch, []
+        return batch
+
+    def flush(self) -> None:
+        with self._batch_lock:
+            batch = self._take_batch()
+        if batch:
+            self._post(batch)
+
+    def _flush_periodically(self) -> None:
+        next_spool_retry = time.perf_counter() + self.spool_retry_period
+        while not self.stop_event.wait(self.batch_period):
+            with verbose_suppress("ArgusEventPostman failed to flush events"):
+                self.flush()
+                if time.perf_counter() >= next_spool_retry:
+                    self.resubmit_spooled_events()
+                    next_spool_retry = time.perf_counter() + self.spool_retry_period
+
+    def _post(self, batch: List[SCTArgusEvent]) -> None:
+        self._in_flight.acquire()  # backpressure: wait for a posted batch if there are too many of them
+        try:
+            self._executor.submit(self._submit_batch, batch)
+        except RuntimeError:  # the executor is shut down already
+            self._in_flight.release()
+            self._submit_batch(batch, release=False)
+
+    def _submit_batch(self, batch: List[SCTArgusEvent], release: bool = True) -> None:
+        try:
+            if self._argus_client:
+                self._argus_client.submit_event(batch)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning(
+                "ArgusEventPostman failed to post %s events to '%s' endpoint, spool them to %s: %s",
+                len(batch),
                 self._argus_client.Routes.SUBMIT_EVENT,
-                event,
-            ):
-                if self._argus_client:
-                    self._argus_client.submit_event(event)
+                self.spool.path,
+                exc,
+            )
+            self.spool.append(batch)
+        finally:
+            if release:
+                self._in_flight.release()
+
+    def resubmit_spooled_events(self, wait: bool = False) -> None:
+        events = self.spool.pop()
+        if events:
+            LOGGER.debug("Re-post %s spooled Argus events", len(events))
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start : start + self.batch_size]
+            if wait:
+                self._submit_batch(batch, release=False)
+            else:
+                self._post(batch)
 
     def enable_argus_posting(self) -> None:
         self._argus_client = Argus.get().client
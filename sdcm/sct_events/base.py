@@ -16,7 +16,6 @@ from __future__ import annotations
 import json
 import time
 import uuid
-import pickle
 import fnmatch
 import logging
 from enum import Enum
@@ -438,10 +437,30 @@ class BaseFilter(SystemEvent, abstract=True):
     def eval_filter(self, event: SctEventProtocol) -> bool:
         raise NotImplementedError()
 
+    def may_match(self, envelope) -> bool:
+        """Cheap check by the header fields of `sdcm.sct_events.wire_format.EventEnvelope', before unpickling.
+
+        Return False only if `eval_filter()' would return False for the event for sure.
+        """
+        return True
+
 
 T_log_event = TypeVar("T_log_event", bound="LogEvent")
 
 
+def parse_log_line_timestamp(event_time: str) -> float:
+    """Return a timestamp of a log line time, which is in UTC (a timezone offset in the time is ignored.)
+
+    Time in the known fixed formats (`2021-04-06T13:03:28+00:00', `2021-04-06 13:03:28' or `2021/04/06 13:03:28')
+    is parsed by `datetime.fromisoformat()', and by much slower `dateutil.parser.parse()' otherwise.
+    """
+    try:
+        parsed = datetime.fromisoformat(event_time.replace("/", "-", 2))
+    except ValueError:
+        parsed = dateutil.parser.parse(event_time)
+    return parsed.replace(tzinfo=timezone.utc).timestamp()
+
+
 @runtime_checkable
 class LogEventProtocol(SctEventProtocol, Protocol[T_log_event]):
     regex: str
@@ -495,7 +514,7 @@ class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
                 # 2021-04-06 13:03:28  ...
                 event_time = " ".join(splitted_line[:2])
 
-            self.source_timestamp = dateutil.parser.parse(event_time).replace(tzinfo=timezone.utc).timestamp()
+            self.source_timestamp = parse_log_line_timestamp(event_time)
         except ValueError:
             pass
         self.event_timestamp = time.time()
@@ -510,7 +529,14 @@ class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
         return self
 
     def clone(self: T_log_event) -> T_log_event:
-        return pickle.loads(pickle.dumps(self))
+        """Return a copy of the event with the same public fields, not ready to publish until `.add_info()' call.
+
+        It's the same as unpickling of a pickled event (see `__getstate__()'), but doesn't serialize anything: the
+        fields of LogEvent are immutable (besides `subcontext', which is a new list), so they are shared.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__getstate__())
+        return clone
 
     @property
     def msgfmt(self):
@@ -542,6 +568,7 @@ __all__ = (
     "LogEvent",
     "LogEventProtocol",
     "T_log_event",
+    "parse_log_line_timestamp",
     "add_severity_limit_rules",
     "max_severity",
     "print_critical_events",
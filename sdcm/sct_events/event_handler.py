@@ -41,15 +41,18 @@ class EventsHandler(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
         "CassandraStressLogEvent.SchemaDisagreement": SchemaDisagreementHandler(),
     }
 
+    inbound_envelopes = True
+
     def run(self) -> None:
         LOGGER.debug("Started events handler")
         for event_tuple in self.inbound_events():
             with verbose_suppress("EventsHandler failed to process %s", event_tuple):
-                event_class, event = event_tuple  # try to unpack event from EventsDevice
-                full_class_name = event_class + f".{event.type}" if event.type else event_class
+                event_class, envelope = event_tuple  # try to unpack event from EventsDevice
+                full_class_name = event_class + f".{envelope.type}" if envelope.type else event_class
                 handler = self.handlers.get(full_class_name)
                 if handler is None:
                     continue
+                event = envelope.event
                 tester_obj = TestConfig().tester_obj()
                 if not tester_obj:
                     LOGGER.error("Tester object was not initialized, skipping handling event: %s", event_class)
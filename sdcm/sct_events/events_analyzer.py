@@ -45,14 +45,17 @@ class TestFailure(Exception):
 
 
 class EventsAnalyzer(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
+    inbound_envelopes = True
+
     def run(self) -> None:
         for event_tuple in self.inbound_events():
             with verbose_suppress("EventsAnalyzer failed to process %s", event_tuple):
-                event_class, event = event_tuple  # try to unpack event from EventsDevice
+                event_class, envelope = event_tuple  # try to unpack event from EventsDevice
 
                 # Don't kill the test cause of TestResultEvent: it was done already when this event was sent out.
-                if event_class == "TestResultEvent" or event.severity != Severity.CRITICAL:
+                if event_class == "TestResultEvent" or envelope.severity != Severity.CRITICAL:
                     continue
+                event = envelope.event
 
                 try:
                     if event_class in LOADERS_EVENTS:
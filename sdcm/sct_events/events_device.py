@@ -15,22 +15,24 @@ import time
 import queue
 import ctypes
 import pickle
+import struct
 import signal
 import logging
 import multiprocessing
-from typing import Optional, Generator, Any, Tuple, Callable, cast, Dict
+from typing import Optional, Generator, Any, Tuple, Callable, cast, List
+from collections import OrderedDict
 from pathlib import Path
 from functools import cached_property, partial
-from uuid import UUID
+from contextlib import suppress
 
 from sdcm.utils.action_logger import get_action_logger
 from sdcm.sct_events import Severity
 
-from sdcm.sct_events.base import max_severity
-from sdcm.sct_events.system import SystemEvent
-from sdcm.sct_events.filters import BaseFilter
+from sdcm.sct_events.filters import FiltersIndex
+from sdcm.sct_events.wire_format import EventEnvelope, encode_event
 
 import zmq
+import prometheus_client
 
 from sdcm.sct_events.events_processes import (
     EVENTS_MAIN_DEVICE_ID,
@@ -48,31 +50,140 @@ EVENTS_DEVICE_START_TIMEOUT: float = 30  # seconds
 SUB_POLLING_TIMEOUT: int = 1000  # milliseconds
 PUB_QUEUE_WAIT_TIMEOUT: float = 1  # seconds
 PUB_QUEUE_EVENTS_RATE: float = 0  # seconds
+PUB_BATCH_SIZE: int = 100  # max number of events sent in a single multipart message
 PUBLISH_EVENT_TIMEOUT: float = 5  # seconds
+RAW_EVENTS_LOG_FLUSH_PERIOD: float = 0.5  # seconds
+RAW_EVENTS_LOG_BUFFER_SIZE: int = 1024 * 1024
 FILTERS_GC_PERIOD: float = 60  # Cleanup old filters once in a while
 
 EVENTS_LOG_DIR: str = "events_log"
 RAW_EVENTS_LOG: str = "raw_events.log"
 
+# first frame of every multipart message on the events bus: sequence number of the first event and events count
+BATCH_HEADER = struct.Struct("!QI")
+
 LOGGER = logging.getLogger(__name__)
 ACTION_LOGGER = get_action_logger("event")
 
+# evaluation of the active filters for every event, per subscriber (exposed by `sdcm.prometheus' metrics server)
+FILTERS_EVALUATIONS = prometheus_client.Counter(
+    "sct_events_filters_evaluations", "Number of events evaluated against the active events filters", ["result"]
+)
+FILTERS_EVALUATION_SECONDS = prometheus_client.Histogram(
+    "sct_events_filters_evaluation_seconds",
+    "Time of evaluation of an event against the active events filters",
+    buckets=(1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1),
+)
+
+
+class RawEventsWriter:
+    """Append events to raw_events.log through a single buffered handle, flushed at most every `flush_period'."""
+
+    def __init__(self, path: Path, flush_period: float = RAW_EVENTS_LOG_FLUSH_PERIOD):
+        self.path = path
+        self.flush_period = flush_period
+        self.pending = 0
+        self._file = None
+        self._next_flush = 0.0
+
+    def write(self, lines: List[bytes]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "ab", buffering=RAW_EVENTS_LOG_BUFFER_SIZE)  # noqa: SIM115
+            self._next_flush = time.monotonic() + self.flush_period
+        self._file.writelines(lines)
+        self.pending += len(lines)
+
+    def flush(self, force: bool = False) -> int:
+        """Flush if forced or the flush period is over, return number of the flushed events."""
+        if not self.pending or not (force or time.monotonic() >= self._next_flush):
+            return 0
+        self._file.flush()
+        self._next_flush = time.monotonic() + self.flush_period
+        flushed, self.pending = self.pending, 0
+        return flushed
+
+    def close(self) -> int:
+        flushed = self.flush(force=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return flushed
+
+
+class DeliveryTracker:
+    """Sequence number based delivery accounting of the batches sent to the events bus.
+
+    Every batch is registered on send and confirmed when it's received back by the device's own subscriber;
+    batches which weren't confirmed in `timeout' seconds, or were overtaken by a later batch, are reported lost.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.next_seq = 0
+        self.lost = 0
+        self._pending: OrderedDict[int, Tuple[float, List[bytes]]] = OrderedDict()
+
+    def sent(self, events: List[bytes]) -> bytes:
+        """Register a batch and return its header frame."""
+        header = BATCH_HEADER.pack(self.next_seq, len(events))
+        self._pending[self.next_seq] = (time.monotonic() + self.timeout, events)
+        self.next_seq += len(events)
+        return header
+
+    def confirm(self, header: bytes) -> None:
+        seq, _ = BATCH_HEADER.unpack(header)
+        while self._pending:
+            first_seq, (_, events) = next(iter(self._pending.items()))
+            if first_seq > seq:
+                break
+            del self._pending[first_seq]
+            if first_seq < seq:
+                self._report_lost(events)
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        while self._pending:
+            first_seq, (deadline, events) = next(iter(self._pending.items()))
+            if deadline > now:
+                break
+            del self._pending[first_seq]
+            self._report_lost(events)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _report_lost(self, events: List[bytes]) -> None:
+        self.lost += len(events)
+        for event in events:
+            LOGGER.error("EventsDevice failed to verify delivery of %s", pickle.loads(event))
+
 
 class EventsDevice(multiprocessing.Process):
+    """Events bus: events published by any process are sent to all subscribers (events processes.)
+
+    Events from the publish queue are sent in batches, as multipart messages with a header frame (sequence number
+    of the first event and count) followed by the pickled events.  The device subscribes to itself and accounts
+    the received headers to verify the delivery, without blocking on every single event.  It's also the single
+    writer of raw_events.log, which is written through a buffered handle and flushed periodically or when idle.
+    """
+
     start_delay = EVENTS_DEVICE_START_DELAY
     start_timeout = EVENTS_DEVICE_START_TIMEOUT
     sub_polling_timeout = SUB_POLLING_TIMEOUT
     pub_queue_wait_timeout = PUB_QUEUE_WAIT_TIMEOUT
     pub_queue_events_rate = PUB_QUEUE_EVENTS_RATE
+    pub_batch_size = PUB_BATCH_SIZE
+    raw_events_log_flush_period = RAW_EVENTS_LOG_FLUSH_PERIOD
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self._registry = _registry
         self._events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
+        self._raw_events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
 
         self._running = multiprocessing.Event()
         self._sub_port = multiprocessing.Value(ctypes.c_uint16, 0)
         self._queue = multiprocessing.Queue()
-        self._raw_events_lock = multiprocessing.RLock()
         self.events_log_base_dir.mkdir(parents=True, exist_ok=True)
 
         super().__init__(daemon=True)
@@ -81,6 +192,11 @@ class EventsDevice(multiprocessing.Process):
     def events_counter(self):
         return self._events_counter.value
 
+    @property
+    def raw_events_counter(self):
+        """Number of events flushed to raw_events.log."""
+        return self._raw_events_counter.value
+
     @cached_property
     def events_log_base_dir(self) -> Path:
         return self._registry.log_dir / EVENTS_LOG_DIR
@@ -89,6 +205,22 @@ class EventsDevice(multiprocessing.Process):
     def raw_events_log(self) -> Path:
         return self.events_log_base_dir / RAW_EVENTS_LOG
 
+    def wait_for_raw_events_log(self, timeout: float = PUBLISH_EVENT_TIMEOUT) -> bool:
+        """Wait until all events published so far are flushed to raw_events.log."""
+        published = self.events_counter
+        end_time = time.perf_counter() + timeout
+        while self.raw_events_counter < published:
+            if time.perf_counter() > end_time:
+                LOGGER.warning(
+                    "Only %s of %s published events are written to %s",
+                    self.raw_events_counter,
+                    published,
+                    self.raw_events_log,
+                )
+                return False
+            time.sleep(0.05)
+        return True
+
     def stop(self, timeout: Optional[float] = None) -> None:
         self._running.clear()
         self.join(timeout)
@@ -105,10 +237,26 @@ class EventsDevice(multiprocessing.Process):
             return f"tcp://localhost:{self._sub_port.value}"
         raise RuntimeError("EventsDevice is not ready to send events.")
 
+    def _get_batch(self) -> List[Tuple[Optional[bytes], bytes, bytes]]:
+        """Block until at least one event is in the publish queue, return up to `pub_batch_size' of them."""
+        batch = [self._queue.get(timeout=self.pub_queue_wait_timeout)]
+        with suppress(queue.Empty):
+            while len(batch) < self.pub_batch_size:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    def _write_raw_events(self, writer: RawEventsWriter, lines: List[bytes], force_flush: bool) -> None:
+        with verbose_suppress("%s: failed to write events to %s", self, self.raw_events_log):
+            if lines:
+                writer.write(lines)
+            self._raw_events_counter.value += writer.flush(force=force_flush)
+
     def run(self):
         # SIGTERM handler enables cooperative shutdown: terminate() sends SIGTERM which
         # triggers _running.clear(), letting the loop drain and exit gracefully.
         signal.signal(signal.SIGTERM, lambda *_: self._running.clear())
+        raw_events_writer = RawEventsWriter(path=self.raw_events_log, flush_period=self.raw_events_log_flush_period)
+        delivery = DeliveryTracker(timeout=self.sub_polling_timeout / 1000)
         with verbose_suppress("EventsDevice failed"):
             with zmq.Context() as ctx, ctx.socket(zmq.PUB) as pub, ctx.socket(zmq.SUB) as sub:
                 self._sub_port.value = pub.bind_to_random_port("tcp://*")
@@ -130,31 +278,53 @@ class EventsDevice(multiprocessing.Process):
                         if time.monotonic() >= drain_deadline:
                             break
                     try:
-                        event = self._queue.get(timeout=self.pub_queue_wait_timeout)
-                        try:
-                            pub.send(event)
-                        except zmq.ZMQError:
-                            LOGGER.exception("EventsDevice failed to send %s", pickle.loads(event))
-                        else:
-                            try:
-                                if sub.poll(timeout=self.sub_polling_timeout) and sub.recv(zmq.NOBLOCK) == event:
-                                    continue  # everything is OK, we can go to send next event in the queue.
-                            except zmq.ZMQError:
-                                pass
-                            LOGGER.error("EventsDevice failed to verify delivery of %s", pickle.loads(event))
-                        time.sleep(self.pub_queue_events_rate)
+                        batch = self._get_batch()
                     except queue.Empty:
-                        if not self._running.is_set():
+                        self._write_raw_events(raw_events_writer, lines=[], force_flush=True)
+                        self._verify_delivery(sub, delivery)
+                        if not self._running.is_set() and not delivery.pending:
                             break
                         continue
 
+                    self._write_raw_events(
+                        raw_events_writer,
+                        lines=[line for line, _, _ in batch if line is not None],
+                        force_flush=len(batch) < self.pub_batch_size,  # the queue is drained, don't hold events
+                    )
+                    # events without the raw line (failed to serialize) should be counted as written
+                    self._raw_events_counter.value += sum(1 for line, _, _ in batch if line is None)
+
+                    events = [payload for _, _, payload in batch]
+                    try:
+                        pub.send_multipart(
+                            [
+                                delivery.sent(events),
+                                *(frame for _, header, payload in batch for frame in (header, payload)),
+                            ]
+                        )
+                    except zmq.ZMQError:
+                        LOGGER.exception("EventsDevice failed to send %s events", len(events))
+                    self._verify_delivery(sub, delivery)
+                    time.sleep(self.pub_queue_events_rate)
+
+                self._verify_delivery(sub, delivery)
+        with verbose_suppress("%s: failed to close %s", self, self.raw_events_log):
+            self._raw_events_counter.value += raw_events_writer.close()
+
+    @staticmethod
+    def _verify_delivery(sub: zmq.Socket, delivery: DeliveryTracker) -> None:
+        with suppress(zmq.ZMQError):
+            while sub.poll(timeout=0):
+                delivery.confirm(sub.recv_multipart(zmq.NOBLOCK)[0])
+        delivery.expire()
+
     def publish_event(self, event, timeout=PUBLISH_EVENT_TIMEOUT) -> None:
-        with verbose_suppress("%s: failed to write %s to %s", self, event, self.raw_events_log):
-            with self._raw_events_lock, open(self.raw_events_log, "ab+", buffering=0) as log_file:
-                log_file.write(event.to_json().encode("utf-8") + b"\n")
+        raw_line = None
+        with verbose_suppress("%s: failed to serialize %s for %s", self, event, self.raw_events_log):
+            raw_line = event.to_json().encode("utf-8") + b"\n"
 
         with verbose_suppress("%s: failed to publish %s", self, event):
-            self._queue.put(pickle.dumps(event), timeout=timeout)
+            self._queue.put((raw_line, *encode_event(event)), timeout=timeout)
             self._events_counter.value += 1
 
     def _sub_socket(self, ctx: zmq.Context) -> zmq.Socket:
@@ -164,31 +334,33 @@ class EventsDevice(multiprocessing.Process):
         sub.subscribe(b"")
         return sub
 
-    def inbound_events(self, stop_event: StopEvent) -> Generator[Any, None, None]:
+    def inbound_events(self, stop_event: StopEvent) -> Generator[EventEnvelope, None, None]:
         with zmq.Context() as ctx, self._sub_socket(ctx) as sub:
             while not stop_event.is_set():
                 if sub.poll(timeout=self.sub_polling_timeout):
-                    yield sub.recv_pyobj(flags=zmq.NOBLOCK)
+                    _, *frames = sub.recv_multipart(flags=zmq.NOBLOCK)
+                    for index in range(0, len(frames), 2):
+                        yield EventEnvelope(header=frames[index], payload=frames[index + 1])
 
-    def outbound_events(
+    def outbound_envelopes(
         self, stop_event: StopEvent, events_counter: multiprocessing.Value
-    ) -> Generator[Tuple[str, Any], None, None]:
-        filters: Dict[UUID, BaseFilter] = {}
+    ) -> Generator[Tuple[str, EventEnvelope], None, None]:
+        """Same as `outbound_events()', but an event is unpickled only if it's required for the filtering."""
+        filters = FiltersIndex()
         filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
 
         with suppress_interrupt():
-            for events_counter.value, obj in enumerate(self.inbound_events(stop_event=stop_event), start=1):
+            for events_counter.value, envelope in enumerate(self.inbound_events(stop_event=stop_event), start=1):
                 if filters_gc_next_hit < time.perf_counter():
                     # Run filter GC once in FILTERS_GC_PERIOD seconds
-                    for filter_key, filter_obj in list(filters.items()):
-                        if filter_obj.is_deceased():
-                            del filters[filter_key]
+                    filters.remove_deceased()
                     filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
 
-                if isinstance(obj, BaseFilter):
+                if envelope.is_filter:
+                    obj = envelope.event
                     if obj.clear_filter and not obj.expire_time:
                         LOGGER.debug("%s: delete filter with uuid=%s", self, obj.uuid)
-                        filters.pop(obj.uuid, None)
+                        filters.remove(obj.uuid)
                     elif obj.clear_filter and obj.expire_time and obj.uuid in filters:
                         LOGGER.debug(
                             "%s: set expire_time to %s for filter with uuid=%s", self, obj.expire_time, obj.uuid
@@ -196,32 +368,41 @@ class EventsDevice(multiprocessing.Process):
                         filters[obj.uuid].expire_time = obj.expire_time
                     else:
                         LOGGER.debug("%s: add filter %s with uuid=%s", self, obj, obj.uuid)
-                        filters[obj.uuid] = obj
+                        filters.add(obj)
 
-                if isinstance(obj, SystemEvent):
+                if envelope.is_system_event:
                     continue
 
-                obj_filtered = any(f.eval_filter(obj) for f in filters.values())
+                filters_eval_start = time.perf_counter()
+                obj_filtered = filters.eval_filters(envelope)
+                FILTERS_EVALUATION_SECONDS.observe(time.perf_counter() - filters_eval_start)
+                FILTERS_EVALUATIONS.labels("filtered" if obj_filtered else "passed").inc()
 
                 if obj_filtered:
                     continue
 
-                if (obj_max_severity := max_severity(obj)).value < obj.severity.value:
-                    LOGGER.warning("Limit %s severity to %s as configured", obj, obj_max_severity)
-                    obj.severity = obj_max_severity
+                if (obj_max_severity := envelope.max_severity()).value < envelope.severity.value:
+                    LOGGER.warning("Limit %s severity to %s as configured", envelope.event, obj_max_severity)
+                    envelope.severity = obj_max_severity
 
                 # Log to actions.log (only non-filtered Error/Critical events)
-                if obj.severity.value > Severity.WARNING.value:
-                    event_type = obj.base
-                    if getattr(obj, "type", None):
-                        event_type += f".{obj.type}"
-                    if getattr(obj, "subtype", None):
-                        event_type += f".{obj.subtype}"
+                if envelope.severity.value > Severity.WARNING.value:
+                    event_type = envelope.base
+                    if envelope.type:
+                        event_type += f".{envelope.type}"
+                    if envelope.subtype:
+                        event_type += f".{envelope.subtype}"
                     ACTION_LOGGER.error(
-                        f"{event_type} {obj.severity.name} Event (id={obj.event_id}) on node: {getattr(obj, 'node', None)}"
+                        f"{event_type} {envelope.severity.name} Event (id={envelope.event_id}) on node: {envelope.node}"
                     )
 
-                yield obj.base, obj
+                yield envelope.base, envelope
+
+    def outbound_events(
+        self, stop_event: StopEvent, events_counter: multiprocessing.Value
+    ) -> Generator[Tuple[str, Any], None, None]:
+        for event_class, envelope in self.outbound_envelopes(stop_event=stop_event, events_counter=events_counter):
+            yield event_class, envelope.event
 
     def is_alive(self) -> bool:
         if not self._running.is_set():
@@ -0,0 +1,249 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""On-disk index of the events in a log file written by EventsFileLogger.
+
+The index is a file next to the log (`<log>.idx') with a fixed size record per event: offset and length of the
+event in the log, event timestamp and the max event timestamp seen so far.  Head/tail-N queries read N records
+from the start/end of the index, time range queries bisect the max timestamps to the first candidate record, and
+only the selected events are read from the log.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import math
+import bisect
+import logging
+import struct
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_RECORD = struct.Struct("!QIdd")  # offset, length, event timestamp, max event timestamp so far
+EVENT_START_RE = re.compile(rb"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
+EVENT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+EVENT_TIMESTAMP_LENGTH = len("YYYY-MM-DD HH:MM:SS.mmm")
+
+
+class IndexRecord(NamedTuple):
+    offset: int
+    length: int
+    timestamp: float
+    max_timestamp: float
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+
+def parse_event_timestamp(line: bytes) -> float:
+    """Get the event timestamp from the first line of a formatted event, NaN if there is no valid one."""
+    try:
+        return (
+            datetime.strptime(line[:EVENT_TIMESTAMP_LENGTH].decode(), EVENT_TIMESTAMP_FORMAT)
+            .replace(tzinfo=timezone.utc)
+            .timestamp()
+        )
+    except ValueError:
+        return math.nan
+
+
+def scan_events(fobj: BinaryIO, offset: int = 0, max_timestamp: float = -math.inf) -> Iterator[IndexRecord]:
+    """Split the log into events starting from the offset (an event starts with a line which starts with a date.)"""
+    fobj.seek(offset)
+    start, timestamp = None, math.nan
+    for line in fobj:
+        if EVENT_START_RE.match(line):
+            if start is not None:
+                yield IndexRecord(start, offset - start, timestamp, max_timestamp)
+            start, timestamp = offset, parse_event_timestamp(line)
+            max_timestamp = _max_timestamp(max_timestamp, timestamp)
+        elif start is None:
+            start = offset
+        offset += len(line)
+    if start is not None:
+        yield IndexRecord(start, offset - start, timestamp, max_timestamp)
+
+
+def _max_timestamp(max_timestamp: float, timestamp: Optional[float]) -> float:
+    if timestamp is None or math.isnan(timestamp):
+        return max_timestamp
+    return max(max_timestamp, timestamp)
+
+
+def format_event_text(data: bytes) -> str:
+    """Same normalization as the old line by line reader: strip trailing spaces and drop empty lines."""
+    return "\n".join(line for line in map(str.rstrip, data.decode("utf-8", errors="replace").splitlines()) if line)
+
+
+def _read_record(fd: int, index: int) -> IndexRecord:
+    return IndexRecord(*INDEX_RECORD.unpack(os.pread(fd, INDEX_RECORD.size, index * INDEX_RECORD.size)))
+
+
+class _MaxTimestamps:
+    """Lazy sequence of the max timestamps of the index records for `bisect'."""
+
+    def __init__(self, fd: int, count: int):
+        self.fd = fd
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> float:
+        return _read_record(self.fd, index).max_timestamp
+
+
+class EventsLogIndex:
+    """Index of a single events log file.
+
+    The writer (EventsFileLogger) calls `open()' once, which rebuilds the index if it doesn't match the log, and
+    `append()' after each event written (events written without an opened index are picked up by the next rebuild.)  Index should be flushed after the log, so it never points beyond the
+    flushed part of the log; records which do (written concurrently with a flush) are ignored by readers, and
+    events which are in the log but not indexed yet are found by scanning the tail of the log.
+    """
+
+    def __init__(self, log_path: Path):
+        self.log_path = Path(log_path)
+        self.index_path = self.log_path.with_name(self.log_path.name + INDEX_SUFFIX)
+        self.max_timestamp = -math.inf
+        self._fobj: Optional[BinaryIO] = None
+
+    def _last_record(self) -> Optional[IndexRecord]:
+        try:
+            with self.index_path.open("rb") as fobj:
+                if count := os.fstat(fobj.fileno()).st_size // INDEX_RECORD.size:
+                    return _read_record(fobj.fileno(), count - 1)
+        except FileNotFoundError:
+            pass
+        return None
+
+    @property
+    def is_opened(self) -> bool:
+        return self._fobj is not None
+
+    def is_valid(self) -> bool:
+        try:
+            index_size, log_size = self.index_path.stat().st_size, self.log_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if index_size % INDEX_RECORD.size:
+            return False
+        last_record = self._last_record()
+        return (last_record.end if last_record else 0) == log_size
+
+    def rebuild(self) -> int:
+        """Write a new index by scanning the whole log, return number of indexed events."""
+        count = 0
+        with self.log_path.open("rb") as log, self.index_path.open("wb") as index:
+            for record in scan_events(log):
+                index.write(INDEX_RECORD.pack(*record))
+                count += 1
+        return count
+
+    def open(self, buffering: int = -1) -> None:
+        if not self.is_valid():
+            LOGGER.debug("Rebuilding index of %s: %s events", self.log_path, self.rebuild())
+        if last_record := self._last_record():
+            self.max_timestamp = last_record.max_timestamp
+        self._fobj = self.index_path.open("ab", buffering=buffering)
+
+    def append(self, offset: int, length: int, timestamp: Optional[float]) -> None:
+        self.max_timestamp = _max_timestamp(self.max_timestamp, timestamp)
+        self._fobj.write(
+            INDEX_RECORD.pack(offset, length, math.nan if timestamp is None else timestamp, self.max_timestamp)
+        )
+
+    def flush(self) -> None:
+        if self._fobj is not None:
+            self._fobj.flush()
+
+    def close(self) -> None:
+        if self._fobj is not None:
+            self._fobj.close()
+            self._fobj = None
+
+    def get_events(
+        self,
+        limit: Optional[int] = None,
+        from_head: bool = False,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> List[str]:
+        """Return up to `limit' first (or last) events, optionally only with timestamps in [start_time, end_time]."""
+        if limit is not None and limit <= 0:
+            return []
+        with self.log_path.open("rb") as log:
+            records = self._select(log, limit=limit, from_head=from_head, start_time=start_time, end_time=end_time)
+            events = (format_event_text(os.pread(log.fileno(), record.length, record.offset)) for record in records)
+            return [event for event in events if event]
+
+    def _select(
+        self,
+        log: BinaryIO,
+        limit: Optional[int],
+        from_head: bool,
+        start_time: Optional[float],
+        end_time: Optional[float],
+    ) -> List[IndexRecord]:
+        try:
+            index = self.index_path.open("rb")
+        except FileNotFoundError:
+            LOGGER.debug("No index for %s, scanning the log", self.log_path)
+            records = list(scan_events(log))
+        else:
+            with index:
+                log_size = os.fstat(log.fileno()).st_size
+                records, indexed_end = self._read_records(
+                    fd=index.fileno(),
+                    log_size=log_size,
+                    limit=limit if start_time is None and end_time is None else None,
+                    from_head=from_head,
+                    start_time=start_time,
+                )
+            if indexed_end < log_size and (not from_head or limit is None or len(records) < limit):
+                records.extend(scan_events(log, offset=indexed_end))
+
+        if start_time is not None or end_time is not None:
+            start_time = -math.inf if start_time is None else start_time
+            end_time = math.inf if end_time is None else end_time
+            records = [record for record in records if start_time <= record.timestamp <= end_time]
+        if limit is not None:
+            records = records[:limit] if from_head else records[-limit:]
+        return records
+
+    @staticmethod
+    def _read_records(
+        fd: int, log_size: int, limit: Optional[int], from_head: bool, start_time: Optional[float]
+    ) -> Tuple[List[IndexRecord], int]:
+        """Read the selected index records and return them with the end offset of the last indexed event."""
+        count = os.fstat(fd).st_size // INDEX_RECORD.size
+        while count and (last_record := _read_record(fd, count - 1)).end > log_size:
+            count -= 1  # written concurrently with a flush of the log, not there yet
+        indexed_end = last_record.end if count else 0
+
+        first, last = 0, count
+        if start_time is not None:
+            first = bisect.bisect_left(_MaxTimestamps(fd, count), start_time)
+        if limit is not None:
+            first, last = (first, min(first + limit, count)) if from_head else (max(first, count - limit), count)
+        data = os.pread(fd, (last - first) * INDEX_RECORD.size, first * INDEX_RECORD.size)
+        return [IndexRecord(*record) for record in INDEX_RECORD.iter_unpack(data)], indexed_end
+
+
+__all__ = ("EventsLogIndex", "IndexRecord", "scan_events")
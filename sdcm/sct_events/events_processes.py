@@ -62,6 +62,8 @@ class OutboundEventsProtocol(Protocol[T_outbound_events_protocol]):
 
 class BaseEventsProcess(Generic[T_inbound_event, T_outbound_event], abc.ABC):
     inbound_events_process = EVENTS_MAIN_DEVICE_ID
+    # receive `EventEnvelope' objects instead of events, which are unpickled on demand (main device only)
+    inbound_envelopes = False
     stop_event: StopEvent
 
     def __init__(self, _registry: EventsProcessesRegistry):
@@ -82,10 +84,15 @@ class BaseEventsProcess(Generic[T_inbound_event, T_outbound_event], abc.ABC):
         return self._events_counter.value
 
     def inbound_events(self) -> InboundEventsGenerator:
-        yield from cast(
-            OutboundEventsProtocol[T_inbound_event],
-            get_events_process(name=self.inbound_events_process, _registry=self._registry),
-        ).outbound_events(stop_event=self.stop_event, events_counter=self._events_counter)
+        inbound_process = get_events_process(name=self.inbound_events_process, _registry=self._registry)
+        if self.inbound_envelopes:
+            yield from inbound_process.outbound_envelopes(
+                stop_event=self.stop_event, events_counter=self._events_counter
+            )
+            return
+        yield from cast(OutboundEventsProtocol[T_inbound_event], inbound_process).outbound_events(
+            stop_event=self.stop_event, events_counter=self._events_counter
+        )
 
     def outbound_events(self, stop_event: StopEvent, events_counter: multiprocessing.Value) -> OutboundEventsGenerator:
         yield from []
@@ -11,21 +11,22 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
-import re
 import json
+import time
 import logging
+import threading
 import collections
 import multiprocessing
 from typing import Tuple, Optional, Callable, Any, Dict, List, cast
 from pathlib import Path
 from functools import partial
 from itertools import chain
-from collections import deque as tail
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.base import SctEvent
 from sdcm.sct_events.system import TestResultEvent
 from sdcm.sct_events.events_device import get_events_main_device
+from sdcm.sct_events.events_index import EventsLogIndex
 from sdcm.sct_events.events_processes import (
     EVENTS_FILE_LOGGER_ID,
     EventsProcessesRegistry,
@@ -44,24 +45,29 @@ WARNING_LOG: str = "warning.log"
 NORMAL_LOG: str = "normal.log"
 DEBUG_LOG: str = "debug.log"
 
-LINE_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
+EVENTS_LOG_BUFFER_SIZE: int = 256 * 1024
+EVENTS_INDEX_BUFFER_SIZE: int = 16 * 1024
+EVENTS_LOG_FLUSH_PERIOD: float = 0.1  # seconds, readers of the files expect events to show up promptly
+EVENTS_SUMMARY_UPDATES_PER_SECOND: float = 2
+EVENTS_LOG_SYNC_TIMEOUT: float = 5  # seconds
 
 LOGGER = logging.getLogger(__name__)
 
 
-class head(list):
-    def __init__(self, maxlen: Optional[int] = None):
-        super().__init__()
-        if maxlen is None:
-            self.append = super().append
-        self.maxlen = maxlen
+class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
+    """Write events to events.log, per-severity logs and summary.log.
 
-    def append(self, item: Any) -> None:
-        if len(self) < self.maxlen:
-            super().append(item)
+    Log files are kept opened and buffered: a flusher thread flushes them every `flush_period' seconds and
+    rewrites summary.log at most `summary_updates_per_second' times per second (only if it's changed.)
+    Readers in other processes call `sync()' to get all received events flushed before reading the files.
 
+    Every per-severity log has an index of its events (see `sdcm.sct_events.events_index'), so head/tail-N and
+    time range queries don't need to read the whole log.
+    """
+
+    flush_period = EVENTS_LOG_FLUSH_PERIOD
+    summary_updates_per_second = EVENTS_SUMMARY_UPDATES_PER_SECOND
 
-class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
     def __init__(self, _registry: EventsProcessesRegistry):
         base_dir: Path = get_events_main_device(_registry=_registry).events_log_base_dir
 
@@ -74,9 +80,22 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
             Severity.DEBUG: base_dir / DEBUG_LOG,
         }
 
+        self.events_indexes = {
+            severity: EventsLogIndex(log_file) for severity, log_file in self.events_logs_by_severity.items()
+        }
+
         self.events_summary = collections.defaultdict(int)
         self.events_summary_log = base_dir / SUMMARY_LOG
 
+        self._files = {}
+        self._buffering = False  # enabled in the logger process only, `write_event()' may be called from others
+        self._summary_lock = threading.Lock()
+        self._summary_changed = False
+        self._summary_next_update = 0.0
+        self._sync_lock = multiprocessing.Lock()
+        self._sync_requested = multiprocessing.Event()
+        self._synced = multiprocessing.Event()
+
         super().__init__(_registry=_registry)
 
     def run(self) -> None:
@@ -91,10 +110,79 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         ):
             log_file.touch()
 
-        for event_tuple in self.inbound_events():
-            with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
-                _, event = event_tuple  # try to unpack event from EventsDevice
-                self.write_event(event=event)
+        for index in self.events_indexes.values():
+            with verbose_suppress("%s: failed to open index of %s", self, index.log_path):
+                index.open(buffering=EVENTS_INDEX_BUFFER_SIZE)
+
+        self._buffering = True
+        flusher = threading.Thread(target=self._flusher, name="EventsFileLoggerFlusher", daemon=True)
+        flusher.start()
+        try:
+            for event_tuple in self.inbound_events():
+                with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
+                    _, event = event_tuple  # try to unpack event from EventsDevice
+                    self.write_event(event=event)
+        finally:
+            flusher.join(timeout=self.flush_period * 2)
+            self.flush(force_summary=True)
+            for fobj in self._files.values():
+                with verbose_suppress("%s: failed to close %s", self, fobj.name):
+                    fobj.close()
+            self._files.clear()
+            for index in self.events_indexes.values():
+                with verbose_suppress("%s: failed to close %s", self, index.index_path):
+                    index.close()
+
+    def _write(
+        self, path: Path, data: bytes, index: Optional[EventsLogIndex] = None, timestamp: Optional[float] = None
+    ) -> None:
+        if not self._buffering:
+            with path.open("ab+", buffering=0) as fobj:
+                fobj.write(data)
+            return
+        if (fobj := self._files.get(path)) is None:
+            fobj = self._files[path] = path.open("ab", buffering=EVENTS_LOG_BUFFER_SIZE)
+        offset = fobj.tell()
+        fobj.write(data)
+        if index is not None and index.is_opened:
+            index.append(offset=offset, length=len(data), timestamp=timestamp)
+
+    def _flusher(self) -> None:
+        while not self.stop_event.is_set():
+            sync_requested = self._sync_requested.wait(timeout=self.flush_period)
+            self._sync_requested.clear()
+            self.flush(force_summary=sync_requested)
+            if sync_requested:
+                self._synced.set()
+
+    def flush(self, force_summary: bool = False) -> None:
+        """Flush the log files and rewrite summary.log if it's changed (rate limited unless forced.)"""
+        for fobj in list(self._files.values()):
+            with verbose_suppress("%s: failed to flush %s", self, fobj.name):
+                fobj.flush()
+        for index in self.events_indexes.values():  # after the logs, so an index never points beyond them
+            with verbose_suppress("%s: failed to flush %s", self, index.index_path):
+                index.flush()
+        if not self._summary_changed or (not force_summary and time.monotonic() < self._summary_next_update):
+            return
+        with self._summary_lock:
+            summary, self._summary_changed = dict(self.events_summary), False
+        self._summary_next_update = time.monotonic() + 1 / self.summary_updates_per_second
+        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
+            with self.events_summary_log.open("wb", buffering=0) as fobj:
+                fobj.write(json.dumps(summary, indent=4).encode("utf-8"))
+
+    def sync(self, timeout: float = EVENTS_LOG_SYNC_TIMEOUT) -> bool:
+        """Wait until all received events are written to the files (call from any process.)"""
+        try:
+            if not self.is_alive():
+                return False
+        except AssertionError:  # not a child of the current process, `is_alive()' can't be checked
+            pass
+        with self._sync_lock:
+            self._synced.clear()
+            self._sync_requested.set()
+            return self._synced.wait(timeout=timeout)
 
     def write_event(self, event: SctEvent) -> None:
         message = event.format_event()
@@ -110,43 +198,49 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         # Write event to events.log file
         if getattr(event, "save_to_files", False):
             with verbose_suppress("%s: failed to write %s to %s", self, event, self.events_log):
-                with self.events_log.open("ab+", buffering=0) as fobj:
-                    fobj.write(message_bin)
+                self._write(self.events_log, message_bin)
 
             if log_file := self.events_logs_by_severity.get(event.severity):
                 with verbose_suppress("%s: failed to write %s to %s", self, event, log_file):
-                    with log_file.open("ab+", buffering=0) as fobj:
-                        fobj.write(message_bin)
+                    self._write(
+                        log_file,
+                        message_bin,
+                        index=self.events_indexes[event.severity],
+                        timestamp=event.event_timestamp,
+                    )
 
-        # Update summary.log file (statistics.)
-        self.events_summary[Severity(event.severity).name] += 1
-        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
-            with self.events_summary_log.open("wb", buffering=0) as fobj:
-                fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+        # Update summary.log file (statistics), it's written by `flush()'.
+        with self._summary_lock:
+            self.events_summary[Severity(event.severity).name] += 1
+            self._summary_changed = True
+        if not self._buffering:
+            self.flush(force_summary=True)
+
+    def get_events_by_category(
+        self,
+        limit: Optional[int] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> Dict[str, List[str]]:
+        """Get first `limit' events with CRITICAL severity and last `limit' for other severities.
 
-    def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
+        If `start_time' or `end_time' given, only events with timestamps in this range are returned.
+        """
+        self.sync()
         output = {}
-        for severity, log_file in self.events_logs_by_severity.items():
-            # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
-            events_bucket = (head if severity is Severity.CRITICAL else tail)(maxlen=limit)
-            event = []
+        for severity, index in self.events_indexes.items():
             try:
-                with log_file.open() as fobj:
-                    for line in fobj:
-                        if line := line.rstrip():
-                            if LINE_START_RE.match(line):
-                                if event:
-                                    events_bucket.append("\n".join(event))
-                                event.clear()
-                            event.append(line)
-                if event:
-                    events_bucket.append("\n".join(event))
+                events = index.get_events(
+                    limit=limit,
+                    from_head=severity is Severity.CRITICAL,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
             except Exception as exc:  # noqa: BLE001
-                error_msg = f"{self}: failed to read {log_file}: {exc}"
+                error_msg = f"{self}: failed to read {index.log_path}: {exc}"
                 LOGGER.error(error_msg)
-                if not events_bucket:
-                    events_bucket.append(error_msg)
-            output[severity.name] = list(events_bucket)
+                events = [error_msg]
+            output[severity.name] = events
         return output
 
 
@@ -155,13 +249,20 @@ get_events_logger = cast(Callable[..., EventsFileLogger], partial(get_events_pro
 
 
 def get_events_grouped_by_category(
-    limit: Optional[int] = None, _registry: Optional[EventsProcessesRegistry] = None
+    limit: Optional[int] = None,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    _registry: Optional[EventsProcessesRegistry] = None,
 ) -> Dict[str, List[str]]:
-    return get_events_logger(_registry=_registry).get_events_by_category(limit=limit)
+    return get_events_logger(_registry=_registry).get_events_by_category(
+        limit=limit, start_time=start_time, end_time=end_time
+    )
 
 
 def get_logger_event_summary(_registry: Optional[EventsProcessesRegistry] = None) -> dict:
-    events_summary_log = get_events_logger(_registry=_registry).events_summary_log
+    events_logger = get_events_logger(_registry=_registry)
+    events_logger.sync()
+    events_summary_log = events_logger.events_summary_log
     with verbose_suppress("Failed to read %s", events_summary_log):
         with events_summary_log.open() as fobj:
             return json.load(fobj)
@@ -68,6 +68,9 @@ class DbEventsFilter(BaseFilter):
 
         return result
 
+    def may_match(self, envelope) -> bool:
+        return bool(self.filter_type) and self.filter_type == envelope.type
+
     def cancel_filter(self) -> None:
         if self.extra_time_to_expiration:
             self.expire_time = time.time() + self.extra_time_to_expiration
@@ -120,6 +123,9 @@ class EventsFilter(BaseFilter):
             self.expire_time = time.time() + self.extra_time_to_expiration
         super().cancel_filter()
 
+    def may_match(self, envelope) -> bool:
+        return not self.event_class or (envelope.name + ".").startswith(self.event_class)
+
     def eval_filter(self, event: SctEventProtocol) -> bool:
         if self.expire_time and event.timestamp and self.expire_time < event.timestamp:
             return False
@@ -157,3 +163,80 @@ class EventsSeverityChangerFilter(EventsFilter):
         if super().eval_filter(event) and self.new_severity:
             event.severity = self.new_severity
         return False
+
+
+class FiltersIndex:
+    """Active filters of an events stream, indexed to evaluate only the filters which may match an event.
+
+    `DbEventsFilter's are indexed by the event type and node, `EventsFilter's by the event class prefix;
+    filters of other kinds (and the ones without such keys) are evaluated for every event.  Candidates are
+    evaluated in the order the filters were added, same as a sequential evaluation of all filters, which
+    matters for `EventsSeverityChangerFilter'.
+    """
+
+    def __init__(self):
+        self.filters: dict[str, BaseFilter] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._by_db_event: dict[tuple[str, Optional[str]], dict[str, BaseFilter]] = {}
+        self._by_class_prefix: dict[str, dict[str, BaseFilter]] = {}
+        self._unindexed: dict[str, BaseFilter] = {}
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self.filters
+
+    def __getitem__(self, uuid: str) -> BaseFilter:
+        return self.filters[uuid]
+
+    def _bucket(self, filter_obj: BaseFilter) -> dict[str, BaseFilter]:
+        if isinstance(filter_obj, DbEventsFilter) and filter_obj.filter_type:
+            return self._by_db_event.setdefault((filter_obj.filter_type, filter_obj.filter_node), {})
+        if isinstance(filter_obj, EventsFilter) and filter_obj.event_class:
+            return self._by_class_prefix.setdefault(filter_obj.event_class, {})
+        return self._unindexed
+
+    def add(self, filter_obj: BaseFilter) -> None:
+        if filter_obj.uuid in self.filters:
+            self.remove(filter_obj.uuid)
+        self.filters[filter_obj.uuid] = filter_obj
+        self._order[filter_obj.uuid] = self._next_order
+        self._next_order += 1
+        self._bucket(filter_obj)[filter_obj.uuid] = filter_obj
+
+    def remove(self, uuid: str) -> Optional[BaseFilter]:
+        if (filter_obj := self.filters.pop(uuid, None)) is not None:
+            del self._order[uuid]
+            self._bucket(filter_obj).pop(uuid, None)
+        return filter_obj
+
+    def remove_deceased(self) -> None:
+        for uuid, filter_obj in list(self.filters.items()):
+            if filter_obj.is_deceased():
+                self.remove(uuid)
+
+    def candidates(self, envelope) -> list[BaseFilter]:
+        """Return filters which may match an event, by `sdcm.sct_events.wire_format.EventEnvelope' header fields."""
+        buckets = [self._unindexed]
+        if self._by_db_event and envelope.type:
+            buckets.append(self._by_db_event.get((envelope.type, None)))
+            if envelope.node:
+                buckets.extend(self._by_db_event.get((envelope.type, node)) for node in envelope.node.split())
+        if self._by_class_prefix:
+            prefix = ""
+            for part in envelope.name.split("."):
+                prefix += part + "."
+                buckets.append(self._by_class_prefix.get(prefix))
+        candidates = [filter_obj for bucket in buckets if bucket for filter_obj in bucket.values()]
+        if len(candidates) > 1:
+            candidates.sort(key=lambda filter_obj: self._order[filter_obj.uuid])
+        return candidates
+
+    def eval_filters(self, envelope) -> bool:
+        """Return True if the event should be filtered out; the event is unpickled only if some filter may match."""
+        return any(
+            filter_obj.may_match(envelope) and filter_obj.eval_filter(envelope.event)
+            for filter_obj in self.candidates(envelope)
+        )
@@ -30,6 +30,8 @@ LOGGER = logging.getLogger(__name__)
 
 
 class PrometheusDumper(BaseEventsProcess[Tuple[str, Any], None], threading.Thread):
+    inbound_envelopes = True
+
     def run(self) -> None:
         events_gauge = nemesis_metrics_obj().create_gauge(
             "sct_events_gauge",
@@ -45,11 +47,11 @@ class PrometheusDumper(BaseEventsProcess[Tuple[str, Any], None], threading.Threa
 
         for event_tuple in self.inbound_events():
             with verbose_suppress("PrometheusDumper failed to process %s", event_tuple):
-                event_class, event = event_tuple  # try to unpack event from EventsDevice
+                event_class, envelope = event_tuple  # try to unpack event from EventsDevice
                 events_gauge.labels(
                     event_class,
-                    getattr(event, "type", ""),
-                    getattr(event, "subtype", ""),
-                    event.severity,
-                    getattr(event, "node", ""),
-                ).set(event.event_timestamp)
+                    envelope.type,
+                    envelope.subtype,
+                    envelope.severity,
+                    envelope.node if envelope.node is not None else "",
+                ).set(envelope.event_timestamp)
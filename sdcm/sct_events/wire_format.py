@@ -0,0 +1,218 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Wire format of SCT events on the events bus.
+
+Every event is encoded once, by the publisher, to two frames:
+
+  * header: a small versioned struct (version, flags, severity, timestamp) followed by the strings which are
+    enough for routing and filtering (class name, type, subtype, node, event id);
+  * payload: the pickled event itself.
+
+Subscribers get an `EventEnvelope' which decodes the header only, and unpickles the payload on first access
+to `EventEnvelope.event', so events which are dropped by the header fields are never unpickled.
+"""
+
+from __future__ import annotations
+
+import math
+import pickle
+import struct
+from typing import Any, NamedTuple, Optional, Tuple, Type
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.base import SctEvent, SystemEvent, BaseFilter, _max_severity
+
+WIRE_FORMAT_VERSION = 1
+
+FLAG_SYSTEM_EVENT = 0x01
+FLAG_FILTER = 0x02
+
+# version, flags, severity, event timestamp; followed by the NUL-separated strings (see `EventHeader')
+HEADER_PREFIX = struct.Struct("!BBbd")
+STRINGS_SEPARATOR = "\0"
+SEVERITIES = {severity.value: severity for severity in Severity}
+
+
+class EventSchema(NamedTuple):
+    """Per-class constant part of the header, computed once for every event class."""
+
+    flags: int
+    name: str
+
+
+_EVENT_SCHEMAS: dict[Type, EventSchema] = {}
+
+
+def get_event_schema(event_class: Type) -> EventSchema:
+    if (schema := _EVENT_SCHEMAS.get(event_class)) is None:
+        flags = 0
+        if issubclass(event_class, SystemEvent):
+            flags |= FLAG_SYSTEM_EVENT
+        if issubclass(event_class, BaseFilter):
+            flags |= FLAG_FILTER
+        schema = _EVENT_SCHEMAS[event_class] = EventSchema(flags=flags, name=event_class.__name__)
+    return schema
+
+
+def _header_string(value: Any) -> str:
+    return "" if value is None else str(value).replace(STRINGS_SEPARATOR, " ")
+
+
+def encode_event(event: SctEvent) -> Tuple[bytes, bytes]:
+    """Return (header, payload) frames of the event."""
+    schema = get_event_schema(type(event))
+    timestamp = event.event_timestamp
+    prefix = HEADER_PREFIX.pack(
+        WIRE_FORMAT_VERSION, schema.flags, event.severity.value, math.nan if timestamp is None else timestamp
+    )
+    strings = STRINGS_SEPARATOR.join(
+        (
+            schema.name,
+            _header_string(event.type),
+            _header_string(event.subtype),
+            _header_string(getattr(event, "node", None)),
+            _header_string(getattr(event, "event_id", None)),
+        )
+    )
+    return prefix + strings.encode("utf-8"), pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class EventHeader(NamedTuple):
+    flags: int
+    severity: Severity
+    event_timestamp: Optional[float]
+    name: str
+    type: Optional[str]
+    subtype: Optional[str]
+    node: Optional[str]
+    event_id: Optional[str]
+
+
+def _decode_prefix(header: bytes) -> Tuple[int, Severity, Optional[float]]:
+    version, flags, severity, timestamp = HEADER_PREFIX.unpack_from(header)
+    if version != WIRE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported events wire format version: {version}")
+    return flags, SEVERITIES[severity], None if math.isnan(timestamp) else timestamp
+
+
+def _decode_strings(header: bytes) -> list[Optional[str]]:
+    return [value or None for value in header[HEADER_PREFIX.size :].decode("utf-8").split(STRINGS_SEPARATOR)]
+
+
+def decode_header(header: bytes) -> EventHeader:
+    return EventHeader(*_decode_prefix(header), *_decode_strings(header))
+
+
+class EventEnvelope:
+    """Event received from the events bus: header fields are available without unpickling of the event.
+
+    The fixed part of the header (flags, severity, timestamp) and the strings are decoded separately on first
+    access.  Once the event is unpickled, the severity is taken from the event (filters may change it.)
+    """
+
+    __slots__ = ("_header", "_payload", "_prefix", "_strings", "_event")
+
+    def __init__(self, header: bytes, payload: bytes):
+        self._header = header
+        self._payload = payload
+        self._prefix: Optional[Tuple[int, Severity, Optional[float]]] = None
+        self._strings: Optional[list[Optional[str]]] = None
+        self._event: Optional[SctEvent] = None
+
+    @classmethod
+    def from_event(cls, event: SctEvent) -> EventEnvelope:
+        return cls(*encode_event(event))
+
+    @property
+    def frames(self) -> Tuple[bytes, bytes]:
+        return self._header, self._payload
+
+    @property
+    def fields(self) -> EventHeader:
+        return EventHeader(*self._get_prefix(), *self._get_strings())
+
+    def _get_prefix(self) -> Tuple[int, Severity, Optional[float]]:
+        if self._prefix is None:
+            self._prefix = _decode_prefix(self._header)
+        return self._prefix
+
+    def _get_strings(self) -> list[Optional[str]]:
+        if self._strings is None:
+            self._strings = _decode_strings(self._header)
+        return self._strings
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._event is not None
+
+    @property
+    def event(self) -> SctEvent:
+        if self._event is None:
+            self._event = pickle.loads(self._payload)
+        return self._event
+
+    @property
+    def name(self) -> str:
+        return self._get_strings()[0]
+
+    @property
+    def base(self) -> str:
+        return self.name.split(".", 1)[0]
+
+    @property
+    def type(self) -> Optional[str]:
+        return self._get_strings()[1]
+
+    @property
+    def subtype(self) -> Optional[str]:
+        return self._get_strings()[2]
+
+    @property
+    def node(self) -> Optional[str]:
+        return self._get_strings()[3]
+
+    @property
+    def event_id(self) -> Optional[str]:
+        return self._get_strings()[4]
+
+    @property
+    def event_timestamp(self) -> Optional[float]:
+        return self._get_prefix()[2]
+
+    @property
+    def severity(self) -> Severity:
+        return self._event.severity if self._event is not None else self._get_prefix()[1]
+
+    @severity.setter
+    def severity(self, value: Severity) -> None:
+        self.event.severity = value
+
+    @property
+    def is_system_event(self) -> bool:
+        return bool(self._get_prefix()[0] & FLAG_SYSTEM_EVENT)
+
+    @property
+    def is_filter(self) -> bool:
+        return bool(self._get_prefix()[0] & FLAG_FILTER)
+
+    def max_severity(self) -> Severity:
+        """Same as `sdcm.sct_events.base.max_severity()', but without unpickling of the event."""
+        base, event_type, subtype = self.base, self.type, self.subtype
+        return _max_severity(keys=(base, f"{base}.{event_type}", f"{base}.{event_type}.{subtype}"), name=self.name)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name}, severity={self.severity.name}, event_id={self.event_id})"
+
+
+__all__ = ("WIRE_FORMAT_VERSION", "EventEnvelope", "EventHeader", "decode_header", "encode_event")
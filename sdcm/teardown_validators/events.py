@@ -55,7 +55,9 @@ class ErrorEventsValidator(TeardownValidator):
     def validate(self):
         LOGGER.info("Running validation of failing events for parallel nemeses")
         filters = [FailingEventsFilter(**event) for event in self.configuration.get("failing_events")]
-        raw_events_log = get_events_main_device(_registry=self.tester.events_processes_registry).raw_events_log
+        events_device = get_events_main_device(_registry=self.tester.events_processes_registry)
+        events_device.wait_for_raw_events_log()
+        raw_events_log = events_device.raw_events_log
 
         with open(raw_events_log, encoding="utf-8") as events_file:
             initial_events = (json.loads(line) for line in events_file)
@@ -4,6 +4,7 @@ import logging
 import multiprocessing
 import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, TYPE_CHECKING
@@ -28,6 +29,7 @@ from sdcm.utils.metaclasses import Singleton
 from sdcm.utils.sct_agent_installer import generate_agent_api_key, save_agent_api_key, load_agent_api_key
 
 if TYPE_CHECKING:
+    from sdcm.db_log_reader import DbLogReaderPool
     from sdcm.sct_config import SCTConfiguration
 
 LOGGER = logging.getLogger(__name__)
@@ -59,6 +61,7 @@ class TestConfig(metaclass=Singleton):
     LDAP_ADDRESS = None
     LDAP_USERS_ON_SCYLLA: bool = False
     DECODING_QUEUE = None
+    DB_LOG_READER_POOL = None
 
     _test_id = None
     _test_name = None
@@ -68,6 +71,7 @@ class TestConfig(metaclass=Singleton):
     _tester_obj = None
     _argus_client: ArgusSCTClient | MagicMock = MagicMock()
     _agent_api_key = None
+    _db_log_reader_pool_lock = threading.Lock()
 
     backup_azure_blob_credentials = {}
 
@@ -178,6 +182,27 @@ class TestConfig(metaclass=Singleton):
     def set_decoding_queue(cls):
         cls.DECODING_QUEUE = multiprocessing.Queue()
 
+    @classmethod
+    def get_db_log_reader_pool(cls, size: int) -> DbLogReaderPool:
+        from sdcm.db_log_reader import DbLogReaderPool  # noqa: PLC0415
+        from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS  # noqa: PLC0415
+
+        with cls._db_log_reader_pool_lock:
+            if cls.DB_LOG_READER_POOL is None:
+                cls.DB_LOG_READER_POOL = DbLogReaderPool(
+                    size=size,
+                    system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS,
+                    decoding_queue=cls.DECODING_QUEUE,
+                )
+            return cls.DB_LOG_READER_POOL
+
+    @classmethod
+    def stop_db_log_reader_pool(cls) -> None:
+        with cls._db_log_reader_pool_lock:
+            pool, cls.DB_LOG_READER_POOL = cls.DB_LOG_READER_POOL, None
+        if pool is not None:
+            pool.stop()
+
     @classmethod
     def set_intra_node_comm_public(cls, intra_node_comm_public):
         cls.INTRA_NODE_COMM_PUBLIC = intra_node_comm_public
@@ -39,7 +39,6 @@ import yaml
 import pytest
 from invoke.exceptions import UnexpectedExit, Failure
 
-from cassandra.concurrent import execute_concurrent_with_args
 from cassandra import ConsistencyLevel
 from cassandra.cluster import Session
 
@@ -137,7 +136,7 @@ from sdcm.utils.common import (
 )
 from sdcm.utils.parallel_object import ParallelObject
 from sdcm.utils.cql_utils import cql_quote_if_needed
-from sdcm.utils.database_query_utils import PartitionsValidationAttributes, fetch_all_rows
+from sdcm.utils.database_query_utils import PartitionsValidationAttributes
 from sdcm.utils.features import is_tablets_feature_enabled
 from sdcm.utils.get_username import get_username
 from sdcm.utils.decorators import log_run_info, retrying, measure_time, optional_stage
@@ -213,8 +212,11 @@ from sdcm.keystore import KeyStore
 from sdcm.utils.hdrhistogram import (
     make_hdrhistogram_summary,
     make_hdrhistogram_summary_by_interval,
+    remove_hdr_cache_dir,
 )
+from sdcm.utils.backtrace_decoder import remove_backtrace_cache_dir
 from sdcm.utils.raft.common import validate_raft_on_nodes
+from sdcm.utils.range_copy import COPY_INSERT_WORKERS, TableRangeCopier
 from sdcm.commit_log_check_thread import CommitLogCheckThread
 from sdcm.kafka.kafka_consumer import KafkaCDCReaderThread
 from test_lib.compaction import CompactionStrategy
@@ -3553,37 +3555,13 @@ class ClusterTester(unittest.TestCase):
     def copy_data_between_tables(self, node, src_keyspace, src_table, dest_keyspace, dest_table, columns_list=None):
         """Copy all data from one table/view to another table
         Structure of the tables has to be same
+
+        The source is scanned by token ranges in parallel and the rows are inserted while they are streamed,
+        so the data isn't held in the memory of the runner.
         """
         self.log.debug("Start copying data")
         with self.db_cluster.cql_connection_patient(node, verbose=False) as session:
-            # Copy data from source to the destination table
-            statement = "SELECT {columns} FROM {keyspace}.{table}".format(
-                keyspace=src_keyspace, table=src_table, columns=",".join(columns_list) if columns_list else "*"
-            )
-            # Get table columns list
-            result = session.execute(statement + " LIMIT 1")
-            columns = result.column_names
-
-            # Fetch all rows from view / table
-            source_table_rows = fetch_all_rows(session=session, default_fetch_size=5000, statement=statement)
-            if not source_table_rows:
-                self.log.error("Can't copy data from %s. Fetch all rows failed, see error above", src_table)
-                return False
-
-            # TODO: Temporary function. Will be removed
-            self.log.debug(f"Rows in the {src_table} MV before saving: {len(source_table_rows)}")
-
-            insert_statement = session.prepare(
-                "insert into {keyspace}.{name} ({columns}) values ({values})".format(
-                    keyspace=dest_keyspace,
-                    name=dest_table,
-                    columns=", ".join(columns),
-                    values=", ".join(["?" for _ in columns]),
-                )
-            )
-
-            # Save all rows
-            # Workers = Parallel queries = (nodes in cluster) x (cores in node) x 3
+            # Inserts = Parallel queries = (nodes in cluster) x (cores in node) x 3
             # (from https://www.scylladb.com/2017/02/13/efficient-full-table-scans-with-scylla-1-6/)
             cores = self.db_cluster.nodes[0].cpu_cores
             if not cores:
@@ -3593,36 +3571,49 @@ class ClusterTester(unittest.TestCase):
 
             session.default_consistency_level = ConsistencyLevel.QUORUM
 
-            results = execute_concurrent_with_args(
+            copier = TableRangeCopier(
                 session=session,
-                statement=insert_statement,
-                parameters=source_table_rows,
-                concurrency=max_workers,
-                results_generator=True,
+                src_keyspace=src_keyspace,
+                src_table=src_table,
+                dest_keyspace=dest_keyspace,
+                dest_table=dest_table,
+                columns=columns_list,
+                scan_concurrency=len(self.db_cluster.nodes) * 2,
+                insert_concurrency=max(max_workers // COPY_INSERT_WORKERS, 1),
             )
+            copier.copy()
+            if not copier.scanned_rows:
+                self.log.error("Can't copy data from %s. No rows were fetched", src_table)
+                return False
 
-            try:
-                succeeded_rows = sum(1 for (success, result) in results if success)
-                if succeeded_rows != len(source_table_rows):
-                    self.log.warning(
-                        "Problem during copying data. Not all rows were inserted. "
-                        "Rows expected to be inserted: %s; "
-                        "Actually inserted rows: %s.",
-                        len(source_table_rows),
-                        succeeded_rows,
-                    )
-                    return False
-            except Exception as exc:  # noqa: BLE001
-                self.log.warning("Problem during copying data: %s", exc)
+            self.log.debug(f"Rows in the {src_table} MV before saving: {copier.scanned_rows}")
+
+            if copier.inserted_rows != copier.scanned_rows:
+                self.log.warning(
+                    "Problem during copying data. Not all rows were inserted. "
+                    "Rows expected to be inserted: %s; "
+                    "Actually inserted rows: %s.",
+                    copier.scanned_rows,
+                    copier.inserted_rows,
+                )
+                return False
+
+            if mismatching_ranges := copier.verify():
+                self.log.warning(
+                    "Problem during copying data. Rows of %s token ranges of %s differ in %s",
+                    len(mismatching_ranges),
+                    src_table,
+                    dest_table,
+                )
                 return False
 
             result = session.execute(f"SELECT count(*) FROM {dest_keyspace}.{dest_table}")
             if result:
-                if result.current_rows[0].count != len(source_table_rows):
+                if result.current_rows[0].count != copier.scanned_rows:
                     self.log.warning(
                         "Problem during copying data. Rows in source table: %s; Rows in destination table: %s.",
-                        len(source_table_rows),
-                        len(result.current_rows),
+                        copier.scanned_rows,
+                        result.current_rows[0].count,
                     )
                     return False
         self.log.debug("All rows have been copied from %s to %s", src_table, dest_table)
@@ -4031,6 +4022,9 @@ class ClusterTester(unittest.TestCase):
         self.stop_event_analyzer()
         self.stop_resources()
 
+        with silence(parent=self, name="Stopping db log reader pool"):
+            self.test_config.stop_db_log_reader_pool()
+
         with silence(parent=self, name="closing decoding queue as needed"):
             if self.test_config.BACKTRACE_DECODING and hasattr(self.test_config.DECODING_QUEUE, "close"):
                 self.test_config.DECODING_QUEUE.close()
@@ -4051,11 +4045,17 @@ class ClusterTester(unittest.TestCase):
             self.collect_logs()
         self.collect_ssl_conf()
         self.clean_resources()
+        for k8s_cluster in self.k8s_clusters:
+            with silence(parent=self, name=f"Stopping K8S informers of {k8s_cluster.region_name}"):
+                k8s_cluster.stop_informers()
         time.sleep(1)  # Sleep is needed to let final event being saved into files
         self.save_email_data()
         time.sleep(1)  # Sleep is needed to let events from save_email_data being processed
         self.argus_collect_gemini_results()
         self.destroy_localhost()
+        with silence(parent=self, name="Removing caches of the test run"):
+            remove_hdr_cache_dir()
+            remove_backtrace_cache_dir()
         if not self.test_config.KEEP_ALIVE_DB_NODES:
             with silence(parent=self, name="Cleaning up SSL config directory"):
                 cleanup_ssl_config()
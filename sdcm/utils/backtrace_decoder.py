@@ -0,0 +1,185 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Helpers for batched decoding of Scylla backtraces with `addr2line'.
+
+Unique addresses of many backtraces are decoded by a single `addr2line -a' call (the `-a' option prints every input
+address before its frames, so the output can be split per address), and the decoded addresses are cached per build
+id in the logdir of the test, so the same frames of reactor stalls are decoded once per test run.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import json
+import shutil
+import logging
+import tempfile
+import threading
+from typing import Iterable, Optional
+
+from sdcm.prometheus import NemesisMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+BACKTRACE_CACHE_DIR_NAME = "backtrace-cache"
+BACKTRACE_DECODING_BATCH_SIZE = 100  # events
+BACKTRACE_DECODING_WORKERS = 4
+ADDR2LINE_MAX_ADDRESSES = 500  # per a single call, to keep the command line short enough
+
+ADDR2LINE_ADDRESS_RE = re.compile(r"^0x[0-9a-f]+: ", re.MULTILINE)
+BUILD_ID_RE = re.compile(r"^[0-9a-fA-F]+$")
+
+
+def get_backtrace_cache_dir() -> Optional[str]:
+    """Return the directory of the decoded frames cache of the test run (under its logdir), or None out of a test."""
+    if sct_test_logdir := os.environ.get("_SCT_TEST_LOGDIR"):
+        return os.path.join(sct_test_logdir, BACKTRACE_CACHE_DIR_NAME)
+    return None
+
+
+def remove_backtrace_cache_dir() -> None:
+    if cache_dir := get_backtrace_cache_dir():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def get_backtrace_addresses(raw_backtrace: str) -> list[str]:
+    return raw_backtrace.split()
+
+
+def addr2line_command(debug_file: str, addresses: Iterable[str]) -> str:
+    return f"addr2line -Cpifae {debug_file} {' '.join(addresses)}"
+
+
+def parse_addr2line_output(addresses: list[str], output: str) -> Optional[dict[str, str]]:
+    """Split output of `addr2line -Cpifa' into frames per address, return None if the output is unexpected.
+
+    Frames of an address are in the same format as `addr2line -Cpif' prints them (i.e., without the address.)
+    """
+    head, *frames = ADDR2LINE_ADDRESS_RE.split(output)
+    if head or len(frames) != len(addresses):
+        return None
+    return dict(zip(addresses, frames))
+
+
+def compose_backtrace(addresses: list[str], frames: dict[str, str]) -> str:
+    return "".join(frames[address] for address in addresses)
+
+
+class BacktraceFramesCache:
+    """Decoded frames of addresses per build id, persisted to `cache_dir' (None to keep them in the memory only.)
+
+    Only frames of build ids (i.e., hex strings) are persisted, frames of other keys are kept in the memory.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self._frames: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _get_cache_path(self, build_id: str) -> Optional[str]:
+        if not self.cache_dir or not BUILD_ID_RE.match(build_id):
+            return None
+        return os.path.join(self.cache_dir, f"{build_id}.json")
+
+    def _load(self, build_id: str) -> dict[str, str]:
+        if (frames := self._frames.get(build_id)) is not None:
+            return frames
+        frames = {}
+        if cache_path := self._get_cache_path(build_id):
+            try:
+                with open(cache_path, encoding="utf-8") as cache_file:
+                    frames = json.load(cache_file)
+                if not isinstance(frames, dict) or not all(
+                    isinstance(address, str) and isinstance(frame, str) for address, frame in frames.items()
+                ):
+                    raise ValueError("not a mapping of addresses to frames")
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as exc:
+                LOGGER.warning("Failed to load decoded backtrace frames of %s: %s", build_id, exc)
+                frames = {}
+        return self._frames.setdefault(build_id, frames)
+
+    def get(self, build_id: str, addresses: Iterable[str]) -> dict[str, str]:
+        with self._lock:
+            frames = self._load(build_id)
+            return {address: frames[address] for address in addresses if address in frames}
+
+    def update(self, build_id: str, frames: dict[str, str]) -> None:
+        with self._lock:
+            cached_frames = self._load(build_id)
+            cached_frames.update(frames)
+            if not (cache_path := self._get_cache_path(build_id)):
+                return
+            try:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    mode="w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+                ) as tmp_file:
+                    json.dump(cached_frames, tmp_file)
+                os.replace(tmp_file.name, cache_path)
+            except OSError as exc:
+                LOGGER.warning("Failed to save decoded backtrace frames of %s: %s", build_id, exc)
+
+
+class BacktraceDecodingMetrics:
+    """Gauges of the backtraces decoding queue: its depth, size of the last batch and max latency in the batch."""
+
+    def __init__(self):
+        self._queue_depth = NemesisMetrics.create_gauge(
+            "sct_backtrace_decoding_queue_depth", "Number of backtraces waiting for decoding", []
+        )
+        self._batch_size = NemesisMetrics.create_gauge(
+            "sct_backtrace_decoding_batch_size", "Number of backtraces decoded in the last batch", []
+        )
+        self._latency = NemesisMetrics.create_gauge(
+            "sct_backtrace_decoding_latency_seconds",
+            "Max time from queueing a backtrace till its decoding in the last batch",
+            [],
+        )
+
+    def observe(self, queue_depth: Optional[int], batch_size: int, latency: float) -> None:
+        if self._queue_depth and queue_depth is not None:
+            self._queue_depth.set(queue_depth)
+        if self._batch_size:
+            self._batch_size.set(batch_size)
+        if self._latency:
+            self._latency.set(latency)
+
+
+_DECODING_METRICS: Optional[BacktraceDecodingMetrics] = None
+_DECODING_METRICS_LOCK = threading.Lock()
+
+
+def backtrace_decoding_metrics() -> BacktraceDecodingMetrics:
+    global _DECODING_METRICS  # noqa: PLW0603
+    with _DECODING_METRICS_LOCK:
+        if _DECODING_METRICS is None:
+            _DECODING_METRICS = BacktraceDecodingMetrics()
+        return _DECODING_METRICS
+
+
+__all__ = (
+    "BACKTRACE_DECODING_BATCH_SIZE",
+    "BACKTRACE_DECODING_WORKERS",
+    "ADDR2LINE_MAX_ADDRESSES",
+    "BacktraceDecodingMetrics",
+    "BacktraceFramesCache",
+    "addr2line_command",
+    "backtrace_decoding_metrics",
+    "compose_backtrace",
+    "get_backtrace_addresses",
+    "parse_addr2line_output",
+)
@@ -41,7 +41,7 @@ from urllib.parse import urlparse, urljoin
 from unittest.mock import Mock
 from textwrap import dedent
 from contextlib import closing, contextmanager
-from functools import cached_property, lru_cache, singledispatch
+from functools import cached_property, lru_cache, partial, singledispatch
 from collections import defaultdict, namedtuple
 import concurrent.futures
 import hashlib
@@ -291,10 +291,41 @@ class S3Storage:
 
     def upload_file(self, file_path, dest_dir="", public=True):
         s3_url = self.generate_url(file_path, dest_dir)
-        s3_obj = f"{dest_dir}/{os.path.basename(file_path)}"
+        LOGGER.info(f"Uploading '{file_path}' to {s3_url}")
+        return self._upload(
+            upload=partial(self._bucket.upload_file, Filename=file_path, Config=self.transfer_config),
+            s3_url=s3_url,
+            s3_obj=f"{dest_dir}/{os.path.basename(file_path)}",
+            public=public,
+        )
+
+    def upload_fileobj(self, fileobj, file_name, dest_dir="", public=True):
+        """Upload a stream of unknown size (e.g., stdout of a compressor) using a multipart upload.
+
+        Parts are uploaded while the stream is being read, so only a few parts are kept in the memory.  If `fileobj'
+        raises an exception, the multipart upload is aborted.
+        """
+        s3_url = self.generate_url(file_name, dest_dir)
+        LOGGER.info(f"Uploading a stream to {s3_url}")
+        return self._upload(
+            upload=partial(self._bucket.upload_fileobj, Fileobj=fileobj, Config=self.stream_transfer_config),
+            s3_url=s3_url,
+            s3_obj=f"{dest_dir}/{file_name}",
+            public=public,
+        )
+
+    @property
+    def stream_transfer_config(self):
+        # A non-seekable stream is buffered in the memory until `multipart_threshold' to choose the upload method.
+        return boto3.s3.transfer.TransferConfig(
+            multipart_threshold=self.multipart_chunksize,
+            multipart_chunksize=self.multipart_chunksize,
+            num_download_attempts=self.num_download_attempts,
+        )
+
+    def _upload(self, upload: Callable[..., None], s3_url: str, s3_obj: str, public: bool) -> str:
         try:
-            LOGGER.info(f"Uploading '{file_path}' to {s3_url}")
-            self._bucket.upload_file(Filename=file_path, Key=s3_obj, Config=self.transfer_config)
+            upload(Key=s3_obj)
             LOGGER.info(f"Uploaded to {s3_url}")
 
             for user, canonical_id in KeyStore().get_acl_grantees().items():
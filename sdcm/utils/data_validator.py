@@ -13,10 +13,9 @@
 
 # Data validation module may be used with cassandra-stress user profile only
 #
-# **************** Caution **************************************************************
-# BE AWARE: During data validation all materialized views/expected table rows will be read into the memory
-#           Be sure your dataset will be less then 2Gb.
-# ****************************************************************************************
+# Rows of materialized views/expected tables are streamed page by page, sorted by primary key (sorted runs are
+# spilled to temporary files if they don't fit the sort buffer) and merge-compared, so the memory used by the data
+# validation is bounded by the page size and the sort buffer size (see `sdcm.utils.rows_comparison').
 #
 # Here is described Data validation module and requirements for user profile.
 # Please, read the explanation and requirements
@@ -134,13 +133,24 @@
 import json
 import os
 import re
+import heapq
 import logging
+import operator
 import uuid
-from typing import NamedTuple, Optional
+from typing import Iterator, NamedTuple, Optional
 
 from sdcm.sct_events import Severity
 from sdcm.test_config import TestConfig
-from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.database_query_utils import fetch_all_rows, stream_all_rows
+from sdcm.utils.range_digest import TableRangeDigests, diff_range_digests
+from sdcm.utils.rows_comparison import (
+    MAX_REPORTED_MISMATCHES,
+    SORT_BUFFER_SIZE,
+    RowKey,
+    RowsComparisonResult,
+    compare_sorted_rows,
+    sort_rows,
+)
 
 from sdcm.utils.user_profile import get_profile_content
 from sdcm.sct_events.health import DataValidatorEvent
@@ -151,10 +161,9 @@ LOGGER = logging.getLogger(__name__)
 
 class DataForValidation(NamedTuple):
     views: tuple  # list of view names with data for validation
-    actual_data: list
-    expected_data: list
-    before_update_rows: Optional[list]
-    after_update_rows: Optional[list]
+    comparison: RowsComparisonResult  # actual data (rows before and after update) vs. expected data
+    before_update_rows: int
+    after_update_rows: int
 
 
 class LongevityDataValidator:
@@ -163,9 +172,16 @@ class LongevityDataValidator:
     SUBSTRING_NOT_UPDATED = "_not_updated"
     SUBSTRING_DELETION = "_deletions"
     DEFAULT_FETCH_SIZE = 5000
+    SORT_BUFFER_SIZE = SORT_BUFFER_SIZE
+    MAX_REPORTED_MISMATCHES = MAX_REPORTED_MISMATCHES
 
     def __init__(
-        self, longevity_self_object, user_profile_name, base_table_partition_keys, stress_cmds_part="prepare_write_cmd"
+        self,
+        longevity_self_object,
+        user_profile_name,
+        base_table_partition_keys,
+        stress_cmds_part="prepare_write_cmd",
+        digest_mode=False,
     ):
         """
 
@@ -174,11 +190,14 @@ class LongevityDataValidator:
         :param stress_cmds_part: name of stress part from test yaml
         :param base_table_partition_keys: used for test of updated rows. List of all primary keys of base table
                                           For example: ['domain', 'published_date']
+        :param digest_mode: validate immutable rows by comparing digests of token ranges of the view and
+                            the expected data table, and compare rows of mismatching token ranges only
         """
         self.longevity_self_object = longevity_self_object
         self.user_profile_name = user_profile_name
         self.stress_cmds_part = stress_cmds_part
         self.base_table_partition_keys = base_table_partition_keys
+        self.digest_mode = digest_mode
 
         self._validate_not_updated_data = True
         self._validate_updated_data = True
@@ -332,6 +351,81 @@ class LongevityDataValidator:
         result = session.execute(f"SELECT * FROM {entity_name} LIMIT 1")
         return result.column_names
 
+    def get_primary_key_length(self, entity_name: str, session) -> int:
+        # Primary key columns go first in the `SELECT *' result
+        result = session.execute(
+            "SELECT kind FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s",
+            (self.keyspace_name, entity_name),
+        )
+        return sum(row.kind in ("partition_key", "clustering") for row in result)
+
+    def stream_sorted_rows(
+        self, statement: str, session, during_nemesis: bool, key: Optional[RowKey] = None
+    ) -> Iterator[tuple]:
+        return sort_rows(
+            stream_all_rows(
+                session=session,
+                default_fetch_size=self.DEFAULT_FETCH_SIZE,
+                statement=statement,
+                verbose=not during_nemesis,
+            ),
+            key=key,
+            buffer_size=self.SORT_BUFFER_SIZE,
+        )
+
+    def compare_by_range_digests(
+        self, actual_table: str, expected_table: str, session, key: Optional[RowKey] = None
+    ) -> Optional[RowsComparisonResult]:
+        """
+        Compare digests of token ranges of the tables and rows of the mismatching token ranges only.
+        Return None if the tables have different partition keys, so token ranges of them can't be compared.
+        """
+        actual = TableRangeDigests(session=session, keyspace=self.keyspace_name, table=actual_table)
+        expected = TableRangeDigests(session=session, keyspace=self.keyspace_name, table=expected_table)
+        if actual.partition_key != expected.partition_key:
+            LOGGER.debug(
+                "Partition keys of %s and %s are different (%s != %s), can't compare digests",
+                actual_table,
+                expected_table,
+                actual.partition_key,
+                expected.partition_key,
+            )
+            return None
+
+        actual_digests, expected_digests = actual.compute(), expected.compute()
+        mismatching_ranges = diff_range_digests(actual=actual_digests, expected=expected_digests)
+        LOGGER.debug(
+            "%s of %s token ranges of %s and %s are different",
+            len(mismatching_ranges),
+            len(actual.token_ranges),
+            actual_table,
+            expected_table,
+        )
+        comparison = RowsComparisonResult(
+            max_mismatches=self.MAX_REPORTED_MISMATCHES,
+            actual_rows=sum(
+                digest.rows for token_range, digest in actual_digests.items() if token_range not in mismatching_ranges
+            ),
+            expected_rows=sum(
+                digest.rows for token_range, digest in expected_digests.items() if token_range not in mismatching_ranges
+            ),
+        )
+        for token_range in mismatching_ranges:
+            compare_sorted_rows(
+                actual=sort_rows(actual.range_rows(token_range), key=key, buffer_size=self.SORT_BUFFER_SIZE),
+                expected=sort_rows(expected.range_rows(token_range), key=key, buffer_size=self.SORT_BUFFER_SIZE),
+                key=key,
+                result=comparison,
+            )
+        return comparison
+
+    @staticmethod
+    def format_mismatches(comparison: RowsComparisonResult) -> str:
+        return "\n".join(
+            f"  {mismatch.kind} row: actual={mismatch.actual}, expected={mismatch.expected}"
+            for mismatch in comparison.mismatches
+        )
+
     def copy_immutable_expected_data(self):
         # Create expected data for immutable rows
         if self._validate_not_updated_data:
@@ -447,68 +541,95 @@ class LongevityDataValidator:
         if not during_nemesis:
             LOGGER.debug("Verify immutable rows")
 
-        actual_result = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
-            verbose=not during_nemesis,
-        )
-        if not actual_result:
+        primary_key_length = self.get_primary_key_length(entity_name=self.expected_data_table_name, session=session)
+        row_key = operator.itemgetter(slice(0, primary_key_length)) if primary_key_length else None
+        try:
+            comparison = None
+            if self.digest_mode:
+                comparison = self.compare_by_range_digests(
+                    actual_table=self.view_name_for_not_updated_data,
+                    expected_table=self.expected_data_table_name,
+                    session=session,
+                    key=row_key,
+                )
+            if comparison is None:
+                comparison = compare_sorted_rows(
+                    actual=self.stream_sorted_rows(
+                        statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
+                        session=session,
+                        during_nemesis=during_nemesis,
+                        key=row_key,
+                    ),
+                    expected=self.stream_sorted_rows(
+                        statement=f"SELECT * FROM {self.expected_data_table_name}",
+                        session=session,
+                        during_nemesis=during_nemesis,
+                        key=row_key,
+                    ),
+                    key=row_key,
+                    max_mismatches=self.MAX_REPORTED_MISMATCHES,
+                )
+        except Exception as exc:  # noqa: BLE001
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Can't validate immutable rows. "
-                f"Fetch all rows from {self.view_name_for_not_updated_data} failed. "
-                f"See error above in the sct.log",
+                message=f"Can't validate immutable rows. Fetch rows from {self.view_name_for_not_updated_data} "
+                f"and {self.expected_data_table_name} failed: {exc}",
             ).publish()
             return
 
-        expected_result = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT * FROM {self.expected_data_table_name}",
-            verbose=not during_nemesis,
-        )
-        if not expected_result:
-            DataValidatorEvent.ImmutableRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate immutable rows. Fetch all rows from {self.expected_data_table_name} failed. "
-                f"See error above in the sct.log",
-            ).publish()
-            return
+        for entity_name, rows_number in (
+            (self.view_name_for_not_updated_data, comparison.actual_rows),
+            (self.expected_data_table_name, comparison.expected_rows),
+        ):
+            if not rows_number:
+                DataValidatorEvent.ImmutableRowsValidator(
+                    severity=Severity.WARNING,
+                    message=f"Can't validate immutable rows. Fetch all rows from {entity_name} failed. "
+                    f"See error above in the sct.log",
+                ).publish()
+                return
 
         # Issue https://github.com/scylladb/scylla/issues/6181
         # Not fail the test if unexpected additional rows where found in actual result table
-        if len(actual_result) > len(expected_result):
+        if comparison.actual_rows > comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Actual dataset length more then expected ({len(actual_result)} > {len(expected_result)}). "
-                f"Issue #6181",
+                message=f"Actual dataset length more then expected "
+                f"({comparison.actual_rows} > {comparison.expected_rows}). Issue #6181",
             ).publish()
         elif not during_nemesis:
-            assert len(actual_result) == len(expected_result), (
+            assert comparison.actual_rows == comparison.expected_rows, (
                 "One or more rows are not as expected, suspected LWT wrong update. "
-                f"Actual dataset length: {len(actual_result)}, Expected dataset length: {len(expected_result)}"
+                f"Actual dataset length: {comparison.actual_rows}, Expected dataset length: {comparison.expected_rows}"
             )
 
-            assert actual_result == expected_result, "One or more rows are not as expected, suspected LWT wrong update"
+            if not comparison.is_equal:
+                LOGGER.error(
+                    "Verify immutable rows. %s. First mismatches:\n%s",
+                    comparison.summary,
+                    self.format_mismatches(comparison),
+                )
+            assert comparison.is_equal, (
+                f"One or more rows are not as expected, suspected LWT wrong update. {comparison.summary}"
+            )
 
             # Raise info event at the end of the test only.
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.NORMAL, message="Validation immutable rows finished successfully"
             ).publish()
-        elif len(actual_result) < len(expected_result):
+        elif comparison.actual_rows < comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.ERROR,
                 error=f"Verify immutable rows. "
                 f"One or more rows not found as expected, suspected LWT wrong update. "
-                f"Actual dataset length: {len(actual_result)}, "
-                f"Expected dataset length: {len(expected_result)}",
+                f"Actual dataset length: {comparison.actual_rows}, "
+                f"Expected dataset length: {comparison.expected_rows}",
             ).publish()
         else:
             LOGGER.debug(
                 "Verify immutable rows. Actual dataset length: %s, Expected dataset length: %s",
-                len(actual_result),
-                len(expected_result),
+                comparison.actual_rows,
+                comparison.expected_rows,
             )
 
     def list_of_view_names_for_update_test(self):
@@ -522,63 +643,52 @@ class LongevityDataValidator:
             )
         )
 
-    def fetch_data_for_validation_after_update(
-        self, during_nemesis: bool, views_set: tuple, session
-    ) -> Optional[DataForValidation]:
+    def compare_data_after_update(self, during_nemesis: bool, views_set: tuple, session) -> Optional[DataForValidation]:
         # views_set[0] - view name with rows before update
         # views_set[1] - view name with rows after update
         # views_set[2] - view name with all expected partition keys
         # views_set[3] - do perform validation for the view or not
         partition_keys = ", ".join(self.base_table_partition_keys)
+        rows_numbers = dict.fromkeys(views_set[:2], 0)
 
-        before_update_rows = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT {partition_keys} FROM {views_set[0]}",
-            verbose=not during_nemesis,
-        )
-        if not before_update_rows:
-            DataValidatorEvent.UpdatedRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate updated rows. Fetch all rows from {views_set[0]} failed. "
-                f"See error above in the sct.log",
-            ).publish()
-            return None
-
-        after_update_rows = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT {partition_keys} FROM {views_set[1]}",
-            verbose=not during_nemesis,
-        )
-        if not after_update_rows:
+        def count_rows(view_name: str) -> Iterator[tuple]:
+            for row in self.stream_sorted_rows(
+                statement=f"SELECT {partition_keys} FROM {view_name}", session=session, during_nemesis=during_nemesis
+            ):
+                rows_numbers[view_name] += 1
+                yield row
+
+        try:
+            comparison = compare_sorted_rows(
+                actual=heapq.merge(count_rows(views_set[0]), count_rows(views_set[1])),
+                expected=self.stream_sorted_rows(
+                    statement=f"SELECT {partition_keys} FROM {views_set[2]}",
+                    session=session,
+                    during_nemesis=during_nemesis,
+                ),
+                max_mismatches=self.MAX_REPORTED_MISMATCHES,
+            )
+        except Exception as exc:  # noqa: BLE001
             DataValidatorEvent.UpdatedRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Can't validate updated rows. Fetch all rows from {views_set[1]} failed. "
-                f"See error above in the sct.log",
+                message=f"Can't validate updated rows. Fetch rows from {', '.join(views_set[:3])} failed: {exc}",
             ).publish()
             return None
 
-        expected_rows = fetch_all_rows(
-            session=session,
-            default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT {partition_keys} FROM {views_set[2]}",
-            verbose=not during_nemesis,
-        )
-        if not expected_rows:
-            DataValidatorEvent.UpdatedRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate updated row. Fetch all rows from {views_set[2]} failed. "
-                f"See error above in the sct.log",
-            ).publish()
-            return None
+        for view_name, rows_number in (*rows_numbers.items(), (views_set[2], comparison.expected_rows)):
+            if not rows_number:
+                DataValidatorEvent.UpdatedRowsValidator(
+                    severity=Severity.WARNING,
+                    message=f"Can't validate updated rows. Fetch all rows from {view_name} failed. "
+                    f"See error above in the sct.log",
+                ).publish()
+                return None
 
         return DataForValidation(
             views=views_set,
-            actual_data=sorted(before_update_rows + after_update_rows),
-            expected_data=sorted(expected_rows),
-            before_update_rows=before_update_rows,
-            after_update_rows=after_update_rows,
+            comparison=comparison,
+            before_update_rows=rows_numbers[views_set[0]],
+            after_update_rows=rows_numbers[views_set[1]],
         )
 
     @staticmethod
@@ -586,40 +696,38 @@ class LongevityDataValidator:
         log_dir = TestConfig().logdir()
         logdir = os.path.join(log_dir, "lwt_validator_data_for_debug")
         os.makedirs(logdir, exist_ok=True)
-        unique_index = uuid.UUID
+        unique_index = uuid.uuid4()
+        comparison = data_for_validation.comparison
 
         with open(
-            os.path.join(logdir, f"{data_for_validation.views[0]}_{unique_index}_debug.json"), "w", encoding="utf8"
-        ) as json_file:
-            json.dump(sorted(data_for_validation.before_update_rows), json_file)
-            LOGGER.info("before_update_rows json: %s", json_file.name)
-
-        with open(
-            os.path.join(logdir, f"{data_for_validation.views[1]}_{unique_index}_debug.json"), "w", encoding="utf8"
-        ) as json_file:
-            json.dump(sorted(data_for_validation.after_update_rows), json_file)
-            LOGGER.info("after_update_rows json: %s", json_file.name)
-
-        with open(
-            os.path.join(logdir, f"{data_for_validation.views[2]}_{unique_index}_debug.json"), "w", encoding="utf8"
-        ) as json_file:
-            json.dump(sorted(data_for_validation.expected_data), json_file)
-            LOGGER.info("expected_rows json: %s", json_file.name)
-
-        with open(
-            os.path.join(logdir, f"{data_for_validation.views[0]}_{unique_index}_actual_data_debug.json"),
+            os.path.join(logdir, f"{data_for_validation.views[0]}_{unique_index}_mismatches_debug.json"),
             "w",
             encoding="utf8",
         ) as json_file:
-            json.dump(sorted(data_for_validation.actual_data), json_file)
-            LOGGER.info("actual_data json: %s", json_file.name)
+            json.dump(
+                {
+                    "views": data_for_validation.views[:3],
+                    "before_update_rows": data_for_validation.before_update_rows,
+                    "after_update_rows": data_for_validation.after_update_rows,
+                    "actual_rows": comparison.actual_rows,
+                    "expected_rows": comparison.expected_rows,
+                    "missing_rows": comparison.missing_rows,
+                    "unexpected_rows": comparison.unexpected_rows,
+                    "first_mismatches": [
+                        {"kind": mismatch.kind, "actual": mismatch.actual, "expected": mismatch.expected}
+                        for mismatch in comparison.mismatches
+                    ],
+                },
+                json_file,
+                default=str,
+            )
+            LOGGER.info("mismatches json: %s", json_file.name)
 
         return logdir
 
     def analyze_updated_data_and_save_in_file(self, data_for_validation: DataForValidation, session, logdir: str):
-        actual_data_set = {tuple(item) for item in sorted(data_for_validation.actual_data)}
-        expected_data_set = {tuple(item) for item in sorted(data_for_validation.expected_data)}
-        difference_set = expected_data_set - actual_data_set  # missed in the actual data after update
+        # first missed in the actual data after update rows only
+        difference_set = data_for_validation.comparison.missing
 
         if not self.base_table_name:
             DataValidatorEvent.UpdatedRowsValidator(
@@ -753,20 +861,21 @@ class LongevityDataValidator:
                 ).publish()
                 continue
 
-            data_for_validation = self.fetch_data_for_validation_after_update(
+            data_for_validation = self.compare_data_after_update(
                 during_nemesis=during_nemesis, views_set=views_set, session=session
             )
             if data_for_validation is None:
                 continue
+            comparison = data_for_validation.comparison
 
             # Issue https://github.com/scylladb/scylla/issues/6181
             # Not fail the test if unexpected additional rows where found in actual result table
-            if len(data_for_validation.actual_data) > len(data_for_validation.expected_data):
+            if comparison.actual_rows > comparison.expected_rows:
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.WARNING,
                     message=f"View {views_set[0]}. "
-                    f"Actual dataset length {len(data_for_validation.actual_data)} "
-                    f"more then expected dataset length: {len(data_for_validation.expected_data)}. "
+                    f"Actual dataset length {comparison.actual_rows} "
+                    f"more then expected dataset length: {comparison.expected_rows}. "
                     f"Issue #6181",
                 ).publish()
                 continue
@@ -775,21 +884,22 @@ class LongevityDataValidator:
                 LOGGER.debug(
                     "Validation updated rows.  View %s. Actual dataset length %s, Expected dataset length: %s.",
                     data_for_validation.views[0],
-                    len(data_for_validation.actual_data),
-                    len(data_for_validation.expected_data),
+                    comparison.actual_rows,
+                    comparison.expected_rows,
                 )
                 continue
 
-            if (
-                len(data_for_validation.actual_data) != len(data_for_validation.expected_data)
-            ) or data_for_validation.actual_data != data_for_validation.expected_data:
+            if not comparison.is_equal:
                 LOGGER.debug(
-                    "%s. Rows amount:\n  before update: %s\n  after update: %s\n  expected: %s\n actual: %s",
+                    "%s. Rows amount:\n  before update: %s\n  after update: %s\n  expected: %s\n actual: %s\n"
+                    "%s. First mismatches:\n%s",
                     data_for_validation.views[0],
-                    len(data_for_validation.before_update_rows),
-                    len(data_for_validation.after_update_rows),
-                    len(data_for_validation.expected_data),
-                    len(data_for_validation.actual_data),
+                    data_for_validation.before_update_rows,
+                    data_for_validation.after_update_rows,
+                    comparison.expected_rows,
+                    comparison.actual_rows,
+                    comparison.summary,
+                    self.format_mismatches(comparison),
                 )
 
                 logdir = self.save_data_for_debugging(data_for_validation)
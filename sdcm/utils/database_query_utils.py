@@ -17,9 +17,12 @@ from __future__ import absolute_import, annotations
 import logging
 import os
 import sys
-from typing import List
+import time
+from typing import Iterator, List
 
 from cassandra import ConsistencyLevel
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.query import SimpleStatement
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.health import PartitionRowsValidationEvent
@@ -29,6 +32,9 @@ from sdcm.utils.decorators import retrying, optional_stage
 
 LOGGER = logging.getLogger(__name__)
 
+COUNT_ROWS_CONCURRENCY = 16
+COUNT_ROWS_PROGRESS_INTERVAL = 60  # seconds
+
 
 class PartitionsValidationAttributes:
     """
@@ -49,12 +55,14 @@ class PartitionsValidationAttributes:
         max_partitions_in_test_table: str | None = None,
         partition_range_with_data_validation: str | None = None,
         validate_partitions: bool = False,
+        count_rows_concurrency: int = COUNT_ROWS_CONCURRENCY,
     ):
         """
         limit_rows_number is a limit for querying rows per partition.
         When running a health-check and calling "validate_partitions",
         it would nor read more than this number of rows-per-partition.
         The default is NO limit_rows_number, marked by '0'.
+        count_rows_concurrency is a number of partitions counted concurrently.
         """
         self.tester = tester
         self.table_name = table_name
@@ -66,6 +74,7 @@ class PartitionsValidationAttributes:
         self.limit_rows_number = limit_rows_number
         self.partitions_dict_before = None
         self.validate_partitions = validate_partitions
+        self.count_rows_concurrency = count_rows_concurrency
 
     def _init_partition_range(self):
         if self.partition_range_with_data_validation:
@@ -93,6 +102,36 @@ class PartitionsValidationAttributes:
         )
         return count_pk_rows_cmd
 
+    def count_partitions_rows(self, session, pk_list: list, ignore_limit_rows_number: bool = False):
+        """
+        Count rows of the partitions using a single session, keeping up to `count_rows_concurrency' queries
+        in flight. The query is prepared, so the driver routes every query to a replica of the partition.
+        Yield (partition key, rows number) in the order of pk_list.
+        """
+        statement = session.prepare(
+            self.get_count_pk_rows_query(key="?", ignore_limit_rows_number=ignore_limit_rows_number)
+        )
+        results = execute_concurrent_with_args(
+            session,
+            statement,
+            ((key,) for key in pk_list),
+            concurrency=self.count_rows_concurrency,
+            raise_on_first_error=True,
+            results_generator=True,
+        )
+        start_time = last_report_time = time.perf_counter()
+        for counted, (key, (_, result)) in enumerate(zip(pk_list, results), start=1):
+            yield key, result.one().count
+            if (now := time.perf_counter()) - last_report_time >= COUNT_ROWS_PROGRESS_INTERVAL:
+                last_report_time = now
+                LOGGER.info(
+                    "Counted rows of %s/%s partitions of %s (%.1f partitions/s)",
+                    counted,
+                    len(pk_list),
+                    self.table_name,
+                    counted / (now - start_time),
+                )
+
     def collect_partitions_info(self, ignore_limit_rows_number: bool = False) -> dict[int, int] | None:
         # Get and save how many rows in each partition.
         # It may be used for validation data in the end of test.
@@ -126,33 +165,25 @@ class PartitionsValidationAttributes:
         )
         partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
         LOGGER.debug("%s partition-keys to query are in range: %s - %s", len(pk_list), pk_list[0], pk_list[-1])
+        start_time = time.perf_counter()
         with open(partitions_stats_file, "a", encoding="utf-8") as stats_file:
-            for i in pk_list:
-                count_pk_rows_cmd = self.get_count_pk_rows_query(
-                    key=i, ignore_limit_rows_number=ignore_limit_rows_number
-                )
-                try:
-                    with self.db_cluster.cql_connection_patient(
-                        node=self.db_cluster.nodes[0], connect_timeout=600
-                    ) as session:
-                        pk_rows_num_query_result = fetch_all_rows(
-                            session=session,
-                            default_fetch_size=3000,
-                            statement=count_pk_rows_cmd,
-                            retries=1,
-                            timeout=600,
-                            raise_on_exceeded=True,
-                            verbose=False,
-                        )
-                        pk_rows_num_result = pk_rows_num_query_result[0].count
-                except Exception as exc:  # noqa: BLE001
-                    TestFrameworkEvent(
-                        source=self.__class__.__name__, message=error_message.format(exc), severity=Severity.ERROR
-                    ).publish()
-                    return None
-
-                partitions[i] = pk_rows_num_result
-                stats_file.write(f"{i}:{partitions[i]}, ")
+            try:
+                with self.db_cluster.cql_connection_patient(
+                    node=self.db_cluster.nodes[0], connect_timeout=600
+                ) as session:
+                    session.default_consistency_level = ConsistencyLevel.QUORUM
+                    session.default_timeout = 600
+                    for key, rows_number in self.count_partitions_rows(
+                        session=session, pk_list=pk_list, ignore_limit_rows_number=ignore_limit_rows_number
+                    ):
+                        partitions[key] = rows_number
+                        stats_file.write(f"{key}:{rows_number}, ")
+            except Exception as exc:  # noqa: BLE001
+                TestFrameworkEvent(
+                    source=self.__class__.__name__, message=error_message.format(exc), severity=Severity.ERROR
+                ).publish()
+                return None
+        LOGGER.debug("Counted rows of %s partitions in %.1f seconds", len(partitions), time.perf_counter() - start_time)
         LOGGER.info(f"File with partitions row data: {partitions_stats_file}")
         if save_into_file_name == self.PARTITIONS_ROWS_BEFORE:
             self.partitions_rows_collected = True
@@ -282,3 +313,33 @@ def fetch_all_rows(
         dataset_size = sum(sys.getsizeof(e) for e in current_rows[0]) * len(current_rows)
         LOGGER.debug("Size of fetched rows: %s bytes", dataset_size)
     return current_rows
+
+
+def stream_all_rows(
+    session,
+    default_fetch_size,
+    statement,
+    retries: int = 4,
+    timeout: int = None,
+    verbose=True,
+) -> Iterator[tuple]:
+    """
+    Same as fetch_all_rows(), but yield rows (as tuples) page by page, holding a single page in the memory.
+    Failed page requests are retried starting from the same page; the last failure is raised.
+    """
+    if verbose:
+        LOGGER.debug("Stream all rows by statement: %s", statement)
+    query = SimpleStatement(statement, fetch_size=default_fetch_size, consistency_level=ConsistencyLevel.QUORUM)
+    execute_kwargs = {"timeout": timeout} if timeout else {}
+
+    @retrying(n=retries, sleep_time=5, message="Fetch page of rows")
+    def _fetch_page(paging_state):
+        return session.execute(query, paging_state=paging_state, **execute_kwargs)
+
+    paging_state = None
+    while True:
+        result = _fetch_page(paging_state)
+        for row in result.current_rows:
+            yield tuple(row)
+        if not (paging_state := result.paging_state):
+            break
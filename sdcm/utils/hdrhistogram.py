@@ -1,13 +1,24 @@
+import re
+import sys
+import math
+import ctypes
+import bisect
+import itertools
 import glob
+import json
+import shutil
+import hashlib
+import tempfile
 import os.path
 import time
 import logging
-import traceback
-from typing import Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import NamedTuple
 from dataclasses import asdict, dataclass, make_dataclass
 
 from hdrh.histogram import HdrHistogram
-from hdrh.log import HistogramLogReader
 
 from sdcm.utils.decorators import log_run_info
 
@@ -15,6 +26,24 @@ LOGGER = logging.getLogger(__file__)
 
 TIME_INTERVAL = 600
 PERCENTILES = [50, 90, 95, 99, 99.9, 99.99, 99.999]
+HDR_CACHE_DIR_NAME = "hdr-cache"
+
+# Same as in `hdrh.log'
+HDR_START_TIME_RE = re.compile(r"#\[StartTime: *([\d\.]*) ")
+HDR_BASE_TIME_RE = re.compile(r"#\[BaseTime: *([\d\.]*) ")
+HDR_INTERVAL_RE = re.compile(r"([\d\.]*),([\d\.]*),([\d\.]*),(.*)")
+
+
+def get_hdr_cache_dir() -> str | None:
+    """Return the directory of the HDR files cache of the test run (under its logdir), or None out of a test run."""
+    if sct_test_logdir := os.environ.get("_SCT_TEST_LOGDIR"):
+        return os.path.join(sct_test_logdir, HDR_CACHE_DIR_NAME)
+    return None
+
+
+def remove_hdr_cache_dir() -> None:
+    if cache_dir := get_hdr_cache_dir():
+        shutil.rmtree(cache_dir, ignore_errors=True)
 
 
 def make_hdrhistogram_summary(
@@ -122,6 +151,101 @@ class _HdrHistogram(HdrHistogram):
             **kwargs,
         )
 
+    def _recorded_values(self) -> list[tuple[int, int]]:
+        """
+        (count, median equivalent value) for every recorded value, in the same order as
+        `get_recorded_iterator()' visits them, but without the iterator overhead.
+        """
+        return [
+            (count, self._hdr_median_equiv_value(self.get_highest_equivalent_value(self.get_value_from_index(index))))
+            for index, count in enumerate(self.counts[: self.counts_len])
+            if count
+        ]
+
+    def reset(self) -> None:
+        """Same as `HdrHistogram.reset()', but clear the counts with a single `memset()'."""
+        ctypes.memset(ctypes.addressof(self.counts), 0, ctypes.sizeof(self.counts))
+        self.total_count = 0
+        self.min_value = sys.maxsize
+        self.max_value = 0
+        self.start_time_stamp_msec = sys.maxsize
+        self.end_time_stamp_msec = 0
+
+    def get_percentile_to_value_dict(self, percentile_list: list[float]) -> dict[float, int]:
+        """Same result as `HdrHistogram.get_percentile_to_value_dict()', but with a binary search in cumulative counts."""
+        result = {}
+        if not self.total_count:
+            return result
+        # all counts are between the indexes of the min and max values
+        first_index = self._counts_index_for(self.get_min_value())
+        last_index = min(
+            self._counts_index_for(self.max_value), self.counts_len - 1, self.encoder.payload.counts_len - 1
+        )
+        cumulative_counts = list(itertools.accumulate(self.counts[first_index : last_index + 1]))
+        for percentile in sorted(set(percentile_list)):
+            if percentile > 100:
+                break
+            index = bisect.bisect_left(cumulative_counts, self.get_target_count_at_percentile(percentile))
+            if index == len(cumulative_counts):
+                break
+            value_at_index = self.get_value_from_index(first_index + index)
+            if percentile:
+                result[percentile] = self.get_highest_equivalent_value(value_at_index)
+            else:
+                result[percentile] = self.get_lowest_equivalent_value(value_at_index)
+        return result
+
+    def get_mean_value(self, recorded_values: list[tuple[int, int]] | None = None) -> float:
+        if not self.total_count:
+            return 0.0
+        total = sum(count * value for count, value in recorded_values or self._recorded_values())
+        return float(total) / self.total_count
+
+    def get_stddev(self) -> float:
+        """Same result as `HdrHistogram.get_stddev()' (same operations in the same order), but much faster."""
+        if not self.total_count:
+            return 0.0
+        recorded_values = self._recorded_values()
+        mean = self.get_mean_value(recorded_values)
+        geometric_dev_total = 0.0
+        for count, value in recorded_values:
+            dev = (value * 1.0) - mean
+            geometric_dev_total += (dev * dev) * count
+        return math.sqrt(geometric_dev_total / self.total_count)
+
+
+class HdrLogLineDecoder:
+    """Decode HDR log lines one by one (e.g., while following a log of a stress tool) into few percentiles.
+
+    A histogram is reused per tag, and lines with tags which are not tracked are skipped before decoding their
+    payload.  Only the requested percentiles are computed, in ms.
+    """
+
+    def __init__(self, hdr_tags: list[str], percentiles: list[float]):
+        self.hdr_tags = set(hdr_tags)
+        self.percentiles = percentiles
+        self._histograms: dict[str, _HdrHistogram] = {}
+
+    def decode(self, log_line: str) -> tuple[str, dict[float, float | None]] | None:
+        """Return the tag and values keyed by percentile, or None if the line is not an interval of a tracked tag.
+
+        The value of a percentile which the histogram has no value for (e.g., an empty histogram) is None.
+        """
+        if not log_line.startswith("Tag="):
+            return None
+        tag, _, _, _, encoded_hist = log_line.split(",")
+        if (tag := tag[4:]) not in self.hdr_tags:
+            return None
+        if (histogram := self._histograms.get(tag)) is None:
+            histogram = self._histograms[tag] = _HdrHistogram()
+        else:
+            histogram.reset()
+        histogram.decode_and_add(encoded_hist.strip())
+        percentiles = histogram.get_percentile_to_value_dict(self.percentiles)
+        return tag, {
+            perc: round(percentiles[perc] / 1_000_000, 2) if perc in percentiles else None for perc in self.percentiles
+        }
+
 
 @dataclass
 class _HdrRangeHistogram:
@@ -131,6 +255,306 @@ class _HdrRangeHistogram:
     histogram: _HdrHistogram | None
 
 
+class _HdrLogInterval(NamedTuple):
+    tag: str | None
+    start_time_sec: float
+    end_time_sec: float
+    offset_start_time_sec: float
+    payload: str
+
+
+class _HdrLogParser:
+    """Parse lines of HDR log file the same way as `hdrh.log.HistogramLogReader', without decoding histograms."""
+
+    def __init__(self):
+        self.start_time_sec = 0.0
+        self.observed_start_time = False
+        self.base_time_sec = 0.0
+        self.observed_base_time = False
+
+    def parse_line(self, line: str) -> _HdrLogInterval | None:
+        if line.startswith("#"):
+            if match := HDR_START_TIME_RE.match(line):
+                self.start_time_sec = float(match.group(1))
+                self.observed_start_time = True
+                return None
+            if match := HDR_BASE_TIME_RE.match(line):
+                self.base_time_sec = float(match.group(1))
+                self.observed_base_time = True
+                return None
+        tag = None
+        if line.startswith("Tag="):
+            index = line.find(",")
+            tag, line = line[4:index], line[index + 1 :]
+        if not (match := HDR_INTERVAL_RE.match(line)):
+            return None
+        log_time_stamp_sec = float(match.group(1))
+        interval_length_sec = float(match.group(2))
+        if not self.observed_start_time:
+            self.start_time_sec = log_time_stamp_sec
+            self.observed_start_time = True
+        if not self.observed_base_time:
+            if log_time_stamp_sec < self.start_time_sec - (365 * 24 * 3600.0):
+                self.base_time_sec = self.start_time_sec
+            else:
+                self.base_time_sec = 0.0
+            self.observed_base_time = True
+        start_time_sec = log_time_stamp_sec + self.base_time_sec
+        return _HdrLogInterval(
+            tag=tag,
+            start_time_sec=start_time_sec,
+            end_time_sec=start_time_sec + interval_length_sec,
+            offset_start_time_sec=start_time_sec - self.start_time_sec,
+            payload=match.group(4),
+        )
+
+
+class _HdrCachedInterval(NamedTuple):
+    tag: str | None
+    start_time_sec: float
+    end_time_sec: float
+    offset_start_time_sec: float
+    payload_offset: int
+    payload_length: int
+
+
+_NOT_CACHED = object()
+
+
+class _HdrFileCache:
+    """
+    Incremental parsing state of a single HDR log file.
+
+    Keeps the intervals parsed so far (payloads are read by offsets only when needed), the byte offset where
+    parsing stopped, and histograms of time windows which can't change anymore (an interval which starts
+    after the window was already seen.)  The cache is saved to `cache_dir' as JSON, so summaries of a growing
+    file parse only lines appended since the previous summary, and don't sum up the same closed windows again.
+    A line is parsed only when it's complete (ends with a newline.)
+    """
+
+    VERSION = 2
+    FINGERPRINT_SIZE = 256
+
+    def __init__(self, hdr_file: str):
+        self.version = self.VERSION
+        self.hdr_file = hdr_file
+        self.file_id = None
+        self.fingerprint = b""
+        self.offset = 0
+        self.parser = _HdrLogParser()
+        self.intervals: list[_HdrCachedInterval] = []
+        self.windows: dict[tuple[float, float, bool, str], tuple[float, float, bytes] | None] = {}
+        self.changed = False
+
+    @staticmethod
+    def get_cache_path(hdr_file: str, cache_dir: str) -> str:
+        return os.path.join(cache_dir, hashlib.sha1(os.path.abspath(hdr_file).encode()).hexdigest() + ".json")
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "hdr_file": self.hdr_file,
+            "file_id": self.file_id,
+            "fingerprint": self.fingerprint.hex(),
+            "offset": self.offset,
+            "parser": vars(self.parser),
+            "intervals": self.intervals,
+            "windows": [
+                [*key, None if value is None else [value[0], value[1], value[2].decode("ascii")]]
+                for key, value in self.windows.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_HdrFileCache":
+        cache = cls(data["hdr_file"])
+        cache.file_id = tuple(data["file_id"]) if data["file_id"] is not None else None
+        cache.fingerprint = bytes.fromhex(data["fingerprint"])
+        cache.offset = data["offset"]
+        vars(cache.parser).update(data["parser"])
+        cache.intervals = [_HdrCachedInterval(*interval) for interval in data["intervals"]]
+        cache.windows = {
+            (start, end, absolute, tag): None if value is None else (value[0], value[1], value[2].encode("ascii"))
+            for start, end, absolute, tag, value in data["windows"]
+        }
+        return cache
+
+    @classmethod
+    def load(cls, hdr_file: str, cache_dir: str | None) -> "_HdrFileCache":
+        if cache_dir:
+            try:
+                with open(cls.get_cache_path(hdr_file, cache_dir), encoding="utf-8") as fobj:
+                    data = json.load(fobj)
+                if data.get("version") == cls.VERSION and data.get("hdr_file") == hdr_file:
+                    return cls.from_dict(data)
+            except FileNotFoundError:
+                pass
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("Failed to load HDR cache of %s, parse it from the start: %s", hdr_file, exc)
+        return cls(hdr_file)
+
+    def save(self, cache_dir: str | None) -> None:
+        if not cache_dir or not self.changed:
+            return
+        self.changed = False
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+        ) as tmp_file:
+            json.dump(self.to_dict(), tmp_file)
+        os.replace(tmp_file.name, self.get_cache_path(self.hdr_file, cache_dir))
+
+    def update(self) -> None:
+        """Parse lines appended since the previous update, start from scratch if the file was replaced."""
+        with open(self.hdr_file, "rb") as fobj:
+            stat = os.fstat(fobj.fileno())
+            file_id = (stat.st_dev, stat.st_ino)
+            if (
+                file_id != self.file_id
+                or stat.st_size < self.offset
+                or os.pread(fobj.fileno(), len(self.fingerprint), 0) != self.fingerprint
+            ):
+                if self.file_id is not None:
+                    LOGGER.debug("File %s was replaced or truncated, parse it from the start", self.hdr_file)
+                self.__init__(self.hdr_file)
+                self.file_id = file_id
+                self.changed = True
+            if stat.st_size == self.offset:
+                return
+            fobj.seek(self.offset)
+            for line in fobj:
+                if not line.endswith(b"\n"):
+                    break
+                if interval := self.parser.parse_line(line.decode("utf-8")):
+                    payload = interval.payload.encode("utf-8")
+                    self.intervals.append(
+                        _HdrCachedInterval(
+                            tag=interval.tag,
+                            start_time_sec=interval.start_time_sec,
+                            end_time_sec=interval.end_time_sec,
+                            offset_start_time_sec=interval.offset_start_time_sec,
+                            payload_offset=self.offset + line.rfind(payload),
+                            payload_length=len(payload),
+                        )
+                    )
+                self.offset += len(line)
+            if len(self.fingerprint) < self.FINGERPRINT_SIZE:
+                self.fingerprint = os.pread(fobj.fileno(), min(self.offset, self.FINGERPRINT_SIZE), 0)
+            self.changed = True
+
+
+def _read_hdr_file(
+    hdr_file: str,
+    hdr_tags: list[str],
+    windows: list[tuple[float, float]],
+    absolute: bool,
+    cache_dir: str | None = None,
+) -> dict[tuple[int, str], _HdrHistogram]:
+    """Read HDR log file once and sum up its intervals for all tags and time windows together.
+
+    Return histograms keyed by (window index, tag), only for pairs which have at least one interval.  Same result
+    as reading the file with `HistogramLogReader' per a tag and a window: intervals are matched by a tag case
+    insensitively, and a window is closed on the first interval which starts after its end.
+
+    Parsed intervals and histograms of closed windows are cached in `cache_dir' (see `_HdrFileCache'.)
+    """
+    tags_by_name = {}
+    for tag in hdr_tags:
+        tags_by_name.setdefault(tag.lower(), []).append(tag)
+    histograms = {}
+    index_errors = 0
+    LOGGER.debug("Parsing file: %s tags %s", hdr_file, hdr_tags)
+    try:
+        cache = _HdrFileCache.load(hdr_file, cache_dir)
+        cache.update()
+
+        open_windows = []
+        for index, (start, end) in enumerate(windows):
+            cached = [cache.windows.get((start, end, absolute, tag), _NOT_CACHED) for tag in hdr_tags]
+            if _NOT_CACHED in cached:
+                open_windows.append((index, (start, end)))
+                continue
+            for tag, value in zip(hdr_tags, cached):
+                if value is not None:
+                    histograms[index, tag] = _decode_hdr_histogram(tag, *value)
+
+        closed_windows = []
+        with open(hdr_file, "rb") as fobj:
+            for interval in cache.intervals:
+                if not open_windows:
+                    break
+                timestamp = interval.start_time_sec if absolute else interval.offset_start_time_sec
+                if closing := [window for window in open_windows if timestamp > window[1][1]]:
+                    closed_windows.extend(index for index, _ in closing)
+                    open_windows = [window for window in open_windows if timestamp <= window[1][1]]
+                if not (in_range := [index for index, (start, _) in open_windows if timestamp >= start]):
+                    continue
+                if not (tags := tags_by_name.get((interval.tag or "").lower())):
+                    continue
+                try:
+                    decoded = HdrHistogram.decode(
+                        os.pread(fobj.fileno(), interval.payload_length, interval.payload_offset).decode("utf-8")
+                    )
+                except IndexError:
+                    LOGGER.warning(
+                        "IndexError in file %s at offset %s, skipping this line", hdr_file, interval.payload_offset
+                    )
+                    index_errors += 1
+                    continue
+                decoded.set_start_time_stamp(interval.start_time_sec * 1000.0)
+                decoded.set_end_time_stamp(interval.end_time_sec * 1000.0)
+                for tag in tags:
+                    for index in in_range:
+                        if (histogram := histograms.get((index, tag))) is None:
+                            histogram = histograms[index, tag] = _HdrHistogram()
+                            histogram.set_tag(tag)
+                            histogram.set_start_time_stamp(decoded.get_start_time_stamp())
+                        histogram.add(decoded)
+
+        for index in closed_windows:
+            start, end = windows[index]
+            for tag in hdr_tags:
+                histogram = histograms.get((index, tag))
+                cache.windows[start, end, absolute, tag] = (
+                    None if histogram is None else _encode_hdr_histogram(histogram)
+                )
+            cache.changed = True
+        cache.save(cache_dir)
+    except Exception as exc:
+        LOGGER.error("Failed to parse file %s with tags %s: %s", hdr_file, hdr_tags, exc)
+        raise
+    if index_errors > 0:
+        LOGGER.warning("%s lines were ignored in file %s due to IndexError", index_errors, hdr_file)
+    return histograms
+
+
+def _read_hdr_file_encoded(
+    hdr_file: str,
+    hdr_tags: list[str],
+    windows: list[tuple[float, float]],
+    absolute: bool,
+    cache_dir: str | None = None,
+) -> dict[tuple[int, str], tuple[float, float, bytes]]:
+    """Same as `_read_hdr_file()', but histograms are encoded to be passed between processes."""
+    return {
+        key: _encode_hdr_histogram(histogram)
+        for key, histogram in _read_hdr_file(hdr_file, hdr_tags, windows, absolute, cache_dir).items()
+    }
+
+
+def _encode_hdr_histogram(histogram: _HdrHistogram) -> tuple[float, float, bytes]:
+    return histogram.get_start_time_stamp(), histogram.get_end_time_stamp(), histogram.encode()
+
+
+def _decode_hdr_histogram(tag: str, start_time_stamp: float, end_time_stamp: float, payload: bytes) -> _HdrHistogram:
+    histogram = _HdrHistogram()
+    histogram.set_tag(tag)
+    histogram.decode_and_add(payload)
+    histogram.set_start_time_stamp(start_time_stamp)
+    histogram.set_end_time_stamp(end_time_stamp)
+    return histogram
+
+
 class _HdrRangeHistogramBuilder:
     def __init__(
         self,
@@ -139,6 +563,7 @@ class _HdrRangeHistogramBuilder:
         start_time: int | float,
         end_time: int | float,
         hdr_file_pattern: str = "*/hdrh-*.hdr",
+        max_workers: int | None = None,
     ):
         self.hdr_tags = hdr_tags
         self.stress_operation = stress_operation.upper().strip()
@@ -146,6 +571,8 @@ class _HdrRangeHistogramBuilder:
         self.end_time = end_time
         self.hdrh_files_pattern = hdr_file_pattern
         self.absolute_time = True
+        self.max_workers = max_workers
+        self.cache_dir = get_hdr_cache_dir()  # set to None to parse the files from scratch every time
 
     @log_run_info("HdrHistogram Summary Builder")
     def build_histogram_summary(self, path: str) -> list[dict[str, dict[str, int]]]:
@@ -155,10 +582,10 @@ class _HdrRangeHistogramBuilder:
 
         LOGGER.debug(f"Building histogram summary for {path} with tags {self.hdr_tags}")
         try:
+            histograms = self._build_range_histograms(path, windows=[(self.start_time, self.end_time)])
             scan_results = {}
             for tag in self.hdr_tags:
-                LOGGER.debug(f"Get result for tag {tag}")
-                summary = self.build_histogram_summary_by_tag(path, tag)
+                summary = self._get_summary_for_operation_by_hdr_tag(histograms.get((0, tag)))
                 LOGGER.debug(f"Summary for tag {tag}: {summary}")
                 if summary:
                     scan_results.update(summary)
@@ -186,46 +613,27 @@ class _HdrRangeHistogramBuilder:
             else:
                 window_step = interval or TIME_INTERVAL
 
-            interval_num = 0
-            start_intervals = range(start_ts, end_ts, window_step)
+            windows = [
+                (start_interval, min(start_interval + window_step, end_ts))
+                for start_interval in range(start_ts, end_ts, window_step)
+            ]
             LOGGER.debug(
-                f"Building histogram summary for {path} with tags {self.hdr_tags} and intervals {len(start_intervals)}"
+                f"Building histogram summary for {path} with tags {self.hdr_tags} and intervals {len(windows)}"
             )
 
-            results = {}
-            for start_interval in start_intervals:
-                end_interval = end_ts if start_interval + window_step > end_ts else start_interval + window_step
-                for hdr_tag in self.hdr_tags:
-                    summary_with_interval_by_tag = self._build_histograms_summary_with_interval_by_tag(
-                        path, hdr_tag, start_interval, end_interval, interval_num
-                    )
-                    LOGGER.debug(
-                        f"Got result for tag {hdr_tag} and interval #{interval_num}: {summary_with_interval_by_tag}"
-                    )
-                    if summary_with_interval_by_tag:
-                        if summary_with_interval_by_tag["interval_num"] not in results:
-                            results[summary_with_interval_by_tag["interval_num"]] = {}
-                        results[summary_with_interval_by_tag["interval_num"]].update(
-                            summary_with_interval_by_tag["result"]
-                        )
-                        LOGGER.debug(
-                            "Updated results for interval_num=%s", summary_with_interval_by_tag.get("interval_num")
-                        )
-                interval_num += 1
-
-                LOGGER.debug(
-                    f"Processing interval {interval_num} out of {len(start_intervals)} for tags {self.hdr_tags}"
-                )
-
-            LOGGER.debug("Finalised results for path %s", path)
-            keys = list(results.keys())
-            LOGGER.debug("Finalised results keys for path %s: %s", path, keys)
-            keys.sort()
+            # All intervals of all the files are read in a single pass
+            histograms = self._build_range_histograms(path, windows=windows)
             summary = []
-            for key in keys:
-                LOGGER.debug("Adding results for key %s", key)
-                summary.append(results[key])
-                LOGGER.debug("Added results for key %s", key)
+            for interval_num in range(len(windows)):
+                result = {}
+                for hdr_tag in self.hdr_tags:
+                    if summary_by_tag := self._get_summary_for_operation_by_hdr_tag(
+                        histograms.get((interval_num, hdr_tag))
+                    ):
+                        result.update(summary_by_tag)
+                LOGGER.debug(f"Got result for interval #{interval_num}: {result}")
+                if result:
+                    summary.append(result)
             return summary
         except Exception as e:
             LOGGER.error(f"Error building histogram summary for {path} with tags {self.hdr_tags}: {e}")
@@ -253,100 +661,59 @@ class _HdrRangeHistogramBuilder:
 
         return self._get_summary_for_operation_by_hdr_tag(histogram) or {}
 
-    def _build_histogram_from_file(self, hdr_file: str, hdr_tag: str) -> _HdrRangeHistogram | None:
-        def analyze_hdr_file():
-            """
-            :return: tuple(tag_not_found, file_with_correct_time_interval)
-            tag_not_found: bool - row with HDR tag (like "WRITE-st") is not found in the file
-            file_with_correct_time_interval: bool - HDR file keep the data for different time interval
-            """
-            hdr_reader = HistogramLogReader(hdr_file, _HdrHistogram())
-            if not (
-                next_hist := hdr_reader.get_next_interval_histogram(
-                    range_start_time_sec=self.start_time, range_end_time_sec=self.end_time, absolute=self.absolute_time
-                )
-            ):
-                LOGGER.debug(
-                    f"no histogram entry found in file {hdr_file} starting from {self.start_time} ending at {self.end_time} absolute_time={self.absolute_time}"
-                )
-                return True, False
-
-            tag_not_found = True
-            file_with_correct_time_interval = True
-            index_errors = 0
-            line_index = 5
-            while next_hist:
-                tag = next_hist.get_tag()
-                # The tag in the HDR file for the stress command with the user profile is in lowercase.
-                # Modify the tag validation to perform a case-insensitive comparison.
-                if tag.lower() == hdr_tag.lower():
-                    if tag_not_found:
-                        LOGGER.debug(f"found histogram entry with tag {hdr_tag} in file {hdr_file}")
-                    if histogram.get_start_time_stamp() == 0:
-                        histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
-                    histogram.add(next_hist)
-                    tag_not_found = False
-
-                while next_hist:
-                    line_index += 1
-                    try:
-                        next_hist = hdr_reader.get_next_interval_histogram(
-                            range_start_time_sec=self.start_time,
-                            range_end_time_sec=self.end_time,
-                            absolute=self.absolute_time,
-                        )
-                    except IndexError:
-                        LOGGER.warning(f"IndexError in file {hdr_file} near line {line_index}, skipping this line")
-                        index_errors += 1
-                        continue
-                    break
-            if index_errors > 0:
-                LOGGER.warning(f"{index_errors} lines were ignored in file {hdr_file} due to IndexError")
-            LOGGER.debug(
-                f"Finished reading file {hdr_file} with tag {hdr_tag}, tag_not_found={tag_not_found} file_with_correct_time_interval={file_with_correct_time_interval}"
-            )
-            return tag_not_found, file_with_correct_time_interval
-
-        if not os.path.exists(hdr_file):
-            LOGGER.error("File doesn't exists: %s", hdr_file)
-            return _HdrRangeHistogram(start_time=0, end_time=0, histogram=None, hdr_tag=None)
-
-        LOGGER.debug("Parsing file: %s tag %s", hdr_file, hdr_tag)
-        histogram = _HdrHistogram()
-        histogram.set_tag(hdr_tag)
-        try:
-            _, file_with_correct_time_interval = analyze_hdr_file()
-        except Exception as e:
-            LOGGER.error("Failed to parse file %s with tag %s: %s", hdr_file, hdr_tag, e)
-            LOGGER.error(traceback.format_exc())
-            raise
-        if not file_with_correct_time_interval:
-            LOGGER.debug(
-                f"The file {hdr_file} does not include the time interval from `{self.start_time}` to `{self.end_time}`"
-            )
-            # Keep this message for future debug
-            LOGGER.debug(
-                "The file '%s' does not include the time interval from `%s` to `%s`",
-                hdr_file,
-                self.start_time,
-                self.end_time,
+    def _read_hdr_files(self, hdr_files: list[str], windows: list[tuple[float, float]]) -> list[dict]:
+        """
+        Read hdr log files, in a process pool if there are several of them.
+        Return histograms keyed by (window index, tag) for every file.
+        """
+        max_workers = min(len(hdr_files), self.max_workers or os.cpu_count() or 1)
+        if max_workers <= 1:
+            return [
+                _read_hdr_file(hdr_file, self.hdr_tags, windows, self.absolute_time, self.cache_dir)
+                for hdr_file in hdr_files
+            ]
+        LOGGER.debug("Reading %s hdr files using %s processes", len(hdr_files), max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = executor.map(
+                _read_hdr_file_encoded,
+                hdr_files,
+                repeat(self.hdr_tags),
+                repeat(windows),
+                repeat(self.absolute_time),
+                repeat(self.cache_dir),
             )
-            return None
-
-        LOGGER.debug(f"Collected histogram from file {hdr_file} with tag {hdr_tag}: {histogram}")
-        # Keep this message for future debug
-        LOGGER.debug(
-            "Collect data from the file '%s' (time interval from `%s` to `%s`)",
-            hdr_file,
-            self.start_time,
-            self.end_time,
-        )
-        if histogram.get_start_time_stamp() == 0:
-            return None
+            return [{key: _decode_hdr_histogram(key[1], *value) for key, value in result.items()} for result in results]
 
-        return _HdrRangeHistogram(
-            start_time=self.start_time, end_time=self.end_time, histogram=histogram, hdr_tag=histogram.get_tag()
-        )
+    def _build_range_histograms(
+        self, path: str, windows: list[tuple[float, float]]
+    ) -> dict[tuple[int, str], _HdrRangeHistogram]:
+        """
+        Build Range Histograms for all tags and time windows from a hdr log file or from all
+        hdr log files found in dir by pattern. Every file is read once.
+        Return them keyed by (window index, tag), only for pairs which have data.
+        """
+        if os.path.isfile(path):
+            hdr_files = [path]
+        elif os.path.isdir(path):
+            hdr_files = []
+            for hdr_file in self._get_list_of_hdr_files(path):
+                if os.stat(hdr_file).st_size == 0:
+                    LOGGER.error("File %s is empty", hdr_file)
+                    continue
+                hdr_files.append(hdr_file)
+        else:
+            LOGGER.info(f"No histogram for path {path}  - not a file or directory")
+            return {}
+
+        collected_histograms: dict[tuple[int, str], list[_HdrRangeHistogram]] = {}
+        for hdr_file, histograms in zip(hdr_files, self._read_hdr_files(hdr_files, windows)):
+            LOGGER.debug(f"Collected histograms from file {hdr_file}: {sorted(histograms)}")
+            for (index, tag), histogram in histograms.items():
+                start_time, end_time = windows[index]
+                collected_histograms.setdefault((index, tag), []).append(
+                    _HdrRangeHistogram(start_time=start_time, end_time=end_time, histogram=histogram, hdr_tag=tag)
+                )
+        return {key: self._merge_range_histograms(value) for key, value in collected_histograms.items()}
 
     def _get_list_of_hdr_files(self, base_path: str) -> list[str]:
         """
@@ -384,30 +751,6 @@ class _HdrRangeHistogramBuilder:
         LOGGER.debug(f"Merged histograms with tag {final_hst.hdr_tag} result {final_hst}")
         return final_hst
 
-    def _build_histogram_from_dir(
-        self,
-        base_path: str,
-        hdr_tag: str,
-    ) -> _HdrRangeHistogram:
-        """
-        search in dir from 'base_path' with provided pattern or
-        default global pattern 'CS_HDR_FILE_WC' hdr log files
-        and build Range Histogram with time interval (start_time, end_time)
-        For timestamps is used absolute time in ms since epoch start
-        """
-        collected_histograms: list[_HdrRangeHistogram] = []
-        hdr_files = self._get_list_of_hdr_files(base_path)
-        for hdr_file in hdr_files:
-            if os.stat(hdr_file).st_size == 0:
-                LOGGER.error("File %s is empty", hdr_file)
-                continue
-
-            file_range_histogram = self._build_histogram_from_file(hdr_file, hdr_tag)
-            LOGGER.debug(f"Collected histogram from file {hdr_file} with tag {hdr_tag}: {file_range_histogram}")
-            if file_range_histogram:
-                collected_histograms.append(file_range_histogram)
-        return self._merge_range_histograms(collected_histograms)
-
     def _get_workload_type_by_hdr_tag(self, hdr_tag):
         # NOTE: different benchmarking tools have completly different approaches for HDR tag usages.
         #
@@ -435,9 +778,17 @@ class _HdrRangeHistogramBuilder:
         # NOTE: following exception raising is not expected in the properly configured test scenarios
         raise ValueError(f"Failed to detect the workload type for the following hdr_tag: {hdr_tag}")
 
-    def _get_summary_for_operation_by_hdr_tag(self, histogram: _HdrRangeHistogram) -> dict[str, dict[str, int]] | None:
-        if histogram.histogram and (
-            parsed_summary := self._convert_raw_histogram(histogram.histogram, histogram.start_time, histogram.end_time)
+    def _get_summary_for_operation_by_hdr_tag(
+        self, histogram: _HdrRangeHistogram | None
+    ) -> dict[str, dict[str, int]] | None:
+        if (
+            histogram
+            and histogram.histogram
+            and (
+                parsed_summary := self._convert_raw_histogram(
+                    histogram.histogram, histogram.start_time, histogram.end_time
+                )
+            )
         ):
             actual_workload_type = self._get_workload_type_by_hdr_tag(histogram.hdr_tag)
             return {f"{actual_workload_type}--{histogram.hdr_tag}": asdict(parsed_summary)}
@@ -465,30 +816,17 @@ class _HdrRangeHistogramBuilder:
 
     def build_histogram_summary_by_tag(self, path: str, hdr_tag: str) -> dict[str, dict[str, int]] | None:
         LOGGER.debug(f"Running build_histogram_summary_by_tag for tag {hdr_tag} in path {path}")
-        if os.path.exists(path) and os.path.isfile(path):
-            histogram = self._build_histogram_from_file(hdr_file=path, hdr_tag=hdr_tag)
-            if not histogram:
-                LOGGER.info(f"File {path} didn't generate histogram for tag {hdr_tag}")
-                return None
-        elif os.path.exists(path) and os.path.isdir(path):
-            histogram = self._build_histogram_from_dir(base_path=path, hdr_tag=hdr_tag)
-        else:
-            LOGGER.info(f"No histogram for path {path}  - not a file or directory")
-            return None
-
+        builder = _HdrRangeHistogramBuilder(
+            hdr_tags=[hdr_tag],
+            stress_operation=self.stress_operation,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            hdr_file_pattern=self.hdrh_files_pattern,
+            max_workers=self.max_workers,
+        )
+        builder.absolute_time = self.absolute_time
+        builder.cache_dir = self.cache_dir
+        histogram = builder._build_range_histograms(path, windows=[(self.start_time, self.end_time)]).get((0, hdr_tag))
         val = self._get_summary_for_operation_by_hdr_tag(histogram)
         LOGGER.debug(f"Path {path} generated histogram for tag {hdr_tag}: {val}")
         return val
-
-    def _build_histograms_summary_with_interval_by_tag(
-        self, path: str, hdr_tag: str, start_interval: int, end_interval: int, interval_num: int
-    ) -> dict[str, Any] | None:
-        result = _HdrRangeHistogramBuilder(
-            hdr_tags=[hdr_tag],
-            stress_operation=self.stress_operation,
-            start_time=start_interval,
-            end_time=end_interval,
-        ).build_histogram_summary_by_tag(path, hdr_tag)
-        if result:
-            return {"interval_num": interval_num, "result": result}
-        return None
@@ -0,0 +1,108 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+from typing import Optional
+
+LOGGER = logging.getLogger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+EVENT_HEADER = struct.Struct("iIII")
+READ_BUFFER_SIZE = 64 * 1024
+
+
+class InotifyWatcher:
+    """Minimal Linux inotify wrapper, used to block until watched files are changed instead of busy polling.
+
+    Use `InotifyWatcher.create()' which returns None if inotify is not available (non-Linux platforms, too many
+    instances, etc.), so callers can fall back to periodic polling.
+    """
+
+    _libc = None
+
+    def __init__(self):
+        self.fd = self._get_libc().inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watches = {}
+
+    @classmethod
+    def _get_libc(cls) -> ctypes.CDLL:
+        if cls._libc is None:
+            cls._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        return cls._libc
+
+    @classmethod
+    def create(cls) -> Optional["InotifyWatcher"]:
+        try:
+            return cls()
+        except (OSError, AttributeError) as exc:
+            LOGGER.debug("inotify is not available: %s", exc)
+            return None
+
+    def add_watch(self, path: str, mask: int = IN_MODIFY | IN_CREATE | IN_MOVED_TO) -> int:
+        """Watch a file or a directory (directory watch reports changes of the files in it, even not existing yet.)"""
+        watch = self._get_libc().inotify_add_watch(self.fd, os.fsencode(path), ctypes.c_uint32(mask))
+        if watch < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self._watches[watch] = path
+        return watch
+
+    def read_events(self) -> list[tuple[str, int, str]]:
+        """Drain all pending events without blocking, return them as (watched path, mask, name) tuples."""
+        events = []
+        while True:
+            try:
+                buffer = os.read(self.fd, READ_BUFFER_SIZE)
+            except BlockingIOError:
+                return events
+            if not buffer:
+                return events
+            offset = 0
+            while offset < len(buffer):
+                watch, mask, _, name_length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = buffer[offset : offset + name_length].rstrip(b"\0").decode(errors="replace")
+                offset += name_length
+                events.append((self._watches.get(watch, ""), mask, name))
+
+    def wait(self, timeout: float) -> list[tuple[str, int, str]]:
+        """Block up to `timeout' seconds until something is changed, return the drained events."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        return self.read_events()
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
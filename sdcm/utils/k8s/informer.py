@@ -0,0 +1,306 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Watch-driven local caches of K8S objects (informers.)
+
+An informer lists all objects of a kind once and then watches for changes starting from the `resourceVersion' of
+the list, so the cache is kept up to date by a single long-running API request.  If the watch expires (410 Gone),
+the objects are listed again.
+
+Reads are served from the cache after the initial list is done, waits are woken up by the watch events.  If the
+cache is stale (no update for `max_staleness' seconds) or the last watch failed, reads go to the API instead.
+"""
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+import contextlib
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+import kubernetes as k8s
+
+from sdcm.log import SDCMAdapter
+from sdcm.prometheus import NemesisMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+INFORMER_WATCH_TIMEOUT = 300  # seconds, the watch is restarted from the last seen resourceVersion after it
+INFORMER_SYNC_TIMEOUT = 60  # seconds, the longest time to wait for the initial list before reading from the API
+INFORMER_MAX_STALENESS = 360  # seconds, reads go to the API if the cache has no updates for longer
+INFORMER_RETRY_DELAY = 5  # seconds
+HTTP_GONE = 410
+
+
+def namespaced_key(obj) -> tuple[str, str]:
+    return obj.metadata.namespace, obj.metadata.name
+
+
+def cluster_scoped_key(obj) -> str:
+    return obj.metadata.name
+
+
+@dataclass
+class InformerStats:
+    lists: int = 0
+    watches: int = 0
+    events: int = 0
+    errors: int = 0
+    cache_reads: int = 0
+    api_reads: int = 0
+    last_sync_at: float = 0.0  # time.monotonic() of the last list, watch event or end of a watch
+
+
+class InformerMetrics:
+    """Gauges of informers: the counters of `InformerStats' and the staleness of the cache.
+
+    The values are read from the informer when the metrics are collected.
+    """
+
+    STATS = ("lists", "watches", "events", "errors", "cache_reads", "api_reads")
+
+    def __init__(self):
+        self._stats = NemesisMetrics.create_gauge(
+            "sct_k8s_informer_stats",
+            "Number of lists, watches, events, errors and reads of a K8S informer",
+            ["informer", "stat"],
+        )
+        self._staleness = NemesisMetrics.create_gauge(
+            "sct_k8s_informer_staleness_seconds", "Seconds since a K8S informer cache got the last update", ["informer"]
+        )
+
+    def register(self, informer: K8sObjectsInformer) -> None:
+        if self._stats:
+            for stat in self.STATS:
+                self._stats.labels(informer.name, stat).set_function(lambda stat=stat: getattr(informer.stats, stat))
+        if self._staleness:
+            self._staleness.labels(informer.name).set_function(lambda: informer.staleness)
+
+    def unregister(self, informer: K8sObjectsInformer) -> None:
+        with contextlib.suppress(KeyError):
+            if self._stats:
+                for stat in self.STATS:
+                    self._stats.remove(informer.name, stat)
+            if self._staleness:
+                self._staleness.remove(informer.name)
+
+
+_INFORMER_METRICS: Optional[InformerMetrics] = None
+_INFORMER_METRICS_LOCK = threading.Lock()
+
+
+def informer_metrics() -> InformerMetrics:
+    global _INFORMER_METRICS  # noqa: PLW0603
+    with _INFORMER_METRICS_LOCK:
+        if _INFORMER_METRICS is None:
+            _INFORMER_METRICS = InformerMetrics()
+        return _INFORMER_METRICS
+
+
+class K8sObjectsInformer(threading.Thread):
+    """Cache of K8S objects of one kind, kept up to date by list+watch.
+
+    `list_func' is a list method of a K8S API (e.g., `CoreV1Api.list_pod_for_all_namespaces'), it's used both for
+    the list and for the watch.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        list_func: Callable,
+        key_func: Callable[[Any], Hashable] = namespaced_key,
+        watch_timeout: int = INFORMER_WATCH_TIMEOUT,
+        sync_timeout: float = INFORMER_SYNC_TIMEOUT,
+        max_staleness: float = INFORMER_MAX_STALENESS,
+        log_prefix: str = "",
+        **list_kwargs,
+    ):
+        super().__init__(name=name, daemon=True)
+        self.list_func = list_func
+        self.key_func = key_func
+        self.watch_timeout = watch_timeout
+        self.sync_timeout = sync_timeout
+        self.max_staleness = max_staleness
+        self.list_kwargs = list_kwargs
+        self.stats = InformerStats()
+        self.log = SDCMAdapter(LOGGER, extra={"prefix": log_prefix or name})
+        self._objects: dict[Hashable, Any] = {}
+        self._resource_version: Optional[str] = None
+        self._cond = threading.Condition()
+        self._synced = threading.Event()
+        self._termination_event = threading.Event()
+        self._watch: Optional[k8s.watch.Watch] = None
+        self._watch_failed = False
+        self._start_lock = threading.Lock()
+        self._sync_deadline = 0.0
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    @property
+    def staleness(self) -> float:
+        """Seconds since the cache got the last update (a list or a watch event.)"""
+        return time.monotonic() - self.stats.last_sync_at if self.stats.last_sync_at else float("inf")
+
+    @property
+    def fresh(self) -> bool:
+        """True if the cache is synced and kept up to date by a working watch."""
+        return (
+            self.synced
+            and not self._watch_failed
+            and not self._termination_event.is_set()
+            and self.staleness <= self.max_staleness
+        )
+
+    def ensure_started(self) -> K8sObjectsInformer:
+        with self._start_lock:
+            if self.ident is None and not self._termination_event.is_set():
+                self._sync_deadline = time.monotonic() + self.sync_timeout
+                informer_metrics().register(self)
+                self.start()
+        return self
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the initial list, but no longer than `sync_timeout' since the start in total by default."""
+        self.ensure_started()
+        if timeout is None:
+            timeout = max(self._sync_deadline - time.monotonic(), 0)
+        return self._synced.wait(timeout)
+
+    def get(self, key: Hashable, default=None, fallback: Optional[Callable[[], Any]] = None):
+        """Return a cached object (a snapshot of the latest seen version), or `default' if there is no such object.
+
+        If the cache is not synced yet, or it's stale, or the last watch failed, return the result of `fallback'
+        (i.e., read the object from the API.)  Without a fallback, raise TimeoutError if the cache is not synced.
+        """
+        synced = self.wait_for_sync()
+        if fallback is not None and not (synced and self.fresh):
+            self.stats.api_reads += 1
+            return fallback()
+        if not synced:
+            raise TimeoutError(f"{self.name} is not synced")
+        with self._cond:
+            self.stats.cache_reads += 1
+            return self._objects.get(key, default)
+
+    def list(self, predicate: Optional[Callable[[Any], bool]] = None) -> list:
+        if not self.wait_for_sync():
+            raise TimeoutError(f"{self.name} is not synced")
+        with self._cond:
+            self.stats.cache_reads += 1
+            return [obj for obj in self._objects.values() if predicate is None or predicate(obj)]
+
+    def wait_for(self, predicate: Callable[[dict], Any], timeout: float) -> Any:
+        """Block until `predicate(objects)' is true, re-check it on every change of the cache.
+
+        Return the last result of the predicate (falsy on timeout.)
+        """
+        deadline = time.monotonic() + timeout
+        if not self.wait_for_sync(timeout=timeout):
+            return None
+        with self._cond:
+            return self._cond.wait_for(lambda: predicate(self._objects), timeout=max(deadline - time.monotonic(), 0))
+
+    def run(self) -> None:
+        while not self._termination_event.is_set():
+            try:
+                if self._resource_version is None:
+                    self._list()
+                self._watch_changes()
+            except k8s.client.rest.ApiException as exc:
+                self.stats.errors += 1
+                self._watch_failed = True
+                if exc.status == HTTP_GONE:
+                    self.log.debug("Watch of %s expired, list the objects again", self.name)
+                    self._resource_version = None
+                    continue
+                self.log.warning("Failed to list or watch objects: %s", exc)
+                self._termination_event.wait(INFORMER_RETRY_DELAY)
+            except Exception as exc:  # noqa: BLE001
+                self.stats.errors += 1
+                self._watch_failed = True
+                if self._termination_event.is_set():
+                    break
+                self.log.warning("Failed to list or watch objects: %s", exc)
+                self._termination_event.wait(INFORMER_RETRY_DELAY)
+        self.log.debug("%s is stopped: %s", self.name, self.stats)
+
+    def _list(self) -> None:
+        result = self.list_func(watch=False, **self.list_kwargs)
+        with self._cond:
+            self._objects = {self.key_func(obj): obj for obj in result.items}
+            self._resource_version = result.metadata.resource_version
+            self.stats.lists += 1
+            self.stats.last_sync_at = time.monotonic()
+            self._watch_failed = False
+            self._synced.set()
+            self._cond.notify_all()
+
+    def _watch_changes(self) -> None:
+        self._watch = k8s.watch.Watch()
+        self.stats.watches += 1
+        for event in self._watch.stream(
+            self.list_func,
+            resource_version=self._resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True,
+            **self.list_kwargs,
+        ):
+            if self._termination_event.is_set():
+                break
+            if event["type"] == "ERROR":
+                status = event.get("raw_object", {})
+                if status.get("code") == HTTP_GONE:
+                    raise k8s.client.rest.ApiException(status=HTTP_GONE, reason=status.get("message"))
+                raise RuntimeError(f"Watch error: {status}")
+            self._apply_event(event_type=event["type"], obj=event["object"])
+        else:
+            # the watch ended by the timeout, so the cache was up to date till now
+            with self._cond:
+                self.stats.last_sync_at = time.monotonic()
+                self._watch_failed = False
+
+    def _apply_event(self, event_type: str, obj) -> None:
+        with self._cond:
+            self._resource_version = obj.metadata.resource_version
+            self.stats.events += 1
+            self.stats.last_sync_at = time.monotonic()
+            self._watch_failed = False
+            if event_type == "BOOKMARK":
+                return
+            if event_type == "DELETED":
+                self._objects.pop(self.key_func(obj), None)
+            else:
+                self._objects[self.key_func(obj)] = obj
+            self._cond.notify_all()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._termination_event.set()
+        if self._watch:
+            self._watch.stop()
+        if self.is_alive():
+            self.join(timeout)
+        informer_metrics().unregister(self)
+
+
+__all__ = (
+    "InformerMetrics",
+    "InformerStats",
+    "K8sObjectsInformer",
+    "cluster_scoped_key",
+    "informer_metrics",
+    "namespaced_key",
+)
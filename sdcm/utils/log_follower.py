@@ -0,0 +1,208 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Single thread which follows many growing log files (e.g., stress tools logs) instead of a thread per file.
+
+Files are read in bulk when inotify reports a change in their directories (all files are also re-checked every
+`LOG_RECHECK_PERIOD' seconds, or polled every `LOG_POLL_PERIOD' seconds if inotify is not available), and complete
+lines are dispatched to the callbacks of the followers.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import select
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import BinaryIO, Callable, Optional
+
+from sdcm.utils.inotify import InotifyWatcher
+
+LOGGER = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+LOG_RECHECK_PERIOD = 1.0  # seconds
+LOG_POLL_PERIOD = 0.1  # seconds
+
+
+class FollowedFile:
+    """A file followed by `LogFollowerReactor': offset and a partial line are kept between reads.
+
+    `future' is resolved once the file is unfollowed and the rest of its complete lines are dispatched, or is set to
+    an exception raised by the callback (the file isn't followed anymore then.)
+    """
+
+    def __init__(self, path: str, on_line: Callable[[str], None]):
+        self.path = os.path.abspath(path)
+        self.on_line = on_line
+        self.future = Future()
+        self.future.set_running_or_notify_cancel()
+        self._fobj: Optional[BinaryIO] = None
+        self._partial_line = b""
+
+    def _open(self) -> bool:
+        if self._fobj is None:
+            try:
+                self._fobj = open(self.path, "rb")  # noqa: SIM115
+            except FileNotFoundError:
+                return False
+        return True
+
+    def read_lines(self) -> list[str]:
+        """Read everything appended since the last call, return complete lines (with the line ends.)"""
+        if not self._open():
+            return []
+        lines = []
+        while data := self._fobj.read(READ_CHUNK_SIZE):
+            *complete, self._partial_line = (self._partial_line + data).split(b"\n")
+            lines.extend(line.decode("utf-8", errors="replace") + "\n" for line in complete)
+        return lines
+
+    def dispatch(self) -> bool:
+        """Read and dispatch new lines, return False if the callback failed."""
+        for line in self.read_lines():
+            try:
+                self.on_line(line)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error("Failed to handle a line of %s: %s", self.path, exc)
+                self.close(exc=exc)
+                return False
+        return True
+
+    def close(self, exc: Optional[BaseException] = None) -> None:
+        if self._fobj is not None:
+            self._fobj.close()
+            self._fobj = None
+        if not self.future.done():
+            if exc is None:
+                self.future.set_result(None)
+            else:
+                self.future.set_exception(exc)
+
+
+class LogFollowerReactor:
+    """Follow files in a single daemon thread, started on the first `follow()' call."""
+
+    def __init__(self):
+        self._commands = queue.SimpleQueue()
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._watched_directories: set[str] = set()
+
+    def follow(self, path: str, on_line: Callable[[str], None]) -> FollowedFile:
+        followed_file = FollowedFile(path=path, on_line=on_line)
+        self._send(("follow", followed_file))
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+                self._thread.start()
+        return followed_file
+
+    def unfollow(self, followed_file: FollowedFile) -> None:
+        self._send(("unfollow", followed_file))
+
+    def _send(self, command: tuple) -> None:
+        self._commands.put(command)
+        os.write(self._wakeup_write_fd, b"\0")
+
+    def _handle_commands(self, followed_files: set[FollowedFile], watcher: Optional[InotifyWatcher]) -> set:
+        """Return files which should be read now: the new ones."""
+        added = set()
+        while True:
+            try:
+                command, followed_file = self._commands.get_nowait()
+            except queue.Empty:
+                return added
+            if command == "follow":
+                followed_files.add(followed_file)
+                added.add(followed_file)
+                if watcher:
+                    self._watch_directory(watcher, os.path.dirname(followed_file.path))
+            elif followed_file in followed_files:
+                followed_files.discard(followed_file)
+                added.discard(followed_file)
+                if followed_file.dispatch():
+                    followed_file.close()
+            else:
+                followed_file.close()
+
+    def _watch_directory(self, watcher: InotifyWatcher, directory: str) -> None:
+        if directory in self._watched_directories:
+            return
+        self._watched_directories.add(directory)
+        try:
+            watcher.add_watch(directory)
+        except OSError as exc:
+            LOGGER.debug("Failed to watch %s, the files will be re-checked periodically only: %s", directory, exc)
+
+    def _wait(self, watcher: Optional[InotifyWatcher], timeout: float) -> set[str]:
+        """Wait for changes of the files or for a command, return paths of the changed files."""
+        fds = [self._wakeup_read_fd] + ([watcher.fd] if watcher else [])
+        readable, _, _ = select.select(fds, [], [], timeout)
+        if self._wakeup_read_fd in readable:
+            while True:
+                try:
+                    if not os.read(self._wakeup_read_fd, 4096):
+                        break
+                except BlockingIOError:
+                    break
+        if watcher and watcher.fd in readable:
+            return {os.path.join(path, name) for path, _, name in watcher.read_events()}
+        return set()
+
+    def _run(self) -> None:
+        watcher = InotifyWatcher.create()
+        self._watched_directories.clear()
+        period = LOG_RECHECK_PERIOD if watcher else LOG_POLL_PERIOD
+        followed_files: set[FollowedFile] = set()
+        due = set()
+        next_recheck = time.perf_counter()
+        try:
+            while True:
+                due |= self._handle_commands(followed_files=followed_files, watcher=watcher)
+                if (now := time.perf_counter()) >= next_recheck:
+                    due |= followed_files
+                    next_recheck = now + period
+                for followed_file in due & followed_files:
+                    if not followed_file.dispatch():
+                        followed_files.discard(followed_file)
+                changed_paths = self._wait(watcher=watcher, timeout=max(next_recheck - time.perf_counter(), 0))
+                due = {followed_file for followed_file in followed_files if followed_file.path in changed_paths}
+        except Exception:
+            LOGGER.exception("%s failed", self.__class__.__name__)
+            for followed_file in followed_files:
+                followed_file.close()
+            raise
+        finally:
+            if watcher:
+                watcher.close()
+
+
+_REACTOR: Optional[LogFollowerReactor] = None
+_REACTOR_LOCK = threading.Lock()
+
+
+def get_log_follower_reactor() -> LogFollowerReactor:
+    global _REACTOR  # noqa: PLW0603
+    with _REACTOR_LOCK:
+        if _REACTOR is None:
+            _REACTOR = LogFollowerReactor()
+        return _REACTOR
+
+
+__all__ = ("FollowedFile", "LogFollowerReactor", "get_log_follower_reactor")
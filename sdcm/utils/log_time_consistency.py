@@ -90,22 +90,30 @@ class DbLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):
         output = cls._init_timeshift_buckets(list)
         counters = cls._init_timeshift_buckets(int) | {"total": 0}
         prior_line = ""
-        for line in log_file.open(mode="r").readlines():
-            if cls.ignore_lines:
-                if any(line_pattern in line for line_pattern in cls.ignore_lines):
+        prior_token = None
+        with log_file.open(mode="r") as log:
+            for line in log:
+                if cls.ignore_lines:
+                    if any(line_pattern in line for line_pattern in cls.ignore_lines):
+                        continue
+                token = line.split(maxsplit=1)[0] if line.strip() else ""
+                if token == prior_token:
+                    # logged at the same time as the prior line, no time shift
+                    prior_line = line
                     continue
-            try:
-                current_time = datetime.datetime.fromisoformat(line.split()[0]).timestamp()
-            except Exception:  # noqa: BLE001
-                continue
-            current_time_shift = prior_time - current_time
-            if bucket_name := cls._get_timeshift_bucket_name(current_time_shift):
-                counters["total"] += 1
-                counters[bucket_name] += 1
-                if counters[bucket_name] < cls.records_limit:
-                    output[bucket_name].append(prior_line + line)
-            prior_time = current_time
-            prior_line = line
+                try:
+                    current_time = datetime.datetime.fromisoformat(token).timestamp()
+                except Exception:  # noqa: BLE001
+                    continue
+                prior_token = token
+                current_time_shift = prior_time - current_time
+                if bucket_name := cls._get_timeshift_bucket_name(current_time_shift):
+                    counters["total"] += 1
+                    counters[bucket_name] += 1
+                    if counters[bucket_name] < cls.records_limit:
+                        output[bucket_name].append(prior_line + line)
+                prior_time = current_time
+                prior_line = line
         cls._append_counters_to_details(counters=counters, output=output)
         return output, counters
 
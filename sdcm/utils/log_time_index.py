@@ -0,0 +1,145 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Sparse time -> offset index of a log with ISO timestamps at the beginning of the lines.
+
+An entry is added at the start of a line every `LOG_TIME_INDEX_STEP' bytes.  The index is updated incrementally:
+only lines added since the previous update are read.  Every entry keeps the latest timestamp of the lines before
+it, so a lookup is correct even if the time in the log goes backwards (e.g., after a clock shift.)
+
+To find the first line logged at a given time, the index is bisected in the memory and at most about one step of
+the log is read.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Iterator, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+LOG_TIME_INDEX_STEP = 64 * 1024
+LOG_TIME_INDEX_READ_SIZE = 4 * 1024 * 1024
+
+
+def parse_line_time(line: str | bytes) -> Optional[datetime]:
+    """Return the time of a log line (without the time zone and microseconds), or None if there is no time in it."""
+    if isinstance(line, bytes):
+        line = line[:64].decode(errors="replace")
+    try:
+        return datetime.fromisoformat(line.split(" ", 1)[0]).replace(tzinfo=None, microsecond=0)
+    except ValueError:
+        return None
+
+
+class LogTimeIndex:
+    """Index of a log file, use `LogTimeIndex.for_log()' to get an index shared by all users of the log."""
+
+    _indexes: dict[str, LogTimeIndex] = {}
+    _indexes_lock = threading.Lock()
+
+    def __init__(self, path: str, step: int = LOG_TIME_INDEX_STEP):
+        self.path = path
+        self.step = step
+        self._lock = threading.Lock()
+        self._reset()
+
+    @classmethod
+    def for_log(cls, path: str) -> LogTimeIndex:
+        path = os.path.abspath(path)
+        with cls._indexes_lock:
+            if (index := cls._indexes.get(path)) is None:
+                index = cls._indexes[path] = cls(path)
+            return index
+
+    def _reset(self) -> None:
+        # bisect is done on the times, so they're kept separately from the offsets
+        self._times = [datetime.min]
+        self._offsets = [0]
+        self._indexed = 0  # offset of the end of the last indexed (complete) line
+        self._max_time = datetime.min
+        self._last_token = b""
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def update(self) -> None:
+        """Index lines added to the log since the previous update."""
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                return
+            if size < self._indexed:
+                LOGGER.debug("%s was truncated or replaced, index it from the beginning", self.path)
+                self._reset()
+            if size == self._indexed:
+                return
+            with open(self.path, "rb") as log_file:
+                log_file.seek(self._indexed)
+                offset, partial_line = self._indexed, b""
+                while chunk := log_file.read(LOG_TIME_INDEX_READ_SIZE):
+                    *lines, partial_line = (partial_line + chunk).split(b"\n")
+                    for line in lines:
+                        self._index_line(offset, line)
+                        offset += len(line) + 1
+                self._indexed = offset
+
+    def _index_line(self, offset: int, line: bytes) -> None:
+        if offset - self._offsets[-1] >= self.step:
+            self._times.append(self._max_time)
+            self._offsets.append(offset)
+        token = line.split(b" ", 1)[0]
+        if token == self._last_token:  # the same time as of the previous line, no need to parse it again
+            return
+        self._last_token = token
+        if (line_time := parse_line_time(token)) and line_time > self._max_time:
+            self._max_time = line_time
+
+    def offset_of(self, on_datetime: datetime) -> int:
+        """Return the offset of the first line logged at `on_datetime' or later (the log size if there is no such.)"""
+        self.update()
+        on_datetime = on_datetime.replace(tzinfo=None, microsecond=0)
+        with self._lock:
+            # all lines before the found entry were logged before `on_datetime'
+            entry = bisect.bisect_left(self._times, on_datetime) - 1
+            offset, end = self._offsets[entry], self._indexed
+        with open(self.path, "rb") as log_file:
+            log_file.seek(offset)
+            for line in log_file:
+                if offset >= end:
+                    break
+                if (line_time := parse_line_time(line)) and line_time >= on_datetime:
+                    return offset
+                offset += len(line)
+        return end
+
+    def read_lines(self, start_time: datetime, end_time: Optional[datetime] = None) -> Iterator[str]:
+        """Iterate over the lines logged from `start_time' until `end_time' (inclusive) or the end of the log.
+
+        Lines without a time (e.g., lines of backtraces) belong to the preceding line.
+        """
+        end_time = end_time and end_time.replace(tzinfo=None, microsecond=0)
+        with open(self.path, encoding="utf-8", errors="replace") as log_file:
+            log_file.seek(self.offset_of(start_time))
+            for line in log_file:
+                if end_time and (line_time := parse_line_time(line)) and line_time > end_time:
+                    return
+                yield line
+
+
+__all__ = ("LogTimeIndex", "parse_line_time")
@@ -0,0 +1,164 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import re
+import logging
+from functools import lru_cache
+from re import _constants as sre_constants, _parser as sre_parse
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# a leading `.*' doesn't change whether `search()' finds a match, but makes it quadratic on long lines
+LEADING_DOT_STAR_RE = re.compile(r"^(?:\.\*(?![?+*{]))+")
+MIN_LITERAL_LENGTH = 3
+NON_ASCII_RE = re.compile(rb"[\x80-\xff]")
+
+
+class CompiledPattern(NamedTuple):
+    pattern: re.Pattern
+    probe: re.Pattern
+    literals: Optional[Tuple[str, ...]]
+    ignorecase: bool
+
+
+def _required_literals(parsed) -> Optional[Tuple[str, ...]]:
+    """Find literals which the regex can't match without: at least one of them should be in a matching line.
+
+    Return None if no such literals found (i.e. a line can't be filtered out without running the regex.)
+    """
+    best = None
+    run = []
+
+    def consider(candidate):
+        nonlocal best
+        if candidate and min(map(len, candidate)) >= MIN_LITERAL_LENGTH:
+            if best is None or min(map(len, candidate)) > min(map(len, best)):
+                best = candidate
+
+    for op, arg in parsed:
+        if op is sre_constants.LITERAL and arg < 128:
+            run.append(chr(arg))
+            continue
+        consider(("".join(run),))
+        run = []
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, subpattern = arg
+            if not add_flags and not del_flags:  # scoped flags like `(?i:...)' would need another haystack
+                consider(_required_literals(subpattern))
+        elif op is sre_constants.BRANCH:
+            branches = [_required_literals(branch) for branch in arg[1]]
+            if all(branches):
+                consider(tuple(literal for branch in branches for literal in branch))
+    consider(("".join(run),))
+    return best
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: re.Pattern) -> CompiledPattern:
+    """Cached, so readers of many nodes in the same process share the compiled patterns."""
+    try:
+        literals = _required_literals(sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.debug("Failed to find literals of `%s': %s", pattern.pattern, exc)
+        literals = None
+    ignorecase = bool(pattern.flags & re.IGNORECASE)
+    if literals and ignorecase:
+        literals = tuple(dict.fromkeys(literal.lower() for literal in literals))
+    return CompiledPattern(
+        pattern=pattern,
+        probe=re.compile(LEADING_DOT_STAR_RE.sub("", pattern.pattern), pattern.flags),
+        literals=literals,
+        ignorecase=ignorecase,
+    )
+
+
+class MultiPatternMatcher:
+    """Match a line against an ordered list of regexes, returning the first one which matches.
+
+    Same result as a sequential `for pattern in patterns: pattern.search(line)' loop, but most patterns are
+    rejected by a cheap literal prefilter: every pattern gets a set of ASCII literals it can't match without,
+    and the regex is executed only if one of them is found in the line (the line is lowered once for all the
+    case-insensitive patterns.)  Patterns which pass the prefilter are probed without a leading `.*' first.
+
+    A single combined alternation of all patterns was tried as well, but CPython's `re' can't use literal
+    prefix scanning for such alternation and it's slower than the sequential search.
+    """
+
+    def __init__(self, patterns: Iterable[re.Pattern]):
+        self.patterns = [compile_pattern(pattern) for pattern in patterns]
+
+    def search(self, line: str) -> Tuple[int, Optional[re.Match]]:
+        """Return index of the first pattern (in the original order) which matches the line and its match.
+
+        Return (-1, None) if no pattern matches.
+        """
+        # prefilter is exact only for ASCII, `re.IGNORECASE' has some non-ASCII equivalents for ASCII letters
+        prefilter = line.isascii()
+        lowered_line = line.lower() if prefilter else None
+        for index, (pattern, probe, literals, ignorecase) in enumerate(self.patterns):
+            if prefilter and literals:
+                haystack = lowered_line if ignorecase else line
+                for literal in literals:
+                    if literal in haystack:
+                        break
+                else:
+                    continue
+            if probe.search(line):
+                return index, pattern.search(line)
+        return -1, None
+
+
+class ChunkPrefilter:
+    """Find lines of a raw bytes chunk which can be matched by any of the given patterns, without decoding it.
+
+    Every literal is searched in the whole chunk at once (lowered once for all the case-insensitive literals),
+    so for a chunk with few interesting lines the cost is a handful of `bytes.find()' calls instead of a Python
+    level loop over each line.  Lines with non-ASCII bytes are always reported as interesting.
+    """
+
+    def __init__(self, literals: Iterable[bytes] = (), ignorecase_literals: Iterable[bytes] = ()):
+        self.literals = tuple(dict.fromkeys(literals))
+        self.ignorecase_literals = tuple(dict.fromkeys(literal.lower() for literal in ignorecase_literals))
+
+    @classmethod
+    def from_patterns(
+        cls,
+        patterns: Iterable[CompiledPattern],
+        literals: Iterable[bytes] = (),
+        ignorecase_literals: Iterable[bytes] = (),
+    ) -> Optional["ChunkPrefilter"]:
+        """Return None if some pattern has no required literals, i.e. all lines should be checked."""
+        literals, ignorecase_literals = list(literals), list(ignorecase_literals)
+        for pattern in patterns:
+            if not pattern.literals:
+                return None
+            (ignorecase_literals if pattern.ignorecase else literals).extend(
+                literal.encode() for literal in pattern.literals
+            )
+        return cls(literals=literals, ignorecase_literals=ignorecase_literals)
+
+    def line_starts(self, chunk: bytes) -> list[int]:
+        """Return sorted offsets of the beginnings of the lines which may be matched."""
+        starts = set()
+        for haystack, literals in ((chunk, self.literals), (chunk.lower(), self.ignorecase_literals)):
+            for literal in literals:
+                position = haystack.find(literal)
+                while position != -1:
+                    starts.add(chunk.rfind(b"\n", 0, position) + 1)
+                    if (line_end := chunk.find(b"\n", position)) == -1:
+                        break
+                    position = haystack.find(literal, line_end + 1)
+        if not chunk.isascii():
+            starts.update(chunk.rfind(b"\n", 0, match.start()) + 1 for match in NON_ASCII_RE.finditer(chunk))
+        return sorted(starts)
@@ -0,0 +1,256 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Streaming copy of a table (or a materialized view) to another table, token range by token range.
+
+The token ring is split into equal ranges which are scanned concurrently.  Pages of the scanned rows are put to a
+bounded queue and inserted by a few inserter threads using a prepared statement, so the driver routes every insert
+to a replica (and a shard) of its partition, and no more than `queue_size' pages are held in the memory.
+
+Numbers of scanned and inserted rows are kept per range and the copy can be verified range by range.
+"""
+
+from __future__ import annotations
+
+import time
+import queue
+import logging
+import threading
+from itertools import batched
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, NamedTuple
+
+from cassandra.concurrent import execute_concurrent_with_args
+
+from sdcm.utils.database_query_utils import stream_all_rows
+from sdcm.utils.range_digest import TokenRange, get_partition_key_columns, split_token_ring
+
+LOGGER = logging.getLogger(__name__)
+
+COPY_RANGES = 256
+COPY_SCAN_CONCURRENCY = 8
+COPY_INSERT_WORKERS = 4
+COPY_INSERT_CONCURRENCY = 100
+COPY_FETCH_SIZE = 5000
+COPY_QUEUE_SIZE = 16  # pages
+COPY_PROGRESS_INTERVAL = 60  # seconds
+
+
+class RangeCopyResult(NamedTuple):
+    scanned: int
+    inserted: int
+
+
+class TableRangeCopier:
+    """Copy rows of `src_keyspace.src_table' to `dest_keyspace.dest_table' which has the same (or a subset of) columns.
+
+    The destination table has to exist already.  If `columns' is not given, all columns are copied.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session,
+        src_keyspace: str,
+        src_table: str,
+        dest_keyspace: str,
+        dest_table: str,
+        columns: list[str] | None = None,
+        ranges_number: int = COPY_RANGES,
+        scan_concurrency: int = COPY_SCAN_CONCURRENCY,
+        insert_workers: int = COPY_INSERT_WORKERS,
+        insert_concurrency: int = COPY_INSERT_CONCURRENCY,
+        fetch_size: int = COPY_FETCH_SIZE,
+        queue_size: int = COPY_QUEUE_SIZE,
+    ):
+        self.session = session
+        self.src_keyspace = src_keyspace
+        self.src_table = src_table
+        self.dest_keyspace = dest_keyspace
+        self.dest_table = dest_table
+        self.token_ranges = split_token_ring(ranges_number)
+        self.scan_concurrency = scan_concurrency
+        self.insert_workers = insert_workers
+        self.insert_concurrency = insert_concurrency
+        self.fetch_size = fetch_size
+        self.queue_size = queue_size
+        self.partition_key = get_partition_key_columns(session=session, keyspace=src_keyspace, table=src_table)
+        if not self.partition_key:
+            raise ValueError(f"Failed to get partition key columns of {src_keyspace}.{src_table}")
+        self.columns = list(
+            session.execute(
+                f"SELECT {','.join(columns) if columns else '*'} FROM {src_keyspace}.{src_table} LIMIT 1"
+            ).column_names
+        )
+        self.results: dict[TokenRange, RangeCopyResult] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._insert_statement = None
+        self._start_time = self._last_report_time = 0.0
+
+    @property
+    def scanned_rows(self) -> int:
+        return sum(result.scanned for result in self.results.values())
+
+    @property
+    def inserted_rows(self) -> int:
+        return sum(result.inserted for result in self.results.values())
+
+    def range_rows(self, token_range: TokenRange) -> Iterator[tuple]:
+        token = f"token({', '.join(self.partition_key)})"
+        return stream_all_rows(
+            session=self.session,
+            default_fetch_size=self.fetch_size,
+            statement=f"SELECT {', '.join(self.columns)} FROM {self.src_keyspace}.{self.src_table} "
+            f"WHERE {token} > {token_range.start} AND {token} <= {token_range.end}",
+            verbose=False,
+        )
+
+    def copy(self) -> dict[TokenRange, RangeCopyResult]:
+        """Copy all token ranges and return numbers of scanned and inserted rows per range.
+
+        An error of a scan stops the copy and is raised; failed inserts are counted as not inserted rows.
+        """
+        LOGGER.debug(
+            "Copy %s token ranges of %s.%s to %s.%s",
+            len(self.token_ranges),
+            self.src_keyspace,
+            self.src_table,
+            self.dest_keyspace,
+            self.dest_table,
+        )
+        self._insert_statement = self.session.prepare(
+            f"INSERT INTO {self.dest_keyspace}.{self.dest_table} ({', '.join(self.columns)}) "
+            f"VALUES ({', '.join('?' for _ in self.columns)})"
+        )
+        self.results = dict.fromkeys(self.token_ranges, RangeCopyResult(scanned=0, inserted=0))
+        self._stop.clear()
+        self._start_time = self._last_report_time = time.perf_counter()
+        pages = queue.Queue(maxsize=self.queue_size)
+        inserters = [
+            threading.Thread(target=self._insert_pages, args=(pages,), name=f"RangeCopyInserter-{num}", daemon=True)
+            for num in range(self.insert_workers)
+        ]
+        for inserter in inserters:
+            inserter.start()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.scan_concurrency, thread_name_prefix="RangeCopyScanner"
+            ) as executor:
+                for _ in executor.map(lambda token_range: self._scan_range(token_range, pages), self.token_ranges):
+                    pass
+        finally:
+            for _ in inserters:
+                pages.put(None)
+            for inserter in inserters:
+                inserter.join()
+        elapsed = time.perf_counter() - self._start_time
+        LOGGER.info(
+            "Copied %s/%s rows of %s.%s in %.1f seconds (%.1f rows/s)",
+            self.inserted_rows,
+            self.scanned_rows,
+            self.src_keyspace,
+            self.src_table,
+            elapsed,
+            self.inserted_rows / elapsed if elapsed else 0,
+        )
+        return self.results
+
+    def verify(self) -> list[TokenRange]:
+        """Return token ranges which weren't copied completely.
+
+        If the destination table has the same partition key, rows of every range are counted in the destination
+        table too.  Otherwise, a range is verified by the number of successful inserts only.
+        """
+        mismatching_ranges = {
+            token_range for token_range, result in self.results.items() if result.inserted != result.scanned
+        }
+        dest_partition_key = get_partition_key_columns(
+            session=self.session, keyspace=self.dest_keyspace, table=self.dest_table
+        )
+        if dest_partition_key == self.partition_key:
+            with ThreadPoolExecutor(
+                max_workers=self.scan_concurrency, thread_name_prefix="RangeCopyCounter"
+            ) as executor:
+                dest_rows = dict(zip(self.results, executor.map(self._count_dest_range_rows, self.results)))
+            mismatching_ranges.update(
+                token_range for token_range, result in self.results.items() if dest_rows[token_range] != result.scanned
+            )
+        for token_range in sorted(mismatching_ranges):
+            LOGGER.warning(
+                "Token range (%s, %s] of %s.%s isn't copied completely: %s",
+                token_range.start,
+                token_range.end,
+                self.src_keyspace,
+                self.src_table,
+                self.results.get(token_range),
+            )
+        return sorted(mismatching_ranges)
+
+    def _count_dest_range_rows(self, token_range: TokenRange) -> int:
+        token = f"token({', '.join(self.partition_key)})"
+        return self.session.execute(
+            f"SELECT count(*) FROM {self.dest_keyspace}.{self.dest_table} "
+            f"WHERE {token} > {token_range.start} AND {token} <= {token_range.end} USING TIMEOUT 5m"
+        ).one()[0]
+
+    def _scan_range(self, token_range: TokenRange, pages: queue.Queue) -> None:
+        try:
+            for page in batched(self.range_rows(token_range), self.fetch_size):
+                if self._stop.is_set():
+                    return
+                self._update_result(token_range, scanned=len(page))
+                pages.put((token_range, page))
+        except Exception:
+            self._stop.set()
+            raise
+
+    def _insert_pages(self, pages: queue.Queue) -> None:
+        while (item := pages.get()) is not None:
+            token_range, page = item
+            if self._stop.is_set():
+                continue
+            try:
+                results = execute_concurrent_with_args(
+                    self.session,
+                    self._insert_statement,
+                    page,
+                    concurrency=self.insert_concurrency,
+                    raise_on_first_error=False,
+                    results_generator=True,
+                )
+                inserted = sum(1 for success, _ in results if success)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning(
+                    "Failed to insert %s rows to %s.%s: %s", len(page), self.dest_keyspace, self.dest_table, exc
+                )
+                inserted = 0
+            self._update_result(token_range, inserted=inserted)
+
+    def _update_result(self, token_range: TokenRange, scanned: int = 0, inserted: int = 0) -> None:
+        with self._lock:
+            result = self.results[token_range]
+            self.results[token_range] = RangeCopyResult(
+                scanned=result.scanned + scanned, inserted=result.inserted + inserted
+            )
+            if inserted and (now := time.perf_counter()) - self._last_report_time >= COPY_PROGRESS_INTERVAL:
+                self._last_report_time = now
+                LOGGER.info(
+                    "Copied %s rows of %s.%s (%.1f rows/s)",
+                    self.inserted_rows,
+                    self.src_keyspace,
+                    self.src_table,
+                    self.inserted_rows / (now - self._start_time),
+                )
+
+
+__all__ = ("RangeCopyResult", "TableRangeCopier")
@@ -0,0 +1,137 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Per token range digests of tables.
+
+The token ring is split into equal ranges and a digest (number of rows and a 128-bit multiset hash: sum of hashes of
+the rows modulo 2^128) is computed for every range, concurrently across ranges.  The digest doesn't depend on the
+order of the rows, so tables with the same partition key and different clustering order can be compared too.
+
+Digests of two tables (or of the same table at two points in time) are compared range by range, and only the rows
+of the mismatching ranges need to be compared.  CQL has no generic hash aggregate, so the rows are hashed on the
+runner while they are paged, without holding more than a page of a range in the memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, NamedTuple
+
+from sdcm.utils.database_query_utils import stream_all_rows
+
+LOGGER = logging.getLogger(__name__)
+
+MURMUR3_MIN_TOKEN = -(2**63)
+MURMUR3_MAX_TOKEN = 2**63 - 1
+DIGEST_RANGES = 256
+DIGEST_CONCURRENCY = 8
+DIGEST_FETCH_SIZE = 5000
+DIGEST_MODULUS = 2**128
+
+
+class TokenRange(NamedTuple):
+    start: int  # exclusive
+    end: int  # inclusive
+
+
+class RangeDigest(NamedTuple):
+    rows: int
+    digest: int
+
+
+def split_token_ring(ranges_number: int = DIGEST_RANGES) -> list[TokenRange]:
+    # The min token of Murmur3Partitioner is never assigned to a key, so it's fine to exclude it from the first range
+    step = (MURMUR3_MAX_TOKEN - MURMUR3_MIN_TOKEN) // ranges_number
+    bounds = [MURMUR3_MIN_TOKEN + step * num for num in range(ranges_number)] + [MURMUR3_MAX_TOKEN]
+    return [TokenRange(start=start, end=end) for start, end in zip(bounds, bounds[1:])]
+
+
+def row_digest(row: tuple) -> int:
+    return int.from_bytes(hashlib.blake2b(repr(row).encode(), digest_size=16).digest(), "big")
+
+
+def get_partition_key_columns(session, keyspace: str, table: str) -> list[str]:
+    result = session.execute(
+        "SELECT column_name, kind, position FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s",
+        (keyspace, table),
+    )
+    return [row.column_name for row in sorted(result, key=lambda row: row.position) if row.kind == "partition_key"]
+
+
+class TableRangeDigests:
+    """Compute digests of token ranges of a table (or a materialized view.)"""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session,
+        keyspace: str,
+        table: str,
+        columns: str = "*",
+        ranges_number: int = DIGEST_RANGES,
+        concurrency: int = DIGEST_CONCURRENCY,
+        fetch_size: int = DIGEST_FETCH_SIZE,
+    ):
+        self.session = session
+        self.keyspace = keyspace
+        self.table = table
+        self.columns = columns
+        self.token_ranges = split_token_ring(ranges_number)
+        self.concurrency = concurrency
+        self.fetch_size = fetch_size
+        self.partition_key = get_partition_key_columns(session=session, keyspace=keyspace, table=table)
+        if not self.partition_key:
+            raise ValueError(f"Failed to get partition key columns of {keyspace}.{table}")
+
+    def range_rows(self, token_range: TokenRange) -> Iterator[tuple]:
+        token = f"token({', '.join(self.partition_key)})"
+        return stream_all_rows(
+            session=self.session,
+            default_fetch_size=self.fetch_size,
+            statement=f"SELECT {self.columns} FROM {self.keyspace}.{self.table} "
+            f"WHERE {token} > {token_range.start} AND {token} <= {token_range.end}",
+            verbose=False,
+        )
+
+    def range_digest(self, token_range: TokenRange) -> RangeDigest:
+        rows = digest = 0
+        for row in self.range_rows(token_range):
+            rows += 1
+            digest += row_digest(row)
+        return RangeDigest(rows=rows, digest=digest % DIGEST_MODULUS)
+
+    def compute(self) -> dict[TokenRange, RangeDigest]:
+        LOGGER.debug("Compute digests of %s token ranges of %s.%s", len(self.token_ranges), self.keyspace, self.table)
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="RangeDigest") as executor:
+            return dict(zip(self.token_ranges, executor.map(self.range_digest, self.token_ranges)))
+
+
+def diff_range_digests(
+    actual: dict[TokenRange, RangeDigest], expected: dict[TokenRange, RangeDigest]
+) -> list[TokenRange]:
+    """Return token ranges with different digests (ranges which are not in both digests are different too.)"""
+    return sorted(
+        token_range
+        for token_range in actual.keys() | expected.keys()
+        if actual.get(token_range) != expected.get(token_range)
+    )
+
+
+__all__ = (
+    "RangeDigest",
+    "TableRangeDigests",
+    "TokenRange",
+    "diff_range_digests",
+    "split_token_ring",
+)
@@ -14,7 +14,12 @@
 from __future__ import annotations
 
 import os
+import json
 import time
+import zlib
+import shlex
+import base64
+import codecs
 import socket
 import logging
 import subprocess
@@ -23,11 +28,12 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import cached_property
 from threading import Lock, Thread, Event as ThreadEvent
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 from textwrap import dedent
 
 import kubernetes as k8s
 from dateutil.parser import isoparse
+from invoke.watchers import StreamWatcher
 from urllib3.exceptions import (
     MaxRetryError,
     ProtocolError,
@@ -107,33 +113,32 @@ class SSHLoggerBase(LoggerBase):
         Returns the PID of the remote logger process.
         This is used to ensure that the logger is running and to manage its lifecycle.
         """
-        remote_pid_file = f"/tmp/logger_{os.getpid()}.pid"
-        if not self._remoter.run(f"test -f {remote_pid_file}", ignore_status=True).ok:
-            return ""
-        return self._remoter.run(f"cat {remote_pid_file}").stdout.strip()
+        result = self._remoter.run(f"cat /tmp/logger_{os.getpid()}.pid", ignore_status=True, verbose=False)
+        return result.stdout.strip() if result.ok else ""
 
     def _retrieve(self, since: str) -> None:
         self._log.debug(
             self.RETRIEVE_LOG_MESSAGE_TEMPLATE.format(log_file=self._target_log_file, since=since or "the beginning")
         )
+        self._run_logger_cmd(
+            cmd=self._logger_cmd_template.format(since=f'--since "{since}" ' if since else ""),
+            log_file=self._target_log_file,
+        )
+
+    def _run_logger_cmd(self, cmd: str, **kwargs) -> None:
         try:
             # Write the remote PID to a file before running the logger command
             remote_pid_file = f"/tmp/logger_{os.getpid()}.pid"
-            cmd = self._logger_cmd_template.format(since=f'--since "{since}" ' if since else "")
             remote_cmd = (
                 f"cat <<'EOF' > /tmp/logger_cmd_{os.getpid()}.sh\n{cmd}\nEOF\n"
                 f"setsid bash /tmp/logger_cmd_{os.getpid()}.sh & echo $! > {remote_pid_file}; wait"
             )
-            self._remoter.run(
-                cmd=remote_cmd,
-                verbose=self.VERBOSE_RETRIEVE,
-                ignore_status=True,
-                log_file=self._target_log_file,
-            )
+            return self._remoter.run(cmd=remote_cmd, verbose=self.VERBOSE_RETRIEVE, ignore_status=True, **kwargs)
         except Exception as details:  # noqa: BLE001
             self._log.error(
                 "Error retrieving remote node DB service log for file %s: %s", self._target_log_file, details
             )
+        return None
 
     @cached_property
     def _remoter(self) -> RemoteCmdRunnerBase:
@@ -272,43 +277,226 @@ class HDRHistogramFileLogger(SSHLoggerBase):
         self.validate_and_collect_hdr_file()
 
 
+# Reformat `journalctl -o json' output of Scylla services to the text lines, adding the level/priority that
+# is missing from the regular output.  Every line is a single journal entry (except for multiline messages which
+# are followed by a cursor immediately), a cursor of the last entry (prefixed with JOURNAL_CURSOR_MARKER) is printed
+# every JOURNAL_CURSOR_PERIOD entries, after multiline messages, and when there are no more entries to read.
+# Arguments: number of entries to skip (which were received after the cursor before a reconnect), and "1" to
+# compress the output with zlib (base64-encoded chunks prefixed with JOURNAL_CHUNK_MARKER), otherwise lines are
+# prefixed with JOURNAL_LINE_MARKER.  Lines without the markers are stderr of the commands.
+JOURNAL_LINE_MARKER = "\x1d"
+JOURNAL_CURSOR_MARKER = "\x1e"
+JOURNAL_CHUNK_MARKER = "\x1f"
+JOURNAL_CURSOR_PERIOD = 100  # entries
+JOURNAL_REFORMAT_PROGRAM = dedent(
+    f"""\
+    import base64, datetime, json, select, sys, zlib
+
+    skip, compress = int(sys.argv[1]), sys.argv[2] == "1"
+    priorities = "emerg,alert,critical,error,warning,notice,info,debug"
+    prio_map = {{str(i): str(prio).upper() for i, prio in enumerate(priorities.split(","))}}
+    compressor = zlib.compressobj()
+    output, entries = [], 0
+
+    def flush():
+        text = "".join(output)
+        output.clear()
+        if compress:
+            chunk = compressor.compress(text.encode(errors="replace")) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            sys.stdout.write({JOURNAL_CHUNK_MARKER!r} + base64.b64encode(chunk).decode() + "\\n")
+        else:
+            sys.stdout.write(text)
+        sys.stdout.flush()
+
+    for line in iter(sys.stdin.readline, ""):
+        d = json.loads(line)
+        cursor = d["__CURSOR"]
+        if skip:
+            skip -= 1
+            continue
+        message = d.get("MESSAGE", "")
+        o = str(datetime.datetime.fromtimestamp(int(d.get("__REALTIME_TIMESTAMP", "1000")) / 1000**2).isoformat(timespec="milliseconds"))
+        o += f" {{d.get('_HOSTNAME', 'unknown')}}"
+        o += f" !{{prio_map.get(d.get('PRIORITY', '7'), '???')}} |"
+        o += f" {{d.get('SYSLOG_IDENTIFIER', 'unknown')}}[{{d.get('_PID', '0')}}]:"
+        o += f" {{message}}"
+        output.append(("" if compress else {JOURNAL_LINE_MARKER!r}) + o + "\\n")
+        entries += 1
+        if entries >= {JOURNAL_CURSOR_PERIOD} or "\\n" in str(message) or not select.select([sys.stdin], [], [], 0)[0]:
+            output.append({JOURNAL_CURSOR_MARKER!r} + cursor + "\\n")
+            entries = 0
+            flush()
+    if output:
+        flush()
+    """
+)
+
+
+class JournalPosition:
+    """A journal cursor and number of lines received after it, persisted to a file next to the log file.
+
+    `since' is the time (UTC) the last cursor was received at, it's used to resume if the cursor is not valid anymore.
+    """
+
+    def __init__(self, position_file: str):
+        self.position_file = position_file
+        self.cursor = None
+        self.lines = 0
+        self.since = None
+        try:
+            with open(position_file, encoding="utf-8") as fobj:
+                position = json.load(fobj)
+            self.cursor, self.lines, self.since = position["cursor"], position["lines"], position.get("since")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as exc:
+            LOGGER.warning("Failed to load journal position from %s: %s", position_file, exc)
+
+    def set_cursor(self, cursor: str) -> None:
+        self.cursor, self.lines = cursor, 0
+        self.since = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self._save()
+
+    def reset(self) -> None:
+        """Forget the cursor (e.g., the journal was vacuumed or the node was rebuilt), resume from `since'."""
+        self.cursor, self.lines = None, 0
+        self._save()
+
+    def _save(self) -> None:
+        tmp_file = f"{self.position_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as fobj:
+            json.dump({"cursor": self.cursor, "lines": self.lines, "since": self.since}, fobj)
+        os.replace(tmp_file, self.position_file)
+
+
+class JournalStreamWatcher(StreamWatcher):
+    """Write lines of `JOURNAL_REFORMAT_PROGRAM' output to the log file and track the journal position."""
+
+    def __init__(self, log_file: str, position: JournalPosition):
+        super().__init__()
+        self.position = position
+        self.entries = 0  # received in this stream
+        self._len = 0
+        self._partial_line = ""
+        self._decompressor = zlib.decompressobj()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._file_object = open(log_file, "a+", encoding="utf-8", buffering=1)  # noqa: SIM115
+
+    def submit(self, stream: str) -> list:
+        self.submit_line(stream[self._len :])
+        self._len = len(stream)
+        return []
+
+    def submit_line(self, line: str) -> None:
+        stream_lines = (self._partial_line + line).split("\n")
+        self._partial_line = stream_lines.pop()
+        for stream_line in stream_lines:
+            if stream_line.startswith(JOURNAL_CHUNK_MARKER):
+                data = self._decompressor.decompress(base64.b64decode(stream_line[1:]))
+                # not `splitlines()', the markers are line boundaries for it
+                self._handle_lines(line + "\n" for line in self._decoder.decode(data).split("\n")[:-1])
+            elif stream_line.startswith(JOURNAL_LINE_MARKER):
+                self._handle_lines([stream_line[1:] + "\n"])
+            else:
+                self._handle_lines([stream_line + "\n"], entries=False)
+
+    def _handle_lines(self, lines: Iterable[str], entries: bool = True) -> None:
+        log_lines = []
+        for line in lines:
+            if line.startswith(JOURNAL_CURSOR_MARKER):
+                self._file_object.write("".join(log_lines))
+                log_lines = []
+                self.position.set_cursor(line[1:].strip())
+            else:
+                log_lines.append(line)
+                self.position.lines += entries
+                self.entries += entries
+        self._file_object.write("".join(log_lines))
+
+    def close(self) -> None:
+        if not self._file_object.closed:
+            self._file_object.close()
+
+    def __del__(self):
+        self.close()
+
+
 class SSHScyllaSystemdLogger(SSHLoggerBase):
+    """Stream the journal of Scylla services, resuming after a reconnect exactly from the last received entry.
+
+    The position (a journal cursor and number of entries received after it) is persisted to a file next to the
+    log file, and `journalctl --after-cursor' is used to resume.  The output is compressed on the wire if
+    `COMPRESS_STREAM' is set.
+    """
+
+    VERBOSE_RETRIEVE = False  # the output may be compressed
+    COMPRESS_STREAM = True
+
+    def __init__(self, node: BaseNode, target_log_file: str):
+        super().__init__(node=node, target_log_file=target_log_file)
+        self._python3_found = False
+        self.position = JournalPosition(position_file=f"{target_log_file}.journal_position")
+
     def _is_ready_to_retrieve(self) -> bool:
-        return super()._is_ready_to_retrieve() and self._remoter.sudo(cmd="which python3", ignore_status=True).ok
+        if not super()._is_ready_to_retrieve():
+            return False
+        if not self._python3_found:
+            self._python3_found = self._remoter.sudo(cmd="which python3", ignore_status=True).ok
+        return self._python3_found
 
-    @staticmethod
-    def reformat_output_command(cmd: str) -> str:
-        """
-        Wrapping journalctl -f command with a python program
-        that read a s json stream, and add the level/priority that
-        is missing from regular output
-        """
-        return dedent(
-            """
-            PYTHON_PROG="
-            import json,sys, datetime
-
-            priorities = \\"emerg,alert,critical,error,warning,notice,info,debug\\"
-            prio_map = {{str(i) : str(prio).upper() for i, prio in enumerate(priorities.split(','))}}
-
-            for line in iter(sys.stdin.readline, b''):
-                d = json.loads(line)
-                o = str(datetime.datetime.fromtimestamp(int(d.get('__REALTIME_TIMESTAMP', '1000')) / 1000**2).isoformat(timespec='milliseconds'))
-                o += f\\" {{d.get('_HOSTNAME', 'unknown')}}\\"
-                o += f\\" !{{prio_map.get(d.get('PRIORITY', '7'), '???')}} |\\"
-                o += f\\" {{d.get('SYSLOG_IDENTIFIER', 'unknown')}}[{{d.get('_PID', '0')}}]:\\"
-                o += f\\" {{d.get('MESSAGE', '')}}\\"
-                print(o)
-            "
-                      """
-            f'{cmd} -o json | python3 -c "$PYTHON_PROG"'
+    @raise_event_on_failure
+    def _journal_thread(self) -> None:
+        while not self._termination_event.is_set():
+            if self._is_ready_to_retrieve():
+                self._retrieve_after_cursor()
+            else:
+                time.sleep(self.READINESS_CHECK_DELAY)
+
+    def _retrieve_after_cursor(self) -> None:
+        self._log.debug(
+            "SSHLogger reading %s after the cursor %s and %s more entries",
+            self._target_log_file,
+            self.position.cursor or f"of {self.position.since or 'the beginning'}",
+            self.position.lines,
+        )
+        watcher = JournalStreamWatcher(log_file=self._target_log_file, position=self.position)
+        try:
+            result = self._run_logger_cmd(cmd=self._logger_cmd, watchers=[watcher])
+        finally:
+            watcher.close()
+        if (result is None or result.failed) and not watcher.entries:
+            # e.g., the cursor is not valid anymore, don't restart journalctl with it in a loop
+            if self.position.cursor:
+                self._log.warning(
+                    "SSHLogger failed to read %s after the cursor %s, read it since %s",
+                    self._target_log_file,
+                    self.position.cursor,
+                    self.position.since or "the beginning",
+                )
+                self.position.reset()
+            self._termination_event.wait(self.READINESS_CHECK_DELAY)
+
+    @property
+    def _logger_cmd(self) -> str:
+        if self.position.cursor:
+            since = f"--after-cursor={shlex.quote(self.position.cursor)} "
+        elif self.position.since:
+            since = f'--since "{self.position.since}" '
+        else:
+            since = ""
+        program_file = f"/tmp/logger_journal_reformat_{os.getpid()}.py"
+        return (
+            f"cat <<'PROGRAM_EOF' > {program_file}\n{JOURNAL_REFORMAT_PROGRAM}PROGRAM_EOF\n"
+            "set -o pipefail\n"  # fail if journalctl fails
+            f"{self._logger_cmd_template.format(since=since)} -o json"
+            f" | python3 {program_file} {self.position.lines} {int(self.COMPRESS_STREAM)}"
         )
 
     @cached_property
     def _logger_cmd_template(self) -> str:
-        return self.reformat_output_command(
+        return (
             f"{self._node.journalctl} -f --no-tail --no-pager "
-            "--utc {since} "
+            "--utc {since}"
             "-u scylla-ami-setup.service "
             "-u scylla-image-setup.service "
             "-u scylla-io-setup.service "
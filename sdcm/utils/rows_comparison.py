@@ -0,0 +1,175 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Comparison of large row sets with bounded memory.
+
+Rows are streamed (see `sdcm.utils.database_query_utils.stream_all_rows()'), sorted by a key with an external
+merge sort (sorted runs of `buffer_size' rows are spilled to temporary files) and merge-compared, so only a buffer
+of rows and the first mismatches are held in the memory.
+"""
+
+from __future__ import annotations
+
+import heapq
+import pickle
+import tempfile
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, NamedTuple, Optional
+
+SORT_BUFFER_SIZE = 100_000  # rows
+SPILL_CHUNK_SIZE = 1_000  # rows pickled together into a temporary file
+MAX_REPORTED_MISMATCHES = 100
+
+RowKey = Callable[[tuple], Any]
+
+
+def _row_itself(row: tuple) -> tuple:
+    return row
+
+
+def _spill_run(stack: contextlib.ExitStack, rows: list, tmp_dir: Optional[str]) -> Iterator[tuple]:
+    run_file = stack.enter_context(tempfile.TemporaryFile(dir=tmp_dir))
+    for start in range(0, len(rows), SPILL_CHUNK_SIZE):
+        pickle.dump(rows[start : start + SPILL_CHUNK_SIZE], run_file, protocol=pickle.HIGHEST_PROTOCOL)
+    run_file.seek(0)
+    return _read_run(run_file)
+
+
+def _read_run(run_file: BinaryIO) -> Iterator[tuple]:
+    while True:
+        try:
+            yield from pickle.load(run_file)
+        except EOFError:
+            return
+
+
+def sort_rows(
+    rows: Iterable[tuple],
+    key: Optional[RowKey] = None,
+    buffer_size: int = SORT_BUFFER_SIZE,
+    tmp_dir: Optional[str] = None,
+) -> Iterator[tuple]:
+    """Yield the rows sorted by the key, holding up to `buffer_size' rows in the memory."""
+    key = key or _row_itself
+    with contextlib.ExitStack() as stack:
+        runs, buffer = [], []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) >= buffer_size:
+                buffer.sort(key=key)
+                runs.append(_spill_run(stack, buffer, tmp_dir))
+                buffer = []
+        buffer.sort(key=key)
+        if not runs:
+            yield from buffer
+            return
+        runs.append(iter(buffer))
+        yield from heapq.merge(*runs, key=key)
+
+
+class RowsMismatch(NamedTuple):
+    key: Any
+    actual: Optional[tuple]  # None if the row is missing in the actual rows
+    expected: Optional[tuple]  # None if the row is not expected
+
+    @property
+    def kind(self) -> str:
+        if self.actual is None:
+            return "missing"
+        if self.expected is None:
+            return "unexpected"
+        return "different"
+
+
+@dataclass
+class RowsComparisonResult:
+    max_mismatches: int = MAX_REPORTED_MISMATCHES
+    actual_rows: int = 0
+    expected_rows: int = 0
+    missing_rows: int = 0
+    unexpected_rows: int = 0
+    different_rows: int = 0
+    mismatches: list[RowsMismatch] = field(default_factory=list)  # first `max_mismatches' mismatches only
+
+    @property
+    def is_equal(self) -> bool:
+        return not (self.missing_rows or self.unexpected_rows or self.different_rows)
+
+    @property
+    def missing(self) -> list[tuple]:
+        return [mismatch.expected for mismatch in self.mismatches if mismatch.kind == "missing"]
+
+    def add_mismatch(self, mismatch: RowsMismatch) -> None:
+        setattr(self, f"{mismatch.kind}_rows", getattr(self, f"{mismatch.kind}_rows") + 1)
+        if len(self.mismatches) < self.max_mismatches:
+            self.mismatches.append(mismatch)
+
+    @property
+    def summary(self) -> str:
+        return (
+            f"actual rows: {self.actual_rows}, expected rows: {self.expected_rows}, "
+            f"missing rows: {self.missing_rows}, unexpected rows: {self.unexpected_rows}, "
+            f"different rows: {self.different_rows}"
+        )
+
+
+_END = object()
+
+
+def compare_sorted_rows(
+    actual: Iterable[tuple],
+    expected: Iterable[tuple],
+    key: Optional[RowKey] = None,
+    max_mismatches: int = MAX_REPORTED_MISMATCHES,
+    result: Optional[RowsComparisonResult] = None,
+) -> RowsComparisonResult:
+    """Merge-compare two row streams sorted by the key.
+
+    Rows with the same key are compared with `==', every extra row with a key already matched (a duplicate) is
+    counted as missing or unexpected.  Pass a result of a previous call to accumulate comparisons of several pairs
+    of streams (e.g., of token ranges.)
+    """
+    key = key or _row_itself
+    if result is None:
+        result = RowsComparisonResult(max_mismatches=max_mismatches)
+    actual, expected = iter(actual), iter(expected)
+    actual_row, expected_row = next(actual, _END), next(expected, _END)
+    while actual_row is not _END or expected_row is not _END:
+        actual_key = None if actual_row is _END else key(actual_row)
+        expected_key = None if expected_row is _END else key(expected_row)
+        if expected_row is _END or (actual_row is not _END and actual_key < expected_key):
+            result.add_mismatch(RowsMismatch(key=actual_key, actual=actual_row, expected=None))
+            result.actual_rows += 1
+            actual_row = next(actual, _END)
+        elif actual_row is _END or expected_key < actual_key:
+            result.add_mismatch(RowsMismatch(key=expected_key, actual=None, expected=expected_row))
+            result.expected_rows += 1
+            expected_row = next(expected, _END)
+        else:
+            if actual_row != expected_row:
+                result.add_mismatch(RowsMismatch(key=actual_key, actual=actual_row, expected=expected_row))
+            result.actual_rows += 1
+            result.expected_rows += 1
+            actual_row, expected_row = next(actual, _END), next(expected, _END)
+    return result
+
+
+__all__ = (
+    "MAX_REPORTED_MISMATCHES",
+    "SORT_BUFFER_SIZE",
+    "RowsComparisonResult",
+    "RowsMismatch",
+    "compare_sorted_rows",
+    "sort_rows",
+)
@@ -0,0 +1,138 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""`.tar.zst' archives which are uploaded to S3 while they are being written.
+
+Directories are appended to a tar stream by a writer thread, the stream is compressed by multithreaded `zstd', and
+the compressed stream is uploaded by a multipart upload.  So, logs of a node can be compressed and uploaded while logs
+of other nodes are still being fetched, and there is no archive file on the disk at all.
+"""
+
+from __future__ import annotations
+
+import queue
+import logging
+import tarfile
+import threading
+import subprocess
+from contextlib import suppress
+from typing import Optional
+
+from sdcm.utils.common import S3Storage
+
+LOGGER = logging.getLogger(__name__)
+
+ZSTD_COMPRESS_PROGRAM = "zstd -T0"  # use all cores, compatible with `tar --zstd'
+
+
+class StreamingArchiveError(Exception):
+    pass
+
+
+class StreamingArchiveUpload:
+    """Write a `.tar.zst' archive to S3 (as `dest_dir/archive_name') while directories are added to it.
+
+    `add()' doesn't wait for the compression or the upload.  `finish()' returns a link to the uploaded archive, or
+    None if anything failed (the upload is aborted then, and the added files can be archived in another way.)
+    """
+
+    def __init__(self, archive_name: str, dest_dir: str, storage: Optional[S3Storage] = None, public: bool = False):
+        self.archive_name = archive_name
+        self.dest_dir = dest_dir
+        self.storage = storage
+        self.public = public
+        self._paths = queue.SimpleQueue()
+        self._failed = threading.Event()
+        self._zstd: Optional[subprocess.Popen] = None
+        self._writer: Optional[threading.Thread] = None
+        self._uploader: Optional[threading.Thread] = None
+        self._link = None
+
+    def start(self) -> StreamingArchiveUpload:
+        self.storage = self.storage or S3Storage()
+        self._zstd = subprocess.Popen(  # noqa: S603
+            [*ZSTD_COMPRESS_PROGRAM.split(), "-q", "-c"], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        self._writer = threading.Thread(target=self._write, name=f"{self.archive_name}-writer", daemon=True)
+        self._uploader = threading.Thread(target=self._upload, name=f"{self.archive_name}-uploader", daemon=True)
+        self._writer.start()
+        self._uploader.start()
+        return self
+
+    def add(self, path: str, arcname: str) -> None:
+        self._paths.put((path, arcname))
+
+    def abort(self) -> None:
+        self._failed.set()
+        self.finish()
+
+    def finish(self) -> Optional[str]:
+        self._paths.put(None)
+        self._writer.join()
+        self._uploader.join()
+        if self._zstd.wait() or self._failed.is_set() or not self._link:
+            return None
+        return self._link
+
+    def _write(self) -> None:
+        try:
+            with tarfile.open(fileobj=self._zstd.stdin, mode="w|") as tar:
+                while (item := self._paths.get()) is not None:
+                    if self._failed.is_set():
+                        continue
+                    path, arcname = item
+                    tar.add(path, arcname=arcname)
+        except (OSError, tarfile.TarError) as exc:
+            LOGGER.error("Failed to add files to %s: %s", self.archive_name, exc)
+            self._failed.set()
+            while self._paths.get() is not None:
+                pass
+        finally:
+            try:
+                self._zstd.stdin.close()
+            except OSError:
+                self._failed.set()
+
+    def _upload(self) -> None:
+        stream = _ArchiveStream(archive=self)
+        self._link = self.storage.upload_fileobj(
+            fileobj=stream, file_name=self.archive_name, dest_dir=self.dest_dir, public=self.public
+        )
+        with suppress(StreamingArchiveError):
+            while stream.read(1024 * 1024):  # don't block the writer if the upload failed in the middle
+                pass
+
+    @property
+    def _broken(self) -> bool:
+        return bool(self._zstd.wait()) or self._failed.is_set()
+
+
+class _ArchiveStream:
+    """Non-seekable stream of the compressed archive, fails at the end if the archive is broken."""
+
+    def __init__(self, archive: StreamingArchiveUpload):
+        self._archive = archive
+        self._eof = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._eof:
+            return b""
+        if data := self._archive._zstd.stdout.read(size):
+            return data
+        self._eof = True
+        if self._archive._broken:
+            raise StreamingArchiveError(f"{self._archive.archive_name} is broken, abort the upload")
+        return b""
+
+
+__all__ = ("StreamingArchiveError", "StreamingArchiveUpload", "ZSTD_COMPRESS_PROGRAM")
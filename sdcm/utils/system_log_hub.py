@@ -0,0 +1,208 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""Shared subscriptions to lines of a node log.
+
+A single `SystemLogHub' per log file reads new lines of the log once and broadcasts them to all subscriptions whose
+patterns match, so a log followed by several callers at once (nemeses, health checks, waits) is read once only.
+
+The log is read lazily: when a subscription is iterated, or when somebody waits for a match.  While there are
+waiters, a tailer thread of the hub reads the log on every change (using inotify if it's available) and wakes up
+the waiters as soon as their subscriptions get a match.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+import logging
+import threading
+import weakref
+from collections import deque
+from typing import Iterable, Iterator, Optional
+
+from sdcm.utils.inotify import InotifyWatcher
+
+LOGGER = logging.getLogger(__name__)
+
+LOG_HUB_READ_SIZE = 4 * 1024 * 1024
+LOG_HUB_POLL_INTERVAL = 0.5  # seconds, used if inotify isn't available or the log is not changed
+
+
+class LogSubscription:
+    """Lines of the log which match any of the patterns, in the order they were written.
+
+    Iteration returns the matches received so far (reading new lines of the log first) and doesn't block; it can be
+    iterated again later to get new matches.  `wait()' blocks until the next match.
+    """
+
+    def __init__(self, hub: SystemLogHub, patterns: Iterable[re.Pattern]):
+        self._hub = hub
+        self.patterns = tuple(patterns)
+        self._matches = deque()
+
+    def __iter__(self) -> Iterator[str]:
+        self._hub.catch_up()
+        while self._matches:
+            yield self._matches.popleft()
+
+    def wait(self, timeout: float) -> Optional[str]:
+        """Return the next matching line, or None if no line matched during `timeout' seconds."""
+        return self._hub.wait_for_match(self, timeout=timeout)
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+
+    def _deliver(self, line: str) -> bool:
+        if any(pattern.search(line) for pattern in self.patterns):
+            self._matches.append(line)
+            return True
+        return False
+
+
+class SystemLogHub:
+    """Broadcast lines of a log file to pattern subscriptions, use `SystemLogHub.for_log()' to get a shared hub."""
+
+    _hubs: weakref.WeakValueDictionary[str, SystemLogHub] = weakref.WeakValueDictionary()
+    _hubs_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._cond = threading.Condition()
+        self._subscriptions: weakref.WeakSet[LogSubscription] = weakref.WeakSet()
+        self._position = self._get_log_size()
+        self._partial_line = b""
+        self._waiters = 0
+        self._tailer: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_log(cls, path: str) -> SystemLogHub:
+        path = os.path.abspath(path)
+        with cls._hubs_lock:
+            if (hub := cls._hubs.get(path)) is None:
+                hub = cls._hubs[path] = cls(path)
+            return hub
+
+    def subscribe(self, patterns: Iterable[re.Pattern], start_from_beginning: bool = False) -> LogSubscription:
+        """Subscribe to lines written after this call (or to all lines of the log if `start_from_beginning'.)"""
+        subscription = LogSubscription(hub=self, patterns=patterns)
+        with self._cond:
+            self._catch_up()
+            if start_from_beginning:
+                # the already broadcast part of the log is read again for this subscription only
+                for line in self._read_lines(start=0, end=self._position - len(self._partial_line)):
+                    subscription._deliver(line)
+            self._subscriptions.add(subscription)
+        # the hub is referenced by the subscriptions only, so it's alive while somebody follows the log
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription) -> None:
+        with self._cond:
+            self._subscriptions.discard(subscription)
+
+    def catch_up(self) -> None:
+        with self._cond:
+            self._catch_up()
+
+    def wait_for_match(self, subscription: LogSubscription, timeout: float) -> Optional[str]:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._waiters += 1
+            try:
+                self._start_tailer()
+                while True:
+                    self._catch_up()
+                    if subscription._matches:
+                        return subscription._matches.popleft()
+                    if (remaining := deadline - time.monotonic()) <= 0:
+                        return None
+                    self._cond.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+    def _get_log_size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def _catch_up(self) -> None:
+        """Read lines added since the last call and deliver them to the subscriptions, the lock has to be held."""
+        size = self._get_log_size()
+        if size < self._position:
+            LOGGER.debug("%s was truncated or replaced, follow it from the beginning", self.path)
+            self._position, self._partial_line = 0, b""
+        if size == self._position:
+            return
+        if not (subscriptions := list(self._subscriptions)):
+            # nobody is interested in these lines, skip them
+            self._position, self._partial_line = size, b""
+            return
+        delivered = False
+        for line in self._read_lines(start=self._position, end=size, track_position=True):
+            for subscription in subscriptions:
+                delivered |= subscription._deliver(line)
+        if delivered:
+            self._cond.notify_all()
+
+    def _read_lines(self, start: int, end: int, track_position: bool = False) -> Iterator[str]:
+        try:
+            log_file = open(self.path, "rb")  # noqa: SIM115
+        except OSError:
+            return
+        with log_file:
+            log_file.seek(start)
+            position = start
+            partial_line = self._partial_line if track_position else b""
+            while position < end and (chunk := log_file.read(min(LOG_HUB_READ_SIZE, end - position))):
+                position += len(chunk)
+                *lines, partial_line = (partial_line + chunk).split(b"\n")
+                if track_position:
+                    self._position, self._partial_line = position, partial_line
+                for line in lines:
+                    yield line.decode(errors="replace") + "\n"
+
+    def _start_tailer(self) -> None:
+        if self._tailer and self._tailer.is_alive():
+            return
+        self._tailer = threading.Thread(target=self._tail, name=f"SystemLogHub-{self.path}", daemon=True)
+        self._tailer.start()
+
+    def _tail(self) -> None:
+        watcher = InotifyWatcher.create()
+        try:
+            if watcher:
+                # watch the directory, since the log could be not created yet or replaced
+                watcher.add_watch(os.path.dirname(self.path))
+        except OSError as exc:
+            LOGGER.debug("Failed to watch %s, fallback to polling: %s", self.path, exc)
+            watcher.close()
+            watcher = None
+        try:
+            while True:
+                with self._cond:
+                    if not self._waiters:
+                        self._tailer = None
+                        return
+                    self._catch_up()
+                if watcher:
+                    watcher.wait(timeout=LOG_HUB_POLL_INTERVAL)
+                else:
+                    time.sleep(LOG_HUB_POLL_INTERVAL)
+        finally:
+            if watcher:
+                watcher.close()
+
+
+__all__ = ("LogSubscription", "SystemLogHub")
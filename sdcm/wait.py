@@ -162,17 +162,9 @@ def wait_for_log_lines(
     try:
         yield
     finally:
-        started = any(start_follower)
-        while not started and (time.time() - start_time < start_timeout):
-            started = any(start_follower)
-            time.sleep(0.1)
-        if not started:
+        if start_follower.wait(timeout=start_time + start_timeout - time.time()) is None:
             raise TimeoutError(start_ctx)
         LOGGER.debug("Start line patterns %s were found.%s", start_line_patterns, error_msg_ctx)
-        ended = any(end_follower)
-        while not ended and (time.time() - start_time < end_timeout):
-            ended = any(end_follower)
-            time.sleep(0.1)
-        if not ended:
+        if end_follower.wait(timeout=start_time + end_timeout - time.time()) is None:
             raise TimeoutError(end_ctx)
         LOGGER.debug("End line patterns %s were found.%s", end_line_patterns, error_msg_ctx)
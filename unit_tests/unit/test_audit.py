@@ -136,7 +136,7 @@ def test_get_audit_log_rows_can_be_filtered_by_time(test_data_dir):
     start_time = datetime(2025, 5, 17, 5, 49, 37, 280)  # 2025-05-17T05:49:37.280
     rows = get_audit_log_rows(node, from_datetime=start_time)
     rows = list(rows)
-    assert len(rows) == 4
+    assert len(rows) == 5
     assert not [row for row in rows if row.event_time < start_time.replace(microsecond=0)]
 
 
@@ -150,7 +150,7 @@ def test_get_audit_log_rows_can_be_filtered_by_time_comma_separated(test_data_di
     start_time = datetime(2025, 7, 19, 16, 1, 31, 790)  # 2025-07-19T16:01:31.790
     rows = get_audit_log_rows(node, from_datetime=start_time)
     rows = list(rows)
-    assert len(rows) == 209
+    assert len(rows) == 211
     assert not [row for row in rows if row.event_time < start_time.replace(microsecond=0)]
 
 
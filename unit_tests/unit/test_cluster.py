@@ -40,6 +40,8 @@ from unit_tests.lib.fake_cluster import DummyDbCluster, DummyNode, DummyScyllaCl
 
 
 class TestBaseNode:
+    chunked_tailing = False
+
     @pytest.fixture(autouse=True)
     def setup_events(self, events_function_scope, tmp_path):
         """Use per-test events fixture for proper isolation between tests."""
@@ -79,6 +81,7 @@ class TestBaseNode:
             log_lines=False,
             backtrace_stall_decoding=True,
             backtrace_decoding_disable_regex=None,
+            chunked_tailing=self.chunked_tailing,
         )
 
     def _read_and_publish_events(self, log_text=None):
@@ -250,6 +253,10 @@ INFO  2022-07-14 09:28:35,102 [shard 1] database - Flushed non-system tables
         assert "Reactor stalled for 32 ms on shard 1" in event["line"]
 
 
+class TestBaseNodeChunkedTailing(TestBaseNode):
+    chunked_tailing = True
+
+
 class VersionDummyRemote:
     def __init__(self, test, results):
         self.results = iter(results)
@@ -0,0 +1,104 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sdcm.utils.database_query_utils import PartitionsValidationAttributes, stream_all_rows
+
+CountRow = namedtuple("CountRow", ["count"])
+
+
+def fake_execute_concurrent_with_args(session, statement, parameters, concurrency, **kwargs):
+    for (key,) in parameters:
+        if key == session.failing_key:
+            raise RuntimeError(f"failed to count rows of {key}")
+        result = MagicMock()
+        result.one.return_value = CountRow(count=key * 10)
+        yield True, result
+
+
+@pytest.fixture
+def partitions_attributes(tmp_path):
+    session = MagicMock(failing_key=None)
+    tester = MagicMock(logdir=str(tmp_path))
+    tester.db_cluster.cql_connection_patient.return_value.__enter__.return_value = session
+    attributes = PartitionsValidationAttributes(
+        tester=tester,
+        table_name="scylla_bench.test",
+        primary_key_column="pk",
+        limit_rows_number=100,
+        partition_range_with_data_validation="0-50",
+        count_rows_concurrency=4,
+    )
+    with (
+        patch("sdcm.utils.database_query_utils.get_partition_keys", return_value=list(range(60))),
+        patch(
+            "sdcm.utils.database_query_utils.execute_concurrent_with_args",
+            side_effect=fake_execute_concurrent_with_args,
+        ) as execute_concurrent,
+    ):
+        yield attributes, session, execute_concurrent
+
+
+def test_collect_partitions_info(partitions_attributes, tmp_path):
+    attributes, session, execute_concurrent = partitions_attributes
+
+    partitions = attributes.collect_partitions_info()
+
+    assert partitions == {key: key * 10 for key in range(50)}
+    session.prepare.assert_called_once_with(
+        "select count(*) from scylla_bench.test where pk = ? LIMIT 100 using timeout 5m"
+    )
+    assert execute_concurrent.call_args.kwargs["concurrency"] == 4
+    assert (tmp_path / attributes.PARTITIONS_ROWS_BEFORE).read_text() == "".join(
+        f"{key}:{count}, " for key, count in partitions.items()
+    )
+    assert attributes.partitions_rows_collected
+
+
+def test_collect_partitions_info_failure(partitions_attributes, tmp_path):
+    attributes, session, _ = partitions_attributes
+    session.failing_key = 3
+
+    with patch("sdcm.utils.database_query_utils.TestFrameworkEvent") as event:
+        assert attributes.collect_partitions_info(ignore_limit_rows_number=True) is None
+    assert "failed to count rows of 3" in event.call_args.kwargs["message"]
+    session.prepare.assert_called_once_with("select count(*) from scylla_bench.test where pk = ? using timeout 5m")
+    assert not attributes.partitions_rows_collected
+
+
+def test_stream_all_rows():
+    pages = [([(1, "a"), (2, "b")], "page-2"), ([(3, "c")], "page-3"), ([], None)]
+    session = MagicMock()
+    session.execute.side_effect = [
+        MagicMock(current_rows=rows, paging_state=paging_state) for rows, paging_state in pages[:1]
+    ] + [
+        RuntimeError("timed out"),
+        *[MagicMock(current_rows=rows, paging_state=paging_state) for rows, paging_state in pages[1:]],
+    ]
+
+    with patch("time.sleep"):
+        assert list(stream_all_rows(session=session, default_fetch_size=2, statement="SELECT * FROM t")) == [
+            (1, "a"),
+            (2, "b"),
+            (3, "c"),
+        ]
+    assert [call.kwargs["paging_state"] for call in session.execute.call_args_list] == [
+        None,
+        "page-2",
+        "page-2",
+        "page-3",
+    ]
@@ -0,0 +1,244 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from sdcm import db_log_reader
+from sdcm.db_log_reader import DbLogReader, DbLogReaderPool, DbLogReaderWorker
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
+
+
+def make_db_log_reader(system_log, chunked_tailing, log_lines=False):
+    return DbLogReader(
+        system_log=str(system_log),
+        remoter=None,
+        node_name="node1",
+        system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS,
+        decoding_queue=None,
+        log_lines=log_lines,
+        chunked_tailing=chunked_tailing,
+    )
+
+
+def published(events, start=0):
+    return [
+        (event["base"], event.get("type"), event.get("line_number"), event.get("line"), event.get("raw_backtrace"))
+        for event in events.published_events[start:]
+    ]
+
+
+@pytest.mark.parametrize("log_lines", [False, True], ids=["prefilter", "log_lines"])
+@pytest.mark.parametrize("chunk_size", [64, db_log_reader.LOG_READ_CHUNK_SIZE], ids=["small_chunks", "default"])
+@pytest.mark.parametrize(
+    "log_file", ["system.log", "system_interlace_stall.log", "system_one_line_backtrace.log", "kernel_callstack.log"]
+)
+def test_chunked_tailing_publishes_same_events(
+    events_function_scope, test_data_dir, monkeypatch, log_file, chunk_size, log_lines
+):
+    monkeypatch.setattr(db_log_reader, "LOG_READ_CHUNK_SIZE", chunk_size)
+    system_log = test_data_dir / log_file
+
+    legacy_reader = make_db_log_reader(system_log, chunked_tailing=False, log_lines=log_lines)
+    legacy_reader._read_and_publish_events()
+    expected = published(events_function_scope)
+
+    reader = make_db_log_reader(system_log, chunked_tailing=True, log_lines=log_lines)
+    try:
+        reader._read_and_publish_events()
+    finally:
+        reader._close_system_log()
+
+    assert expected
+    assert published(events_function_scope, start=len(expected)) == expected
+    assert reader._last_log_position == legacy_reader._last_log_position == os.path.getsize(system_log)
+    assert reader._last_line_no == legacy_reader._last_line_no
+
+
+def test_chunked_tailing_postpones_partial_line(events_function_scope, tmp_path):
+    system_log = tmp_path / "system.log"
+    first_line = b"INFO  2022-07-14 09:28:34,095 [shard 1] database - Flushing non-system tables\n"
+    system_log.write_bytes(first_line + b"Reactor stalled for 32 ms on sha")
+
+    reader = make_db_log_reader(system_log, chunked_tailing=True)
+    try:
+        reader._read_and_publish_events()
+        assert not events_function_scope.published_events
+        assert reader._last_log_position == len(first_line)
+        assert reader._last_line_no == 0
+        assert reader._skipped_end_line == 1
+
+        with system_log.open("ab") as log_file:
+            log_file.write(b"rd 1. Backtrace: 0x4e0d6e2 0x4e0c340\n")
+        reader._read_and_publish_events()
+    finally:
+        reader._close_system_log()
+
+    assert [(event["type"], event["line_number"]) for event in events_function_scope.published_events] == [
+        ("REACTOR_STALLED", 1)
+    ]
+    assert reader._last_log_position == os.path.getsize(system_log)
+    assert reader._skipped_end_line == 0
+
+
+def test_chunked_tailing_processes_stuck_partial_line(events_function_scope, tmp_path):
+    system_log = tmp_path / "system.log"
+    system_log.write_bytes(b"Reactor stalled for 32 ms on shard 1")
+
+    reader = make_db_log_reader(system_log, chunked_tailing=True)
+    try:
+        for _ in range(22):
+            reader._read_and_publish_events()
+    finally:
+        reader._close_system_log()
+
+    assert [(event["type"], event["line_number"]) for event in events_function_scope.published_events] == [
+        ("REACTOR_STALLED", 0)
+    ]
+    assert reader._last_log_position == os.path.getsize(system_log)
+
+
+def test_chunked_tailing_reopens_replaced_log(events_function_scope, tmp_path):
+    system_log = tmp_path / "system.log"
+    system_log.write_bytes(b"INFO  2022-07-14 09:28:34,095 [shard 1] database - Flushing non-system tables\n")
+
+    reader = make_db_log_reader(system_log, chunked_tailing=True)
+    try:
+        reader._read_and_publish_events()
+        first_fd_stat = os.fstat(reader._log_fd)
+
+        replaced_log = tmp_path / "system.log.new"
+        replaced_log.write_bytes(system_log.read_bytes() + b"Reactor stalled for 32 ms on shard 1\n")
+        replaced_log.replace(system_log)
+        reader._read_and_publish_events()
+
+        assert not os.path.samestat(first_fd_stat, os.fstat(reader._log_fd))
+    finally:
+        reader._close_system_log()
+
+    assert [event["type"] for event in events_function_scope.published_events] == ["REACTOR_STALLED"]
+
+
+def wait_for_events(events, count, timeout=10):
+    end_time = time.perf_counter() + timeout
+    while len(events.published_events) < count and time.perf_counter() < end_time:
+        time.sleep(0.05)
+    return events.published_events
+
+
+@pytest.mark.parametrize("chunked_tailing", [True, False], ids=["chunked", "legacy"])
+def test_pool_worker_multiplexes_node_logs(events_function_scope, tmp_path, chunked_tailing):
+    worker = DbLogReaderWorker(index=0, system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS, decoding_queue=None)
+    for index in range(3):
+        node_dir = tmp_path / f"node{index}"
+        node_dir.mkdir()
+        (node_dir / "system.log").write_bytes(
+            b"INFO  2022-07-14 09:28:34,095 [shard 1] database - Flushing non-system tables\n"
+            b"Reactor stalled for 32 ms on shard 1\n"
+        )
+        worker.add_reader(
+            reader_id=f"reader{index}",
+            reader_kwargs=dict(
+                system_log=str(node_dir / "system.log"),
+                node_name=f"node{index}",
+                log_lines=False,
+                chunked_tailing=chunked_tailing,
+            ),
+        )
+
+    worker_thread = threading.Thread(target=worker.run, daemon=True)
+    worker_thread.start()
+    try:
+        events = wait_for_events(events_function_scope, count=3)
+        assert sorted(event["node"] for event in events) == ["node0", "node1", "node2"]
+
+        worker.remove_reader(reader_id="reader0")
+        time.sleep(0.5)
+        for index in range(3):
+            with (tmp_path / f"node{index}" / "system.log").open("ab") as log_file:
+                log_file.write(b"Reactor stalled for 64 ms on shard 2\n")
+        events = wait_for_events(events_function_scope, count=5)
+        time.sleep(0.5)
+    finally:
+        worker.stop()
+        worker_thread.join(timeout=10)
+
+    assert not worker_thread.is_alive()
+    assert len(events_function_scope.published_events) == 5
+    assert sorted(event["node"] for event in events[3:]) == ["node1", "node2"]
+    assert all(event["line_number"] == 2 for event in events[3:])
+
+
+def test_pool_assigns_logs_to_least_loaded_worker():
+    pool = DbLogReaderPool(size=2, system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS, decoding_queue=None)
+    with (
+        patch.object(DbLogReaderWorker, "start"),
+        patch.object(DbLogReaderWorker, "is_alive", return_value=True),
+        patch.object(DbLogReaderWorker, "add_reader") as add_reader,
+        patch.object(DbLogReaderWorker, "remove_reader") as remove_reader,
+    ):
+        handles = [
+            pool.register(system_log=f"/tmp/node{index}/system.log", node_name=f"node{index}", log_lines=False)
+            for index in range(3)
+        ]
+        workers = [handle._worker for handle in handles]
+        assert workers[0] is workers[2] is not workers[1]
+        assert [worker.readers_count for worker in pool._workers] == [2, 1]
+
+        for handle in handles:
+            handle.start()
+        assert add_reader.call_count == 3
+        assert all(handle.is_alive() for handle in handles)
+
+        handles[0].stop()
+        handles[0].stop()
+        remove_reader.assert_called_once_with(reader_id=handles[0].reader_id)
+        assert not handles[0].is_alive()
+        assert [worker.readers_count for worker in pool._workers] == [1, 1]
+
+        new_handle = pool.register(system_log="/tmp/node3/system.log", node_name="node3", log_lines=False)
+        assert new_handle._worker is workers[0]
+
+
+def test_pool_reregistered_node_is_not_removed_by_stale_handle(events_function_scope, tmp_path):
+    pool = DbLogReaderPool(size=1, system_event_patterns=SYSTEM_ERROR_EVENTS_PATTERNS, decoding_queue=None)
+    system_log = tmp_path / "system.log"
+    system_log.write_bytes(b"Reactor stalled for 32 ms on shard 1\n")
+    with (
+        patch.object(DbLogReaderWorker, "start"),
+        patch.object(DbLogReaderWorker, "is_alive", return_value=True),
+    ):
+        old_handle = pool.register(system_log=str(system_log), node_name="node0", log_lines=False)
+        new_handle = pool.register(system_log=str(system_log), node_name="node0", log_lines=False)
+    worker = old_handle._worker
+    assert old_handle.reader_id != new_handle.reader_id
+
+    old_handle.start()
+    new_handle.start()
+    old_handle.stop()
+    assert worker.readers_count == 1
+
+    readers, added = {}, []
+    end_time = time.perf_counter() + 10
+    while list(readers) != [new_handle.reader_id] and time.perf_counter() < end_time:
+        added += worker._handle_commands(readers=readers, watcher=None)
+        time.sleep(0.05)
+    assert added == [old_handle.reader_id, new_handle.reader_id]
+    assert list(readers) == [new_handle.reader_id]
+    assert readers[new_handle.reader_id]._node_name == "node0"
+    for reader in readers.values():
+        reader._close_system_log()
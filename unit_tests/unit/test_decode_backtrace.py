@@ -22,8 +22,14 @@ import requests
 from sdcm.cluster import TestConfig
 from sdcm.db_log_reader import DbLogReader
 from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
+from sdcm.utils.backtrace_decoder import (
+    BacktraceFramesCache,
+    get_backtrace_cache_dir,
+    parse_addr2line_output,
+    remove_backtrace_cache_dir,
+)
 
-from unit_tests.lib.dummy_remote import DummyRemote
+from unit_tests.lib.dummy_remote import DummyOutput, DummyRemote
 from unit_tests.lib.fake_cluster import DummyNode
 
 
@@ -227,25 +233,33 @@ def test_backtrace_decoding_configuration(
             )
 
 
-def _run_decode_with_queue_item(monitor_node, build_id, raw_backtrace):
-    """Helper: enqueue one fake event, run decode_backtrace(), return the event mock."""
+def _run_decode_with_queue_items(monitor_node, build_id, raw_backtraces):
+    """Helper: enqueue fake events, run decode_backtrace(), return the event mocks."""
     config = TestConfig()
     config.DECODING_QUEUE = queue.Queue()
 
-    event = MagicMock()
-    event.raw_backtrace = raw_backtrace
-    event.backtrace = None
-    event.severity = MagicMock()
-    event.severity.value = 0
-    event.type = "REACTOR_STALLED"
-    event.event_id = "test-event-id"
-
-    config.DECODING_QUEUE.put({"event": event, "node": "test_node", "build_id": build_id})
+    events = []
+    for raw_backtrace in raw_backtraces:
+        event = MagicMock()
+        event.raw_backtrace = raw_backtrace
+        event.backtrace = None
+        event.severity = MagicMock()
+        event.severity.value = 0
+        event.type = "REACTOR_STALLED"
+        event.event_id = "test-event-id"
+        config.DECODING_QUEUE.put({"event": event, "node": "test_node", "build_id": build_id})
+        events.append(event)
     config.DECODING_QUEUE.put(None)
 
     monitor_node.test_config = config
 
     monitor_node.decode_backtrace()
+    return events
+
+
+def _run_decode_with_queue_item(monitor_node, build_id, raw_backtrace):
+    """Helper: enqueue one fake event, run decode_backtrace(), return the event mock."""
+    [event] = _run_decode_with_queue_items(monitor_node, build_id, [raw_backtrace])
     return event
 
 
@@ -307,3 +321,75 @@ def test_no_build_id_skips_external_service(monitor_node):
     mock_post.assert_not_called()
     assert event.backtrace is not None
     assert "addr2line" in event.backtrace
+
+
+def addr2line_frames(address):
+    return f"func_{address} at file.cc:1\n (inlined by) inlined_{address} at file.hh:2\n"
+
+
+class Addr2lineRemote:
+    """Emulate `addr2line -Cpifae' output: every address is printed before its frames."""
+
+    def __init__(self):
+        self.commands = []
+
+    def run(self, cmd, **_):
+        self.commands.append(cmd)
+        _, _, _, *addresses = cmd.split()
+        return DummyOutput("".join(f"0x{int(address, 16):016x}: {addr2line_frames(address)}" for address in addresses))
+
+
+def test_parse_addr2line_output():
+    addresses = ["0x1234", "0x5678"]
+    output = f"0x0000000000001234: {addr2line_frames('0x1234')}0x0000000000005678: {addr2line_frames('0x5678')}"
+    assert parse_addr2line_output(addresses, output) == {
+        "0x1234": addr2line_frames("0x1234"),
+        "0x5678": addr2line_frames("0x5678"),
+    }
+    assert parse_addr2line_output(addresses, f"0x0000000000001234: {addr2line_frames('0x1234')}") is None
+    assert parse_addr2line_output(addresses, "addr2line: unknown option\n") is None
+
+
+def test_backtraces_decoded_in_batch_with_cache(monitor_node, tmp_path):
+    """Unique addresses of a batch are decoded by a single addr2line call and cached per build id."""
+    monitor_node.remoter = Addr2lineRemote()
+    monitor_node.backtrace_frames_cache = BacktraceFramesCache(cache_dir=str(tmp_path))
+    raw_backtraces = ["0x1234\n0x5678\n0x9abc", "0x1234\n0x5678\n0xdef0", "0x1234\n0x5678\n0x9abc"]
+
+    with patch("sdcm.cluster.requests.post", side_effect=requests.ConnectionError("connection refused")):
+        events = _run_decode_with_queue_items(monitor_node, "abc123", raw_backtraces)
+
+    assert monitor_node.remoter.commands == ["addr2line -Cpifae scylla_debug_info_file 0x1234 0x5678 0x9abc 0xdef0"]
+    for event, raw_backtrace in zip(events, raw_backtraces):
+        assert event.backtrace == "".join(addr2line_frames(address) for address in raw_backtrace.split())
+        event.publish.assert_called_once()
+
+    monitor_node.remoter = Addr2lineRemote()
+    monitor_node.backtrace_frames_cache = BacktraceFramesCache(cache_dir=str(tmp_path))  # loaded from the disk
+    with patch("sdcm.cluster.requests.post", side_effect=requests.ConnectionError("connection refused")):
+        [event] = _run_decode_with_queue_items(monitor_node, "abc123", ["0x9abc\n0x1234\n0x4321"])
+    assert monitor_node.remoter.commands == ["addr2line -Cpifae scylla_debug_info_file 0x4321"]
+    assert event.backtrace == "".join(addr2line_frames(address) for address in ("0x9abc", "0x1234", "0x4321"))
+
+
+def test_backtrace_frames_cache_of_test_run(tmp_path, monkeypatch):
+    monkeypatch.setenv("_SCT_TEST_LOGDIR", str(tmp_path))
+    cache_dir = tmp_path / "backtrace-cache"
+    assert get_backtrace_cache_dir() == str(cache_dir)
+
+    cache = BacktraceFramesCache(cache_dir=get_backtrace_cache_dir())
+    cache.update("abc123", {"0x1234": addr2line_frames("0x1234")})
+    cache.update("/tmp/scylla.debug", {"0x5678": addr2line_frames("0x5678")})  # not a build id, kept in the memory
+    assert [path.name for path in cache_dir.iterdir()] == ["abc123.json"]
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert BacktraceFramesCache(cache_dir=str(cache_dir)).get("abc123", ["0x1234"]) == {
+        "0x1234": addr2line_frames("0x1234")
+    }
+
+    (cache_dir / "abc123.json").write_text('["0x1234"]')
+    assert BacktraceFramesCache(cache_dir=str(cache_dir)).get("abc123", ["0x1234"]) == {}
+
+    remove_backtrace_cache_dir()
+    assert not cache_dir.exists()
+    monkeypatch.delenv("_SCT_TEST_LOGDIR")
+    assert get_backtrace_cache_dir() is None
@@ -0,0 +1,164 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import time
+import queue
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from argus.client.sct.client import ArgusSCTClient
+from sdcm.sct_events.argus import ArgusEventPostman
+from sdcm.sct_events.events_processes import EventsProcessesRegistry
+
+
+class StubArgusServer(ThreadingHTTPServer):
+    """Accept bulk event submissions, or fail them while `failing' is set."""
+
+    def __init__(self):
+        self.submissions = []
+        self.failing = threading.Event()
+        self.concurrent = self.max_concurrent = 0
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), StubArgusHandler)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @property
+    def events(self):
+        with self.lock:
+            return [event for submission in self.submissions for event in submission]
+
+
+class StubArgusHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # noqa: N802
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.concurrent += 1
+            server.max_concurrent = max(server.max_concurrent, server.concurrent)
+        time.sleep(0.05)
+        with server.lock:
+            server.concurrent -= 1
+            if server.failing.is_set():
+                status, response = 500, {"status": "error", "response": {"arguments": ["down"]}}
+            else:
+                server.submissions.append(body["data"])
+                status, response = 200, {"status": "ok", "response": None}
+        data = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def argus_server():
+    server = StubArgusServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def postman(tmp_path, argus_server):
+    inbound = queue.SimpleQueue()
+    postman = ArgusEventPostman(_registry=EventsProcessesRegistry(log_dir=tmp_path))
+
+    def inbound_events():
+        while not postman.stop_event.is_set():
+            try:
+                yield inbound.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    postman.inbound = inbound
+    postman._argus_client = ArgusSCTClient(
+        run_id=uuid.uuid4(), auth_token="token", base_url=argus_server.url, max_retries=0
+    )
+    with patch.object(postman, "inbound_events", inbound_events):
+        yield postman
+    postman.stop(timeout=10)
+
+
+def make_events(start, count):
+    return [{"event_type": "TestEvent", "message": f"event {num}", "ts": float(num)} for num in range(start, count)]
+
+
+def wait_for(predicate, timeout=10):
+    end_time = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < end_time, "timed out"
+        time.sleep(0.01)
+
+
+def test_events_posted_in_batches(postman, argus_server):
+    postman.batch_size = 10
+    postman.batch_period = 0.2
+    postman.start()
+    postman.start_posting_argus_events()
+
+    for event in make_events(0, 95):
+        postman.inbound.put(event)
+    wait_for(lambda: len(argus_server.events) == 95)  # the last partial batch is flushed by the time
+
+    assert sorted(argus_server.events, key=lambda event: event["ts"]) == make_events(0, 95)
+    assert len(argus_server.submissions) < 20
+    assert max(len(submission) for submission in argus_server.submissions) == 10
+    assert argus_server.max_concurrent > 1
+
+
+def test_failed_events_spooled_and_reposted(postman, argus_server):
+    postman.batch_size = 10
+    postman.batch_period = 0.1
+    postman.spool_retry_period = 0.5
+    argus_server.failing.set()
+    postman.start()
+    postman.start_posting_argus_events()
+
+    for event in make_events(0, 25):
+        postman.inbound.put(event)
+    wait_for(lambda: postman.spool.path.exists() and len(postman.spool.path.read_text().splitlines()) == 25)
+    assert not argus_server.events
+
+    argus_server.failing.clear()
+    for event in make_events(25, 30):
+        postman.inbound.put(event)
+    wait_for(lambda: len(argus_server.events) == 30)
+    assert sorted(argus_server.events, key=lambda event: event["ts"]) == make_events(0, 30)
+    assert postman.spool.pop() == []
+
+
+def test_spooled_events_reposted_on_termination(postman, argus_server):
+    postman.spool.append(make_events(0, 15))
+    postman.start()
+    postman.start_posting_argus_events()
+    for event in make_events(15, 20):
+        postman.inbound.put(event)
+    time.sleep(0.3)
+
+    postman.stop(timeout=10)
+    assert not postman.is_alive()
+    assert sorted(argus_server.events, key=lambda event: event["ts"]) == make_events(0, 20)
@@ -13,13 +13,22 @@
 
 import json
 import pickle
+from datetime import timezone
 from typing import Type, Protocol, runtime_checkable
 from unittest.mock import patch
 
+import dateutil.parser
 import pytest
 
 from sdcm.sct_events import Severity, SctEventProtocol
-from sdcm.sct_events.base import SctEvent, SctEventTypesRegistry, BaseFilter, LogEvent, LogEventProtocol
+from sdcm.sct_events.base import (
+    SctEvent,
+    SctEventTypesRegistry,
+    BaseFilter,
+    LogEvent,
+    LogEventProtocol,
+    parse_log_line_timestamp,
+)
 from sdcm.sct_events.nemesis import DisruptionEvent
 
 Y = None  # define a global name for pickle.
@@ -590,6 +599,73 @@ def test_log_event_clone_with_info():
     assert z._ready_to_publish
 
 
+def test_log_event_clone_same_as_unpickled():
+    global Y  # noqa: PLW0603
+
+    class Y(LogEvent):
+        pass
+
+    z = Y(regex="regex1")
+    z.add_info(node="node1", line="2021-04-06 13:03:28 message", line_number=1)
+    z.subcontext = [{"event_id": "dict-event-id", "base": "TestBase", "nemesis_name": "DictNemesis"}]
+    z._private = "not cloned"
+    y = z.clone()
+    assert vars(y) == vars(pickle.loads(pickle.dumps(z)))
+    assert y.subcontext == z.subcontext
+    assert y.subcontext is not z.subcontext
+    assert not hasattr(y, "_private")
+    assert not y._ready_to_publish
+    z._ready_to_publish = False
+
+
+@pytest.mark.parametrize(
+    "event_time",
+    [
+        "2021-04-06T13:03:28+00:00",
+        "2021-04-06T13:03:28.123456+02:00",
+        "2021-04-06T13:03:28.123+00:00",
+        "2021-04-06T13:03:28Z",
+        "2021-04-06 13:03:28",
+        "2021-04-06 13:03:28,123",
+        "2021/04/06 13:03:28",
+        "Apr 6 13:03:28",
+    ],
+)
+def test_parse_log_line_timestamp(event_time):
+    assert parse_log_line_timestamp(event_time) == (
+        dateutil.parser.parse(event_time).replace(tzinfo=timezone.utc).timestamp()
+    )
+
+
+def test_parse_log_line_timestamp_invalid():
+    with pytest.raises(ValueError):
+        parse_log_line_timestamp("INFO  2021-04-06")
+
+
+def test_log_event_clone_and_add_info():
+    """A clone of a prototype event with a matched line added is the same as a pickle round-trip of the prototype."""
+    global Y  # noqa: PLW0603
+
+    class Y(LogEvent):
+        pass
+
+    prototype = Y(regex="regex1")
+    lines = [f"2021-04-06T13:00:{num:02}.123456+00:00 db-node-1 !ERR | error {num}" for num in range(60)]
+
+    events = [prototype.clone().add_info(node="node1", line=line, line_number=num) for num, line in enumerate(lines)]
+    expected = [
+        pickle.loads(pickle.dumps(prototype)).add_info(node="node1", line=line, line_number=num)
+        for num, line in enumerate(lines)
+    ]
+    for event, expected_event in zip(events, expected):
+        assert type(event) is type(expected_event)
+        state, expected_state = event.__getstate__(), expected_event.__getstate__()
+        del state["event_timestamp"], expected_state["event_timestamp"]  # the time of `.add_info()' call
+        assert state == expected_state
+    for event in events + expected:
+        event._ready_to_publish = False
+
+
 def test_log_event_msgfmt():
     class Y(LogEvent):
         T: Type[LogEventProtocol]
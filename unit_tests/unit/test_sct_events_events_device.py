@@ -11,14 +11,24 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import json
 import ctypes
+import pickle
 import threading
 import multiprocessing
 
+import prometheus_client
 import pytest
 
 from sdcm.sct_events.health import ClusterHealthValidatorEvent
-from sdcm.sct_events.events_device import EventsDevice, start_events_main_device, get_events_main_device
+from sdcm.sct_events.system import InfoEvent
+from sdcm.sct_events.events_device import (
+    PUB_BATCH_SIZE,
+    DeliveryTracker,
+    EventsDevice,
+    start_events_main_device,
+    get_events_main_device,
+)
 from sdcm.sct_events.events_processes import EventsProcessesRegistry
 from sdcm.wait import wait_for
 
@@ -39,7 +49,12 @@ def test_defaults(events_device, events_processes_registry):
     assert events_device.raw_events_log == events_device.events_log_base_dir / "raw_events.log"
 
 
+def filters_evaluations(result):
+    return prometheus_client.REGISTRY.get_sample_value("sct_events_filters_evaluations_total", {"result": result}) or 0
+
+
 def test_publish_subscribe(events_device):
+    passed_before = filters_evaluations("passed")
     event1 = ClusterHealthValidatorEvent.NodeStatus()
     event2 = ClusterHealthValidatorEvent.NodePeersNulls()
 
@@ -72,6 +87,7 @@ def test_publish_subscribe(events_device):
 
     assert events_device.events_counter == counter.value
     assert counter.value == 2
+    assert filters_evaluations("passed") == passed_before + 2
 
 
 def test_start_get_events_main_device(events_processes_registry):
@@ -86,3 +102,78 @@ def test_start_get_events_main_device(events_processes_registry):
         assert events_device.subscribe_address
     finally:
         events_device.stop(timeout=1)
+
+
+def test_raw_events_log_is_flushed(events_device):
+    events = [InfoEvent(message=str(index)) for index in range(250)]
+    for event in events:
+        events_device.publish_event(event)
+
+    events_device.start()
+    try:
+        assert events_device.wait_for_raw_events_log(timeout=10)
+        assert events_device.raw_events_counter == events_device.events_counter == len(events)
+        lines = events_device.raw_events_log.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["event_id"] for line in lines] == [event.event_id for event in events]
+    finally:
+        events_device.stop(timeout=5)
+
+
+def test_delivery_tracker():
+    tracker = DeliveryTracker(timeout=60)
+    headers = [tracker.sent([pickle.dumps(index)] * 2) for index in range(3)]
+    assert tracker.pending == 3
+    assert tracker.next_seq == 6
+
+    tracker.confirm(headers[0])
+    assert (tracker.pending, tracker.lost) == (2, 0)
+
+    tracker.confirm(headers[2])  # the second batch is overtaken, i.e. lost
+    assert (tracker.pending, tracker.lost) == (0, 2)
+
+    tracker.timeout = 0
+    tracker.sent([pickle.dumps("late")])
+    tracker.expire()
+    assert (tracker.pending, tracker.lost) == (0, 3)
+
+
+@pytest.mark.parametrize("batch_size", [1, PUB_BATCH_SIZE], ids=["unbatched", "batched"])
+def test_publish_many_events_in_order(events_device, batch_size):
+    events_count = 1000
+    events_device.pub_batch_size = batch_size
+    stop_event = threading.Event()
+    counter = multiprocessing.Value(ctypes.c_uint32, 0)
+    subscribed = threading.Event()
+    received = []
+
+    def consume():
+        for _, event in events_device.outbound_events(stop_event=stop_event, events_counter=counter):
+            if event.message == "ready":
+                subscribed.set()
+                continue
+            received.append(event)
+            if len(received) == events_count:
+                stop_event.set()
+
+    events_device.start()
+    try:
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        # a subscriber misses events published before it's connected, so publish probes until one is received
+        wait_for(
+            func=lambda: events_device.publish_event(InfoEvent(message="ready")) or subscribed.wait(0.1),
+            step=0,
+            timeout=10,
+            throw_exc=True,
+            text="Waiting for the subscriber to connect",
+        )
+
+        for index in range(events_count):
+            events_device.publish_event(InfoEvent(message=str(index)))
+        consumer.join(timeout=60)
+        assert events_device.wait_for_raw_events_log(timeout=10)
+    finally:
+        stop_event.set()
+        events_device.stop(timeout=5)
+
+    assert [event.message for event in received] == [str(index) for index in range(events_count)]
@@ -0,0 +1,114 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+from unittest.mock import patch
+
+import pytest
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.events_index import INDEX_RECORD, EventsLogIndex
+from sdcm.sct_events.events_processes import EventsProcessesRegistry
+from sdcm.sct_events.file_logger import EventsFileLogger
+from sdcm.sct_events.system import SpotTerminationEvent
+
+
+def make_event(num, severity=Severity.WARNING):
+    event = SpotTerminationEvent(node=f"n{num}", message=f"m-{num}\nsecond line of m-{num}\n")
+    event.severity = severity
+    event.event_timestamp = 1_700_000_000 + num
+    return event
+
+
+@pytest.fixture
+def file_logger(tmp_path):
+    with patch("sdcm.sct_events.file_logger.get_events_main_device") as get_events_main_device:
+        get_events_main_device.return_value.events_log_base_dir = tmp_path
+        logger = EventsFileLogger(_registry=EventsProcessesRegistry(log_dir=tmp_path))
+    for log_file in logger.events_logs_by_severity.values():
+        log_file.touch()
+    for index in logger.events_indexes.values():
+        index.open()
+    logger._buffering = True
+    with patch.object(logger, "sync"):
+        yield logger
+    for index in logger.events_indexes.values():
+        index.close()
+
+
+def formatted(events):
+    return [event.format_event().strip() for event in events]
+
+
+def test_head_tail_and_time_range(file_logger):
+    events = [make_event(num) for num in range(100)]
+    for event in events:
+        file_logger.write_event(event)
+    file_logger.flush()
+
+    index = file_logger.events_indexes[Severity.WARNING]
+    assert index.index_path.stat().st_size == INDEX_RECORD.size * len(events)
+    assert index.get_events() == formatted(events)
+    assert index.get_events(limit=3) == formatted(events[-3:])
+    assert index.get_events(limit=3, from_head=True) == formatted(events[:3])
+    assert index.get_events(limit=0) == []
+    assert index.get_events(start_time=1_700_000_010, end_time=1_700_000_019) == formatted(events[10:20])
+    assert index.get_events(limit=2, from_head=True, start_time=1_700_000_090) == formatted(events[90:92])
+
+    grouped = file_logger.get_events_by_category(limit=5)
+    assert grouped[Severity.WARNING.name] == formatted(events[-5:])
+    assert grouped[Severity.ERROR.name] == []
+
+
+def test_out_of_order_timestamps(file_logger):
+    events = [make_event(num) for num in (5, 1, 7, 3, 9, 2)]
+    for event in events:
+        file_logger.write_event(event)
+    file_logger.flush()
+
+    index = file_logger.events_indexes[Severity.WARNING]
+    assert index.get_events(start_time=1_700_000_002, end_time=1_700_000_005) == formatted(
+        [events[0], events[3], events[5]]
+    )
+
+
+def test_not_indexed_events(file_logger):
+    events = [make_event(num, severity=Severity.ERROR) for num in range(10)]
+    for event in events[:6]:
+        file_logger.write_event(event)
+    file_logger.flush()
+
+    file_logger._buffering = False  # written by another process, without the index
+    for event in events[6:]:
+        file_logger.write_event(event)
+
+    index = file_logger.events_indexes[Severity.ERROR]
+    assert index.get_events(limit=5) == formatted(events[-5:])
+    assert index.get_events(limit=8, from_head=True) == formatted(events[:8])
+    assert index.get_events(start_time=1_700_000_005) == formatted(events[5:])
+
+    index.close()
+    assert not index.is_valid()
+    index.open()
+    assert index.is_valid()
+    assert index.index_path.stat().st_size == INDEX_RECORD.size * len(events)
+    assert index.get_events() == formatted(events)
+
+
+def test_without_index(tmp_path):
+    log_file = tmp_path / "warning.log"
+    events = [make_event(num) for num in range(5)]
+    log_file.write_text("".join(f"{event.format_event()}\n" for event in events))
+
+    index = EventsLogIndex(log_file)
+    assert index.get_events(limit=2) == formatted(events[-2:])
+    assert not index.index_path.exists()
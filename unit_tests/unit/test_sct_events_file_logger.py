@@ -11,9 +11,12 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import json
 import time
+from unittest.mock import patch
 
 from sdcm.sct_events import Severity
+from sdcm.sct_events.events_processes import EventsProcessesRegistry
 from sdcm.sct_events.system import SpotTerminationEvent
 from sdcm.sct_events.setup import EVENTS_SUBSCRIBERS_START_DELAY
 from sdcm.sct_events.file_logger import (
@@ -109,3 +112,46 @@ class TestFileLogger(EventsUtilsMixin):
             assert len(group) == 5
             for num, event in enumerate(group, start=0 if severity == Severity.CRITICAL.name else 5):
                 assert f"m-{num}-{severity}" in event
+
+    def test_logs_are_buffered_and_synced(self) -> None:
+        events = []
+        for num in range(50):
+            event = SpotTerminationEvent(node=f"n{num % 3}", message=f"m-{num}")
+            event.severity = (Severity.NORMAL, Severity.WARNING, Severity.ERROR)[num % 3]
+            events.append(event)
+
+        with self.wait_for_n_events(self.file_logger, count=len(events), timeout=3):
+            for event in events:
+                self.events_main_device.publish_event(event)
+
+        assert self.file_logger.sync()
+        expected = "".join(f"{event.format_event()}\n" for event in events).encode("utf-8")
+        assert self.file_logger.events_log.read_bytes() == expected
+        for severity in (Severity.NORMAL, Severity.WARNING, Severity.ERROR):
+            assert self.file_logger.events_logs_by_severity[severity].read_bytes() == "".join(
+                f"{event.format_event()}\n" for event in events if event.severity == severity
+            ).encode("utf-8")
+        assert get_logger_event_summary(_registry=self.events_processes_registry) == {
+            Severity.NORMAL.name: 17,
+            Severity.WARNING.name: 17,
+            Severity.ERROR.name: 16,
+        }
+
+
+def test_summary_updates_are_rate_limited(tmp_path):
+    registry = EventsProcessesRegistry(log_dir=tmp_path)
+    with patch("sdcm.sct_events.file_logger.get_events_main_device") as get_events_main_device:
+        get_events_main_device.return_value.events_log_base_dir = tmp_path
+        file_logger = EventsFileLogger(_registry=registry)
+    file_logger._buffering = True
+
+    event = SpotTerminationEvent(node="n1", message="m1")
+    event.severity = Severity.ERROR
+    for _ in range(100):
+        file_logger.write_event(event)
+        file_logger.flush()
+    assert json.loads(file_logger.events_summary_log.read_text()) == {Severity.ERROR.name: 1}
+    assert file_logger.events_log.read_bytes() == f"{event.format_event()}\n".encode("utf-8") * 100
+
+    file_logger.flush(force_summary=True)
+    assert json.loads(file_logger.events_summary_log.read_text()) == {Severity.ERROR.name: 100}
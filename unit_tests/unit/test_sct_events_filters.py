@@ -15,8 +15,10 @@ import re
 import pickle
 
 from sdcm.sct_events import Severity
-from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsSeverityChangerFilter
+from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsSeverityChangerFilter, FiltersIndex
 from sdcm.sct_events.database import DatabaseLogEvent
+from sdcm.sct_events.system import InfoEvent
+from sdcm.sct_events.wire_format import EventEnvelope
 
 
 def test_db_events_filter_just_type():
@@ -151,3 +153,64 @@ def test_events_severity_changer_filter():
     assert event.severity == Severity.ERROR
     db_events_filter.eval_filter(event)
     assert event.severity == Severity.NORMAL
+
+
+def make_filters():
+    return [
+        DbEventsFilter(db_event=DatabaseLogEvent.BAD_ALLOC, node="node1"),
+        DbEventsFilter(db_event=DatabaseLogEvent.BAD_ALLOC, line="abc"),
+        DbEventsFilter(db_event=DatabaseLogEvent.NO_SPACE_ERROR),
+        EventsSeverityChangerFilter(new_severity=Severity.WARNING, event_class=DatabaseLogEvent.REACTOR_STALLED),
+        EventsSeverityChangerFilter(new_severity=Severity.NORMAL, event_class=DatabaseLogEvent),
+        EventsFilter(event_class=InfoEvent, regex=".*skip me.*"),
+        EventsFilter(regex=".*filter everywhere.*"),
+    ]
+
+
+def make_events():
+    return [
+        DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1),
+        DatabaseLogEvent.BAD_ALLOC().add_info(node="node2", line="abc", line_number=1),
+        DatabaseLogEvent.BAD_ALLOC().add_info(node="node2", line="xyz", line_number=1),
+        DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node3", line="xyz", line_number=1),
+        DatabaseLogEvent.REACTOR_STALLED().add_info(node="node3", line="xyz", line_number=1),
+        DatabaseLogEvent.KERNEL_CALLSTACK().add_info(node="node3", line="xyz", line_number=1),
+        InfoEvent(message="skip me"),
+        InfoEvent(message="keep me"),
+        InfoEvent(message="filter everywhere"),
+    ]
+
+
+def test_filters_index_same_as_sequential_evaluation():
+    filters = make_filters()
+    index = FiltersIndex()
+    for filter_obj in filters:
+        index.add(filter_obj)
+
+    for event, expected_event in zip(make_events(), make_events()):
+        expected = any(filter_obj.eval_filter(expected_event) for filter_obj in filters)
+        envelope = EventEnvelope.from_event(event)
+        assert index.eval_filters(envelope) == expected, event
+        assert envelope.severity == expected_event.severity, event
+
+
+def test_filters_index_candidates():
+    filters = make_filters()
+    index = FiltersIndex()
+    for filter_obj in filters:
+        index.add(filter_obj)
+
+    bad_alloc = EventEnvelope.from_event(make_events()[0])
+    assert index.candidates(bad_alloc) == [filters[0], filters[1], filters[4], filters[6]]
+    assert not bad_alloc.is_decoded
+
+    stall = EventEnvelope.from_event(make_events()[4])
+    assert index.candidates(stall) == [filters[3], filters[4], filters[6]]
+    assert index.eval_filters(stall) is False
+    assert stall.severity == Severity.NORMAL  # the later severity changer wins
+
+    index.remove(filters[4].uuid)
+    index.remove(filters[6].uuid)
+    assert len(index) == 5
+    assert index.candidates(EventEnvelope.from_event(make_events()[7])) == [filters[5]]
+    assert index.candidates(EventEnvelope.from_event(make_events()[5])) == []
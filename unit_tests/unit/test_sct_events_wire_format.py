@@ -0,0 +1,87 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import struct
+
+import pytest
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.database import DatabaseLogEvent
+from sdcm.sct_events.filters import DbEventsFilter, EventsFilter
+from sdcm.sct_events.system import InfoEvent
+from sdcm.sct_events.wire_format import WIRE_FORMAT_VERSION, EventEnvelope, decode_header, encode_event
+
+
+def make_reactor_stall_event(backtrace_lines=0):
+    event = DatabaseLogEvent.REACTOR_STALLED()
+    event.add_info(node="node-1", line="Reactor stalled for 32 ms on shard 1. Backtrace: 0x4e0d6e2", line_number=10)
+    event.raw_backtrace = "\n".join(f"0x{index:x}" * 8 for index in range(backtrace_lines)) or None
+    return event
+
+
+def test_header_fields():
+    event = make_reactor_stall_event()
+    envelope = EventEnvelope(*encode_event(event))
+
+    assert envelope.name == "DatabaseLogEvent.REACTOR_STALLED"
+    assert envelope.base == "DatabaseLogEvent"
+    assert envelope.type == "REACTOR_STALLED"
+    assert envelope.subtype is None
+    assert envelope.node == "node-1"
+    assert envelope.event_id == event.event_id
+    assert envelope.event_timestamp == event.event_timestamp
+    assert envelope.severity == event.severity
+    assert not envelope.is_system_event
+    assert not envelope.is_filter
+    assert not envelope.is_decoded
+
+
+def test_event_decoded_on_demand():
+    event = InfoEvent(message="hello")
+    envelope = EventEnvelope.from_event(event)
+    assert envelope.severity == Severity.NORMAL
+    assert not envelope.is_decoded
+
+    assert envelope.event == event
+    assert envelope.event is envelope.event
+
+    envelope.severity = Severity.WARNING
+    assert envelope.event.severity == envelope.severity == Severity.WARNING
+
+
+def test_filter_flags_and_may_match():
+    db_filter = DbEventsFilter(db_event=DatabaseLogEvent.REACTOR_STALLED, line="shard 1")
+    envelope = EventEnvelope.from_event(db_filter)
+    assert envelope.is_filter
+    assert envelope.is_system_event
+
+    stall = EventEnvelope.from_event(make_reactor_stall_event())
+    info = EventEnvelope.from_event(InfoEvent(message="hello"))
+    assert db_filter.may_match(stall)
+    assert not db_filter.may_match(info)
+    assert EventsFilter(event_class=DatabaseLogEvent).may_match(stall)
+    assert not EventsFilter(event_class=InfoEvent).may_match(stall)
+    assert not stall.is_decoded
+    assert not info.is_decoded
+
+
+def test_unsupported_version():
+    header, _ = encode_event(InfoEvent(message="hello"))
+    with pytest.raises(ValueError, match="wire format version"):
+        decode_header(struct.pack("!B", WIRE_FORMAT_VERSION + 1) + header[1:])
+
+
+@pytest.mark.parametrize("backtrace_lines", [0, 200], ids=["no_backtrace", "backtrace"])
+def test_header_is_smaller_than_payload(backtrace_lines):
+    header, payload = encode_event(make_reactor_stall_event(backtrace_lines=backtrace_lines))
+    assert len(header) < len(payload)
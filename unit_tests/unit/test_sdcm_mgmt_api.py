@@ -0,0 +1,225 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse
+
+import pytest
+
+from sdcm.mgmt.api import MANAGER_API_STATUS_MARKER, ScyllaManagerApiClient
+from sdcm.mgmt.cli import BackupTask, ManagerTask, RepairTask
+from sdcm.mgmt.common import ScyllaManagerError, TaskStatus
+from sdcm.remote import LOCALRUNNER
+
+CLUSTER_ID = "8c20f334-cf37-4528-9219-862d75b84c99"
+REPAIR_ID = "2a4125d6-5d5a-45b9-9d8d-dec038b3732d"
+BACKUP_ID = "dd98f6ae-bcf4-4c98-8949-573d533bb789"
+
+
+class StubManagerServer(ThreadingHTTPServer):
+    """Serve tasks, progress and backups like the Manager REST API does."""
+
+    def __init__(self):
+        self.tasks = {
+            REPAIR_ID: {"id": REPAIR_ID, "type": "repair", "cluster_id": CLUSTER_ID, "status": "new", "retry": 3},
+            BACKUP_ID: {"id": BACKUP_ID, "type": "backup", "cluster_id": CLUSTER_ID, "status": "running"},
+        }
+        self.progress = {
+            REPAIR_ID: {"run": {"id": "run-1", "task_id": REPAIR_ID, "status": "running"}, "progress": {}},
+            BACKUP_ID: {
+                "run": {"id": "run-2", "task_id": BACKUP_ID, "status": "running"},
+                "progress": {"stage": "SNAPSHOT", "snapshot_tag": "sm_20260101000000UTC", "size": 1000},
+            },
+        }
+        self.requests = []
+        self.lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), StubManagerHandler)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def set_task(self, task_id, **fields):
+        with self.lock:
+            self.tasks[task_id].update(fields)
+
+    def set_progress(self, task_id, run_status=None, **counters):
+        with self.lock:
+            self.progress[task_id]["progress"].update(counters)
+            if run_status:
+                self.progress[task_id]["run"]["status"] = run_status
+
+    def respond(self, path, query):
+        parts = path.strip("/").split("/")
+        match parts:
+            case ["ping"]:
+                return 204, None
+            case ["api", "v1", "cluster", cluster_id, "tasks"]:
+                return 200, [task for task in self.tasks.values() if task["type"] == query.get("type", task["type"])]
+            case ["api", "v1", "cluster", cluster_id, "task", _, task_id, "latest"] if task_id in self.progress:
+                return 200, self.progress[task_id]
+            case ["api", "v1", "cluster", cluster_id, "backups"]:
+                return 200, [
+                    {
+                        "cluster_id": cluster_id,
+                        "snapshot_info": [{"snapshot_tag": "sm_20260101000000UTC", "size": 1000}],
+                        "units": [],
+                    }
+                ]
+        return 404, {"message": "not found", "trace_id": "trace"}
+
+
+class StubManagerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):  # noqa: N802
+        server = self.server
+        url = urlparse(self.path)
+        query = dict(param.split("=", 1) for param in url.query.split("&") if param)
+        with server.lock:
+            server.requests.append(url.path)
+            status, response = server.respond(url.path, query)
+        data = json.dumps(response).encode() if response is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def manager_server():
+    server = StubManagerServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def api_client(manager_server):
+    # the commands which would run on the Manager node run locally, so they reach the stub server
+    client = ScyllaManagerApiClient(remoter=mock.MagicMock(wraps=LOCALRUNNER), port=manager_server.port)
+    with (
+        mock.patch.object(ScyllaManagerApiClient, "for_node", return_value=client),
+        mock.patch("sdcm.mgmt.api.MANAGER_API_MIN_POLL_INTERVAL", 0),
+    ):
+        yield client
+
+
+def test_typed_responses(manager_server, api_client):
+    manager_server.set_progress(REPAIR_ID, token_ranges=200, success=50)
+
+    task = api_client.get_task(cluster_id=CLUSTER_ID, task_id=f"repair/{REPAIR_ID}")
+    assert (task.id, task.type, task.task_status, task.retry) == (REPAIR_ID, "repair", TaskStatus.NEW, 3)
+    assert api_client.get_task_progress(cluster_id=CLUSTER_ID, task_id=f"repair/{REPAIR_ID}").percentage("repair") == 25
+    backup_progress = api_client.get_task_progress(cluster_id=CLUSTER_ID, task_id=f"backup/{BACKUP_ID}")
+    assert backup_progress.progress.snapshot_tag == "sm_20260101000000UTC"
+    backups = api_client.list_backups(cluster_id=CLUSTER_ID, locations=["s3:backup-bucket"])
+    assert backups[0].snapshot_tags == ["sm_20260101000000UTC"]
+    assert manager_server.requests[-1] == f"/api/v1/cluster/{CLUSTER_ID}/backups"
+
+
+def test_request_errors(manager_server, api_client):
+    with pytest.raises(ScyllaManagerError, match="404: not found"):
+        api_client.get_task_progress(cluster_id=CLUSTER_ID, task_id="repair/unknown")
+    with pytest.raises(ScyllaManagerError, match="is not found"):
+        api_client.get_task(cluster_id=CLUSTER_ID, task_id="repair/unknown")
+    with pytest.raises(ScyllaManagerError, match="task type"):
+        api_client.get_task(cluster_id=CLUSTER_ID, task_id=REPAIR_ID)
+    assert api_client.available
+    assert not ScyllaManagerApiClient(remoter=LOCALRUNNER, port=1).available
+
+
+def test_client_of_node_uses_local_api():
+    node = mock.MagicMock(MANAGER_SERVER_PORT=5080)
+    node.name = "manager-node"
+    node.is_kubernetes.return_value = False
+    node.remoter.run.return_value = mock.MagicMock(stdout=f"\n{MANAGER_API_STATUS_MARKER}204\n")
+
+    with mock.patch.dict(ScyllaManagerApiClient._clients, clear=True):
+        assert ScyllaManagerApiClient.for_node(node).remoter is node.remoter
+    assert node.remoter.run.call_args.args[0].endswith("http://127.0.0.1:5080/ping")
+
+
+def test_watch_task_polls_by_single_command(manager_server, api_client):
+    manager_server.set_task(BACKUP_ID, status="running")
+    states = api_client.watch_task(
+        cluster_id=CLUSTER_ID, task_id=f"backup/{BACKUP_ID}", timeout=10, interval=0.1, with_progress=True
+    )
+    assert next(states).progress.progress.stage == "SNAPSHOT"
+    manager_server.set_progress(BACKUP_ID, stage="UPLOAD")
+    started_at = time.monotonic()
+    assert next(states).progress.progress.stage == "UPLOAD"
+    assert time.monotonic() - started_at >= 0.1
+
+    # the task and its progress are read by one command per poll
+    assert api_client.remoter.run.call_count == 2
+    assert len(manager_server.requests) == 4
+
+
+def test_watch_task_min_interval(manager_server, api_client):
+    with mock.patch("sdcm.mgmt.api.MANAGER_API_MIN_POLL_INTERVAL", 0.3):
+        states = api_client.watch_task(cluster_id=CLUSTER_ID, task_id=f"repair/{REPAIR_ID}", timeout=10, interval=0)
+        next(states)
+        started_at = time.monotonic()
+        next(states)
+    assert time.monotonic() - started_at >= 0.3
+
+
+def test_wait_for_status_checks_sctool_when_task_changes(manager_server, api_client):
+    task = ManagerTask(task_id=f"repair/{REPAIR_ID}", cluster_id=CLUSTER_ID, manager_node=mock.MagicMock())
+    threading.Timer(0.2, manager_server.set_task, args=(REPAIR_ID,), kwargs={"status": "running"}).start()
+    threading.Timer(0.4, manager_server.set_task, args=(REPAIR_ID,), kwargs={"status": "done"}).start()
+
+    with mock.patch.object(ManagerTask, "is_status_in_list", return_value=True) as is_status_in_list:
+        assert task.wait_for_status(list_status=[TaskStatus.DONE], timeout=10, step=0.1)
+    is_status_in_list.assert_called_once_with(list_status=[TaskStatus.DONE], check_task_progress=True)
+
+
+def test_wait_for_percentage(manager_server, api_client):
+    task = RepairTask(task_id=f"repair/{REPAIR_ID}", cluster_id=CLUSTER_ID, manager_node=mock.MagicMock())
+    manager_server.set_task(REPAIR_ID, status="running")
+    manager_server.set_progress(REPAIR_ID, token_ranges=100, success=10)
+    threading.Timer(0.3, manager_server.set_progress, args=(REPAIR_ID,), kwargs={"success": 60}).start()
+
+    with mock.patch.object(RepairTask, "progress", new_callable=mock.PropertyMock, return_value=" 60%") as progress:
+        assert task.wait_for_percentage(minimum_percentage=50, timeout=10, step=0.1)
+    progress.assert_called_once()
+
+
+def test_wait_for_uploading_stage(manager_server, api_client):
+    task = BackupTask(task_id=f"backup/{BACKUP_ID}", cluster_id=CLUSTER_ID, manager_node=mock.MagicMock())
+    threading.Timer(0.3, manager_server.set_progress, args=(BACKUP_ID,), kwargs={"stage": "UPLOAD"}).start()
+
+    with mock.patch.object(BackupTask, "is_task_in_uploading_stage", return_value=True) as is_uploading:
+        assert task.wait_for_uploading_stage(timeout=10, step=0.1)
+    is_uploading.assert_called_once()
+
+
+def test_wait_falls_back_to_sctool(manager_server, api_client):
+    task = ManagerTask(task_id=f"repair/{REPAIR_ID}", cluster_id=CLUSTER_ID, manager_node=mock.MagicMock())
+    manager_server.shutdown()
+    manager_server.server_close()
+
+    with mock.patch.object(ManagerTask, "is_status_in_list", side_effect=[False, True]) as is_status_in_list:
+        assert task.wait_for_status(list_status=[TaskStatus.DONE], timeout=10, step=0.1)
+    assert is_status_in_list.call_count == 2
@@ -10,11 +10,16 @@
 # See LICENSE for more details.
 #
 # Copyright (c) 2022 ScyllaDB
+import re
 from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+from sdcm.sct_events import Severity
 from sdcm.utils.data_validator import LongevityDataValidator
+from sdcm.utils.range_digest import split_token_ring
 from sdcm import sct_config
 
 
@@ -58,3 +63,122 @@ def test_view_names_for_updated_data_not_found(params):
     data_validator._validate_updated_per_view = [True, True]
     views_list = data_validator.list_of_view_names_for_update_test()
     assert views_list == []
+
+
+def fake_token(row):
+    return row[0] * 2_654_435_761 % 2**64 - 2**63
+
+
+class FakeSession:
+    """Return tables content page by page, 2 rows per page."""
+
+    TOKEN_RANGE_RE = re.compile(
+        r"FROM \S+?\.?(?P<table>\w+) WHERE token\(\w+\) > (?P<start>\S+) AND token\(\w+\) <= (?P<end>\S+)"
+    )
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+
+    def execute(self, query, parameters=None, paging_state=None, **kwargs):
+        if isinstance(query, str):  # primary key columns of the table
+            return [
+                SimpleNamespace(column_name=f"column{position}", kind=kind, position=position)
+                for position, kind in enumerate(("partition_key", "clustering", "clustering", "regular"))
+            ]
+        self.queries.append(query.query_string)
+        if match := self.TOKEN_RANGE_RE.search(query.query_string):
+            start, end = int(match.group("start")), int(match.group("end"))
+            rows = [row for row in self.tables[match.group("table")] if start < fake_token(row) <= end]
+        else:
+            rows = self.tables[query.query_string.rsplit(" ", 1)[-1]]
+        start = paging_state or 0
+        return SimpleNamespace(
+            current_rows=rows[start : start + 2], paging_state=start + 2 if start + 2 < len(rows) else None
+        )
+
+
+@pytest.fixture
+def data_validator(params):
+    data_validator = LongevityDataValidator(
+        longevity_self_object=MockLongevityTest(params=params),
+        user_profile_name="c-s_lwt",
+        base_table_partition_keys=["domain", "published_date"],
+    )
+    data_validator._keyspace_name = "cqlstress_lwt_example"
+    data_validator._validate_updated_per_view = [True, True]
+    data_validator.SORT_BUFFER_SIZE = 3
+    with patch("sdcm.utils.data_validator.DataValidatorEvent") as events:
+        yield data_validator, events
+
+
+@pytest.mark.sct_config(files="unit_tests/test_data/test_data_validator/lwt-basic-3h.yaml")
+def test_validate_range_not_expected_to_change(data_validator):
+    data_validator, events = data_validator
+    rows = [(lwt, f"domain-{lwt % 3}", lwt * 10, "author") for lwt in range(1_000_001, 1_000_011)]
+    view, expected_table = data_validator.view_name_for_not_updated_data, data_validator.expected_data_table_name
+
+    data_validator.validate_range_not_expected_to_change(session=FakeSession({view: rows[::-1], expected_table: rows}))
+    assert events.ImmutableRowsValidator.call_args.kwargs["severity"] == Severity.NORMAL
+
+    changed_rows = rows[:5] + [rows[5][:3] + ("other author",)] + rows[6:]
+    with pytest.raises(AssertionError, match="different rows: 1"):
+        data_validator.validate_range_not_expected_to_change(
+            session=FakeSession({view: changed_rows, expected_table: rows})
+        )
+
+    data_validator.validate_range_not_expected_to_change(
+        session=FakeSession({view: rows[1:], expected_table: rows}), during_nemesis=True
+    )
+    assert events.ImmutableRowsValidator.call_args.kwargs["severity"] == Severity.ERROR
+
+
+@pytest.mark.sct_config(files="unit_tests/test_data/test_data_validator/lwt-basic-3h.yaml")
+def test_validate_range_expected_to_change(data_validator, tmp_path):
+    data_validator, events = data_validator
+    keys = [(f"domain-{num}", num) for num in range(10)]
+    tables = {}
+    for before, after, expected, _ in data_validator.list_of_view_names_for_update_test():
+        tables.update({before: keys[7:], after: keys[:7][::-1], expected: keys})
+
+    data_validator.validate_range_expected_to_change(session=FakeSession(tables))
+    assert [call.kwargs["severity"] for call in events.UpdatedRowsValidator.call_args_list] == [Severity.NORMAL] * 2
+
+    events.reset_mock()
+    before, after, expected, _ = data_validator.list_of_view_names_for_update_test()[0]
+    tables[after] = keys[1:7]
+    with (
+        patch("sdcm.utils.data_validator.TestConfig") as test_config,
+        patch.object(data_validator, "analyze_updated_data_and_save_in_file") as analyze,
+    ):
+        test_config.return_value.logdir.return_value = str(tmp_path)
+        data_validator.validate_range_expected_to_change(session=FakeSession(tables))
+    comparison = analyze.call_args.kwargs["data_for_validation"].comparison
+    assert (comparison.actual_rows, comparison.expected_rows, comparison.missing) == (9, 10, [keys[0]])
+    assert len(list((tmp_path / "lwt_validator_data_for_debug").iterdir())) == 1
+
+
+@pytest.mark.sct_config(files="unit_tests/test_data/test_data_validator/lwt-basic-3h.yaml")
+def test_validate_range_not_expected_to_change_by_digests(data_validator):
+    data_validator, events = data_validator
+    data_validator.digest_mode = True
+    rows = [(lwt, f"domain-{lwt % 3}", lwt * 10, "author") for lwt in range(1_000_001, 1_000_101)]
+    view, expected_table = data_validator.view_name_for_not_updated_data, data_validator.expected_data_table_name
+
+    session = FakeSession({view: rows[::-1], expected_table: rows})
+    data_validator.validate_range_not_expected_to_change(session=session)
+    assert events.ImmutableRowsValidator.call_args.kwargs["severity"] == Severity.NORMAL
+    assert len(set(session.queries)) == 2 * 256  # digests of all token ranges of both tables, no rows compared
+    digest_queries = len(session.queries)
+
+    changed_rows = rows[:50] + [rows[50][:3] + ("other author",)] + rows[51:]
+    session = FakeSession({view: changed_rows, expected_table: rows})
+    with pytest.raises(AssertionError, match="actual rows: 100, expected rows: 100, .* different rows: 1"):
+        data_validator.validate_range_not_expected_to_change(session=session)
+    # rows of the mismatching token range only are fetched again
+    [token_range] = [
+        token_range for token_range in split_token_ring() if token_range.start < fake_token(rows[50]) <= token_range.end
+    ]
+    drilled_queries = set(session.queries[digest_queries:])
+    assert len(drilled_queries) == 2
+    assert all(f"> {token_range.start} AND " in query for query in drilled_queries)
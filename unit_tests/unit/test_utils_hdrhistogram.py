@@ -0,0 +1,281 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+from hdrh.histogram import HdrHistogram
+from hdrh.log import HistogramLogReader
+
+from sdcm.utils.hdrhistogram import (
+    PERCENTILES,
+    HdrLogLineDecoder,
+    _HdrFileCache,
+    _HdrHistogram,
+    _HdrLogParser,
+    _HdrRangeHistogramBuilder,
+    get_hdr_cache_dir,
+    make_hdrhistogram_summary_by_interval,
+    make_hdrhistogram_summary_from_log_line,
+    remove_hdr_cache_dir,
+)
+
+START_TIME = 1_700_000_000
+TAGS = ["WRITE-st", "READ-st"]
+
+
+def hdr_lines(seed, intervals, tags=("WRITE-st", "READ-st", "write-rt"), first_interval=0):
+    rnd = random.Random(seed)
+    lines = []
+    for second in range(first_interval, first_interval + intervals):
+        for tag in tags:
+            histogram = _HdrHistogram()
+            for _ in range(50):
+                histogram.record_value(rnd.randint(100_000, 50_000_000))
+            payload = histogram.encode().decode()
+            lines.append(f"Tag={tag},{second:.3f},1.000,{histogram.get_max_value() / 1e6:.3f},{payload}\n")
+    return "".join(lines)
+
+
+def write_hdr_file(path, seed, intervals=60, tags=("WRITE-st", "READ-st", "write-rt")):
+    header = (
+        "#[Histogram log format version 1.2]\n"
+        f"#[StartTime: {START_TIME:.3f} (seconds since epoch), Tue Nov 14 22:13:20 UTC 2023]\n"
+        '"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n'
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(header + hdr_lines(seed, intervals, tags))
+
+
+@pytest.fixture(autouse=True)
+def hdr_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("_SCT_TEST_LOGDIR", str(tmp_path))
+    return tmp_path / "hdr-cache"
+
+
+@pytest.fixture
+def hdr_dir(tmp_path):
+    for num in range(3):
+        write_hdr_file(tmp_path / f"loader-{num}" / f"hdrh-cs-{num}.hdr", seed=num)
+    (tmp_path / "loader-3").mkdir()
+    (tmp_path / "loader-3" / "hdrh-cs-3.hdr").touch()
+    return tmp_path
+
+
+def reference_histogram(hdr_files, tag, start_time, end_time):
+    """Sum up intervals the old way: read every file with `HistogramLogReader' for a single tag."""
+    histogram = None
+    for hdr_file in hdr_files:
+        reader = HistogramLogReader(str(hdr_file), _HdrHistogram())
+        while next_hist := reader.get_next_interval_histogram(
+            range_start_time_sec=start_time, range_end_time_sec=end_time, absolute=True
+        ):
+            if next_hist.get_tag().lower() == tag.lower():
+                if histogram is None:
+                    histogram = _HdrHistogram()
+                    histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
+                histogram.add(next_hist)
+    return histogram
+
+
+def assert_summary_matches(summary, histogram):
+    assert summary["percentile_99"] == round(histogram.get_value_at_percentile(99) / 1_000_000, 2)
+    assert summary["stddev"] == histogram.get_stddev()
+    assert summary["start_time"] == histogram.get_start_time_stamp()
+    assert summary["end_time"] == histogram.get_end_time_stamp()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_summary_from_dir(hdr_dir, max_workers):
+    [summary] = _HdrRangeHistogramBuilder(
+        hdr_tags=TAGS + ["WRITE-rt"],
+        stress_operation="mixed",
+        start_time=START_TIME + 10,
+        end_time=START_TIME + 40,
+        max_workers=max_workers,
+    ).build_histogram_summary(str(hdr_dir))
+
+    hdr_files = sorted(hdr_dir.glob("*/hdrh-*.hdr"))
+    assert set(summary) == {"WRITE--WRITE-st", "READ--READ-st", "WRITE--WRITE-rt"}
+    for tag in TAGS + ["WRITE-rt"]:
+        workload = "READ" if tag.startswith("READ") else "WRITE"
+        assert_summary_matches(
+            summary[f"{workload}--{tag}"], reference_histogram(hdr_files, tag, START_TIME + 10, START_TIME + 40)
+        )
+
+
+def test_summary_by_interval(hdr_dir):
+    hdr_file = hdr_dir / "loader-0" / "hdrh-cs-0.hdr"
+    summaries = make_hdrhistogram_summary_by_interval(
+        hdr_tags=TAGS,
+        stress_operation="mixed",
+        path=str(hdr_file),
+        start_time=START_TIME,
+        end_time=START_TIME + 100,
+        interval=25,
+    )
+
+    assert len(summaries) == 3  # the file has 60 seconds of data
+    for num, summary in enumerate(summaries):
+        start_time = START_TIME + num * 25
+        for tag in TAGS:
+            workload = "READ" if tag.startswith("READ") else "WRITE"
+            assert_summary_matches(
+                summary[f"{workload}--{tag}"], reference_histogram([hdr_file], tag, start_time, start_time + 25)
+            )
+
+
+def test_missing_tag_and_time_range(hdr_dir):
+    builder = _HdrRangeHistogramBuilder(
+        hdr_tags=["READ-rt"], stress_operation="read", start_time=START_TIME, end_time=START_TIME + 10
+    )
+    assert builder.build_histogram_summary(str(hdr_dir)) == [{}]
+    assert builder.build_histogram_summary_by_tag(str(hdr_dir / "no-such-file"), "READ-rt") is None
+
+    builder = _HdrRangeHistogramBuilder(
+        hdr_tags=TAGS, stress_operation="mixed", start_time=START_TIME + 1000, end_time=START_TIME + 2000
+    )
+    assert builder.build_histogram_summary(str(hdr_dir)) == [{}]
+
+
+def summary_by_interval(hdr_file, cache_dir, end_time=START_TIME + 100):
+    builder = _HdrRangeHistogramBuilder(
+        hdr_tags=TAGS, stress_operation="mixed", start_time=START_TIME, end_time=end_time
+    )
+    builder.cache_dir = cache_dir
+    return builder.build_histograms_summary_with_interval(str(hdr_file), interval=20)
+
+
+def test_cache_parses_appended_lines_only(tmp_path, hdr_cache_dir):
+    hdr_file = tmp_path / "hdrh-cs.hdr"
+    write_hdr_file(hdr_file, seed=1, intervals=30)
+    assert summary_by_interval(hdr_file, hdr_cache_dir) == summary_by_interval(hdr_file, None)
+
+    cache = _HdrFileCache.load(str(hdr_file), str(hdr_cache_dir))
+    assert cache.offset == hdr_file.stat().st_size
+    assert len(cache.intervals) == 90
+    assert {key[:2] for key in cache.windows} == {(START_TIME, START_TIME + 20)}  # the only closed window
+
+    appended = hdr_lines(seed=2, intervals=30, first_interval=30)
+    with hdr_file.open("a") as fobj:
+        fobj.write(appended[:-100])  # the last line is being written
+    with patch.object(_HdrLogParser, "parse_line", autospec=True, side_effect=_HdrLogParser.parse_line) as parse_line:
+        summary_by_interval(hdr_file, hdr_cache_dir)
+    assert parse_line.call_count == 89
+
+    with hdr_file.open("a") as fobj:
+        fobj.write(appended[-100:])
+    expected = summary_by_interval(hdr_file, None)
+    with patch.object(HdrHistogram, "decode", side_effect=HdrHistogram.decode) as decode:
+        assert summary_by_interval(hdr_file, hdr_cache_dir) == expected
+    # first two windows are closed and taken from the cache (2 windows x 2 tags),
+    # lines are decoded for 40..59 seconds only (20 seconds x 2 tags)
+    assert decode.call_count == 2 * 2 + 20 * 2
+    assert _HdrFileCache.load(str(hdr_file), str(hdr_cache_dir)).offset == hdr_file.stat().st_size
+
+
+def test_cache_of_replaced_file(tmp_path, hdr_cache_dir):
+    hdr_file = tmp_path / "hdrh-cs.hdr"
+    write_hdr_file(hdr_file, seed=1, intervals=50)
+    summary_by_interval(hdr_file, hdr_cache_dir)
+
+    write_hdr_file(hdr_file, seed=3, intervals=50)
+    assert summary_by_interval(hdr_file, hdr_cache_dir) == summary_by_interval(hdr_file, None)
+
+
+def test_cache_dir_of_test_run(tmp_path, hdr_cache_dir, monkeypatch):
+    hdr_file = tmp_path / "hdrh-cs.hdr"
+    write_hdr_file(hdr_file, seed=1, intervals=30)
+    assert get_hdr_cache_dir() == str(hdr_cache_dir)
+    summary_by_interval(hdr_file, get_hdr_cache_dir())
+
+    [cache_file] = hdr_cache_dir.iterdir()
+    assert json.loads(cache_file.read_text())["hdr_file"] == str(hdr_file)
+    assert hdr_cache_dir.stat().st_mode & 0o777 == 0o700
+
+    remove_hdr_cache_dir()
+    assert not hdr_cache_dir.exists()
+    monkeypatch.delenv("_SCT_TEST_LOGDIR")
+    assert get_hdr_cache_dir() is None
+
+
+def test_percentiles_and_reset():
+    histogram = _HdrHistogram()
+    assert histogram.get_percentile_to_value_dict(PERCENTILES) == {}
+    rnd = random.Random(0)
+    for _ in range(1000):
+        histogram.record_value(rnd.randint(100_000, 50_000_000))
+    assert histogram.get_percentile_to_value_dict(
+        PERCENTILES + [0, 100, 101]
+    ) == HdrHistogram.get_percentile_to_value_dict(histogram, PERCENTILES + [0, 100, 101])
+
+    histogram.reset()
+    assert (histogram.get_total_count(), histogram.get_max_value()) == (0, 0)
+    assert not any(histogram.counts)
+    histogram.record_value(1000)
+    assert histogram.get_value_at_percentile(50) == histogram.get_highest_equivalent_value(1000)
+
+
+def test_stddev_includes_highest_values():
+    histogram = _HdrHistogram()
+    for value in (1, 1000, histogram.highest_trackable_value, histogram.get_value_from_index(histogram.counts_len - 1)):
+        assert histogram.record_value(value)
+    assert histogram.get_stddev() == HdrHistogram.get_stddev(histogram)
+    assert histogram.get_mean_value() == HdrHistogram.get_mean_value(histogram)
+
+
+def expected_line_percentiles(line, tags, percentiles):
+    summary = make_hdrhistogram_summary_from_log_line(
+        hdr_tags=tags, stress_operation="mixed", log_line=line, hst_log_start_time=START_TIME
+    )
+    [values] = summary.values()
+    return [values[f"percentile_{perc}".replace(".", "_")] for perc in percentiles]
+
+
+def test_log_line_decoder():
+    percentiles = [50, 90, 99, 99.9, 99.99]
+    decoder = HdrLogLineDecoder(hdr_tags=TAGS, percentiles=percentiles)
+    lines = hdr_lines(seed=1, intervals=10).splitlines(keepends=True)
+    with patch.object(HdrHistogram, "decode", side_effect=HdrHistogram.decode) as decode:
+        decoded = [decoder.decode(line) for line in lines]
+    assert decode.call_count == 20  # lines with the "write-rt" tag are not decoded
+    assert decoded[2::3] == [None] * 10
+    for line, (tag, values) in zip(lines[0::3] + lines[1::3], decoded[0::3] + decoded[1::3]):
+        assert tag == line[4:].split(",")[0]
+        assert values == dict(zip(percentiles, expected_line_percentiles(line, TAGS, percentiles)))
+    assert decoder.decode("#[StartTime: 1700000000.000 (seconds since epoch)]\n") is None
+
+
+def test_log_line_decoder_of_empty_histogram():
+    decoder = HdrLogLineDecoder(hdr_tags=TAGS, percentiles=[50, 99])
+    empty_line = f"Tag=READ-st,0.000,1.000,0.000,{_HdrHistogram().encode().decode()}\n"
+    assert decoder.decode(empty_line) == ("READ-st", {50: None, 99: None})
+
+
+def test_log_line_decoder_matches_builder(tmp_path):
+    """Decode a cassandra-stress HDR log (2 tags) with a builder per line and with the decoder."""
+    percentiles = [50, 90, 99, 99.9, 99.99]
+    hdr_file = tmp_path / "hdrh-cs.hdr"
+    write_hdr_file(hdr_file, seed=1, intervals=100)
+    lines = [line for line in hdr_file.read_text().splitlines(keepends=True) if line.startswith("Tag=")]
+
+    expected = [
+        (line[4:].split(",")[0], dict(zip(percentiles, expected_line_percentiles(line, TAGS, percentiles))))
+        for line in lines
+        if line.startswith(tuple(f"Tag={tag}," for tag in TAGS))
+    ]
+    decoder = HdrLogLineDecoder(hdr_tags=TAGS, percentiles=percentiles)
+    decoded = [decoded for line in lines if (decoded := decoder.decode(line))]
+    assert decoded == expected
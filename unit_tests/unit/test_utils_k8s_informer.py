@@ -0,0 +1,190 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import queue
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import prometheus_client
+import pytest
+
+from sdcm.utils.k8s.informer import K8sObjectsInformer
+from sdcm.wait import wait_for
+
+
+def make_pod(name, resource_version, uid=None, namespace="scylla"):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, namespace=namespace, resource_version=str(resource_version), uid=uid)
+    )
+
+
+class FakeApiServer:
+    """Serves a list of pods and a stream of watch events, like the K8S API server does."""
+
+    def __init__(self, pods):
+        self.pods = {pod.metadata.name: pod for pod in pods}
+        self.resource_version = 1
+        self.events = queue.Queue()
+        self.list_calls = []
+        self.watch_calls = []
+
+    def list_pod_for_all_namespaces(self, watch=False, **kwargs):
+        self.list_calls.append(kwargs)
+        return SimpleNamespace(
+            items=list(self.pods.values()), metadata=SimpleNamespace(resource_version=str(self.resource_version))
+        )
+
+    def change(self, event_type, name, **kwargs):
+        self.resource_version += 1
+        pod = make_pod(name, self.resource_version, **kwargs)
+        if event_type == "DELETED":
+            self.pods.pop(name, None)
+        else:
+            self.pods[name] = pod
+        self.events.put({"type": event_type, "object": pod, "raw_object": {}})
+
+    def fail_watch(self):
+        self.events.put({"type": "ERROR", "object": None, "raw_object": {"code": 500, "message": "internal error"}})
+
+    def expire_watch(self):
+        self.events.put({"type": "ERROR", "object": None, "raw_object": {"code": 410, "message": "too old"}})
+
+    def watch(self):
+        server = self
+
+        class FakeWatch:
+            def __init__(self):
+                self._stopped = threading.Event()
+
+            def stream(self, func, **kwargs):
+                server.watch_calls.append(kwargs)
+                while not self._stopped.is_set():
+                    try:
+                        yield server.events.get(timeout=0.05)
+                    except queue.Empty:
+                        continue
+
+            def stop(self):
+                self._stopped.set()
+
+        return FakeWatch
+
+
+@pytest.fixture
+def api_server():
+    server = FakeApiServer(pods=[make_pod("pod-1", 1, uid="uid-1")])
+    with patch("sdcm.utils.k8s.informer.k8s.watch.Watch", server.watch()):
+        yield server
+
+
+@pytest.fixture
+def informer(api_server):
+    informer = K8sObjectsInformer(name="PodsInformer", list_func=api_server.list_pod_for_all_namespaces)
+    yield informer.ensure_started()
+    informer.stop(timeout=5)
+
+
+def test_reads_served_from_cache(api_server, informer):
+    for _ in range(100):
+        assert informer.get(("scylla", "pod-1")).metadata.uid == "uid-1"
+    assert informer.get(("scylla", "pod-2")) is None
+    assert len(api_server.list_calls) == 1
+    assert informer.stats.cache_reads == 101
+    assert api_server.watch_calls[0]["resource_version"] == "1"
+
+
+def test_cache_updated_by_watch_events(api_server, informer):
+    informer.wait_for_sync()
+    api_server.change("ADDED", "pod-2", uid="uid-2")
+    api_server.change("MODIFIED", "pod-1", uid="uid-3")
+
+    assert informer.wait_for(lambda pods: ("scylla", "pod-2") in pods, timeout=5)
+    assert informer.wait_for(lambda pods: pods[("scylla", "pod-1")].metadata.uid == "uid-3", timeout=5)
+    api_server.change("DELETED", "pod-2")
+    assert informer.wait_for(lambda pods: ("scylla", "pod-2") not in pods, timeout=5)
+    assert len(api_server.list_calls) == 1
+    assert informer.staleness < 5
+
+
+def test_relist_when_watch_expired(api_server, informer):
+    informer.wait_for_sync()
+    api_server.pods["pod-3"] = make_pod("pod-3", 5)
+    api_server.resource_version = 5
+    api_server.expire_watch()
+
+    assert informer.wait_for(lambda pods: ("scylla", "pod-3") in pods, timeout=5)
+    assert len(api_server.list_calls) == 2
+    assert api_server.watch_calls[-1]["resource_version"] == "5"
+
+
+def test_wait_for_timeout(informer):
+    assert not informer.wait_for(lambda pods: ("scylla", "pod-2") in pods, timeout=0.2)
+
+
+def test_fallback_when_not_synced():
+    def failing_list(**_):
+        raise ConnectionError("API server is not available")
+
+    informer = K8sObjectsInformer(name="PodsInformer", list_func=failing_list, sync_timeout=0.2)
+    try:
+        assert informer.get(("scylla", "pod-1"), fallback=lambda: "from API") == "from API"
+        assert informer.stats.api_reads == 1
+        with pytest.raises(TimeoutError):
+            informer.get(("scylla", "pod-1"))
+    finally:
+        informer.stop(timeout=5)
+
+
+def test_fallback_when_stale(informer):
+    informer.wait_for_sync()
+    assert informer.get(("scylla", "pod-1"), fallback=lambda: "from API").metadata.uid == "uid-1"
+
+    informer.max_staleness = 0
+    assert informer.get(("scylla", "pod-1"), fallback=lambda: "from API") == "from API"
+    assert informer.get(("scylla", "pod-1")).metadata.uid == "uid-1"
+    assert (informer.stats.cache_reads, informer.stats.api_reads) == (2, 1)
+
+
+def test_fallback_when_watch_failed(api_server, informer):
+    informer.wait_for_sync()
+    with patch("sdcm.utils.k8s.informer.INFORMER_RETRY_DELAY", 0.1):
+        api_server.fail_watch()
+        wait_for(lambda: not informer.fresh, step=0.01, timeout=5, text="Wait for the watch error", throw_exc=True)
+        assert informer.get(("scylla", "pod-1"), fallback=lambda: "from API") == "from API"
+
+        api_server.change("ADDED", "pod-2", uid="uid-2")
+        assert informer.wait_for(lambda pods: ("scylla", "pod-2") in pods, timeout=5)
+    assert informer.get(("scylla", "pod-2"), fallback=lambda: "from API").metadata.uid == "uid-2"
+    assert informer.stats.api_reads == 1
+
+
+def test_fallback_when_stopped(informer):
+    informer.wait_for_sync()
+    informer.stop(timeout=5)
+    assert informer.get(("scylla", "pod-1"), fallback=lambda: "from API") == "from API"
+
+
+def test_metrics(informer):
+    informer.wait_for_sync()
+    informer.get(("scylla", "pod-1"))
+
+    def sample(name, **labels):
+        return prometheus_client.REGISTRY.get_sample_value(name, {"informer": "PodsInformer", **labels})
+
+    assert sample("sct_k8s_informer_stats", stat="lists") == 1
+    assert sample("sct_k8s_informer_stats", stat="cache_reads") == 1
+    assert sample("sct_k8s_informer_staleness_seconds") < 5
+
+    informer.stop(timeout=5)
+    assert sample("sct_k8s_informer_staleness_seconds") is None
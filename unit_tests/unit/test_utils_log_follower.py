@@ -0,0 +1,123 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sdcm.loader import CassandraStressExporter, StressExporter
+from sdcm.utils.inotify import InotifyWatcher
+from sdcm.utils.log_follower import LogFollowerReactor
+
+
+def wait_for(predicate, timeout=10):
+    end_time = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < end_time, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def reactor(request):
+    if request.param == "polling":
+        with patch.object(InotifyWatcher, "create", return_value=None):
+            yield LogFollowerReactor()
+    else:
+        yield LogFollowerReactor()
+
+
+def test_follow_many_files(reactor, tmp_path):
+    lines = {num: [] for num in range(3)}
+    followed_files = [
+        reactor.follow(path=str(tmp_path / f"stress-{num}.log"), on_line=lines[num].append) for num in range(3)
+    ]
+    time.sleep(0.2)
+    for num in range(3):  # files are created after the following is started
+        (tmp_path / f"stress-{num}.log").write_text(f"line 1 of {num}\nline 2 of {num}\nline 3")
+    wait_for(lambda: all(len(file_lines) == 2 for file_lines in lines.values()))
+
+    with (tmp_path / "stress-0.log").open("a") as fobj:
+        fobj.write(" of 0\npartial")
+    wait_for(lambda: len(lines[0]) == 3)
+    assert lines[0] == ["line 1 of 0\n", "line 2 of 0\n", "line 3 of 0\n"]
+
+    for followed_file in followed_files:
+        reactor.unfollow(followed_file)
+    for followed_file in followed_files:
+        assert followed_file.future.result(timeout=10) is None
+    assert [len(file_lines) for file_lines in lines.values()] == [3, 2, 2]  # partial lines are not dispatched
+
+
+def test_unfollow_dispatches_rest_of_lines(reactor, tmp_path):
+    log_file = tmp_path / "stress.log"
+    lines = []
+    followed_file = reactor.follow(path=str(log_file), on_line=lines.append)
+    log_file.write_text("".join(f"line {num}\n" for num in range(10_000)))
+    reactor.unfollow(followed_file)
+    followed_file.future.result(timeout=10)
+    assert lines == [f"line {num}\n" for num in range(10_000)]
+
+
+def test_callback_failure(reactor, tmp_path):
+    log_file = tmp_path / "stress.log"
+    log_file.write_text("good\nbad\ngood\n")
+    lines = []
+
+    def on_line(line):
+        if line == "bad\n":
+            raise ValueError("bad line")
+        lines.append(line)
+
+    followed_file = reactor.follow(path=str(log_file), on_line=on_line)
+    with pytest.raises(ValueError, match="bad line"):
+        followed_file.future.result(timeout=10)
+    assert lines == ["good\n"]
+
+
+def test_cassandra_stress_exporter(tmp_path):
+    log_file = tmp_path / "cassandra-stress.log"
+    metrics = MagicMock()
+    with patch.dict(StressExporter.METRICS_GAUGES, clear=True):
+        exporter = CassandraStressExporter(
+            instance_name="loader-1",
+            metrics=metrics,
+            stress_operation="write",
+            stress_log_filename=str(log_file),
+            loader_idx=0,
+        )
+        with exporter:
+            log_file.write_text(
+                "Keyspace: keyspace1\n"
+                "type       total ops,    op/s,    pk/s,   row/s,    mean,     med,     .95,     .99,    .999,"
+                "     max,   time,   stderr, errors,  gc: #,  max ms,  sum ms,  sdv ms,      mb\n"
+                "total,        116000,   23187,   23187,   23187,     1.7,     1.3,     4.0,     7.2,    12.4,"
+                "    22.3,    5.0,  0.00000,      3,      0,       0,       0,       0,       0\n"
+            )
+            gauge = metrics.create_gauge.return_value
+            wait_for(lambda: gauge.labels.return_value.set.call_count == 8)
+
+    assert exporter.keyspace == "keyspace1"
+    assert exporter.future.done()
+    assert {call.args[4] for call in gauge.labels.call_args_list} == {
+        "lat_mean",
+        "lat_med",
+        "lat_perc_95",
+        "lat_perc_99",
+        "lat_perc_999",
+        "lat_max",
+        "ops",
+        "errors",
+    }
+    assert gauge.labels.return_value.set.call_args_list[-2].args == (23187.0,)
+    assert gauge.labels.return_value.set.call_args_list[-1].args == (3,)
@@ -0,0 +1,100 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sdcm.utils.log_time_index import LogTimeIndex, parse_line_time
+
+START_TIME = datetime(2026, 1, 1, 10, 0, 0)
+
+
+def log_line(seconds: int, text: str = "some message") -> str:
+    return f"{(START_TIME + timedelta(seconds=seconds)).isoformat()}+00:00 db-node-1 !INFO | scylla[1]: {text}\n"
+
+
+def write_log(log_path, lines):
+    with open(log_path, "a", encoding="utf-8") as log_file:
+        log_file.writelines(lines)
+
+
+def test_parse_line_time():
+    assert parse_line_time(log_line(5)) == START_TIME + timedelta(seconds=5)
+    assert parse_line_time(b"2026-01-01T10:00:05.123+00:00 db-node-1") == START_TIME + timedelta(seconds=5)
+    assert parse_line_time("  0x1234 backtrace line") is None
+
+
+def test_offset_of(tmp_path):
+    log_path = tmp_path / "system.log"
+    lines = [log_line(second // 3, text=f"line {second}") for second in range(3000)]
+    write_log(log_path, lines)
+    index = LogTimeIndex(str(log_path), step=4096)
+
+    assert index.offset_of(START_TIME - timedelta(hours=1)) == 0
+    offset = index.offset_of(START_TIME + timedelta(seconds=500))
+    assert offset == sum(len(line) for line in lines[:1500])
+    assert len(index) > 10
+    assert index.offset_of(START_TIME + timedelta(hours=1)) == log_path.stat().st_size
+
+
+def test_offset_of_reads_one_step(tmp_path):
+    log_path = tmp_path / "system.log"
+    write_log(log_path, [log_line(second) for second in range(3000)])
+    index = LogTimeIndex(str(log_path), step=4096)
+    index.update()
+
+    with patch("sdcm.utils.log_time_index.parse_line_time", wraps=parse_line_time) as parse:
+        index.offset_of(START_TIME + timedelta(seconds=2000))
+    assert parse.call_count < 4096 // len(log_line(0)) + 2
+
+
+def test_index_updated_incrementally(tmp_path):
+    log_path = tmp_path / "system.log"
+    write_log(log_path, [log_line(second) for second in range(100)])
+    index = LogTimeIndex(str(log_path), step=1024)
+    index.update()
+    entries = len(index)
+
+    write_log(log_path, [log_line(second) for second in range(100, 200)])
+    with patch("sdcm.utils.log_time_index.parse_line_time", wraps=parse_line_time) as parse:
+        index.update()
+    assert parse.call_count == 100
+    assert len(index) > entries
+    assert list(index.read_lines(START_TIME + timedelta(seconds=150), START_TIME + timedelta(seconds=152))) == [
+        log_line(150),
+        log_line(151),
+        log_line(152),
+    ]
+
+
+def test_time_shift_backwards(tmp_path):
+    log_path = tmp_path / "system.log"
+    lines = [log_line(second) for second in range(100)] + [log_line(second) for second in range(50, 150)]
+    write_log(log_path, lines)
+    index = LogTimeIndex(str(log_path), step=512)
+
+    # the first line logged at that time, not the one after the clock shift
+    assert index.offset_of(START_TIME + timedelta(seconds=60)) == sum(len(line) for line in lines[:60])
+
+
+def test_lines_without_time_belong_to_preceding_line(tmp_path):
+    log_path = tmp_path / "system.log"
+    write_log(log_path, [log_line(0), log_line(1, "Backtrace:"), "  0x1234\n", "  0x5678\n", log_line(2)])
+    index = LogTimeIndex.for_log(str(log_path))
+    assert LogTimeIndex.for_log(str(log_path)) is index
+
+    assert list(index.read_lines(START_TIME + timedelta(seconds=1), START_TIME + timedelta(seconds=1))) == [
+        log_line(1, "Backtrace:"),
+        "  0x1234\n",
+        "  0x5678\n",
+    ]
@@ -0,0 +1,113 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import re
+
+import pytest
+
+from sdcm.sct_events.database import (
+    SYSTEM_ERROR_EVENTS_PATTERNS,
+    CompactionEvent,
+    RepairEvent,
+    get_pattern_to_event_to_func_mapping,
+)
+from sdcm.utils.pattern_matcher import MultiPatternMatcher, compile_pattern
+
+
+def sequential_search(patterns, line):
+    for index, pattern in enumerate(patterns):
+        if match := pattern.search(line):
+            return index, match
+    return -1, None
+
+
+@pytest.mark.parametrize("log_file", ["system.log", "system_core.log", "system_interlace_stall.log"])
+def test_system_event_patterns_same_as_sequential(test_data_dir, log_file):
+    patterns = [pattern for pattern, _ in SYSTEM_ERROR_EVENTS_PATTERNS]
+    matcher = MultiPatternMatcher(patterns)
+
+    matched = 0
+    for line in (test_data_dir / log_file).read_text(encoding="utf-8").splitlines():
+        expected_index, expected_match = sequential_search(patterns, line)
+        index, match = matcher.search(line)
+        assert index == expected_index, line
+        if expected_match:
+            matched += 1
+            assert match.span() == expected_match.span()
+    assert matched
+
+
+def test_continuous_event_patterns():
+    patterns = [item.pattern for item in get_pattern_to_event_to_func_mapping(node="node1")]
+    matcher = MultiPatternMatcher(patterns)
+
+    for line in (
+        "2021-01-01T00:00:00+00:00 node1 !INFO | systemd[1]: Starting Scylla Server...",
+        "2021-01-01T00:00:00+00:00 node1 !INFO | systemd[1]: Failed to start Scylla Server.",
+        "2021-01-01T00:00:00+00:00 node1 !INFO | scylla: [shard 0] storage_service - Bootstrap succeeded",
+    ):
+        assert matcher.search(line)[0] == sequential_search(patterns, line)[0] != -1
+
+
+def test_named_groups_of_original_pattern():
+    matcher = MultiPatternMatcher([re.compile(RepairEvent.begin_pattern), re.compile(CompactionEvent.end_pattern)])
+    line = (
+        "2021-01-01T00:00:00+00:00 node1 !INFO | scylla: [shard 3] compaction - "
+        "[Compact keyspace1.standard1 6f4e5a40-4c4b-11eb-b9a4-000000000003] Compacted 2 sstables"
+    )
+    index, match = matcher.search(line)
+    assert index == 1
+    assert match.groupdict() == {
+        "shard": "3",
+        "table": "keyspace1.standard1",
+        "compaction_process_id": "6f4e5a40-4c4b-11eb-b9a4-000000000003",
+    }
+
+
+def test_priority_of_earlier_pattern_matching_later_in_line():
+    matcher = MultiPatternMatcher([re.compile("world"), re.compile("hello")])
+    assert matcher.search("hello world")[0] == 0
+    assert matcher.search("hello")[0] == 1
+    assert matcher.search("nothing") == (-1, None)
+
+
+@pytest.mark.parametrize(
+    "regex,flags,literals",
+    [
+        pytest.param("Reactor stalled", re.IGNORECASE, ("reactor stalled",), id="literal"),
+        pytest.param(
+            "(^ERROR|!ERR).*rpc - client .*(connection dropped|fail to connect)",
+            0,
+            ("connection dropped", "fail to connect"),
+            id="branch",
+        ),
+        pytest.param("^(?!.*audit:).*backtrace", 0, ("backtrace",), id="negative_lookahead"),
+        pytest.param("(?i:error) [0-9]+", 0, None, id="scoped_flags"),
+        pytest.param("a.b", 0, None, id="too_short"),
+    ],
+)
+def test_required_literals(regex, flags, literals):
+    assert compile_pattern(re.compile(regex, flags)).literals == literals
+
+
+@pytest.mark.parametrize(
+    "line,index",
+    [
+        pytest.param("ERROR: failed", 0, id="ascii"),
+        pytest.param("\u0130 \u212aernel failed", 1, id="non_ascii"),
+        pytest.param("nothing here", -1, id="no_match"),
+    ],
+)
+def test_ignorecase_patterns(line, index):
+    patterns = [re.compile("error", re.IGNORECASE), re.compile("kernel", re.IGNORECASE)]
+    assert MultiPatternMatcher(patterns).search(line)[0] == index == sequential_search(patterns, line)[0]
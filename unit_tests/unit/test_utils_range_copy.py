@@ -0,0 +1,103 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sdcm.utils.range_copy import RangeCopyResult, TableRangeCopier
+from sdcm.utils.range_digest import split_token_ring
+
+
+def fake_execute_concurrent_with_args(session, statement, parameters, concurrency, **kwargs):
+    for row in parameters:
+        if row in session.failing_rows:
+            yield False, RuntimeError(f"failed to insert {row}")
+        else:
+            session.inserted.append(row)
+            yield True, None
+
+
+def make_copier(rows_by_range, dest_partition_key=("pk",), **kwargs):
+    session = MagicMock(failing_rows=set(), inserted=[])
+    session.execute.return_value.column_names = ["pk", "ck", "v"]
+    token_ranges = split_token_ring(ranges_number=len(rows_by_range))
+    with patch(
+        "sdcm.utils.range_copy.get_partition_key_columns",
+        side_effect=lambda session, keyspace, table: ["pk"] if table == "src" else list(dest_partition_key),
+    ):
+        copier = TableRangeCopier(
+            session=session,
+            src_keyspace="ks",
+            src_table="src",
+            dest_keyspace="ks",
+            dest_table="dest",
+            ranges_number=len(rows_by_range),
+            fetch_size=2,
+            queue_size=1,
+            **kwargs,
+        )
+    copier.range_rows = lambda token_range: iter(rows_by_range[token_ranges.index(token_range)])
+    return copier, session, token_ranges
+
+
+@pytest.fixture(autouse=True)
+def execute_concurrent():
+    with patch(
+        "sdcm.utils.range_copy.execute_concurrent_with_args", side_effect=fake_execute_concurrent_with_args
+    ) as execute_concurrent:
+        yield execute_concurrent
+
+
+def test_copy_by_token_ranges(execute_concurrent):
+    rows_by_range = [[(1, 1, "a"), (1, 2, "b"), (1, 3, "c")], [], [(2, 1, "d")]]
+    copier, session, token_ranges = make_copier(rows_by_range, insert_concurrency=7)
+
+    results = copier.copy()
+
+    session.prepare.assert_called_once_with("INSERT INTO ks.dest (pk, ck, v) VALUES (?, ?, ?)")
+    assert results == {
+        token_ranges[0]: RangeCopyResult(scanned=3, inserted=3),
+        token_ranges[1]: RangeCopyResult(scanned=0, inserted=0),
+        token_ranges[2]: RangeCopyResult(scanned=1, inserted=1),
+    }
+    assert sorted(session.inserted) == sorted(row for rows in rows_by_range for row in rows)
+    assert max(len(call.args[2]) for call in execute_concurrent.call_args_list) == 2  # inserted page by page
+    assert execute_concurrent.call_args.kwargs["concurrency"] == 7
+    assert (copier.scanned_rows, copier.inserted_rows) == (4, 4)
+
+
+def test_verify_failed_inserts():
+    copier, session, token_ranges = make_copier([[(1, 1, "a")], [(2, 1, "b"), (2, 2, "c")]], dest_partition_key=())
+    session.failing_rows = {(2, 2, "c")}
+    copier.copy()
+
+    assert copier.verify() == [token_ranges[1]]
+    assert not any("count(*)" in str(call) for call in session.execute.call_args_list)
+
+
+def test_verify_counts_rows_of_ranges_in_destination():
+    copier, session, token_ranges = make_copier([[(1, 1, "a")], [(2, 1, "b"), (2, 2, "c")]])
+    copier.copy()
+    session.execute.return_value.one.return_value = (1,)
+
+    assert copier.verify() == [token_ranges[1]]
+    assert "SELECT count(*) FROM ks.dest WHERE token(pk) >" in str(session.execute.call_args_list[-1])
+
+
+def test_scan_failure_stops_copy():
+    copier, _, _ = make_copier([[(1, 1, "a")], [(2, 1, "b")]])
+    copier.range_rows = MagicMock(side_effect=RuntimeError("scan failed"))
+
+    with pytest.raises(RuntimeError, match="scan failed"):
+        copier.copy()
@@ -0,0 +1,54 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+from unittest.mock import patch
+
+from sdcm.utils.range_digest import (
+    MURMUR3_MAX_TOKEN,
+    MURMUR3_MIN_TOKEN,
+    RangeDigest,
+    TableRangeDigests,
+    diff_range_digests,
+    split_token_ring,
+)
+
+
+def test_split_token_ring():
+    token_ranges = split_token_ring(ranges_number=7)
+    assert len(token_ranges) == 7
+    assert token_ranges[0].start == MURMUR3_MIN_TOKEN
+    assert token_ranges[-1].end == MURMUR3_MAX_TOKEN
+    assert all(prev.end == cur.start for prev, cur in zip(token_ranges, token_ranges[1:]))
+
+
+def digests_of(rows_by_range):
+    with patch("sdcm.utils.range_digest.get_partition_key_columns", return_value=["pk"]):
+        table = TableRangeDigests(session=None, keyspace="ks", table="t", ranges_number=len(rows_by_range))
+    with patch.object(table, "range_rows", side_effect=lambda token_range: iter(rows_by_range[token_range.start])):
+        return table.compute()
+
+
+def test_range_digests():
+    starts = [token_range.start for token_range in split_token_ring(ranges_number=3)]
+    rows = {starts[0]: [(1, "a"), (2, "b")], starts[1]: [], starts[2]: [(3, "c"), (4, "d"), (5, "e")]}
+
+    digests = digests_of(rows)
+    assert [digest.rows for digest in digests.values()] == [2, 0, 3]
+    assert digests[split_token_ring(ranges_number=3)[1]] == RangeDigest(rows=0, digest=0)
+
+    reordered = digests_of({start: rows[start][::-1] for start in starts})
+    assert diff_range_digests(actual=reordered, expected=digests) == []
+
+    changed = digests_of({**rows, starts[2]: [(3, "c"), (4, "x"), (5, "e")]})
+    assert diff_range_digests(actual=changed, expected=digests) == [split_token_ring(ranges_number=3)[2]]
+    assert diff_range_digests(actual=changed, expected={}) == split_token_ring(ranges_number=3)
@@ -0,0 +1,122 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import json
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sdcm.utils.remote_logger import (
+    JOURNAL_CURSOR_PERIOD,
+    JOURNAL_REFORMAT_PROGRAM,
+    JournalPosition,
+    JournalStreamWatcher,
+    SSHScyllaSystemdLogger,
+)
+
+
+def journal_entries(count):
+    return [
+        {
+            "__CURSOR": f"s=abc;i={index:x}",
+            "__REALTIME_TIMESTAMP": str(1_700_000_000_000_000 + index * 1000),
+            "_HOSTNAME": "db-node-1",
+            "PRIORITY": "6",
+            "SYSLOG_IDENTIFIER": "scylla",
+            "_PID": "123",
+            "MESSAGE": f"message {index}" + ("\nsecond line" if index == 42 else ""),
+        }
+        for index in range(count)
+    ]
+
+
+def run_reformat_program(entries, skip, compress):
+    return subprocess.run(
+        [sys.executable, "-c", JOURNAL_REFORMAT_PROGRAM, str(skip), str(int(compress))],
+        input="".join(json.dumps(entry) + "\n" for entry in entries),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["plain", "compressed"])
+def test_journal_stream_resumes_after_cursor(tmp_path, compress):
+    log_file = tmp_path / "system.log"
+    position_file = str(tmp_path / "system.log.journal_position")
+    entries = journal_entries(250)
+
+    # the stream breaks after 130 entries
+    output = run_reformat_program(entries[:130], skip=0, compress=compress)
+    position = JournalPosition(position_file)
+    watcher = JournalStreamWatcher(log_file=str(log_file), position=position)
+    for line in output.splitlines(keepends=True):
+        watcher.submit_line(line)
+    watcher.submit_line("journalctl: some warning in stderr\n")
+    watcher.close()
+    cursor_index = int(position.cursor.split("=")[-1], 16)
+    assert 42 <= cursor_index < 130  # there is a cursor after the multiline message at least
+    assert position.lines == 129 - cursor_index
+    assert JournalPosition(position_file).cursor == position.cursor
+
+    # resume after the cursor, skipping the entries which were received already
+    output = run_reformat_program(entries[cursor_index + 1 :], skip=position.lines, compress=compress)
+    watcher = JournalStreamWatcher(log_file=str(log_file), position=position)
+    watcher.submit(output[:1000])
+    watcher.submit(output)  # a stream accumulated by the runner
+    watcher.close()
+
+    lines = log_file.read_text().splitlines()
+    lines.remove("journalctl: some warning in stderr")
+    lines.remove("second line")
+    assert [line.split(": ", 1)[1] for line in lines] == [f"message {index}" for index in range(250)]
+    assert lines[0].endswith(" db-node-1 !INFO | scylla[123]: message 0")
+    cursor_index = int(position.cursor.split("=")[-1], 16)
+    assert position.lines == 249 - cursor_index
+    assert position.lines < JOURNAL_CURSOR_PERIOD
+
+
+def test_logger_cmd_after_cursor(tmp_path):
+    node = MagicMock()
+    node.journalctl = "sudo journalctl"
+    logger = SSHScyllaSystemdLogger(node=node, target_log_file=str(tmp_path / "system.log"))
+    assert "--after-cursor" not in logger._logger_cmd
+    assert logger._logger_cmd.endswith(" 0 1")
+
+    logger.position.set_cursor("s=abc;i=1f")
+    logger.position.lines = 5
+    cmd = logger._logger_cmd
+    assert (
+        "sudo journalctl -f --no-tail --no-pager --utc --after-cursor='s=abc;i=1f' -u scylla-ami-setup.service" in cmd
+    )
+    assert cmd.endswith(" 5 1")
+
+
+def test_failed_read_after_cursor_is_resumed_since_cursor_time(tmp_path):
+    node = MagicMock()
+    node.journalctl = "sudo journalctl"
+    node.remoter.run.return_value = MagicMock(failed=True)  # e.g., `journalctl --after-cursor' of a vacuumed journal
+    logger = SSHScyllaSystemdLogger(node=node, target_log_file=str(tmp_path / "system.log"))
+    logger.position.set_cursor("s=abc;i=1f")
+    since = logger.position.since
+
+    with patch.object(logger._termination_event, "wait") as wait:
+        logger._retrieve_after_cursor()
+    wait.assert_called_once_with(logger.READINESS_CHECK_DELAY)
+    position = JournalPosition(logger.position.position_file)
+    assert (position.cursor, position.lines, position.since) == (None, 0, since)
+    cmd = logger._logger_cmd
+    assert f'sudo journalctl -f --no-tail --no-pager --utc --since "{since}" -u scylla-ami-setup.service' in cmd
+    assert "set -o pipefail\n" in cmd
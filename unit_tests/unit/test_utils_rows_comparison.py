@@ -0,0 +1,55 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import operator
+import random
+from unittest.mock import patch
+
+import pytest
+
+from sdcm.utils.rows_comparison import RowsMismatch, compare_sorted_rows, sort_rows
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 1000])
+def test_sort_rows(buffer_size, tmp_path):
+    rows = [(random.randint(0, 100), f"value-{num}") for num in range(500)]
+    with patch("sdcm.utils.rows_comparison.SPILL_CHUNK_SIZE", 3):
+        assert list(sort_rows(rows, buffer_size=buffer_size, tmp_dir=tmp_path)) == sorted(rows)
+        assert list(sort_rows(rows, key=operator.itemgetter(1), buffer_size=buffer_size, tmp_dir=tmp_path)) == sorted(
+            rows, key=operator.itemgetter(1)
+        )
+    assert not list(tmp_path.iterdir())
+
+
+def test_compare_equal_rows():
+    rows = [(num, num * 2) for num in range(100)]
+    result = compare_sorted_rows(actual=iter(rows), expected=iter(rows))
+    assert result.is_equal
+    assert (result.actual_rows, result.expected_rows, result.mismatches) == (100, 100, [])
+
+
+def test_compare_rows_by_key():
+    actual = [(0, "a"), (1, "b"), (1, "b"), (3, "x"), (4, "d"), (6, "f")]
+    expected = [(0, "a"), (1, "b"), (2, "c"), (3, "c"), (4, "d"), (5, "e")]
+
+    result = compare_sorted_rows(actual=actual, expected=expected, key=operator.itemgetter(0), max_mismatches=3)
+
+    assert not result.is_equal
+    assert (result.actual_rows, result.expected_rows) == (6, 6)
+    assert (result.missing_rows, result.unexpected_rows, result.different_rows) == (2, 2, 1)
+    assert result.mismatches == [
+        RowsMismatch(key=1, actual=(1, "b"), expected=None),
+        RowsMismatch(key=2, actual=None, expected=(2, "c")),
+        RowsMismatch(key=3, actual=(3, "x"), expected=(3, "c")),
+    ]
+    assert result.missing == [(2, "c")]
@@ -0,0 +1,135 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import os
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from sdcm.logcollector import BaseLogEntity, LogCollector
+from sdcm.utils.common import S3Storage
+from sdcm.utils.streaming_archive import StreamingArchiveUpload
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with (
+        mock_aws(),
+        patch("sdcm.utils.common.KeyStore") as keystore,
+        patch.object(S3Storage, "multipart_chunksize", 5 * 1024 * 1024),  # the min part size of S3
+    ):
+        keystore.return_value.get_acl_grantees.return_value = {}
+        bucket = boto3.resource("s3").Bucket(S3Storage.bucket_name)
+        bucket.create()
+        yield bucket
+
+
+def list_archive(archive_path):
+    return subprocess.run(
+        ["tar", "--zstd", "-tf", str(archive_path)], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_archive_uploaded_while_written(s3_bucket, tmp_path):
+    for node in ("node-1", "node-2"):
+        (tmp_path / node).mkdir()
+        (tmp_path / node / "system.log").write_bytes(os.urandom(6 * 1024 * 1024))  # incompressible
+        (tmp_path / node / "dmesg.log").write_text("dmesg\n" * 1000)
+
+    archive = StreamingArchiveUpload(archive_name="db-cluster.tar.zst", dest_dir="test-id/run").start()
+    archive.add(str(tmp_path / "node-1"), arcname="db-cluster/node-1")
+    archive.add(str(tmp_path / "node-2"), arcname="db-cluster/node-2")
+    link = archive.finish()
+
+    assert link == f"https://{S3Storage.bucket_name}.s3.amazonaws.com/test-id/run/db-cluster.tar.zst"
+    s3_object = s3_bucket.Object("test-id/run/db-cluster.tar.zst")
+    assert s3_object.e_tag.strip('"').endswith("-3")  # uploaded in 3 parts
+    s3_object.download_file(str(tmp_path / "db-cluster.tar.zst"))
+    assert sorted(list_archive(tmp_path / "db-cluster.tar.zst")) == [
+        "db-cluster/node-1/",
+        "db-cluster/node-1/dmesg.log",
+        "db-cluster/node-1/system.log",
+        "db-cluster/node-2/",
+        "db-cluster/node-2/dmesg.log",
+        "db-cluster/node-2/system.log",
+    ]
+
+
+def test_broken_archive_not_uploaded(s3_bucket, tmp_path):
+    (tmp_path / "system.log").write_bytes(os.urandom(6 * 1024 * 1024))
+    archive = StreamingArchiveUpload(archive_name="db-cluster.tar.zst", dest_dir="test-id/run").start()
+    archive.add(str(tmp_path / "system.log"), arcname="db-cluster/system.log")
+    archive.add(str(tmp_path / "no-such-dir"), arcname="db-cluster/no-such-dir")
+
+    assert archive.finish() is None
+    assert not list(s3_bucket.objects.all())
+    assert not list(s3_bucket.multipart_uploads.all())
+
+
+def test_aborted_archive_not_uploaded(s3_bucket):
+    archive = StreamingArchiveUpload(archive_name="db-cluster.tar.zst", dest_dir="test-id/run").start()
+    archive.abort()
+    assert not list(s3_bucket.objects.all())
+
+
+class FakeLog(BaseLogEntity):
+    def collect(self, node, local_dst, remote_dst=None, local_search_path=None):
+        os.makedirs(local_dst, exist_ok=True)
+        with open(os.path.join(local_dst, self.name), "w", encoding="utf-8") as log_file:
+            log_file.write(f"{self.name} of {node.name}\n")
+
+
+class FakeLogCollector(LogCollector):
+    log_entities = [FakeLog(name="system.log"), FakeLog(name="schema.log", collect_from_parent=True)]
+    cluster_log_type = "db-cluster"
+
+
+def test_log_collector_streams_logs_of_nodes(s3_bucket, tmp_path):
+    nodes = [SimpleNamespace(name=f"node-{num}") for num in range(1, 4)]
+    collector = FakeLogCollector(nodes=nodes, test_id="01234567-test-id", storage_dir=str(tmp_path), params={})
+    with patch.object(collector, "create_remote_storage_dir", return_value="/tmp"):
+        links = collector.collect_logs()
+
+    archive_key = f"01234567-test-id/{collector.current_run}/db-cluster-01234567.tar.zst"
+    assert links == [f"https://{S3Storage.bucket_name}.s3.amazonaws.com/{archive_key}"]
+    assert not os.path.exists(collector.local_dir)
+    s3_bucket.Object(archive_key).download_file(str(tmp_path / "db-cluster.tar.zst"))
+    assert sorted(list_archive(tmp_path / "db-cluster.tar.zst")) == [
+        "db-cluster-01234567/node-1/",
+        "db-cluster-01234567/node-1/system.log",
+        "db-cluster-01234567/node-2/",
+        "db-cluster-01234567/node-2/system.log",
+        "db-cluster-01234567/node-3/",
+        "db-cluster-01234567/node-3/system.log",
+        "db-cluster-01234567/schema.log",
+    ]
+
+
+def test_log_collector_falls_back_to_archive_file(s3_bucket, tmp_path):
+    nodes = [SimpleNamespace(name="node-1")]
+    collector = FakeLogCollector(nodes=nodes, test_id="01234567-test-id", storage_dir=str(tmp_path), params={})
+    with (
+        patch.object(collector, "create_remote_storage_dir", return_value="/tmp"),
+        patch("sdcm.utils.streaming_archive.StreamingArchiveUpload.finish", return_value=None),
+        patch("sdcm.logcollector.upload_archive_to_s3", return_value="link") as upload_archive_to_s3,
+        patch.object(collector, "archive_to_tarfile", return_value=str(tmp_path / "archive.tar.zst")),
+    ):
+        assert collector.collect_logs() == ["link"]
+    upload_archive_to_s3.assert_called_once()
@@ -0,0 +1,84 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+import re
+import threading
+import time
+from unittest.mock import patch
+
+from sdcm.utils.system_log_hub import SystemLogHub
+
+
+def append_lines(log_path, *lines):
+    with open(log_path, "a", encoding="utf-8") as log_file:
+        log_file.writelines(f"{line}\n" for line in lines)
+
+
+def test_subscriptions_share_reads(tmp_path):
+    log_path = tmp_path / "system.log"
+    append_lines(log_path, "old error")
+    hub = SystemLogHub.for_log(str(log_path))
+    assert SystemLogHub.for_log(str(log_path)) is hub
+
+    errors = hub.subscribe(patterns=[re.compile("error")])
+    warnings = hub.subscribe(patterns=[re.compile("warning")])
+    all_errors = hub.subscribe(patterns=[re.compile("error")], start_from_beginning=True)
+    append_lines(log_path, "new error", "a warning", "another error")
+
+    with patch.object(hub, "_read_lines", wraps=hub._read_lines) as read_lines:
+        assert list(errors) == ["new error\n", "another error\n"]
+        assert list(warnings) == ["a warning\n"]
+        assert list(all_errors) == ["old error\n", "new error\n", "another error\n"]
+    read_lines.assert_called_once()
+
+    append_lines(log_path, "last error")
+    assert list(errors) == ["last error\n"]
+    assert list(warnings) == []
+
+
+def test_partial_line_delivered_when_completed(tmp_path):
+    log_path = tmp_path / "system.log"
+    log_path.touch()
+    subscription = SystemLogHub.for_log(str(log_path)).subscribe(patterns=[re.compile("done")])
+    with open(log_path, "a", encoding="utf-8") as log_file:
+        log_file.write("repair do")
+    assert list(subscription) == []
+    append_lines(log_path, "ne")
+    assert list(subscription) == ["repair done\n"]
+
+
+def test_log_truncated(tmp_path):
+    log_path = tmp_path / "system.log"
+    append_lines(log_path, "x" * 100)
+    subscription = SystemLogHub.for_log(str(log_path)).subscribe(patterns=[re.compile("error")])
+    log_path.write_text("error\n", encoding="utf-8")
+    assert list(subscription) == ["error\n"]
+
+
+def test_wait_wakes_on_match(tmp_path):
+    log_path = tmp_path / "system.log"
+    subscription = SystemLogHub.for_log(str(log_path)).subscribe(patterns=[re.compile("started")])
+    writer = threading.Timer(0.2, append_lines, args=(log_path, "something else", "node started"))
+    writer.start()
+
+    start_time = time.monotonic()
+    assert subscription.wait(timeout=10) == "node started\n"
+    assert time.monotonic() - start_time < 5
+    writer.join()
+
+
+def test_wait_timeout(tmp_path):
+    log_path = tmp_path / "system.log"
+    log_path.touch()
+    subscription = SystemLogHub.for_log(str(log_path)).subscribe(patterns=[re.compile("started")])
+    assert subscription.wait(timeout=0.3) is None
@@ -613,7 +613,7 @@ class UpgradeTest(FillDatabaseData, loader_utils.LoaderUtilsMixin):
         self.actions_log.info("Populating DB with tables and data")
         self.fill_db_data()
         self.actions_log.info("Running queries to verify data before upgrade")
-        self.verify_db_data()
+        self.verify_db_data(digest_mode=self.params.get("data_validation_digest_mode"))
 
         self.actions_log.info("Starting cassandra-stress write workload for 10M partitions")
         # YAML: stress_cmd: cassandra-stress write cl=QUORUM n=10000000
@@ -646,7 +646,7 @@ class UpgradeTest(FillDatabaseData, loader_utils.LoaderUtilsMixin):
             time.sleep(300)
 
         self.actions_log.info("Running queries to verify data after upgrade")
-        self.verify_db_data()
+        self.verify_db_data(digest_mode=self.params.get("data_validation_digest_mode"))
         for stress_queue in stress_queues:
             self.verify_stress_thread(stress_queue)
 
@@ -655,7 +655,7 @@ class UpgradeTest(FillDatabaseData, loader_utils.LoaderUtilsMixin):
             self.actions_log.info("Populating DB with tables and data")
             self.fill_db_data()
         self.actions_log.info(f"Running queries to verify data (stage: {note})")
-        self.verify_db_data()
+        self.verify_db_data(digest_mode=self.params.get("data_validation_digest_mode"))
         if rewrite_data:
             self.actions_log.info("Re-populating DB with tables and data")
             self.fill_db_data()
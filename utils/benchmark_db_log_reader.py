@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""
+Measure how fast DbLogReader patterns are matched against a recorded Scylla log.
+
+Compares the sequential per-pattern search (one `pattern.search()' per pattern per line) with
+`MultiPatternMatcher' (literal prefilter + regex stage), and verifies both of them find the same events.
+e.g.
+./utils/benchmark_db_log_reader.py -i ~/sct-results/latest/db-cluster-*/node-1/system.log
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+from itertools import islice
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS, get_pattern_to_event_to_func_mapping  # noqa: E402
+from sdcm.utils.pattern_matcher import MultiPatternMatcher  # noqa: E402
+
+
+def sequential_search(patterns, line):
+    for index, pattern in enumerate(patterns):
+        if match := pattern.search(line):
+            return index, match
+    return -1, None
+
+
+def run_pass(log_file, max_lines, search_funcs):
+    stats = Counter()
+    lines = 0
+    start = time.perf_counter()
+    with open(log_file, encoding="utf-8", errors="replace") as db_file:
+        for line in islice(db_file, max_lines):
+            lines += 1
+            for name, search in search_funcs:
+                index, _ = search(line)
+                if index != -1:
+                    stats[(name, index)] += 1
+    return lines, time.perf_counter() - start, stats
+
+
+@click.command(help="Benchmark DbLogReader pattern matching over a recorded Scylla log")
+@click.option("-i", "--input-file", default="system.log", type=click.Path(exists=True))
+@click.option("-n", "--max-lines", default=None, type=int, help="Stop after this number of lines")
+def benchmark(input_file, max_lines):
+    system_patterns = [pattern for pattern, _ in SYSTEM_ERROR_EVENTS_PATTERNS]
+    continuous_patterns = [item.pattern for item in get_pattern_to_event_to_func_mapping(node="benchmark")]
+    system_matcher = MultiPatternMatcher(system_patterns)
+    continuous_matcher = MultiPatternMatcher(continuous_patterns)
+
+    results = {}
+    for name, search_funcs in (
+        (
+            "sequential",
+            [
+                ("continuous", lambda line: sequential_search(continuous_patterns, line)),
+                ("system", lambda line: sequential_search(system_patterns, line)),
+            ],
+        ),
+        ("prefilter", [("continuous", continuous_matcher.search), ("system", system_matcher.search)]),
+    ):
+        lines, elapsed, stats = run_pass(input_file, max_lines, search_funcs)
+        results[name] = stats
+        click.echo(f"{name:>10}: {lines} lines in {elapsed:.2f}s, {lines / elapsed:,.0f} lines/sec")
+
+    if results["sequential"] != results["prefilter"]:
+        click.echo(f"MISMATCH:\n  sequential={results['sequential']}\n  prefilter={results['prefilter']}")
+        sys.exit(1)
+    click.echo(f"matched lines: {sum(results['prefilter'].values())}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""
+Measure how fast the lines of an HDR log of a stress tool are decoded into the percentiles exported while the stress
+runs.
+
+Compares a range histogram builder per line (`make_hdrhistogram_summary_from_log_line()') with `HdrLogLineDecoder',
+and verifies both of them return the same percentiles.
+e.g.
+./utils/benchmark_hdr_log_line_decoder.py -i ~/sct-results/latest/loader-set-*/loader-node-1/hdrh-cs-*.hdr
+"""
+
+import os
+import sys
+import time
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.utils.hdrhistogram import HdrLogLineDecoder, make_hdrhistogram_summary_from_log_line  # noqa: E402
+
+HDR_PERCENTILES = [50, 90, 99, 99.9, 99.99]  # as exported by CassandraStressHDRExporter
+
+
+def decode_with_builder(lines, tags, start_time):
+    decoded = []
+    for line in lines:
+        tag = line[4:].split(",")[0]
+        if tag not in tags:
+            continue
+        summary = make_hdrhistogram_summary_from_log_line(
+            hdr_tags=tags, stress_operation="mixed", log_line=line, hst_log_start_time=start_time
+        )
+        values = next(iter(summary.values()), {})
+        decoded.append((tag, {perc: values.get(f"percentile_{perc}".replace(".", "_")) for perc in HDR_PERCENTILES}))
+    return decoded
+
+
+def decode_with_decoder(lines, tags):
+    decoder = HdrLogLineDecoder(hdr_tags=tags, percentiles=HDR_PERCENTILES)
+    return [decoded for line in lines if (decoded := decoder.decode(line))]
+
+
+@click.command(help="Benchmark decoding of HDR log lines with a builder per line and with HdrLogLineDecoder")
+@click.option("-i", "--input-file", default="hdrh.hdr", type=click.Path(exists=True))
+@click.option("-t", "--tag", "tags", multiple=True, help="Tags to decode, all tags of the file by default")
+def benchmark(input_file, tags):
+    with open(input_file, encoding="utf-8") as hdr_file:
+        lines = [line for line in hdr_file if line.startswith("Tag=")]
+    tags = list(tags or dict.fromkeys(line[4:].split(",")[0] for line in lines))
+
+    results = {}
+    for name, decode in (
+        ("builder", lambda: decode_with_builder(lines, tags, start_time=time.time())),
+        ("decoder", lambda: decode_with_decoder(lines, tags)),
+    ):
+        start = time.perf_counter()
+        results[name] = decode()
+        elapsed = time.perf_counter() - start
+        click.echo(f"{name:>8}: {len(lines)} lines in {elapsed:.2f}s, {len(lines) / elapsed:,.0f} lines/sec")
+
+    if results["builder"] != results["decoder"]:
+        mismatches = sum(old != new for old, new in zip(results["builder"], results["decoder"]))
+        click.echo(f"MISMATCH: {mismatches} of {len(results['builder'])} lines")
+        sys.exit(1)
+    click.echo(f"decoded lines of tags {', '.join(tags)}: {len(results['decoder'])}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""
+Measure the throughput of publishing SCT events through EventsDevice, unbatched and batched.
+
+Events are published by the benchmark process and received by a subscriber, the time is counted from the first
+published event till the last received one.
+e.g.
+./utils/benchmark_sct_events_device.py -n 20000
+"""
+
+import os
+import sys
+import time
+import ctypes
+import tempfile
+import threading
+import multiprocessing
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.sct_events.events_device import PUB_BATCH_SIZE, EventsDevice  # noqa: E402
+from sdcm.sct_events.events_processes import EventsProcessesRegistry  # noqa: E402
+from sdcm.sct_events.system import InfoEvent  # noqa: E402
+from sdcm.wait import wait_for  # noqa: E402
+
+
+def make_event(message):
+    event = InfoEvent(message=message)
+    event.dont_publish()  # it's published by EventsDevice directly
+    return event
+
+
+def run_pass(log_dir, batch_size, events_count):
+    events_device = EventsDevice(_registry=EventsProcessesRegistry(log_dir=log_dir))
+    events_device.pub_batch_size = batch_size
+    stop_event = threading.Event()
+    counter = multiprocessing.Value(ctypes.c_uint32, 0)
+    subscribed = threading.Event()
+    received = 0
+
+    def consume():
+        nonlocal received
+        for _, event in events_device.outbound_events(stop_event=stop_event, events_counter=counter):
+            if event.message == "ready":
+                subscribed.set()
+                continue
+            received += 1
+            if received == events_count:
+                stop_event.set()
+
+    events_device.start()
+    try:
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        # a subscriber misses events published before it's connected, so publish probes until one is received
+        wait_for(
+            func=lambda: events_device.publish_event(make_event("ready")) or subscribed.wait(0.1),
+            step=0,
+            timeout=10,
+            throw_exc=True,
+            text="Waiting for the subscriber to connect",
+        )
+        start = time.perf_counter()
+        for index in range(events_count):
+            events_device.publish_event(make_event(str(index)))
+        consumer.join(timeout=600)
+        elapsed = time.perf_counter() - start
+    finally:
+        stop_event.set()
+        events_device.stop(timeout=5)
+    return received, elapsed
+
+
+@click.command(help="Benchmark publishing of SCT events through EventsDevice with and without batching")
+@click.option("-n", "--events-count", default=10000, type=int, help="Number of events to publish in every pass")
+def benchmark(events_count):
+    for name, batch_size in (("unbatched", 1), ("batched", PUB_BATCH_SIZE)):
+        with tempfile.TemporaryDirectory() as log_dir:
+            received, elapsed = run_pass(log_dir=log_dir, batch_size=batch_size, events_count=events_count)
+        click.echo(f"{name:>10}: {received} events in {elapsed:.2f}s, {received / elapsed:,.0f} events/sec")
+        if received != events_count:
+            click.echo(f"LOST: {events_count - received} events")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""
+Measure the cost of the SCT events wire format compared to a plain pickle of the event.
+
+Encoding adds a header to the pickled event, and subscribers which need only the name or the severity of an event
+decode the header instead of unpickling the whole event.
+e.g.
+./utils/benchmark_sct_events_wire_format.py -n 5000 -b 200
+"""
+
+import os
+import sys
+import pickle
+import timeit
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.sct_events.database import DatabaseLogEvent  # noqa: E402
+from sdcm.sct_events.wire_format import EventEnvelope, encode_event  # noqa: E402
+
+
+def make_reactor_stall_event(backtrace_lines):
+    event = DatabaseLogEvent.REACTOR_STALLED()
+    event.add_info(node="node-1", line="Reactor stalled for 32 ms on shard 1. Backtrace: 0x4e0d6e2", line_number=10)
+    event.raw_backtrace = "\n".join(f"0x{index:x}" * 8 for index in range(backtrace_lines)) or None
+    event.dont_publish()
+    return event
+
+
+def per_call_us(func, number):
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+@click.command(help="Benchmark encoding and decoding of SCT events with the wire format and with pickle")
+@click.option("-n", "--number", default=2000, type=int, help="Number of calls of every function")
+@click.option("-b", "--backtrace-lines", default=[0, 200], multiple=True, type=int, help="Backtrace size of the event")
+def benchmark(number, backtrace_lines):
+    for lines in backtrace_lines:
+        event = make_reactor_stall_event(backtrace_lines=lines)
+        header, payload = encode_event(event)
+        click.echo(f"backtrace of {lines} lines:")
+        click.echo(f"      size: pickle={len(pickle.dumps(event))}B header={len(header)}B")
+        click.echo(
+            f"    encode: pickle={per_call_us(lambda: pickle.dumps(event), number):.1f}us"  # noqa: B023
+            f" header+pickle={per_call_us(lambda: encode_event(event), number):.1f}us"  # noqa: B023
+        )
+        click.echo(
+            f"    decode: pickle={per_call_us(lambda: pickle.loads(payload), number):.1f}us"  # noqa: B023
+            f" header only={per_call_us(lambda: EventEnvelope(header, payload).severity, number):.1f}us"  # noqa: B023
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2026 ScyllaDB
+
+"""
+Measure how fast log events are created from matched db log lines (`event.clone().add_info(...)').
+
+Compares the old way (a pickle round trip to clone the event and `dateutil' to parse the time of the line) with
+`LogEvent.clone()' and `parse_log_line_timestamp()', and verifies both of them produce the same events.
+e.g.
+./utils/benchmark_sct_log_events.py -n 20000
+"""
+
+import os
+import sys
+import time
+import pickle
+from datetime import timezone
+from unittest.mock import patch
+
+import click
+import dateutil.parser
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sdcm.sct_events.database import DatabaseLogEvent  # noqa: E402
+
+
+def dateutil_timestamp(event_time):
+    return dateutil.parser.parse(event_time).replace(tzinfo=timezone.utc).timestamp()
+
+
+def pickle_clone(event):
+    return pickle.loads(pickle.dumps(event))
+
+
+def run_pass(prototype, lines, clone):
+    start = time.perf_counter()
+    events = [clone(prototype).add_info(node="node1", line=line, line_number=num) for num, line in enumerate(lines)]
+    elapsed = time.perf_counter() - start
+    for event in events:
+        event.dont_publish()
+    return events, elapsed
+
+
+@click.command(help="Benchmark cloning of log events with pickle+dateutil and with clone()+fromisoformat")
+@click.option("-n", "--number", default=10000, type=int, help="Number of events to create in every pass")
+def benchmark(number):
+    prototype = DatabaseLogEvent.DATABASE_ERROR()
+    prototype.dont_publish()
+    lines = [
+        f"2021-04-06T13:{num // 60 % 60:02}:{num % 60:02}.123456+00:00 db-node-1 !ERR | scylla[123]: error {num}"
+        for num in range(number)
+    ]
+
+    with patch("sdcm.sct_events.base.parse_log_line_timestamp", dateutil_timestamp):
+        old_events, old_elapsed = run_pass(prototype, lines, clone=pickle_clone)
+    new_events, new_elapsed = run_pass(prototype, lines, clone=DatabaseLogEvent.clone)
+    for name, elapsed in (("pickle+dateutil", old_elapsed), ("clone+fromisoformat", new_elapsed)):
+        click.echo(f"{name:>20}: {number} events in {elapsed:.2f}s, {number / elapsed:,.0f} events/sec")
+
+    mismatches = sum(
+        (old.source_timestamp, old.line) != (new.source_timestamp, new.line) for old, new in zip(old_events, new_events)
+    )
+    if mismatches:
+        click.echo(f"MISMATCH: {mismatches} of {number} events")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    benchmark()